@@ -0,0 +1,250 @@
+"""Content-addressed storage for web archive snapshots."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from .web_archive import _write_atomic
+
+logger = logging.getLogger(__name__)
+
+try:  # pragma: no cover - optional dependency
+    import zstandard
+except ImportError:  # pragma: no cover - gzip remains available
+    zstandard = None
+
+_CODEC_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+_MANIFEST_VERSION = 1
+# Temporary files younger than this may still belong to a writer in flight.
+_TMP_GRACE_SECONDS = 3600
+
+
+@dataclass
+class SnapshotResult:
+    """Outcome of storing one snapshot."""
+
+    name: str
+    manifest_path: Path
+    files: int
+    logical_bytes: int
+    new_objects: int
+    new_bytes: int
+
+
+@dataclass
+class StoreUsage:
+    """Disk usage of the store against the size of what it preserves."""
+
+    snapshots: int
+    objects: int
+    stored_bytes: int
+    logical_bytes: int
+
+
+class SnapshotStore:
+    """Keep archive snapshots as manifests over deduplicated, compressed blobs.
+
+    Every file is addressed by the SHA-256 of its content and written once to
+    ``objects/<aa>/<digest>.<gz|zst>``; each snapshot is a JSON manifest under
+    ``manifests/`` mapping relative paths to digests. A snapshot therefore only
+    costs the pages that changed since any snapshot still held. Files whose
+    size and mtime match the previous manifest are not re-read.
+    """
+
+    def __init__(self, root: Path, *, codec: str = "gzip") -> None:
+        if codec not in _CODEC_SUFFIXES:
+            raise ValueError(f"Unsupported snapshot codec: {codec}")
+        if codec == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed; storing snapshots as gzip")
+            codec = "gzip"
+        self.root = root
+        self.codec = codec
+        self.objects_dir = root / "objects"
+        self.manifests_dir = root / "manifests"
+
+    def snapshot(self, source_dir: Path, name: str) -> SnapshotResult:
+        """Store the files under ``source_dir`` as snapshot ``name``.
+
+        Raises :class:`FileExistsError` if a snapshot called ``name`` already
+        exists; snapshots are never overwritten.
+        """
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = self.manifests_dir / f"{name}.json"
+        if manifest_path.exists():
+            raise FileExistsError(f"Snapshot {name} already exists")
+        names = self.names()
+        previous = self.load_manifest(names[-1])["files"] if names else {}
+
+        files: Dict[str, List[object]] = {}
+        logical_bytes = new_objects = new_bytes = 0
+        for path in sorted(source_dir.rglob("*")):
+            if not path.is_file() or path.name.startswith("."):
+                continue
+            relpath = path.relative_to(source_dir).as_posix()
+            stat = path.stat()
+            known = previous.get(relpath)
+            digest: Optional[str] = None
+            if known and known[1] == stat.st_size and known[2] == stat.st_mtime_ns:
+                digest = str(known[0])
+                if self._find_object(digest) is None:
+                    digest = None
+            if digest is None:
+                data = path.read_bytes()
+                digest = hashlib.sha256(data).hexdigest()
+                if self._find_object(digest) is None:
+                    new_bytes += self._write_object(digest, data)
+                    new_objects += 1
+            files[relpath] = [digest, stat.st_size, stat.st_mtime_ns]
+            logical_bytes += stat.st_size
+
+        manifest = {
+            "version": _MANIFEST_VERSION,
+            "name": name,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "codec": self.codec,
+            "logical_bytes": logical_bytes,
+            "new_bytes": new_bytes,
+            "files": files,
+        }
+        _write_atomic(
+            manifest_path, json.dumps(manifest, sort_keys=True).encode(), replace=False
+        )
+        return SnapshotResult(
+            name=name,
+            manifest_path=manifest_path,
+            files=len(files),
+            logical_bytes=logical_bytes,
+            new_objects=new_objects,
+            new_bytes=new_bytes,
+        )
+
+    def names(self) -> List[str]:
+        """Return snapshot names, oldest first."""
+
+        if not self.manifests_dir.exists():
+            return []
+        return sorted(path.stem for path in self.manifests_dir.glob("*.json"))
+
+    def load_manifest(self, name: str) -> Dict[str, object]:
+        path = self.manifests_dir / f"{name}.json"
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def restore(self, name: str, target_dir: Path) -> int:
+        """Write snapshot ``name`` back out under ``target_dir``."""
+
+        files = self.load_manifest(name)["files"]
+        for relpath, (digest, _size, _mtime) in files.items():
+            blob = self._find_object(digest)
+            if blob is None:
+                raise FileNotFoundError(f"Snapshot {name} is missing object {digest}")
+            target = target_dir / relpath
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(self._read_object(blob))
+        return len(files)
+
+    def prune(self, keep: int) -> List[str]:
+        """Drop all but the newest ``keep`` snapshots and their orphaned blobs."""
+
+        names = self.names()
+        stale = names[:-keep] if keep > 0 else names
+        for name in stale:
+            (self.manifests_dir / f"{name}.json").unlink(missing_ok=True)
+        if stale:
+            self.collect_garbage()
+        return stale
+
+    def collect_garbage(self) -> int:
+        """Delete blobs no remaining manifest refers to.
+
+        Temporary files are left alone unless they are older than
+        ``_TMP_GRACE_SECONDS``; younger ones may belong to a snapshot still
+        being written.
+        """
+
+        referenced: Set[str] = set()
+        for name in self.names():
+            for digest, _size, _mtime in self.load_manifest(name)["files"].values():
+                referenced.add(digest)
+        removed = 0
+        if not self.objects_dir.exists():
+            return removed
+        stale_before = time.time() - _TMP_GRACE_SECONDS
+        for blob in self.objects_dir.rglob("*"):
+            if not blob.is_file():
+                continue
+            if blob.name.endswith(".tmp"):
+                try:
+                    if blob.stat().st_mtime >= stale_before:
+                        continue
+                except FileNotFoundError:
+                    continue
+            elif blob.name.split(".", 1)[0] in referenced:
+                continue
+            blob.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def usage(self) -> StoreUsage:
+        """Measure bytes on disk against the bytes the snapshots represent."""
+
+        stored_bytes = objects = 0
+        if self.objects_dir.exists():
+            for blob in self.objects_dir.rglob("*"):
+                if blob.is_file():
+                    stored_bytes += blob.stat().st_size
+                    objects += 1
+        logical_bytes = 0
+        names = self.names()
+        for name in names:
+            path = self.manifests_dir / f"{name}.json"
+            stored_bytes += path.stat().st_size
+            logical_bytes += int(self.load_manifest(name).get("logical_bytes", 0))
+        return StoreUsage(
+            snapshots=len(names),
+            objects=objects,
+            stored_bytes=stored_bytes,
+            logical_bytes=logical_bytes,
+        )
+
+    def _object_path(self, digest: str, codec: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}{_CODEC_SUFFIXES[codec]}"
+
+    def _find_object(self, digest: str) -> Optional[Path]:
+        for codec in (self.codec, *(c for c in _CODEC_SUFFIXES if c != self.codec)):
+            path = self._object_path(digest, codec)
+            if path.exists():
+                return path
+        return None
+
+    def _write_object(self, digest: str, data: bytes) -> int:
+        if self.codec == "zstd":
+            payload = zstandard.ZstdCompressor(level=10).compress(data)
+        else:
+            payload = gzip.compress(data, compresslevel=6, mtime=0)
+        path = self._object_path(digest, self.codec)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(path, payload)
+        return len(payload)
+
+    @staticmethod
+    def _read_object(path: Path) -> bytes:
+        payload = path.read_bytes()
+        if path.suffix == ".zst":
+            if zstandard is None:
+                raise RuntimeError("zstandard is required to read .zst snapshot blobs")
+            return zstandard.ZstdDecompressor().decompress(payload)
+        return gzip.decompress(payload)
+
+
+__all__ = ["SnapshotResult", "SnapshotStore", "StoreUsage"]
@@ -25,6 +25,7 @@ from .scheduler import GazetteScheduler
 from .service import GameService
 from .telemetry import get_telemetry
 from .telemetry_decorator import track_command
+from .tracing import trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -616,8 +617,9 @@ def build_bot(db_path: Path, intents: Optional[discord.Intents] = None) -> comma
     @track_command
     async def resolve_expeditions(interaction: discord.Interaction) -> None:
         try:
-            digest_releases = service.advance_digest()
-            releases = digest_releases + service.resolve_pending_expeditions()
+            with trace_span("command.resolve_expeditions"):
+                digest_releases = service.advance_digest()
+                releases = digest_releases + service.resolve_pending_expeditions()
         except GameService.GamePausedError as exc:
             await interaction.response.send_message(str(exc), ephemeral=True)
             await _flush_admin_notifications()
@@ -1850,7 +1852,7 @@ def build_bot(db_path: Path, intents: Optional[discord.Intents] = None) -> comma
             output_path = service.export_web_archive(source="command")
 
             # Count files and get stats
-            press_count = len(list(service.state.list_press_releases()))
+            press_count = service.state.count_press_releases()
             scholar_count = len(list(service.state.all_scholars()))
 
             message = (
@@ -1885,11 +1887,11 @@ def build_bot(db_path: Path, intents: Optional[discord.Intents] = None) -> comma
         from .web_archive import WebArchive
 
         # Search for matching press releases
-        all_press = service.state.list_press_releases_with_ids()
+        needle = headline_search.lower()
         matches: List[tuple[int, PressRecord]] = []
 
-        for press_id, record in all_press:
-            if headline_search.lower() in record.release.headline.lower():
+        for press_id, record in service.state.iter_press_releases(with_metadata=False):
+            if needle in record.release.headline.lower():
                 matches.append((press_id, record))
 
         if not matches:
@@ -1964,8 +1966,9 @@ def build_bot(db_path: Path, intents: Optional[discord.Intents] = None) -> comma
 
         try:
             telemetry = get_telemetry()
-            telemetry.flush()  # Ensure all buffered metrics are saved
-            report = telemetry.generate_report()
+            # flush() waits for the writer thread, so keep it off the loop.
+            await asyncio.to_thread(telemetry.flush)
+            report = telemetry.cached_report()
 
             # Format report for Discord
             lines = [
@@ -2116,8 +2119,10 @@ def build_bot(db_path: Path, intents: Optional[discord.Intents] = None) -> comma
                     key=lambda x: x[1]["avg_duration_ms"],
                     reverse=True,
                 )[:5]:
+                    p95 = perf.get("p95_duration_ms")
+                    p95_text = f", p95 {p95:.1f}ms" if p95 is not None else ""
                     lines.append(
-                        f"• {op}: avg {perf['avg_duration_ms']:.1f}ms ({perf['sample_count']} samples)"
+                        f"• {op}: avg {perf['avg_duration_ms']:.1f}ms{p95_text} ({perf['sample_count']} samples)"
                     )
 
             channel_usage = report.get("channel_usage_24h", {})
@@ -2157,14 +2162,23 @@ def build_bot(db_path: Path, intents: Optional[discord.Intents] = None) -> comma
                     llm_stats.items(), key=lambda x: x[1]["total_calls"], reverse=True
                 )[:5]:
                     success_rate = stats["success_rate"] * 100
+                    lookups = stats.get("cache_hits", 0) + stats.get("cache_misses", 0)
+                    cache_text = (
+                        f", cache {stats['cache_hits']}/{lookups} hits"
+                        if lookups
+                        else ""
+                    )
+                    if stats.get("coalesced_calls"):
+                        cache_text += f", {stats['coalesced_calls']} coalesced"
                     lines.append(
-                        "• {press}: {succ}/{total} success ({rate:.0f}%), avg {avg:.0f}ms, max {max:.0f}ms".format(
+                        "• {press}: {succ}/{total} success ({rate:.0f}%), avg {avg:.0f}ms, max {max:.0f}ms{cache}".format(
                             press=press_type.replace("_", " "),
                             succ=stats["successes"],
                             total=stats["total_calls"],
                             rate=success_rate,
                             avg=stats["avg_duration_ms"],
                             max=stats["max_duration_ms"],
+                            cache=cache_text,
                         )
                     )
 
@@ -2201,6 +2215,23 @@ def build_bot(db_path: Path, intents: Optional[discord.Intents] = None) -> comma
                     )
                 )
 
+            trace_summary = report.get("traces", {})
+            if trace_summary.get("slowest"):
+                lines.append("\n**Slowest Traces (recent):**")
+                for trace in trace_summary["slowest"]:
+                    hotspots = ", ".join(
+                        "{name} {self_ms:.0f}ms ×{count}".format(**entry)
+                        for entry in trace["breakdown"][:3]
+                    )
+                    lines.append(
+                        "• {name}: {duration:.0f}ms ({spans} spans) — {hotspots}".format(
+                            name=trace["name"],
+                            duration=trace["duration_ms"],
+                            spans=trace["spans"] + trace["dropped_spans"],
+                            hotspots=hotspots,
+                        )
+                    )
+
             queue_summary = report.get("queue_depth_24h", {})
             if queue_summary:
                 lines.append("\n**Queue Depth (24 hours):**")
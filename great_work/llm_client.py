@@ -3,17 +3,37 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
 import os
 import random
+import sqlite3
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import time
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+DEFAULT_LLM_CACHE_PATH = Path("var") / "llm" / "response_cache.db"
+
 
 _RANDOM = random.Random()  # nosec B311 - pseudo-RNG acceptable for template selection
 # Optional deterministic seed for tests / reproducible runs
@@ -25,6 +45,11 @@ if _seed_env is not None:
         pass
 
 
+# Separate generator so retry and cool-down jitter leave seeded template
+# choices reproducible.
+_JITTER = random.Random()  # nosec B311 - jitter does not need a secure RNG
+
+
 def _random_choice(seq):
     return _RANDOM.choice(seq)
 
@@ -42,6 +67,25 @@ def _augment_prompt_with_related(prompt: str, context: Dict[str, Any]) -> str:
     return f"{prompt}\n\nRelated context:\n{related_section}"
 
 
+_PRESS_PROMPTS = {
+    "academic_bulletin": "Write an academic announcement: {content}",
+    "research_manifesto": "Write a bold research manifesto: {content}",
+    "discovery_report": "Write an exciting discovery report: {content}",
+    "retraction_notice": "Write a humble retraction notice: {content}",
+    "academic_gossip": "Write intriguing academic gossip: {content}",
+    "recruitment_report": "Write a recruitment update: {content}",
+    "defection_notice": "Write a dramatic defection announcement: {content}",
+    "mentorship_announcement": "Write a mentorship announcement: {content}",
+    "conference_report": "Write a conference debate summary: {content}",
+    "symposium_announcement": "Write a symposium topic announcement: {content}",
+}
+
+
+def _press_prompt(press_type: str, base_content: str, context: Dict[str, Any]) -> str:
+    template = _PRESS_PROMPTS.get(press_type, "Write about: {content}")
+    return _augment_prompt_with_related(template.format(content=base_content), context)
+
+
 class LLMGenerationError(RuntimeError):
     """Raised when the LLM cannot generate narrative content."""
 
@@ -50,6 +94,342 @@ class LLMNotEnabledError(LLMGenerationError):
     """Raised when the LLM client is disabled."""
 
 
+class LLMCircuitOpenError(LLMGenerationError):
+    """Raised when the circuit breaker is refusing upstream calls."""
+
+
+class GeneratedText(str):
+    """Narrative text tagged with how the response cache served it.
+
+    ``cache_status`` is ``"hit"``, ``"miss"`` (generated and stored),
+    ``"bypass"`` (the cache is off or skipped for this temperature),
+    ``"coalesced"`` (shared with an identical request already in flight) or
+    ``"short_circuit"`` (a fallback template served while the circuit breaker
+    is open).
+    """
+
+    cache_status: str
+
+    def __new__(cls, text: str, cache_status: str) -> "GeneratedText":
+        value = super().__new__(cls, text)
+        value.cache_status = cache_status
+        return value
+
+
+class LLMResponseCache:
+    """Persistent LLM responses keyed by a fingerprint of the request.
+
+    Entries live in a small SQLite database so they survive restarts and are
+    shared between processes. They expire ``ttl_seconds`` after being stored,
+    and once more than ``max_entries`` are held the least recently used are
+    evicted. Storage errors are logged and treated as misses.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl_seconds: float = 86400.0,
+        max_entries: int = 5000,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=5.0
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used "
+            "ON llm_responses(last_used)"
+        )
+
+    @staticmethod
+    def fingerprint(
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        messages: List[Dict[str, str]],
+    ) -> str:
+        """Hash a request; message whitespace is collapsed before hashing."""
+
+        normalized = [
+            {"role": message["role"], "content": " ".join(message["content"].split())}
+            for message in messages
+        ]
+        payload = json.dumps(
+            {
+                "model": model,
+                "temperature": round(float(temperature), 4),
+                "max_tokens": max_tokens,
+                "messages": normalized,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT response, created_at FROM llm_responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None and now - row[1] > self.ttl_seconds:
+                    self._conn.execute(
+                        "DELETE FROM llm_responses WHERE key = ?", (key,)
+                    )
+                    row = None
+                if row is None:
+                    self.misses += 1
+                    return None
+                self._conn.execute(
+                    "UPDATE llm_responses SET last_used = ? WHERE key = ?",
+                    (now, key),
+                )
+                self.hits += 1
+                return row[0]
+        except sqlite3.Error:
+            logger.warning("LLM response cache read failed", exc_info=True)
+            return None
+
+    def put(self, key: str, model: str, response: str) -> None:
+        now = time.time()
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses "
+                    "(key, model, response, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, model, response, now, now),
+                )
+                self._evict(now)
+        except sqlite3.Error:
+            logger.warning("LLM response cache write failed", exc_info=True)
+
+    def _evict(self, now: float) -> None:
+        expired = self._conn.execute(
+            "DELETE FROM llm_responses WHERE created_at < ?",
+            (now - self.ttl_seconds,),
+        ).rowcount
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM llm_responses WHERE key IN ("
+                "SELECT key FROM llm_responses ORDER BY last_used ASC LIMIT ?)",
+                (overflow,),
+            )
+        self.evictions += max(0, expired) + max(0, overflow)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            (entries,) = self._conn.execute(
+                "SELECT COUNT(*) FROM llm_responses"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CircuitBreaker:
+    """Stop calling an upstream that keeps failing, then probe it back.
+
+    Outcomes of recent calls are kept for ``window_seconds``. Once at least
+    ``min_requests`` are in the window and the share that failed (calls
+    slower than ``slow_call_ms`` count as failures) reaches
+    ``failure_rate``, the breaker opens and rejects calls for a cool-down.
+    After the cool-down it is half-open and lets a single probe through: a
+    success closes it, a failure reopens it for twice as long, up to
+    ``max_open_seconds``. Cool-downs are jittered so several workers do not
+    probe in lockstep. Each admitted call holds a permit from :meth:`allow`;
+    while half-open only the probe's permit decides the outcome, so calls
+    admitted before the trip that finish late are ignored.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        *,
+        window_seconds: float = 60.0,
+        min_requests: int = 5,
+        failure_rate: float = 0.5,
+        slow_call_ms: Optional[float] = None,
+        open_seconds: float = 30.0,
+        max_open_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.window_seconds = window_seconds
+        self.min_requests = max(1, min_requests)
+        self.failure_rate = failure_rate
+        self.slow_call_ms = slow_call_ms
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max(open_seconds, max_open_seconds)
+        self.state = self.CLOSED
+        self.reason: Optional[str] = None
+        self.trips = 0
+        self._clock = clock
+        # (timestamp, failed, latency_ms) for calls inside the window.
+        self._samples: Deque[Tuple[float, bool, float]] = deque(maxlen=1024)
+        self._backoff = open_seconds
+        self._open_until = 0.0
+        self._probing = False
+        self._permits = 0
+        self._probe_permit: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def rejecting(self) -> bool:
+        """Return ``True`` when a call now would be refused."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return False
+            if self.state == self.OPEN:
+                return self._clock() < self._open_until
+            return self._probing
+
+    def allow(self) -> Optional[int]:
+        """Claim permission for one upstream call.
+
+        Returns a permit to hand back to :meth:`record` or :meth:`release`,
+        or ``None`` when the call is refused.
+        """
+        with self._lock:
+            self._permits += 1
+            if self.state == self.CLOSED:
+                return self._permits
+            if self.state == self.OPEN:
+                if self._clock() < self._open_until:
+                    return None
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self._probing:
+                return None
+            self._probing = True
+            self._probe_permit = self._permits
+            return self._permits
+
+    def record(
+        self, success: bool, latency_ms: float, permit: Optional[int] = None
+    ) -> None:
+        """Record the outcome of a call admitted with ``permit``."""
+        with self._lock:
+            now = self._clock()
+            failed = not success or (
+                self.slow_call_ms is not None and latency_ms > self.slow_call_ms
+            )
+            if self.state == self.HALF_OPEN:
+                if permit is None or permit != self._probe_permit:
+                    return
+                self._probing = False
+                self._probe_permit = None
+                if failed:
+                    self._backoff = min(self._backoff * 2, self.max_open_seconds)
+                    self._trip(now, "probe failed")
+                else:
+                    self.state = self.CLOSED
+                    self.reason = None
+                    self._backoff = self.open_seconds
+                    self._samples.clear()
+                    self._samples.append((now, False, latency_ms))
+                return
+            self._samples.append((now, failed, latency_ms))
+            self._prune(now)
+            if self.state != self.CLOSED or len(self._samples) < self.min_requests:
+                return
+            failures = sum(1 for _, bad, _ in self._samples if bad)
+            if failures / len(self._samples) >= self.failure_rate:
+                self._trip(
+                    now,
+                    f"{failures} of {len(self._samples)} calls failed or were slow "
+                    f"in {self.window_seconds:g}s",
+                )
+
+    def release(self, permit: Optional[int] = None) -> None:
+        """Give back a half-open probe that ended without an outcome."""
+        with self._lock:
+            if permit is not None and permit == self._probe_permit:
+                self._probing = False
+                self._probe_permit = None
+
+    def latency_quantile(
+        self, quantile: float, *, min_samples: int = 1
+    ) -> Optional[float]:
+        """Latency (ms) of successful calls in the window at ``quantile``."""
+        with self._lock:
+            self._prune(self._clock())
+            latencies = sorted(ms for _, bad, ms in self._samples if not bad)
+        if not latencies or len(latencies) < min_samples:
+            return None
+        return latencies[min(len(latencies) - 1, int(quantile * len(latencies)))]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current state for operators and the service's pause logic."""
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            total = len(self._samples)
+            failures = sum(1 for _, bad, _ in self._samples if bad)
+            state = self.state
+            if state == self.OPEN and now >= self._open_until:
+                state = self.HALF_OPEN
+            return {
+                "state": state,
+                "reason": self.reason,
+                "trips": self.trips,
+                "calls": total,
+                "failure_rate": round(failures / total, 3) if total else 0.0,
+                "retry_in_seconds": round(max(0.0, self._open_until - now), 1)
+                if self.state == self.OPEN
+                else 0.0,
+            }
+
+    def _trip(self, now: float, reason: str) -> None:
+        self.state = self.OPEN
+        self.reason = reason
+        self.trips += 1
+        self._open_until = now + self._backoff * _JITTER.uniform(0.8, 1.2)
+        logger.warning("LLM circuit opened: %s", reason)
+
+    def _prune(self, now: float) -> None:
+        horizon = now - self.window_seconds
+        while self._samples and self._samples[0][0] < horizon:
+            self._samples.popleft()
+
+
 class SafetyLevel(Enum):
     """Content safety levels for moderation."""
 
@@ -71,10 +451,24 @@ class LLMConfig:
     timeout: int = 30
     retry_attempts: int = 3
     batch_size: int = 10  # For batch processing
+    max_concurrent: int = 4  # Requests in flight at once for batched enhancement
+    max_connections: int = 16  # Pooled keep-alive HTTP connections
     use_fallback_templates: bool = True  # Fallback to templates if LLM fails
     safety_enabled: bool = True
     mock_mode: bool = False
     retry_schedule: Optional[List[float]] = None
+    cache_path: Optional[str] = None  # Persistent response cache; None disables
+    cache_ttl_seconds: float = 86400.0
+    cache_max_entries: int = 5000
+    cache_max_temperature: Optional[float] = None  # Skip caching above this
+    deadline_seconds: float = 45.0  # Budget for all attempts of one call
+    hedge_requests: bool = False  # Race a second request after the p95 latency
+    breaker_window_seconds: float = 60.0
+    breaker_min_requests: int = 5
+    breaker_failure_rate: float = 0.5
+    breaker_slow_call_ms: Optional[float] = None  # Slower calls count as failures
+    breaker_open_seconds: float = 30.0
+    breaker_max_open_seconds: float = 300.0
 
     @classmethod
     def from_env(cls) -> "LLMConfig":
@@ -93,6 +487,27 @@ class LLMConfig:
                 logger.warning("Invalid LLM_RETRY_SCHEDULE value: %s", schedule_env)
                 retry_schedule = None
 
+        cache_max_temperature_env = os.getenv("LLM_CACHE_MAX_TEMPERATURE")
+        cache_max_temperature: Optional[float] = None
+        if cache_max_temperature_env:
+            try:
+                cache_max_temperature = float(cache_max_temperature_env)
+            except ValueError:
+                logger.warning(
+                    "Invalid LLM_CACHE_MAX_TEMPERATURE value: %s",
+                    cache_max_temperature_env,
+                )
+
+        slow_call_env = os.getenv("LLM_BREAKER_SLOW_CALL_MS")
+        breaker_slow_call_ms: Optional[float] = None
+        if slow_call_env:
+            try:
+                breaker_slow_call_ms = float(slow_call_env)
+            except ValueError:
+                logger.warning(
+                    "Invalid LLM_BREAKER_SLOW_CALL_MS value: %s", slow_call_env
+                )
+
         return cls(
             api_base=os.getenv("LLM_API_BASE", "http://localhost:5000/v1"),
             api_key=os.getenv("LLM_API_KEY", "not-needed-for-local"),
@@ -102,11 +517,30 @@ class LLMConfig:
             timeout=int(os.getenv("LLM_TIMEOUT", "30")),
             retry_attempts=int(os.getenv("LLM_RETRY_ATTEMPTS", "3")),
             batch_size=int(os.getenv("LLM_BATCH_SIZE", "10")),
+            max_concurrent=max(1, int(os.getenv("LLM_MAX_CONCURRENT", "4") or 4)),
+            max_connections=max(1, int(os.getenv("LLM_MAX_CONNECTIONS", "16") or 16)),
             use_fallback_templates=os.getenv("LLM_USE_FALLBACK", "true").lower()
             == "true",
             safety_enabled=os.getenv("LLM_SAFETY_ENABLED", "true").lower() == "true",
             mock_mode=mock_mode,
             retry_schedule=retry_schedule,
+            cache_path=os.getenv("LLM_CACHE_PATH", str(DEFAULT_LLM_CACHE_PATH))
+            or None,
+            cache_ttl_seconds=float(os.getenv("LLM_CACHE_TTL", "86400") or 86400),
+            cache_max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000") or 5000),
+            cache_max_temperature=cache_max_temperature,
+            deadline_seconds=float(os.getenv("LLM_DEADLINE", "45") or 45),
+            hedge_requests=os.getenv("LLM_HEDGE", "false").lower() == "true",
+            breaker_window_seconds=float(os.getenv("LLM_BREAKER_WINDOW", "60") or 60),
+            breaker_min_requests=int(os.getenv("LLM_BREAKER_MIN_REQUESTS", "5") or 5),
+            breaker_failure_rate=float(
+                os.getenv("LLM_BREAKER_FAILURE_RATE", "0.5") or 0.5
+            ),
+            breaker_slow_call_ms=breaker_slow_call_ms,
+            breaker_open_seconds=float(os.getenv("LLM_BREAKER_OPEN", "30") or 30),
+            breaker_max_open_seconds=float(
+                os.getenv("LLM_BREAKER_MAX_OPEN", "300") or 300
+            ),
         )
 
 
@@ -150,13 +584,33 @@ class ContentModerator:
 
 
 class LLMClient:
-    """OpenAI-compatible LLM client for narrative generation."""
+    """OpenAI-compatible LLM client for narrative generation.
+
+    Requests go through the async OpenAI client on an event loop owned by
+    this client and run in a background thread, so keep-alive connections
+    are pooled across calls. Synchronous helpers submit work to that loop,
+    and coroutines awaited on any other loop hand their HTTP calls to it.
+    """
 
     def __init__(self, config: Optional[LLMConfig] = None):
         """Initialize LLM client with configuration."""
         self.config = config or LLMConfig.from_env()
         self.moderator = ContentModerator() if self.config.safety_enabled else None
-        self._executor = ThreadPoolExecutor(max_workers=4)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        # Upstream calls in flight by request key; only touched on the loop.
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.coalesced_calls = 0
+        self.hedged_calls = 0
+        self.breaker = CircuitBreaker(
+            window_seconds=self.config.breaker_window_seconds,
+            min_requests=self.config.breaker_min_requests,
+            failure_rate=self.config.breaker_failure_rate,
+            slow_call_ms=self.config.breaker_slow_call_ms,
+            open_seconds=self.config.breaker_open_seconds,
+            max_open_seconds=self.config.breaker_max_open_seconds,
+        )
         self._retry_schedule = self.config.retry_schedule or [
             1.0,
             3.0,
@@ -166,6 +620,7 @@ class LLMClient:
             120.0,
         ]
         self.enabled = True
+        self.cache: Optional[LLMResponseCache] = None
 
         if self.config.mock_mode:
             self.openai = None
@@ -173,16 +628,33 @@ class LLMClient:
             logger.info("LLM client initialised in mock mode")
             return
 
+        if self.config.cache_path:
+            try:
+                self.cache = LLMResponseCache(
+                    Path(self.config.cache_path),
+                    ttl_seconds=self.config.cache_ttl_seconds,
+                    max_entries=self.config.cache_max_entries,
+                )
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning("LLM response cache unavailable: %s", exc)
+
         # Import openai library if available
         try:
+            import httpx
             import openai
 
             self.openai = openai
             # Configure OpenAI client with custom base URL
-            self.client = openai.OpenAI(
+            self.client = openai.AsyncOpenAI(
                 api_key=self.config.api_key,
                 base_url=self.config.api_base,
                 timeout=self.config.timeout,
+                http_client=openai.DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=self.config.max_connections,
+                        max_keepalive_connections=self.config.max_connections,
+                    ),
+                ),
             )
             logger.info(f"LLM client initialized with base URL: {self.config.api_base}")
         except ImportError:
@@ -240,8 +712,21 @@ Be concise but flavorful. Maximum 2-3 sentences."""
                 {"role": "user", "content": full_prompt},
             ]
 
-            # Make API call with retries
-            response = await self._call_with_retry(messages)
+            request_key = self._request_key(messages)
+            if request_key is not None and self.cache is not None:
+                # SQLite may block on a busy cache file; keep it off the
+                # caller's loop (the Discord bot's, for async callers).
+                cached = await asyncio.to_thread(self.cache.get, request_key)
+                if cached is not None:
+                    return GeneratedText(cached, "hit")
+
+            if self.breaker.rejecting():
+                return self._short_circuit(context)
+
+            # Make API call with retries, sharing identical calls in flight
+            response, coalesced = await self._on_client_loop(
+                self._single_flight(request_key, messages)
+            )
 
             if response:
                 generated_text = response.choices[0].message.content.strip()
@@ -266,45 +751,179 @@ Be concise but flavorful. Maximum 2-3 sentences."""
                             f"Content passed with {safety.value}: {generated_text[:50]}..."
                         )
 
-                return generated_text
+                if coalesced:
+                    return GeneratedText(generated_text, "coalesced")
+                if request_key is None or self.cache is None:
+                    return GeneratedText(generated_text, "bypass")
+                await asyncio.to_thread(
+                    self.cache.put, request_key, self.config.model_name, generated_text
+                )
+                return GeneratedText(generated_text, "miss")
             else:
+                if self.breaker.rejecting():
+                    return self._short_circuit(context)
                 if self.config.use_fallback_templates:
                     return self._fallback_template(context)
                 raise LLMGenerationError("LLM call exhausted retries")
 
+        except LLMCircuitOpenError:
+            raise
         except Exception as e:
             logger.error(f"LLM generation failed: {e}")
             if self.config.use_fallback_templates:
                 return self._fallback_template(context)
             raise LLMGenerationError(str(e))
 
+    def _request_key(self, messages: List[Dict[str, str]]) -> Optional[str]:
+        """Fingerprint a request for caching and coalescing.
+
+        Returns ``None`` when the temperature is above
+        ``cache_max_temperature``, where identical prompts should still get
+        independent replies.
+        """
+        limit = self.config.cache_max_temperature
+        if limit is not None and self.config.temperature > limit:
+            return None
+        return LLMResponseCache.fingerprint(
+            self.config.model_name,
+            self.config.temperature,
+            self.config.max_tokens,
+            messages,
+        )
+
+    async def _single_flight(
+        self, key: Optional[str], messages: List[Dict[str, str]]
+    ) -> Tuple[Optional[Any], bool]:
+        """Share one upstream call between identical concurrent requests.
+
+        Runs on the client loop. Returns the response and whether it was
+        borrowed from a call another request had already started.
+        """
+        if key is None:
+            return await self._call_with_retry(messages), False
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced_calls += 1
+            return await asyncio.shield(task), True
+        task = asyncio.ensure_future(self._call_with_retry(messages))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so a cancelled caller does not cancel the shared call.
+        return await asyncio.shield(task), False
+
     async def _call_with_retry(self, messages: List[Dict[str, str]]) -> Optional[Any]:
-        """Make API call with retry logic."""
+        """Make API call with retry logic.
+
+        Every attempt and backoff shares one ``deadline_seconds`` budget, and
+        backoffs are drawn with full jitter from the retry schedule. Returns
+        ``None`` once attempts, budget or the circuit breaker run out.
+        """
         attempts = max(1, self.config.retry_attempts)
+        deadline = time.monotonic() + self.config.deadline_seconds
         for attempt in range(attempts):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.error("LLM call deadline exhausted after %d attempts", attempt)
+                return None
+            permit = self.breaker.allow()
+            if permit is None:
+                logger.warning("LLM circuit open; skipping upstream call")
+                return None
             try:
-                response = await asyncio.get_event_loop().run_in_executor(
-                    self._executor,
-                    lambda: self.client.chat.completions.create(
-                        model=self.config.model_name,
-                        messages=messages,
-                        temperature=self.config.temperature,
-                        max_tokens=self.config.max_tokens,
-                    ),
+                return await self._attempt(
+                    messages, min(float(self.config.timeout), remaining), permit
                 )
-                return response
             except Exception as e:
                 logger.warning(f"LLM API call attempt {attempt + 1} failed: {e}")
-                if attempt < attempts - 1:
-                    delay = self._retry_schedule[
-                        min(attempt, len(self._retry_schedule) - 1)
-                    ]
-                    await asyncio.sleep(delay)
-                else:
-                    logger.error("All retry attempts exhausted for LLM call")
+                if attempt == attempts - 1:
+                    break
+                delay = _JITTER.uniform(
+                    0, self._retry_schedule[min(attempt, len(self._retry_schedule) - 1)]
+                )
+                if time.monotonic() + delay >= deadline:
+                    logger.error("LLM call deadline leaves no time for another retry")
                     return None
+                await asyncio.sleep(delay)
+        logger.error("All retry attempts exhausted for LLM call")
         return None
 
+    async def _attempt(
+        self, messages: List[Dict[str, str]], timeout: float, permit: int
+    ) -> Any:
+        """Make one attempt, hedged with a second request when enabled.
+
+        The hedge starts once the primary request has run for the p95 latency
+        of recent successful calls; whichever reply arrives first wins and the
+        other request is cancelled.
+        """
+        started = time.monotonic()
+        primary = asyncio.ensure_future(self._request(messages, permit))
+        pending = {primary}
+        try:
+            hedge_ms = (
+                self.breaker.latency_quantile(0.95, min_samples=20)
+                if self.config.hedge_requests
+                else None
+            )
+            if hedge_ms is not None and hedge_ms / 1000 < timeout:
+                # A primary that finishes early stays in ``pending`` and is
+                # collected by the loop below.
+                await asyncio.wait({primary}, timeout=hedge_ms / 1000)
+                hedge_permit = None if primary.done() else self.breaker.allow()
+                if hedge_permit is not None:
+                    self.hedged_calls += 1
+                    pending.add(
+                        asyncio.ensure_future(self._request(messages, hedge_permit))
+                    )
+            error: BaseException = LLMGenerationError("LLM attempt returned no reply")
+            while pending:
+                budget = timeout - (time.monotonic() - started)
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=max(0.0, budget),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    # Cancelled below; count the stalled attempt as a failure.
+                    self.breaker.record(False, timeout * 1000, permit)
+                    raise asyncio.TimeoutError(f"LLM call exceeded {timeout:.1f}s")
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _request(self, messages: List[Dict[str, str]], permit: int) -> Any:
+        """Send one request upstream and report its outcome to the breaker."""
+        started = time.perf_counter()
+        try:
+            response = await self._on_client_loop(
+                self.client.chat.completions.create(
+                    model=self.config.model_name,
+                    messages=messages,
+                    temperature=self.config.temperature,
+                    max_tokens=self.config.max_tokens,
+                )
+            )
+        except asyncio.CancelledError:
+            self.breaker.release(permit)
+            raise
+        except Exception:
+            self.breaker.record(False, (time.perf_counter() - started) * 1000, permit)
+            raise
+        self.breaker.record(True, (time.perf_counter() - started) * 1000, permit)
+        return response
+
+    def _short_circuit(self, context: Dict[str, Any]) -> str:
+        """Answer without calling upstream while the breaker is open."""
+        reason = self.breaker.reason or "upstream unavailable"
+        if self.config.use_fallback_templates:
+            return GeneratedText(self._fallback_template(context), "short_circuit")
+        raise LLMCircuitOpenError(f"LLM circuit open: {reason}")
+
     def _fallback_template(self, context: Dict[str, Any]) -> str:
         """Generate fallback text when LLM is unavailable."""
         # Extract key information from context
@@ -340,56 +959,114 @@ Be concise but flavorful. Maximum 2-3 sentences."""
         persona_traits: Optional[Dict[str, Any]] = None,
     ) -> str:
         """Blocking helper for synchronous callers."""
-        coro = self.generate_narrative(
-            prompt=prompt,
-            context=context,
-            persona_name=persona_name,
-            persona_traits=persona_traits,
+        return self._run_sync(
+            self.generate_narrative(
+                prompt=prompt,
+                context=context,
+                persona_name=persona_name,
+                persona_traits=persona_traits,
+            )
         )
-        try:
-            asyncio.get_running_loop()
-        except RuntimeError:
-            return asyncio.run(coro)
-
-        result_container: Dict[str, Any] = {}
-
-        def runner() -> None:
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(new_loop)
-            try:
-                result_container["value"] = new_loop.run_until_complete(coro)
-            finally:
-                new_loop.close()
-
-        thread = threading.Thread(target=runner)
-        thread.start()
-        thread.join()
-        if "value" not in result_container:
-            raise LLMGenerationError("Synchronous narrative generation failed")
-        return result_container["value"]
 
     async def generate_batch(
-        self, prompts: List[Dict[str, Any]], max_concurrent: int = 5
-    ) -> List[str]:
-        """Generate multiple narratives in batch with concurrency control."""
-        semaphore = asyncio.Semaphore(max_concurrent)
+        self,
+        prompts: List[Dict[str, Any]],
+        max_concurrent: int = 5,
+        *,
+        return_exceptions: bool = False,
+        timed: bool = False,
+    ) -> List[Any]:
+        """Generate multiple narratives in batch with concurrency control.
+
+        Results keep the order of ``prompts``. With ``return_exceptions`` a
+        failed prompt yields its exception instead of failing the batch. With
+        ``timed`` each result becomes ``(result, duration_ms)``, timing that
+        prompt alone from the moment it got a concurrency slot.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
 
         async def generate_with_limit(prompt_data):
             async with semaphore:
-                return await self.generate_narrative(
-                    prompt_data["prompt"],
-                    prompt_data.get("context", {}),
-                    prompt_data.get("persona_name"),
-                    prompt_data.get("persona_traits"),
-                )
+                start = time.perf_counter()
+                try:
+                    result = await self.generate_narrative(
+                        prompt_data["prompt"],
+                        prompt_data.get("context", {}),
+                        prompt_data.get("persona_name"),
+                        prompt_data.get("persona_traits"),
+                    )
+                except Exception as exc:
+                    if not (timed and return_exceptions):
+                        raise
+                    result = exc
+                if timed:
+                    return result, (time.perf_counter() - start) * 1000
+                return result
 
         tasks = [generate_with_limit(p) for p in prompts]
-        return await asyncio.gather(*tasks)
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+
+    def generate_batch_sync(
+        self,
+        prompts: List[Dict[str, Any]],
+        max_concurrent: Optional[int] = None,
+        *,
+        return_exceptions: bool = False,
+        timed: bool = False,
+    ) -> List[Any]:
+        """Blocking variant of :meth:`generate_batch` for synchronous callers."""
+        return self._run_sync(
+            self.generate_batch(
+                prompts,
+                max_concurrent or self.config.max_concurrent,
+                return_exceptions=return_exceptions,
+                timed=timed,
+            )
+        )
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="llm-client-loop", daemon=True
+                )
+                thread.start()
+                self._loop, self._loop_thread = loop, thread
+            return self._loop
+
+    def _run_sync(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run ``coro`` on the client loop and block until it finishes."""
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._loop_thread:
+            coro.close()
+            raise LLMGenerationError("Blocking LLM call made from the client loop")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def _on_client_loop(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Await ``coro`` on the client loop, which owns the HTTP connections."""
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
 
     def close(self):
         """Clean up resources."""
-        self._executor.shutdown(wait=True)
-        # No background loop to tear down
+        loop, thread = self._loop, self._loop_thread
+        if loop is not None and not loop.is_closed():
+            if self.client is not None:
+                try:
+                    asyncio.run_coroutine_threadsafe(self.client.close(), loop).result(
+                        timeout=5
+                    )
+                except Exception:  # pragma: no cover - best effort on shutdown
+                    logger.debug("Closing the LLM HTTP client failed", exc_info=True)
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout=5)
+            loop.close()
+        if self.cache is not None:
+            self.cache.close()
 
 
 # Singleton instance
@@ -404,6 +1081,11 @@ def get_llm_client() -> LLMClient:
     return _llm_client
 
 
+def llm_circuit_state() -> Dict[str, Any]:
+    """Snapshot of the shared client's circuit breaker."""
+    return get_llm_client().breaker.snapshot()
+
+
 async def enhance_press_release(
     press_type: str,
     base_content: str,
@@ -413,23 +1095,7 @@ async def enhance_press_release(
 ) -> str:
     """Enhance a press release with LLM-generated narrative."""
     client = get_llm_client()
-
-    # Create appropriate prompt based on press type
-    prompts = {
-        "academic_bulletin": f"Write an academic announcement: {base_content}",
-        "research_manifesto": f"Write a bold research manifesto: {base_content}",
-        "discovery_report": f"Write an exciting discovery report: {base_content}",
-        "retraction_notice": f"Write a humble retraction notice: {base_content}",
-        "academic_gossip": f"Write intriguing academic gossip: {base_content}",
-        "recruitment_report": f"Write a recruitment update: {base_content}",
-        "defection_notice": f"Write a dramatic defection announcement: {base_content}",
-        "mentorship_announcement": f"Write a mentorship announcement: {base_content}",
-        "conference_report": f"Write a conference debate summary: {base_content}",
-        "symposium_announcement": f"Write a symposium topic announcement: {base_content}",
-    }
-
-    prompt = prompts.get(press_type, f"Write about: {base_content}")
-    prompt = _augment_prompt_with_related(prompt, context)
+    prompt = _press_prompt(press_type, base_content, context)
 
     enhanced = await client.generate_narrative(
         prompt=prompt,
@@ -450,21 +1116,7 @@ def enhance_press_release_sync(
 ) -> str:
     """Synchronous variant backed by the client helper."""
 
-    prompt_map = {
-        "academic_bulletin": f"Write an academic announcement: {base_content}",
-        "research_manifesto": f"Write a bold research manifesto: {base_content}",
-        "discovery_report": f"Write an exciting discovery report: {base_content}",
-        "retraction_notice": f"Write a humble retraction notice: {base_content}",
-        "academic_gossip": f"Write intriguing academic gossip: {base_content}",
-        "recruitment_report": f"Write a recruitment update: {base_content}",
-        "defection_notice": f"Write a dramatic defection announcement: {base_content}",
-        "mentorship_announcement": f"Write a mentorship announcement: {base_content}",
-        "conference_report": f"Write a conference debate summary: {base_content}",
-        "symposium_announcement": f"Write a symposium topic announcement: {base_content}",
-    }
-    prompt = prompt_map.get(press_type, f"Write about: {base_content}")
-    prompt = _augment_prompt_with_related(prompt, context)
-
+    prompt = _press_prompt(press_type, base_content, context)
     client = get_llm_client()
     return client.generate_narrative_sync(
         prompt=prompt,
@@ -472,3 +1124,35 @@ def enhance_press_release_sync(
         persona_name=scholar_name,
         persona_traits=scholar_traits,
     )
+
+
+def enhance_press_releases_sync(
+    requests: List[Dict[str, Any]],
+    *,
+    max_concurrent: Optional[int] = None,
+) -> List[Tuple[Union[str, BaseException], float]]:
+    """Enhance several press releases concurrently through ``generate_batch``.
+
+    Each request holds the arguments of :func:`enhance_press_release_sync`
+    (``press_type``, ``base_content``, ``context`` and optionally
+    ``scholar_name``/``scholar_traits``). Results are ``(outcome,
+    duration_ms)`` pairs in request order; a request that fails yields its
+    exception so callers can fall back per item, and each duration times that
+    request alone.
+    """
+
+    client = get_llm_client()
+    prompts = [
+        {
+            "prompt": _press_prompt(
+                request["press_type"], request["base_content"], request["context"]
+            ),
+            "context": request["context"],
+            "persona_name": request.get("scholar_name"),
+            "persona_traits": request.get("scholar_traits"),
+        }
+        for request in requests
+    ]
+    return client.generate_batch_sync(
+        prompts, max_concurrent=max_concurrent, return_exceptions=True, timed=True
+    )
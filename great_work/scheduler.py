@@ -13,10 +13,12 @@ from typing import Callable, Optional
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from .analytics import write_calibration_snapshot
+from .archive_snapshots import SnapshotStore
 from .config import get_settings
 from .models import PressRelease
 from .service import GameService
 from .telemetry import get_telemetry
+from .tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +103,10 @@ class GazetteScheduler:
                 os.getenv("GREAT_WORK_ARCHIVE_MAX_STORAGE_MB"),
             )
             self._archive_storage_limit_mb = 0.0
+        self._archive_snapshot_codec = (
+            os.getenv("GREAT_WORK_ARCHIVE_SNAPSHOT_CODEC", "gzip").strip().lower()
+            or "gzip"
+        )
 
         calibration_flag = os.getenv("GREAT_WORK_CALIBRATION_SNAPSHOTS", "")
         calibration_dir_env = os.getenv("GREAT_WORK_CALIBRATION_SNAPSHOT_DIR", "")
@@ -192,6 +198,7 @@ class GazetteScheduler:
     def shutdown(self) -> None:
         self.scheduler.shutdown(wait=False)
 
+    @traced("scheduler.publish_digest")
     def _publish_digest(self) -> None:
         start = time.perf_counter()
         current_time = datetime.now(timezone.utc)
@@ -232,7 +239,7 @@ class GazetteScheduler:
         # Export web archive after digest
         try:
             archive_path = self.service.export_web_archive(
-                Path("web_archive"), source="scheduler"
+                Path("web_archive"), source="scheduler", incremental=True
             )
             logger.info(f"Web archive exported to {archive_path}")
             self._publish_to_container(archive_path)
@@ -325,14 +332,50 @@ class GazetteScheduler:
         except Exception:  # pragma: no cover - diagnostics only
             logger.exception("Failed to write calibration snapshot")
 
+    def _snapshot_store(self, snapshots_dir: Path) -> SnapshotStore:
+        try:
+            return SnapshotStore(snapshots_dir, codec=self._archive_snapshot_codec)
+        except ValueError:
+            logger.warning(
+                "Invalid GREAT_WORK_ARCHIVE_SNAPSHOT_CODEC=%s; using gzip",
+                self._archive_snapshot_codec,
+            )
+            return SnapshotStore(snapshots_dir)
+
     def _package_archive(self, archive_dir: Path) -> Path:
-        """Create a timestamped ZIP snapshot of the archive directory."""
+        """Snapshot the archive directory and return a ZIP of it for upload.
+
+        The snapshot itself goes into the content-addressed store, so only
+        pages that changed since retained snapshots take new space. The ZIP is
+        a transient copy for the admin channel; only the latest is kept.
+        """
 
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         snapshots_dir = archive_dir.parent / "snapshots"
         snapshots_dir.mkdir(parents=True, exist_ok=True)
-        base_name = snapshots_dir / f"web_archive_{timestamp}"
-        zip_file = shutil.make_archive(str(base_name), "zip", root_dir=archive_dir)
+        store = self._snapshot_store(snapshots_dir)
+        name = f"web_archive_{timestamp}"
+        attempt = 1
+        while True:
+            # Two packages in the same second must not share a manifest.
+            try:
+                result = store.snapshot(archive_dir, name)
+                break
+            except FileExistsError:
+                attempt += 1
+                name = f"web_archive_{timestamp}_{attempt}"
+        logger.info(
+            "Stored archive snapshot %s: %d files, %d new objects (%d bytes)",
+            name,
+            result.files,
+            result.new_objects,
+            result.new_bytes,
+        )
+        outbox = snapshots_dir / "outbox"
+        outbox.mkdir(exist_ok=True)
+        for stale in outbox.glob("web_archive_*.zip"):
+            stale.unlink(missing_ok=True)
+        zip_file = shutil.make_archive(str(outbox / name), "zip", root_dir=archive_dir)
         snapshot_path = Path(zip_file)
         if self._archive_snapshot_limit > 0:
             self._prune_snapshots(snapshots_dir)
@@ -388,6 +431,15 @@ class GazetteScheduler:
                 logger.info("Pruned archive snapshot %s", stale)
             except Exception:  # pragma: no cover - defensive cleanup
                 logger.exception("Failed to prune snapshot %s", stale)
+        try:
+            pruned = self._snapshot_store(snapshots_dir).prune(
+                self._archive_snapshot_limit
+            )
+        except Exception:  # pragma: no cover - defensive cleanup
+            logger.exception("Failed to prune snapshot store in %s", snapshots_dir)
+            return
+        for name in pruned:
+            logger.info("Pruned archive snapshot %s", name)
 
     def _publish_to_pages(self, archive_path: Path) -> None:
         """Copy the archive to a GitHub Pages working directory if configured."""
@@ -447,20 +499,27 @@ class GazetteScheduler:
         if not snapshots_dir.exists():
             return
 
-        total_bytes = 0
-        for snapshot in snapshots_dir.glob("web_archive_*.zip"):
-            try:
-                total_bytes += snapshot.stat().st_size
-            except OSError:
-                continue
+        # Deduplicated store plus any legacy or outbox ZIPs actually on disk.
+        usage = self._snapshot_store(snapshots_dir).usage()
+        total_bytes = usage.stored_bytes
+        for pattern in ("web_archive_*.zip", "outbox/web_archive_*.zip"):
+            for snapshot in snapshots_dir.glob(pattern):
+                try:
+                    total_bytes += snapshot.stat().st_size
+                except OSError:
+                    continue
 
         total_mb = total_bytes / (1024 * 1024)
+        logical_mb = usage.logical_bytes / (1024 * 1024)
         telemetry = get_telemetry()
         try:
             telemetry.track_system_event(
                 "archive_snapshot_usage",
                 source="gazette_scheduler",
-                reason=f"{total_mb:.2f} MB",
+                reason=(
+                    f"{total_mb:.2f} MB ({usage.snapshots} snapshots, "
+                    f"{logical_mb:.2f} MB before dedup)"
+                ),
             )
         except Exception:  # pragma: no cover - telemetry shouldn't break scheduler
             logger.debug("Failed to record archive snapshot usage", exc_info=True)
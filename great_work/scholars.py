@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 import math
-from dataclasses import asdict
+from dataclasses import asdict, replace
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
 
 import yaml
 
-from .models import MemoryFact, Scholar, ScholarStats
+from .models import Memory, MemoryFact, Scholar, ScholarStats
 from .rng import DeterministicRNG
 
 _DATA_PATH = Path(__file__).parent / "data"
@@ -151,9 +151,11 @@ class ScholarRepository:
         )
         return scholar
 
-    def serialize(self, scholar: Scholar) -> Dict:
-        data = asdict(scholar)
+    def serialize(self, scholar: Scholar, *, include_facts: bool = True) -> Dict:
+        # Skip deep-copying the (unbounded) fact log; it is rebuilt below.
+        data = asdict(replace(scholar, memory=Memory()))
         data["stats"] = asdict(scholar.stats)
+        facts = scholar.memory.facts if include_facts else []
         data["memory"] = {
             "facts": [
                 {
@@ -162,7 +164,7 @@ class ScholarRepository:
                     "who": fact.subject,
                     **fact.details,
                 }
-                for fact in scholar.memory.facts
+                for fact in facts
             ],
             "feelings": scholar.memory.feelings,
             "scars": scholar.memory.scars,
@@ -9,7 +9,7 @@ import random
 import textwrap
 import threading
 import time
-from collections import defaultdict, deque
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -18,9 +18,12 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 from .config import Settings, get_settings
 from .expeditions import ExpeditionResolver, FailureTables
 from .llm_client import (
+    LLMCircuitOpenError,
     LLMGenerationError,
     LLMNotEnabledError,
     enhance_press_release_sync,
+    enhance_press_releases_sync,
+    llm_circuit_state,
 )
 from .models import (
     ConfidenceLevel,
@@ -69,6 +72,7 @@ from .rng import DeterministicRNG
 from .scholars import ScholarRepository, apply_scar, defection_probability
 from .state import GameState
 from .telemetry import get_telemetry
+from .tracing import child_span, trace_span, traced
 
 logger = logging.getLogger(__name__)
 
@@ -180,6 +184,9 @@ class GameService:
             repository=self.repository,
             start_year=self.settings.timeline_start_year,
             admin_notifier=self._queue_admin_notification,
+            write_behind_seconds=float(
+                os.getenv("GREAT_WORK_STATE_WRITE_BEHIND_SECONDS", "0")
+            ),
         )
         self.resolver = ExpeditionResolver(failure_tables or FailureTables())
         self._rng = DeterministicRNG(seed=42)
@@ -311,6 +318,7 @@ class GameService:
                 "Telemetry tracking for moderation event failed", exc_info=True
             )
 
+    @traced("moderation.player_input", start_trace=False)
     def _moderate_player_text(
         self,
         *,
@@ -350,6 +358,7 @@ class GameService:
                 text=text,
             )
 
+    @traced("moderation.llm_output", start_trace=False)
     def _moderate_generated_text(
         self,
         *,
@@ -462,6 +471,7 @@ class GameService:
         upcoming.sort(key=lambda item: item["release_at"])
         return upcoming[:limit]
 
+    @traced("service.create_digest_highlights", start_trace=False)
     def create_digest_highlights(
         self,
         *,
@@ -740,6 +750,7 @@ class GameService:
                 }
         return None
 
+    @traced("service.enhance_press_release", start_trace=False)
     def _enhance_press_release(
         self,
         release: PressRelease,
@@ -749,6 +760,90 @@ class GameService:
         persona_traits: Optional[Dict[str, object]] = None,
         extra_context: Optional[Dict[str, object]] = None,
     ) -> PressRelease:
+        start_time = time.perf_counter()
+        context_payload = self._press_enhancement_context(
+            release, base_body, extra_context
+        )
+        try:
+            with child_span("llm.enhance_press_release", press_type=release.type):
+                outcome: str | Exception = enhance_press_release_sync(
+                    release.type,
+                    base_body,
+                    context_payload,
+                    persona_name,
+                    persona_traits,
+                )
+        except (LLMGenerationError, LLMNotEnabledError) as exc:
+            outcome = exc
+        return self._apply_press_enhancement(
+            release,
+            outcome,
+            base_body=base_body,
+            persona_name=persona_name,
+            duration_ms=(time.perf_counter() - start_time) * 1000,
+        )
+
+    @traced("service.enhance_press_releases", start_trace=False)
+    def _enhance_press_releases(
+        self, requests: List[Dict[str, Any]]
+    ) -> List[PressRelease]:
+        """Enhance several releases with their LLM calls in flight together.
+
+        Each request holds the keyword arguments of ``_enhance_press_release``
+        plus ``release``. Calls run concurrently up to ``LLM_MAX_CONCURRENT``;
+        results are applied in request order, each falling back to its own
+        base body on failure, and the pause check is repeated before each one
+        so a failure that pauses the game stops the rest as it would serially.
+        """
+
+        if len(requests) <= 1:
+            return [self._enhance_press_release(**request) for request in requests]
+        contexts = [
+            self._press_enhancement_context(
+                request["release"], request["base_body"], request.get("extra_context")
+            )
+            for request in requests
+        ]
+        with child_span("llm.enhance_press_releases", count=len(requests)):
+            outcomes = enhance_press_releases_sync(
+                [
+                    {
+                        "press_type": request["release"].type,
+                        "base_content": request["base_body"],
+                        "context": context,
+                        "scholar_name": request.get("persona_name"),
+                        "scholar_traits": request.get("persona_traits"),
+                    }
+                    for request, context in zip(requests, contexts)
+                ]
+            )
+        enhanced: List[PressRelease] = []
+        for index, (request, (outcome, duration_ms)) in enumerate(
+            zip(requests, outcomes)
+        ):
+            release = request["release"]
+            if index:
+                self._ensure_press_enhancement_allowed(
+                    release, request.get("extra_context")
+                )
+            if isinstance(outcome, BaseException) and not isinstance(
+                outcome, LLMGenerationError
+            ):
+                raise outcome
+            enhanced.append(
+                self._apply_press_enhancement(
+                    release,
+                    outcome,
+                    base_body=request["base_body"],
+                    persona_name=request.get("persona_name"),
+                    duration_ms=duration_ms,
+                )
+            )
+        return enhanced
+
+    def _ensure_press_enhancement_allowed(
+        self, release: PressRelease, extra_context: Optional[Dict[str, object]]
+    ) -> None:
         allowed_while_paused = {
             "admin_action",
             "admin_update",
@@ -761,11 +856,14 @@ class GameService:
             and event_type != "admin"
         ):
             raise GameService.GamePausedError(self._pause_reason or "Game is paused")
-        telemetry = getattr(self, "_telemetry", None)
-        if telemetry is None:
-            telemetry = get_telemetry()
-            self._telemetry = telemetry
-        start_time = time.perf_counter()
+
+    def _press_enhancement_context(
+        self,
+        release: PressRelease,
+        base_body: str,
+        extra_context: Optional[Dict[str, object]],
+    ) -> Dict[str, object]:
+        self._ensure_press_enhancement_allowed(release, extra_context)
         context_payload: Dict[str, object] = {
             "type": release.type,
             "headline": release.headline,
@@ -776,47 +874,59 @@ class GameService:
         related_press = self._fetch_related_press(release, base_body)
         if related_press:
             context_payload["related_press"] = related_press
-        try:
-            enhanced_body = enhance_press_release_sync(
-                release.type,
-                base_body,
-                context_payload,
-                persona_name,
-                persona_traits,
-            )
-            self._clear_llm_failure()
-            self._resume_from_llm()
-            duration_ms = (time.perf_counter() - start_time) * 1000
-            try:
-                telemetry.track_llm_activity(
-                    release.type,
-                    success=True,
-                    duration_ms=duration_ms,
-                    persona=persona_name,
-                )
-            except Exception:
-                logger.debug("Telemetry tracking for LLM success failed", exc_info=True)
-        except (LLMGenerationError, LLMNotEnabledError) as exc:
-            logger.warning("LLM enhancement failed for %s: %s", release.type, exc)
-            duration_ms = (time.perf_counter() - start_time) * 1000
+        return context_payload
+
+    def _apply_press_enhancement(
+        self,
+        release: PressRelease,
+        outcome: str | BaseException,
+        *,
+        base_body: str,
+        persona_name: Optional[str],
+        duration_ms: float,
+    ) -> PressRelease:
+        telemetry = getattr(self, "_telemetry", None)
+        if telemetry is None:
+            telemetry = get_telemetry()
+            self._telemetry = telemetry
+        if getattr(outcome, "cache_status", None) == "short_circuit":
+            # The client's circuit breaker is open and it answered with a
+            # template: keep the base body and count it as an outage.
+            reason = llm_circuit_state().get("reason") or "upstream unavailable"
+            outcome = LLMCircuitOpenError(f"LLM circuit open: {reason}")
+        if isinstance(outcome, BaseException):
+            logger.warning("LLM enhancement failed for %s: %s", release.type, outcome)
             try:
                 telemetry.track_llm_activity(
                     release.type,
                     success=False,
                     duration_ms=duration_ms,
                     persona=persona_name,
-                    error=str(exc),
+                    error=str(outcome),
                 )
             except Exception:
                 logger.debug("Telemetry tracking for LLM failure failed", exc_info=True)
             if self._register_llm_failure():
-                self._pause_for_llm(str(exc))
+                self._pause_for_llm(str(outcome))
             return release
 
+        self._clear_llm_failure()
+        self._resume_from_llm()
+        try:
+            telemetry.track_llm_activity(
+                release.type,
+                success=True,
+                duration_ms=duration_ms,
+                persona=persona_name,
+                cache=getattr(outcome, "cache_status", None),
+            )
+        except Exception:
+            logger.debug("Telemetry tracking for LLM success failed", exc_info=True)
+
         moderated_body, moderation_decision = self._moderate_generated_text(
             surface=release.type,
             actor=persona_name,
-            generated=enhanced_body,
+            generated=outcome,
             fallback=base_body,
         )
         release.body = moderated_body
@@ -1293,21 +1403,23 @@ class GameService:
         """Alias for resolve_pending_expeditions for backward compatibility."""
         return self.resolve_pending_expeditions()
 
+    @traced("service.resolve_pending_expeditions")
     def resolve_pending_expeditions(self) -> List[PressRelease]:
         self._ensure_not_paused()
         releases: List[PressRelease] = []
         releases.extend(self.release_scheduled_press())
         for code, order in list(self._pending_expeditions.items()):
+            # Roll, write the press and enhance every layer before the unit of
+            # work opens; the transaction below only persists the outcome.
             result = self.resolver.resolve(
-                self._rng, order.preparation, order.prep_depth, order.expedition_type
+                self._rng,
+                order.preparation,
+                order.prep_depth,
+                order.expedition_type,
             )
             delta = self._confidence_delta(order.confidence, result.outcome)
             player = self.state.get_player(order.player_id)
             assert player is not None
-            new_reputation = self._apply_reputation_change(
-                player, delta, order.confidence
-            )
-            self.state.upsert_player(player)
             reactions = self._generate_reactions(order.team, result)
             ctx = OutcomeContext(
                 code=code,
@@ -1336,9 +1448,7 @@ class GameService:
                 persona_traits=None,
                 extra_context=context_payload,
             )
-            releases.append(release)
             now = datetime.now(timezone.utc)
-            self._archive_press(release, now)
             prep_summary = self._summarize_preparation(order.preparation)
             team_names = self._team_member_names(order.team)
             expedition_ctx = ExpeditionContext(
@@ -1368,65 +1478,76 @@ class GameService:
                 preparation_summary=prep_summary,
                 team_names=team_names,
             )
-            extra_releases = self._apply_multi_press_layers(
+            rendered_layers = self._render_multi_press_layers(
                 layers,
                 skip_types={"research_manifesto", release.type},
-                timestamp=now,
                 event_type="expedition",
             )
-            releases.extend(extra_releases)
-            self.state.append_event(
-                Event(
-                    timestamp=now,
-                    action="expedition_resolved",
-                    payload={
-                        "code": code,
-                        "player": order.player_id,
-                        "type": order.expedition_type,
-                        "result": result.outcome.value,
+            with self.state.transaction():
+                new_reputation = self._apply_reputation_change(
+                    player, delta, order.confidence
+                )
+                self.state.upsert_player(player)
+                releases.append(release)
+                self._archive_press(release, now)
+                extra_releases = self._publish_multi_press_layers(
+                    rendered_layers, timestamp=now, event_type="expedition"
+                )
+                releases.extend(extra_releases)
+                self.state.append_event(
+                    Event(
+                        timestamp=now,
+                        action="expedition_resolved",
+                        payload={
+                            "code": code,
+                            "player": order.player_id,
+                            "type": order.expedition_type,
+                            "result": result.outcome.value,
+                            "roll": result.roll,
+                            "modifier": result.modifier,
+                            "final": result.final_score,
+                            "confidence": order.confidence.value,
+                            "reputation_delta": delta,
+                            "reputation_after": new_reputation,
+                        },
+                    )
+                )
+                record = ExpeditionRecord(
+                    code=order.code,
+                    player_id=order.player_id,
+                    expedition_type=order.expedition_type,
+                    objective=order.objective,
+                    team=order.team,
+                    funding=order.funding,
+                    prep_depth=order.prep_depth,
+                    confidence=order.confidence.value,
+                    outcome=result.outcome.value,
+                    reputation_delta=delta,
+                    timestamp=order.timestamp,
+                )
+                self.state.record_expedition(
+                    record,
+                    result_payload={
                         "roll": result.roll,
                         "modifier": result.modifier,
                         "final": result.final_score,
-                        "confidence": order.confidence.value,
-                        "reputation_delta": delta,
-                        "reputation_after": new_reputation,
+                        "sideways": result.sideways_discovery,
+                        "failure": result.failure_detail,
                     },
                 )
-            )
-            record = ExpeditionRecord(
-                code=order.code,
-                player_id=order.player_id,
-                expedition_type=order.expedition_type,
-                objective=order.objective,
-                team=order.team,
-                funding=order.funding,
-                prep_depth=order.prep_depth,
-                confidence=order.confidence.value,
-                outcome=result.outcome.value,
-                reputation_delta=delta,
-                timestamp=order.timestamp,
-            )
-            self.state.record_expedition(
-                record,
-                result_payload={
-                    "roll": result.roll,
-                    "modifier": result.modifier,
-                    "final": result.final_score,
-                    "sideways": result.sideways_discovery,
-                    "failure": result.failure_detail,
-                },
-            )
-            self._apply_expedition_rewards(player, order.expedition_type, result)
-            self.state.upsert_player(player)
-            self._update_relationships_from_result(order, result)
-            # Apply sideways discovery effects if present
-            if result.sideways_effects:
-                effect_releases = self._apply_sideways_effects(order, result, player)
-                releases.extend(effect_releases)
-            sidecast = self._maybe_spawn_sidecast(order, result)
-            if sidecast:
-                releases.append(sidecast)
-                self._archive_press(sidecast, now)
+                self._apply_expedition_rewards(player, order.expedition_type, result)
+                self.state.upsert_player(player)
+                self._update_relationships_from_result(order, result)
+                # Apply sideways discovery effects if present
+                if result.sideways_effects:
+                    effect_releases = self._apply_sideways_effects(
+                        order, result, player
+                    )
+                    releases.extend(effect_releases)
+                sidecast = self._maybe_spawn_sidecast(order, result)
+                if sidecast:
+                    releases.append(sidecast)
+                    self._archive_press(sidecast, now)
             del self._pending_expeditions[code]
         releases.extend(self.release_scheduled_press())
         return releases
@@ -1657,11 +1778,9 @@ class GameService:
         increments = amount // step
         relationship_bonus = increments * self.settings.faction_investment_feeling_bonus
         if relationship_bonus:
-            for scholar in self.state.all_scholars():
-                if scholar.contract.get("employer") != player.id:
-                    continue
-                if faction and scholar.contract.get("faction") != faction:
-                    continue
+            for scholar in self.state.scholars_employed_by(
+                player.id, faction=faction or None
+            ):
                 scholar.memory.adjust_feeling(player.id, relationship_bonus)
                 self.state.save_scholar(scholar)
 
@@ -3959,121 +4078,126 @@ class GameService:
             }[winner_option]
             winner = str(winner_option)
 
-        # Resolve the topic
-        self.state.resolve_symposium_topic(topic_id, winner)
-        self.state.cancel_symposium_reminders(topic_id)
+        with self.state.transaction():
+            # Resolve the topic
+            self.state.resolve_symposium_topic(topic_id, winner)
+            self.state.cancel_symposium_reminders(topic_id)
 
-        topic_meta = self.state.get_symposium_topic(topic_id)
-        if proposal_id and topic_meta is not None:
-            self.state.update_symposium_proposal_status(
-                proposal_id,
-                status="resolved",
-                selected_topic_id=topic_id,
-            )
-        # Generate press release with pledge outcomes
-        player_records = list(self.state.all_players())
-        voted_players = set(self.state.list_symposium_voters(topic_id))
-        non_voter_players = [
-            player for player in player_records if player.id not in voted_players
-        ]
-        penalty_records: List[Dict[str, object]] = []
-        now = datetime.now(timezone.utc)
-        for player in non_voter_players:
-            pledge = self.state.get_symposium_pledge(
-                topic_id=topic_id, player_id=player.id
-            )
-            if not pledge or pledge.get("status") in {"forfeited", "waived"}:
-                continue
-            penalty_record = self._handle_symposium_non_voter(
-                topic_id=topic_id,
-                player=player,
-                pledge=pledge,
-                now=now,
-            )
-            if penalty_record:
-                penalty_records.append(penalty_record)
-        # Ensure any pending pledges for voters are fulfilled
-        for player in player_records:
-            if player.id in voted_players:
+            topic_meta = self.state.get_symposium_topic(topic_id)
+            if proposal_id and topic_meta is not None:
+                self.state.update_symposium_proposal_status(
+                    proposal_id,
+                    status="resolved",
+                    selected_topic_id=topic_id,
+                )
+            # Generate press release with pledge outcomes
+            player_records = list(self.state.all_players())
+            voted_players = set(self.state.list_symposium_voters(topic_id))
+            non_voter_players = [
+                player for player in player_records if player.id not in voted_players
+            ]
+            penalty_records: List[Dict[str, object]] = []
+            now = datetime.now(timezone.utc)
+            for player in non_voter_players:
                 pledge = self.state.get_symposium_pledge(
                     topic_id=topic_id, player_id=player.id
                 )
-                if pledge and pledge.get("status") == "pending":
-                    self.state.update_symposium_pledge_status(
-                        topic_id=topic_id,
-                        player_id=player.id,
-                        status="fulfilled",
-                        resolved_at=now,
+                if not pledge or pledge.get("status") in {"forfeited", "waived"}:
+                    continue
+                penalty_record = self._handle_symposium_non_voter(
+                    topic_id=topic_id,
+                    player=player,
+                    pledge=pledge,
+                    now=now,
+                )
+                if penalty_record:
+                    penalty_records.append(penalty_record)
+            # Ensure any pending pledges for voters are fulfilled
+            for player in player_records:
+                if player.id in voted_players:
+                    pledge = self.state.get_symposium_pledge(
+                        topic_id=topic_id, player_id=player.id
                     )
+                    if pledge and pledge.get("status") == "pending":
+                        self.state.update_symposium_pledge_status(
+                            topic_id=topic_id,
+                            player_id=player.id,
+                            status="fulfilled",
+                            resolved_at=now,
+                        )
 
-        non_voters = [player.display_name for player in non_voter_players]
-        body_lines = [
-            f"The symposium on '{topic}' has concluded.",
-            "",
-            f"Result: {winner_text}",
-            "",
-            "The Academy thanks all participants for their thoughtful contributions.",
-        ]
-        if non_voters:
-            body_lines.append("")
-            body_lines.append(
-                "Outstanding responses required from: " + ", ".join(non_voters)
+            non_voters = [player.display_name for player in non_voter_players]
+            body_lines = [
+                f"The symposium on '{topic}' has concluded.",
+                "",
+                f"Result: {winner_text}",
+                "",
+                "The Academy thanks all participants for their thoughtful contributions.",
+            ]
+            if non_voters:
+                body_lines.append("")
+                body_lines.append(
+                    "Outstanding responses required from: " + ", ".join(non_voters)
+                )
+            if penalty_records:
+                body_lines.append("")
+                body_lines.append("Participation stakes:")
+                for record in penalty_records:
+                    if record["status"] == "waived":
+                        body_lines.append(
+                            f"- {record['display_name']} invoked grace; no influence forfeited."
+                        )
+                    elif record["deducted"] > 0 and record["faction"]:
+                        body_lines.append(
+                            f"- {record['display_name']} forfeits {record['deducted']} {record['faction']} influence."
+                        )
+                    else:
+                        body_lines.append(
+                            f"- {record['display_name']} lacked influence to cover the {record['pledge_amount']} pledge."
+                        )
+                    remaining = record.get("remaining_debt", 0)
+                    if remaining:
+                        body_lines.append(
+                            f"  Outstanding debt recorded: {remaining} influence."
+                        )
+            forfeited_total = sum(
+                record.get("deducted", 0)
+                for record in penalty_records
+                if record["status"] in {"forfeited", "debt"}
             )
-        if penalty_records:
-            body_lines.append("")
-            body_lines.append("Participation stakes:")
-            for record in penalty_records:
-                if record["status"] == "waived":
-                    body_lines.append(
-                        f"- {record['display_name']} invoked grace; no influence forfeited."
-                    )
-                elif record["deducted"] > 0 and record["faction"]:
-                    body_lines.append(
-                        f"- {record['display_name']} forfeits {record['deducted']} {record['faction']} influence."
-                    )
-                else:
-                    body_lines.append(
-                        f"- {record['display_name']} lacked influence to cover the {record['pledge_amount']} pledge."
-                    )
-                remaining = record.get("remaining_debt", 0)
-                if remaining:
-                    body_lines.append(
-                        f"  Outstanding debt recorded: {remaining} influence."
-                    )
-        forfeited_total = sum(
-            record.get("deducted", 0)
-            for record in penalty_records
-            if record["status"] in {"forfeited", "debt"}
-        )
-        waived_total = sum(
-            1 for record in penalty_records if record["status"] == "waived"
-        )
-        try:
-            self._telemetry.track_game_progression(
-                "symposium_penalties",
-                float(forfeited_total),
-                details={
+            waived_total = sum(
+                1 for record in penalty_records if record["status"] == "waived"
+            )
+            try:
+                self._telemetry.track_game_progression(
+                    "symposium_penalties",
+                    float(forfeited_total),
+                    details={
+                        "topic_id": topic_id,
+                        "waived": waived_total,
+                        "non_voters": len(non_voter_players),
+                    },
+                )
+            except Exception:  # pragma: no cover - telemetry optional
+                logger.debug(
+                    "Failed to record symposium penalty telemetry", exc_info=True
+                )
+            press = PressRelease(
+                type="symposium_resolution",
+                headline=f"Symposium Resolved: {topic}",
+                body="\n".join(body_lines),
+                metadata={
                     "topic_id": topic_id,
-                    "waived": waived_total,
-                    "non_voters": len(non_voter_players),
+                    "topic": topic,
+                    "winner": winner,
+                    "votes": votes,
+                    "proposal_id": proposal_id,
+                    "non_voters": non_voters,
+                    "penalties": penalty_records,
                 },
             )
-        except Exception:  # pragma: no cover - telemetry optional
-            logger.debug("Failed to record symposium penalty telemetry", exc_info=True)
-        press = PressRelease(
-            type="symposium_resolution",
-            headline=f"Symposium Resolved: {topic}",
-            body="\n".join(body_lines),
-            metadata={
-                "topic_id": topic_id,
-                "topic": topic,
-                "winner": winner,
-                "votes": votes,
-                "proposal_id": proposal_id,
-                "non_voters": non_voters,
-                "penalties": penalty_records,
-            },
-        )
+        # The pledges are settled; enhance and layer the announcement outside
+        # that unit of work, then archive it in a second, short one.
         press = self._enhance_press_release(
             press,
             base_body=press.body,
@@ -4085,23 +4209,6 @@ class GameService:
                 "winner": winner,
             },
         )
-
-        self._archive_press(press, now)
-        self.state.append_event(
-            Event(
-                timestamp=now,
-                action="symposium_resolved",
-                payload={
-                    "topic_id": topic_id,
-                    "winner": winner,
-                    "votes": votes,
-                    "proposal_id": proposal_id,
-                    "non_voters": non_voters,
-                    "penalties": penalty_records,
-                },
-            )
-        )
-
         layers = self._multi_press.generate_symposium_layers(
             topic,
             description,
@@ -4109,13 +4216,28 @@ class GameService:
             scholars=list(self.state.all_scholars()),
             votes=votes,
         )
-        self._apply_multi_press_layers(
-            layers,
-            skip_types={press.type},
-            timestamp=now,
-            event_type="symposium",
+        rendered_layers = self._render_multi_press_layers(
+            layers, skip_types={press.type}, event_type="symposium"
         )
-
+        with self.state.transaction():
+            self._archive_press(press, now)
+            self.state.append_event(
+                Event(
+                    timestamp=now,
+                    action="symposium_resolved",
+                    payload={
+                        "topic_id": topic_id,
+                        "winner": winner,
+                        "votes": votes,
+                        "proposal_id": proposal_id,
+                        "non_voters": non_voters,
+                        "penalties": penalty_records,
+                    },
+                )
+            )
+            self._publish_multi_press_layers(
+                rendered_layers, timestamp=now, event_type="symposium"
+            )
         return press
 
     # Symposium helpers -------------------------------------------------
@@ -4615,14 +4737,7 @@ class GameService:
         }
 
     def _contract_commitments(self) -> Dict[str, Dict[str, int]]:
-        commitments: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
-        for scholar in self.state.all_scholars():
-            contract = getattr(scholar, "contract", {}) or {}
-            employer = contract.get("employer")
-            faction = contract.get("faction")
-            if employer and faction:
-                commitments[employer][faction] += 1
-        return {player: dict(factions) for player, factions in commitments.items()}
+        return self.state.scholar_contract_counts()
 
     def _apply_contract_upkeep(self, now: datetime) -> None:
         upkeep = max(0, self.settings.contract_upkeep_per_scholar)
@@ -5929,16 +6044,19 @@ class GameService:
         press = self.state.list_press_releases(limit=limit)
         return {"events": events[-limit:], "press": press}
 
+    @traced("service.export_web_archive")
     def export_web_archive(
         self,
         output_dir: Path | None = None,
         *,
         source: str = "manual",
+        incremental: bool = False,
     ) -> Path:
         """Export the complete game history as a static web archive.
 
         Args:
             output_dir: Directory to export to. Defaults to ./web_archive
+            incremental: Only render pages that changed since the last export
 
         Returns:
             Path to the exported archive directory
@@ -5951,7 +6069,10 @@ class GameService:
         base_url = os.getenv("GREAT_WORK_ARCHIVE_BASE_URL")
 
         archive = WebArchive(self.state, output_dir, base_url=base_url)
-        result = archive.export_full_archive()
+        if incremental:
+            result = archive.export_incremental_archive()
+        else:
+            result = archive.export_full_archive()
         try:
             self._telemetry.track_system_event(
                 "web_archive_export",
@@ -5964,18 +6085,53 @@ class GameService:
             )
         return result
 
+    @traced("service.advance_digest")
     def advance_digest(self) -> List[PressRelease]:
-        """Advance the digest tick, decaying cooldowns and maintaining the roster."""
+        """Advance the digest tick, decaying cooldowns and maintaining the roster.
+
+        Each sub-step runs as its own state transaction so it commits once and a
+        failure part-way through never leaves that step half-applied. Steps that
+        generate LLM press commit per item instead, after the press is written,
+        so no LLM round trip runs while SQLite's write lock is held.
+        """
 
         self._ensure_not_paused()
         releases: List[PressRelease] = []
         now = datetime.now(timezone.utc)
-        expired_ids = self.state.expire_symposium_proposals(now)
+        with trace_span("digest.expire_symposium_proposals"), self.state.transaction():
+            expired_ids = self.state.expire_symposium_proposals(now)
         if expired_ids:
             self._queue_admin_notification(
                 f"🗂️ Expired {len(expired_ids)} symposium proposal(s) during digest."
             )
-        releases.extend(self.release_scheduled_press(now))
+        with trace_span("digest.release_scheduled_press"):
+            releases.extend(self.release_scheduled_press(now))
+        with trace_span("digest.advance_timeline"), self.state.transaction():
+            releases.extend(self._advance_timeline_step(now))
+        with trace_span("digest.tick_cooldowns"), self.state.transaction():
+            for player in list(self.state.all_players()):
+                player.tick_cooldowns()
+                self.state.upsert_player(player)
+        with trace_span("digest.ensure_roster"), self.state.transaction():
+            self._ensure_roster()
+        with trace_span("digest.progress_careers"):
+            releases.extend(self._progress_careers())
+        with trace_span("digest.resolve_followups"):
+            releases.extend(self._resolve_followups())
+        with trace_span("digest.symposium_reminders"):
+            releases.extend(self._process_symposium_reminders())
+        with trace_span("digest.contract_upkeep"), self.state.transaction():
+            self._apply_contract_upkeep(now)
+        with trace_span("digest.seasonal_commitments"), self.state.transaction():
+            releases.extend(self._apply_seasonal_commitments(now))
+        with trace_span("digest.faction_projects"), self.state.transaction():
+            releases.extend(self._advance_faction_projects(now))
+        with trace_span("digest.resolve_conferences"), self.state.transaction():
+            releases.extend(self.resolve_conferences())
+        return releases
+
+    def _advance_timeline_step(self, now: datetime) -> List[PressRelease]:
+        releases: List[PressRelease] = []
         years_elapsed, current_year = self.state.advance_timeline(
             now, self.settings.time_scale_days_per_year
         )
@@ -6004,17 +6160,6 @@ class GameService:
                 )
             )
             releases.append(timeline_press)
-        for player in list(self.state.all_players()):
-            player.tick_cooldowns()
-            self.state.upsert_player(player)
-        self._ensure_roster()
-        releases.extend(self._progress_careers())
-        releases.extend(self._resolve_followups())
-        releases.extend(self._process_symposium_reminders())
-        self._apply_contract_upkeep(now)
-        releases.extend(self._apply_seasonal_commitments(now))
-        releases.extend(self._advance_faction_projects(now))
-        releases.extend(self.resolve_conferences())
         return releases
 
     def _confidence_delta(
@@ -6090,6 +6235,7 @@ class GameService:
             )
             return None
 
+    @traced("service.fetch_related_press", start_trace=False)
     def _fetch_related_press(
         self,
         release: PressRelease,
@@ -6233,26 +6379,73 @@ class GameService:
             if not mentorship:
                 continue  # No mentor, no progression
 
-            track = scholar.career.get("track", "Academia")
+            # Work on a copy so the cached scholar only changes once the
+            # progression is persisted.
+            career = dict(scholar.career)
+            track = career.get("track", "Academia")
             ladder = self._CAREER_TRACKS.get(track, self._CAREER_TRACKS["Academia"])
-            tier = scholar.career.get("tier", ladder[0])
-            ticks = int(scholar.career.get("ticks", 0)) + 1
-            scholar.career["ticks"] = ticks
+            tier = career.get("tier", ladder[0])
+            ticks = int(career.get("ticks", 0)) + 1
+            career["ticks"] = ticks
             if tier not in ladder:
                 ladder = self._CAREER_TRACKS["Academia"]
                 tier = ladder[0]
-                scholar.career["tier"] = tier
+                career["tier"] = tier
             idx = ladder.index(tier)
-            if idx < len(ladder) - 1 and ticks >= self._CAREER_TICKS_REQUIRED:
-                scholar.career["tier"] = ladder[idx + 1]
-                scholar.career["ticks"] = 0
+            if not (idx < len(ladder) - 1 and ticks >= self._CAREER_TICKS_REQUIRED):
+                scholar.career = career
+                self.state.save_scholar(scholar)
+                continue
 
-                # Get mentor's name for the press release
-                mentor_player = self.state.get_player(mentorship[1])
-                mentor_name = (
-                    mentor_player.display_name if mentor_player else "their mentor"
+            career["tier"] = ladder[idx + 1]
+            career["ticks"] = 0
+            # Complete mentorship after max tier reached
+            completed = idx == len(ladder) - 2
+
+            # Get mentor's name for the press release
+            mentor_player = self.state.get_player(mentorship[1])
+            mentor_name = (
+                mentor_player.display_name if mentor_player else "their mentor"
+            )
+
+            # Render and enhance every press layer before the unit of work.
+            quote = f"Advanced to {career['tier']} under the guidance of {mentor_name}."
+            press = academic_gossip(
+                GossipContext(
+                    scholar=scholar.name, quote=quote, trigger="Career advancement"
+                ),
+            )
+            rendered_layers = self._render_multi_press_layers(
+                self._multi_press.generate_mentorship_layers(
+                    mentor=mentor_name,
+                    scholar=scholar,
+                    phase="progression",
+                    track=track,
+                ),
+                skip_types={press.type},
+                event_type="mentorship",
+            )
+            if completed:
+                complete_press = academic_gossip(
+                    GossipContext(
+                        scholar=mentor_name,
+                        quote=f"My mentorship of {scholar.name} is complete. They have reached the pinnacle of their field.",
+                        trigger="Mentorship completed",
+                    )
+                )
+                rendered_completion = self._render_multi_press_layers(
+                    self._multi_press.generate_mentorship_layers(
+                        mentor=mentor_name,
+                        scholar=scholar,
+                        phase="completion",
+                        track=track,
+                    ),
+                    skip_types={complete_press.type},
+                    event_type="mentorship",
                 )
 
+            with self.state.transaction():
+                scholar.career = career
                 self._record_mentorship_memory(
                     scholar,
                     mentor_player,
@@ -6260,27 +6453,11 @@ class GameService:
                     track=track,
                     timestamp=now,
                 )
-
-                quote = f"Advanced to {scholar.career['tier']} under the guidance of {mentor_name}."
-                press = academic_gossip(
-                    GossipContext(
-                        scholar=scholar.name, quote=quote, trigger="Career advancement"
-                    ),
-                )
                 releases.append(press)
                 self._archive_press(press, now)
-                layers = self._multi_press.generate_mentorship_layers(
-                    mentor=mentor_name,
-                    scholar=scholar,
-                    phase="progression",
-                    track=track,
-                )
                 releases.extend(
-                    self._apply_multi_press_layers(
-                        layers,
-                        skip_types={press.type},
-                        timestamp=now,
-                        event_type="mentorship",
+                    self._publish_multi_press_layers(
+                        rendered_layers, timestamp=now, event_type="mentorship"
                     )
                 )
                 self.state.append_event(
@@ -6289,14 +6466,12 @@ class GameService:
                         action="career_progression",
                         payload={
                             "scholar": scholar.id,
-                            "new_tier": scholar.career["tier"],
+                            "new_tier": career["tier"],
                             "mentor": mentorship[1],
                         },
                     )
                 )
-
-                # Complete mentorship after max tier reached
-                if idx == len(ladder) - 2:  # Just reached final tier
+                if completed:
                     self.state.complete_mentorship(mentorship[0], now)
                     self._record_mentorship_memory(
                         scholar,
@@ -6305,31 +6480,14 @@ class GameService:
                         track=track,
                         timestamp=now,
                     )
-                    complete_press = academic_gossip(
-                        GossipContext(
-                            scholar=mentor_name,
-                            quote=f"My mentorship of {scholar.name} is complete. They have reached the pinnacle of their field.",
-                            trigger="Mentorship completed",
-                        )
-                    )
                     releases.append(complete_press)
                     self._archive_press(complete_press, now)
-                    completion_layers = self._multi_press.generate_mentorship_layers(
-                        mentor=mentor_name,
-                        scholar=scholar,
-                        phase="completion",
-                        track=track,
-                    )
                     releases.extend(
-                        self._apply_multi_press_layers(
-                            completion_layers,
-                            skip_types={complete_press.type},
-                            timestamp=now,
-                            event_type="mentorship",
+                        self._publish_multi_press_layers(
+                            rendered_completion, timestamp=now, event_type="mentorship"
                         )
                     )
-
-            self.state.save_scholar(scholar)
+                self.state.save_scholar(scholar)
         return releases
 
     def _resolve_mentorships(self) -> List[PressRelease]:
@@ -6377,25 +6535,15 @@ class GameService:
                 )
                 continue
 
-            self.state.activate_mentorship(mentorship_id)
-
             track_name = scholar.career.get("track", "Academia")
+            switch_track = bool(
+                career_track
+                and career_track in self._CAREER_TRACKS
+                and track_name != career_track
+            )
             if career_track and career_track in self._CAREER_TRACKS:
-                if track_name != career_track:
-                    scholar.career["track"] = career_track
-                    scholar.career["tier"] = self._CAREER_TRACKS[career_track][0]
-                    scholar.career["ticks"] = 0
                 track_name = career_track
 
-            self._record_mentorship_memory(
-                scholar,
-                player,
-                event="activation",
-                track=track_name,
-                timestamp=now,
-            )
-            self.state.save_scholar(scholar)
-
             quote = f"The mentorship between {player.display_name} and {scholar.name} has officially commenced."
             press = academic_gossip(
                 GossipContext(
@@ -6416,39 +6564,52 @@ class GameService:
                     "career_track": track_name,
                 },
             )
-            releases.append(press)
-            self._archive_press(press, now)
-
-            self.state.append_event(
-                Event(
-                    timestamp=now,
-                    action="mentorship_activated",
-                    payload={
-                        "player": player_id,
-                        "scholar": scholar_id,
-                        "mentorship_id": mentorship_id,
-                    },
-                )
-            )
-            self.state.update_order_status(
-                order_id,
-                "completed",
-                result={"mentorship_id": mentorship_id},
-            )
-
             layers = self._multi_press.generate_mentorship_layers(
                 mentor=player.display_name,
                 scholar=scholar,
                 phase="activation",
                 track=career_track or scholar.career.get("track", "Academia"),
             )
-            self._apply_multi_press_layers(
-                layers,
-                skip_types={press.type},
-                timestamp=now,
-                event_type="mentorship",
+            rendered_layers = self._render_multi_press_layers(
+                layers, skip_types={press.type}, event_type="mentorship"
             )
 
+            with self.state.transaction():
+                self.state.activate_mentorship(mentorship_id)
+                if switch_track:
+                    scholar.career["track"] = career_track
+                    scholar.career["tier"] = self._CAREER_TRACKS[career_track][0]
+                    scholar.career["ticks"] = 0
+                self._record_mentorship_memory(
+                    scholar,
+                    player,
+                    event="activation",
+                    track=track_name,
+                    timestamp=now,
+                )
+                self.state.save_scholar(scholar)
+                releases.append(press)
+                self._archive_press(press, now)
+                self.state.append_event(
+                    Event(
+                        timestamp=now,
+                        action="mentorship_activated",
+                        payload={
+                            "player": player_id,
+                            "scholar": scholar_id,
+                            "mentorship_id": mentorship_id,
+                        },
+                    )
+                )
+                self.state.update_order_status(
+                    order_id,
+                    "completed",
+                    result={"mentorship_id": mentorship_id},
+                )
+                self._publish_multi_press_layers(
+                    rendered_layers, timestamp=now, event_type="mentorship"
+                )
+
         return releases
 
     def _resolve_followups(self) -> List[PressRelease]:
@@ -6491,24 +6652,25 @@ class GameService:
                         "penalty_reputation": penalty_reputation,
                     },
                 )
-                self._archive_press(press, now)
-                releases.append(press)
-                self.state.append_event(
-                    Event(
-                        timestamp=now,
-                        action="symposium_reprimand",
-                        payload={
-                            "player": payload.get("player_id") or scholar_id,
-                            "faction": faction,
-                            "reprisal_level": reprisal_level,
-                            "remaining": remaining,
-                        },
+                with self.state.transaction():
+                    self._archive_press(press, now)
+                    releases.append(press)
+                    self.state.append_event(
+                        Event(
+                            timestamp=now,
+                            action="symposium_reprimand",
+                            payload={
+                                "player": payload.get("player_id") or scholar_id,
+                                "faction": faction,
+                                "reprisal_level": reprisal_level,
+                                "remaining": remaining,
+                            },
+                        )
+                    )
+                    self.state.clear_followup(
+                        followup_id,
+                        result={"resolution": "symposium_reprimand"},
                     )
-                )
-                self.state.clear_followup(
-                    followup_id,
-                    result={"resolution": "symposium_reprimand"},
-                )
                 continue
 
             scholar = self.state.get_scholar(scholar_id)
@@ -6538,23 +6700,16 @@ class GameService:
                     else (former_employer_id or "their patron")
                 )
 
-                if scenario == "reconciliation":
-                    scholar.memory.adjust_feeling(former_employer_id or "patron", 1.5)
-                    # Return scholar to their prior patron if known
-                    if former_employer_id:
-                        scholar.contract["employer"] = former_employer_id
-                else:
-                    new_faction = (
-                        payload.get("new_faction")
-                        or payload.get("faction")
-                        or scholar.contract.get("employer", "Unknown")
-                    )
-                    scholar.memory.adjust_feeling(new_faction, -1.5)
-
+                # A reconciliation returns the scholar to their prior patron.
+                returning = scenario == "reconciliation" and bool(former_employer_id)
                 new_faction_name = (
                     payload.get("new_faction")
                     or payload.get("faction")
-                    or scholar.contract.get("employer", "Unknown")
+                    or (
+                        former_employer_id
+                        if returning
+                        else scholar.contract.get("employer", "Unknown")
+                    )
                 )
 
                 layers = self._multi_press.generate_defection_epilogue_layers(
@@ -6564,33 +6719,44 @@ class GameService:
                     new_faction=new_faction_name,
                     former_employer=former_name,
                 )
-                immediate_layers = self._apply_multi_press_layers(
-                    layers,
-                    skip_types=set(),
-                    timestamp=now,
-                    event_type="defection_epilogue",
+                rendered_layers = self._render_multi_press_layers(
+                    layers, skip_types=set(), event_type="defection_epilogue"
                 )
-                releases.extend(immediate_layers)
-                self.state.append_event(
-                    Event(
-                        timestamp=now,
-                        action="defection_epilogue",
-                        payload={
-                            "scholar": scholar.id,
-                            "scenario": scenario,
-                            "former_faction": former_name,
-                            "new_faction": new_faction_name,
-                        },
+                with self.state.transaction():
+                    if scenario == "reconciliation":
+                        scholar.memory.adjust_feeling(
+                            former_employer_id or "patron", 1.5
+                        )
+                        if returning:
+                            scholar.contract["employer"] = former_employer_id
+                    else:
+                        scholar.memory.adjust_feeling(new_faction_name, -1.5)
+                    releases.extend(
+                        self._publish_multi_press_layers(
+                            rendered_layers,
+                            timestamp=now,
+                            event_type="defection_epilogue",
+                        )
+                    )
+                    self.state.append_event(
+                        Event(
+                            timestamp=now,
+                            action="defection_epilogue",
+                            payload={
+                                "scholar": scholar.id,
+                                "scenario": scenario,
+                                "former_faction": former_name,
+                                "new_faction": new_faction_name,
+                            },
+                        )
+                    )
+                    self.state.save_scholar(scholar)
+                    self.state.clear_followup(
+                        followup_id,
+                        result={"resolution": f"defection_{scenario}"},
                     )
-                )
-                self.state.save_scholar(scholar)
-                self.state.clear_followup(
-                    followup_id,
-                    result={"resolution": f"defection_{scenario}"},
-                )
                 continue
             elif kind == "recruitment_grudge":
-                scholar.memory.adjust_feeling(payload.get("player", "Unknown"), -1.0)
                 quote = "The slighted scholar sharpens their public retort."
             elif kind.startswith("sidecast_"):
                 arc_key = (
@@ -6622,65 +6788,68 @@ class GameService:
                     expedition_code=expedition_code,
                 )
 
-                self._record_sidecast_memory(
-                    scholar,
-                    sponsor_id,
-                    arc=arc_key,
-                    phase=phase,
-                    timestamp=now,
-                    extra={
-                        "expedition_code": expedition_code,
-                        "expedition_type": expedition_type,
-                    },
-                )
-                self.state.save_scholar(scholar)
-
-                immediate_layers = self._apply_multi_press_layers(
-                    plan.layers,
-                    skip_types=set(),
-                    timestamp=now,
-                    event_type="sidecast",
+                rendered_layers = self._render_multi_press_layers(
+                    plan.layers, skip_types=set(), event_type="sidecast"
                 )
-                releases.extend(immediate_layers)
 
-                self.state.append_event(
-                    Event(
+                with self.state.transaction():
+                    self._record_sidecast_memory(
+                        scholar,
+                        sponsor_id,
+                        arc=arc_key,
+                        phase=phase,
                         timestamp=now,
-                        action="sidecast_followup",
-                        payload={
-                            "scholar": scholar.id,
-                            "arc": arc_key,
-                            "phase": phase,
-                            "sponsor": sponsor_id,
+                        extra={
+                            "expedition_code": expedition_code,
+                            "expedition_type": expedition_type,
                         },
                     )
-                )
+                    self.state.save_scholar(scholar)
 
-                self.state.clear_followup(
-                    followup_id,
-                    result={"resolution": f"sidecast_{phase}"},
-                )
+                    releases.extend(
+                        self._publish_multi_press_layers(
+                            rendered_layers, timestamp=now, event_type="sidecast"
+                        )
+                    )
 
-                if plan.next_phase:
-                    next_delay = plan.next_delay_hours
-                    if next_delay is None:
-                        next_delay = self._multi_press.sidecast_phase_delay(
-                            arc_key, plan.next_phase, default_hours=36.0
+                    self.state.append_event(
+                        Event(
+                            timestamp=now,
+                            action="sidecast_followup",
+                            payload={
+                                "scholar": scholar.id,
+                                "arc": arc_key,
+                                "phase": phase,
+                                "sponsor": sponsor_id,
+                            },
                         )
-                    scheduled_at = now + timedelta(hours=next_delay)
-                    self.state.enqueue_order(
-                        f"followup:sidecast_{plan.next_phase}",
-                        actor_id=scholar.id,
-                        subject_id=sponsor_id,
-                        payload={
-                            "arc": arc_key,
-                            "phase": plan.next_phase,
-                            "sponsor": sponsor_id,
-                            "expedition_code": expedition_code,
-                            "expedition_type": expedition_type,
-                        },
-                        scheduled_at=scheduled_at,
                     )
+
+                    self.state.clear_followup(
+                        followup_id,
+                        result={"resolution": f"sidecast_{phase}"},
+                    )
+
+                    if plan.next_phase:
+                        next_delay = plan.next_delay_hours
+                        if next_delay is None:
+                            next_delay = self._multi_press.sidecast_phase_delay(
+                                arc_key, plan.next_phase, default_hours=36.0
+                            )
+                        scheduled_at = now + timedelta(hours=next_delay)
+                        self.state.enqueue_order(
+                            f"followup:sidecast_{plan.next_phase}",
+                            actor_id=scholar.id,
+                            subject_id=sponsor_id,
+                            payload={
+                                "arc": arc_key,
+                                "phase": plan.next_phase,
+                                "sponsor": sponsor_id,
+                                "expedition_code": expedition_code,
+                                "expedition_type": expedition_type,
+                            },
+                            scheduled_at=scheduled_at,
+                        )
                 continue
             elif kind == "sideways_vignette":
                 headline = payload.get(
@@ -6698,34 +6867,35 @@ class GameService:
                         "discovery": payload.get("discovery"),
                     },
                 )
-                self._archive_press(base_press, now)
-                releases.append(base_press)
+                with self.state.transaction():
+                    self._archive_press(base_press, now)
+                    releases.append(base_press)
 
-                gossip_entries = payload.get("gossip") or []
-                for quote in gossip_entries:
-                    ctx = GossipContext(
-                        scholar=scholar.name,
-                        quote=quote,
-                        trigger="Sideways Discovery",
+                    gossip_entries = payload.get("gossip") or []
+                    for quote in gossip_entries:
+                        ctx = GossipContext(
+                            scholar=scholar.name,
+                            quote=quote,
+                            trigger="Sideways Discovery",
+                        )
+                        gossip_press = academic_gossip(ctx)
+                        self._archive_press(gossip_press, now)
+                        releases.append(gossip_press)
+                    self.state.append_event(
+                        Event(
+                            timestamp=now,
+                            action="sideways_vignette",
+                            payload={
+                                "scholar": scholar.id,
+                                "headline": headline,
+                                "tags": tags,
+                            },
+                        )
                     )
-                    gossip_press = academic_gossip(ctx)
-                    self._archive_press(gossip_press, now)
-                    releases.append(gossip_press)
-                self.state.append_event(
-                    Event(
-                        timestamp=now,
-                        action="sideways_vignette",
-                        payload={
-                            "scholar": scholar.id,
-                            "headline": headline,
-                            "tags": tags,
-                        },
+                    self.state.clear_followup(
+                        followup_id,
+                        result={"resolution": "sideways_vignette"},
                     )
-                )
-                self.state.clear_followup(
-                    followup_id,
-                    result={"resolution": "sideways_vignette"},
-                )
                 continue
             elif kind == "evaluate_offer":
                 # Resolve offer negotiation
@@ -6760,24 +6930,29 @@ class GameService:
                     trigger=kind.replace("_", " ").title(),
                 )
             )
-            self._archive_press(press, now)
-            releases.append(press)
-            self.state.append_event(
-                Event(
-                    timestamp=now,
-                    action="followup_resolved",
-                    payload={
-                        "scholar": scholar.id,
-                        "kind": kind,
-                        "order_id": followup_id,
-                    },
+            with self.state.transaction():
+                if kind == "recruitment_grudge":
+                    scholar.memory.adjust_feeling(
+                        payload.get("player", "Unknown"), -1.0
+                    )
+                self._archive_press(press, now)
+                releases.append(press)
+                self.state.append_event(
+                    Event(
+                        timestamp=now,
+                        action="followup_resolved",
+                        payload={
+                            "scholar": scholar.id,
+                            "kind": kind,
+                            "order_id": followup_id,
+                        },
+                    )
+                )
+                self.state.save_scholar(scholar)
+                self.state.clear_followup(
+                    followup_id,
+                    result={"resolution": kind},
                 )
-            )
-            self.state.save_scholar(scholar)
-            self.state.clear_followup(
-                followup_id,
-                result={"resolution": kind},
-            )
         return releases
 
     def _schedule_symposium_reminders(
@@ -6931,25 +7106,26 @@ class GameService:
                     "reminder_level": reminder_level,
                 },
             )
-            self._archive_press(press, now)
-            releases.append(press)
-            self.state.append_event(
-                Event(
-                    timestamp=now,
-                    action="symposium_vote_reminder",
-                    payload={
-                        "topic_id": topic_id,
-                        "player": player_id,
-                        "reminder_level": reminder_level,
-                        "pledge_amount": pledged_amount,
-                    },
+            with self.state.transaction():
+                self._archive_press(press, now)
+                releases.append(press)
+                self.state.append_event(
+                    Event(
+                        timestamp=now,
+                        action="symposium_vote_reminder",
+                        payload={
+                            "topic_id": topic_id,
+                            "player": player_id,
+                            "reminder_level": reminder_level,
+                            "pledge_amount": pledged_amount,
+                        },
+                    )
+                )
+                self.state.update_order_status(
+                    order_id,
+                    "completed",
+                    result={"reminder": reminder_level},
                 )
-            )
-            self.state.update_order_status(
-                order_id,
-                "completed",
-                result={"reminder": reminder_level},
-            )
         return releases
 
     def _apply_reputation_change(
@@ -7346,6 +7522,7 @@ class GameService:
                 )
             )
 
+    @traced("service.apply_multi_press_layers", start_trace=False)
     def _apply_multi_press_layers(
         self,
         layers,
@@ -7356,13 +7533,35 @@ class GameService:
     ) -> List[PressRelease]:
         """Render additional press layers, archiving each generated release."""
 
+        return self._publish_multi_press_layers(
+            self._render_multi_press_layers(
+                layers, skip_types=skip_types, event_type=event_type
+            ),
+            timestamp=timestamp,
+            event_type=event_type,
+        )
+
+    def _render_multi_press_layers(
+        self,
+        layers,
+        *,
+        skip_types: set[str],
+        event_type: str = "general",
+    ) -> List[Tuple[Any, PressRelease]]:
+        """Render and LLM-enhance press layers without persisting them.
+
+        Units of work call this before opening ``state.transaction()`` so no
+        LLM round trip runs while SQLite's write lock is held, then publish
+        the result inside the transaction.
+        """
+
         if not layers:
             return []
         remaining = [layer for layer in layers if layer.type not in skip_types]
         if not remaining:
             return []
         telemetry = self._telemetry
-        immediate: List[PressRelease] = []
+        requests: List[Dict[str, Any]] = []
         for layer in remaining:
             persona_hint: Optional[str] = None
             if hasattr(layer.context, "scholar"):
@@ -7391,13 +7590,30 @@ class GameService:
             persona_traits = None
             if persona_hint:
                 persona_traits = self._resolve_scholar_traits(persona_hint)
-            release = self._enhance_press_release(
-                release,
-                base_body=base_body,
-                persona_name=persona_hint,
-                persona_traits=persona_traits,
-                extra_context=extra_context,
+            requests.append(
+                {
+                    "release": release,
+                    "base_body": base_body,
+                    "persona_name": persona_hint,
+                    "persona_traits": persona_traits,
+                    "extra_context": extra_context,
+                }
             )
+
+        # The layers' LLM calls run concurrently; archiving keeps layer order.
+        return list(zip(remaining, self._enhance_press_releases(requests)))
+
+    def _publish_multi_press_layers(
+        self,
+        rendered: List[Tuple[Any, PressRelease]],
+        *,
+        timestamp: datetime,
+        event_type: str = "general",
+    ) -> List[PressRelease]:
+        """Archive immediate layers and schedule delayed ones, in layer order."""
+
+        immediate: List[PressRelease] = []
+        for layer, release in rendered:
             if layer.delay_minutes <= 0:
                 self._archive_press(release, timestamp)
                 immediate.append(release)
@@ -7571,11 +7787,9 @@ class GameService:
         )
         total = 0.0
         count = 0
-        for scholar in self.state.all_scholars():
-            if scholar.contract.get("employer") != player.id:
-                continue
-            if faction and scholar.contract.get("faction") != faction:
-                continue
+        for scholar in self.state.scholars_employed_by(
+            player.id, faction=faction or None
+        ):
             feeling = scholar.memory.feelings.get(player.id, 0.0)
             total += feeling
             count += 1
@@ -2,18 +2,34 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import sqlite3
+import sys
+import threading
+import time
+import weakref
 from collections import Counter
-from contextlib import closing
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from typing import (
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from .models import (
     Event,
     ExpeditionRecord,
+    MemoryFact,
     OfferRecord,
     Player,
     PressRecord,
@@ -23,6 +39,7 @@ from .models import (
 )
 from .scholars import ScholarRepository
 from .telemetry import get_telemetry
+from .tracing import get_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +53,26 @@ CREATE TABLE IF NOT EXISTS players (
 );
 CREATE TABLE IF NOT EXISTS scholars (
     id TEXT PRIMARY KEY,
-    data TEXT NOT NULL
+    data TEXT NOT NULL,
+    employer TEXT,
+    faction TEXT,
+    career_track TEXT,
+    career_tier TEXT,
+    talent INTEGER,
+    reliability INTEGER,
+    integrity INTEGER,
+    theatrics INTEGER,
+    loyalty INTEGER,
+    risk INTEGER
+);
+CREATE TABLE IF NOT EXISTS scholar_memory_facts (
+    scholar_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    timestamp TEXT NOT NULL,
+    type TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    details TEXT NOT NULL,
+    PRIMARY KEY (scholar_id, seq)
 );
 CREATE TABLE IF NOT EXISTS events (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -75,6 +111,10 @@ CREATE TABLE IF NOT EXISTS press_releases (
     body TEXT NOT NULL,
     metadata TEXT NOT NULL
 );
+CREATE INDEX IF NOT EXISTS idx_press_releases_type
+    ON press_releases (type, id);
+CREATE INDEX IF NOT EXISTS idx_press_releases_timestamp
+    ON press_releases (timestamp);
 CREATE TABLE IF NOT EXISTS scholar_nicknames (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     scholar_id TEXT NOT NULL,
@@ -105,7 +145,8 @@ CREATE TABLE IF NOT EXISTS offers (
     faction TEXT NOT NULL,
     payload TEXT NOT NULL,
     status TEXT NOT NULL,
-    created_at TEXT NOT NULL
+    created_at TEXT NOT NULL,
+    parent_offer_id INTEGER
 );
 CREATE TABLE IF NOT EXISTS followups (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -297,6 +338,217 @@ CREATE INDEX IF NOT EXISTS idx_archive_endowments_player
     ON archive_endowments (player_id);
 """
 
+# Scholar fields promoted out of the JSON blob into indexed columns.
+_SCHOLAR_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("employer", "TEXT"),
+    ("faction", "TEXT"),
+    ("career_track", "TEXT"),
+    ("career_tier", "TEXT"),
+    ("talent", "INTEGER"),
+    ("reliability", "INTEGER"),
+    ("integrity", "INTEGER"),
+    ("theatrics", "INTEGER"),
+    ("loyalty", "INTEGER"),
+    ("risk", "INTEGER"),
+)
+_SCHOLAR_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_scholars_employer
+    ON scholars (employer, faction);
+CREATE INDEX IF NOT EXISTS idx_scholars_faction
+    ON scholars (faction);
+CREATE INDEX IF NOT EXISTS idx_scholars_career
+    ON scholars (career_track, career_tier);
+"""
+
+_STATEMENT_CACHE_SIZE = 256
+_BUSY_TIMEOUT_SECONDS = 30.0
+_SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
+class _StateConnection(sqlite3.Connection):
+    """SQLite connection whose commits defer to an open ``transaction()``.
+
+    State methods call ``conn.commit()`` after each write. While a unit of
+    work is open those commits are no-ops so the whole operation lands in a
+    single commit (or rolls back together).
+    """
+
+    transaction_depth = 0
+
+    def commit(self) -> None:
+        if self.transaction_depth:
+            return
+        super().commit()
+
+
+class _TracedConnection:
+    """Time a pooled connection's use as a span of the open trace."""
+
+    __slots__ = ("_scope", "_connection")
+
+    def __init__(
+        self, scope: ContextManager[object], connection: ContextManager[_StateConnection]
+    ) -> None:
+        self._scope = scope
+        self._connection = connection
+
+    def __enter__(self) -> _StateConnection:
+        self._scope.__enter__()
+        try:
+            return self._connection.__enter__()
+        except BaseException as exc:
+            self._scope.__exit__(type(exc), exc, exc.__traceback__)
+            raise
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            self._connection.__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            self._scope.__exit__(exc_type, exc_val, exc_tb)
+
+
+class _ConnectionManager:
+    """Hand out one long-lived SQLite connection per thread.
+
+    Connections are opened lazily in WAL mode with a relaxed ``synchronous``
+    level and a large prepared-statement cache, then reused for every
+    subsequent call made from the same thread.
+    """
+
+    def __init__(self, db_path: Path, *, synchronous: str = "NORMAL") -> None:
+        # Interpolated into a PRAGMA, so only the known levels are accepted.
+        level = synchronous.upper()
+        if level not in _SYNCHRONOUS_LEVELS:
+            raise ValueError(
+                f"Unsupported synchronous level {synchronous!r}; "
+                f"expected one of {', '.join(_SYNCHRONOUS_LEVELS)}"
+            )
+        self._db_path = db_path
+        self._synchronous = level
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[_StateConnection] = []
+
+    def _open(self) -> _StateConnection:
+        conn = sqlite3.connect(
+            self._db_path,
+            timeout=_BUSY_TIMEOUT_SECONDS,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+            # Thread affinity is enforced by the thread-local lookup; this
+            # only allows ``close_all`` to run from any thread.
+            check_same_thread=False,
+            factory=_StateConnection,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self._synchronous}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def get(self) -> _StateConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+            self._local.depth = 0
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[_StateConnection]:
+        """Yield this thread's connection, discarding uncommitted work on exit.
+
+        Calls may nest (a state method reading through another); only the
+        outermost exit rolls back writes that were never committed, matching
+        the old behaviour of closing a short-lived connection.
+        """
+
+        conn = self.get()
+        self._local.depth += 1
+        try:
+            yield conn
+        finally:
+            self._local.depth -= 1
+            if (
+                self._local.depth == 0
+                and not conn.transaction_depth
+                and conn.in_transaction
+            ):
+                conn.rollback()
+
+    @contextmanager
+    def transaction(self) -> Iterator[_StateConnection]:
+        """Group writes into one commit; nested calls become savepoints."""
+
+        with self.connection() as conn:
+            depth = conn.transaction_depth
+            savepoint = f"gw_unit_{depth}"
+            if depth == 0:
+                if conn.in_transaction:
+                    conn.rollback()
+                conn.execute("BEGIN")
+            else:
+                conn.execute(f"SAVEPOINT {savepoint}")
+            conn.transaction_depth = depth + 1
+            try:
+                yield conn
+            except BaseException:
+                conn.transaction_depth = depth
+                if depth == 0:
+                    conn.rollback()
+                else:
+                    conn.execute(f"ROLLBACK TO {savepoint}")
+                    conn.execute(f"RELEASE {savepoint}")
+                raise
+            conn.transaction_depth = depth
+            if depth == 0:
+                conn.commit()
+            else:
+                conn.execute(f"RELEASE {savepoint}")
+
+    def transaction_depth(self) -> int:
+        return self.get().transaction_depth
+
+    def close_all(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:  # pragma: no cover - best effort shutdown
+                logger.debug("Failed to close state connection", exc_info=True)
+        self._local = threading.local()
+
+
+_write_behind_states: "weakref.WeakSet[GameState]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_write_behind_states() -> None:
+    # Deferred writes would otherwise die with the daemon flusher thread.
+    for state in list(_write_behind_states):
+        try:
+            state.close()
+        except Exception:
+            logger.exception("Failed to flush deferred state writes at exit")
+
+
+class _UnitOfWork:
+    """Players and scholars one thread marked dirty inside ``transaction()``.
+
+    ``players`` and ``scholars`` still await a flush; the ``touched`` sets
+    remember every id written during the unit so a rollback can forget the
+    fingerprints and fact counts it recorded.
+    """
+
+    __slots__ = ("players", "scholars", "touched_players", "touched_scholars")
+
+    def __init__(self) -> None:
+        self.players: Set[str] = set()
+        self.scholars: Set[str] = set()
+        self.touched_players: Set[str] = set()
+        self.touched_scholars: Set[str] = set()
+
 
 class GameState:
     """High level interface for working with persistent state."""
@@ -308,6 +560,8 @@ class GameState:
         *,
         start_year: int,
         admin_notifier: Optional[Callable[[str], None]] = None,
+        synchronous: str = "NORMAL",
+        write_behind_seconds: float = 0.0,
     ) -> None:
         self._db_path = db_path
         if self._db_path.parent != Path("."):
@@ -315,14 +569,277 @@ class GameState:
         self._repo = repository or ScholarRepository()
         self._start_year = start_year
         self._admin_notifier = admin_notifier
-        self._ensure_schema()
-        self._ensure_timeline()
+        self._connections = _ConnectionManager(db_path, synchronous=synchronous)
         self._cached_players: Dict[str, Player] = {}
         self._cached_scholars: Dict[str, Scholar] = {}
+        # Write-behind bookkeeping for the identity map above: ids awaiting a
+        # flush, plus the last persisted fingerprint of each player so that
+        # unchanged players are never re-serialized. Ids marked inside a unit
+        # of work are kept on that thread's ``_UnitOfWork`` instead, so other
+        # threads never write or discard them.
+        self._dirty_lock = threading.Lock()
+        self._dirty_players: Set[str] = set()
+        self._dirty_scholars: Set[str] = set()
+        self._player_fingerprints: Dict[str, Tuple[object, ...]] = {}
+        # Number of memory facts already stored per scholar (append-only log).
+        self._scholar_fact_counts: Dict[str, int] = {}
+        self._units = threading.local()
+        self._write_behind_seconds = max(0.0, write_behind_seconds)
+        self._last_flush = time.monotonic()
+        # Deferred writes are also flushed from a background thread, so a quiet
+        # server never holds dirty rows for longer than about two intervals.
+        # It (and any write outside a unit) stands aside while a unit of work
+        # is open, rather than queueing behind that unit's write lock.
+        self._flush_lock = threading.Lock()
+        self._units_changed = threading.Condition(self._dirty_lock)
+        self._open_units: List[_UnitOfWork] = []
+        self._background_flushing = False
+        self._flusher_stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
         self._followup_checked = False
+        self._ensure_schema()
+        self._ensure_timeline()
+        if self._write_behind_seconds:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically,
+                name="great-work-state-flush",
+                daemon=True,
+            )
+            self._flusher.start()
+            _write_behind_states.add(self)
+
+    def _connect(self) -> ContextManager[sqlite3.Connection]:
+        """Return a context manager yielding the pooled per-thread connection.
+
+        Inside a sampled trace the query is recorded as a ``state.<method>``
+        span named after the calling state method.
+        """
+
+        connection = self._connections.connection()
+        tracer = get_tracer()
+        if not tracer.active():
+            return connection
+        caller = sys._getframe(1).f_code.co_name
+        return _TracedConnection(tracer.leaf(f"state.{caller}"), connection)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run a unit of work that commits once when the outermost block exits.
+
+        Nested blocks are backed by savepoints, so an inner failure only
+        unwinds its own writes. Players and scholars marked dirty by this
+        thread are flushed just before the outermost commit. When a block
+        rolls back, those ids are forgotten and cached players and scholars
+        without pending writes are dropped, because callers may have mutated
+        them in place.
+        """
+
+        outermost = not self._connections.transaction_depth()
+        if outermost:
+            unit = _UnitOfWork()
+            with self._units_changed:
+                while self._background_flushing:
+                    self._units_changed.wait()
+                self._open_units.append(unit)
+            self._units.unit = unit
+        else:
+            unit = self._units.unit
+            # Persist outer-scope changes first so a savepoint rollback cannot
+            # discard them along with the cache.
+            self.flush()
+        failed = False
+        try:
+            with self._connections.transaction() as conn:
+                yield
+                if conn.transaction_depth == 1:
+                    self.flush()
+        except BaseException:
+            failed = True
+            self._discard_unit(unit)
+            raise
+        finally:
+            if outermost:
+                self._units.unit = None
+                with self._units_changed:
+                    self._open_units.remove(unit)
+                    drained = (
+                        not self._open_units
+                        and not self._write_behind_seconds
+                        and bool(self._dirty_players or self._dirty_scholars)
+                    )
+                if drained:
+                    # Writes made outside a unit were held back while units
+                    # were open; the last unit to close writes them through.
+                    try:
+                        self.flush()
+                    except Exception:
+                        if not failed:
+                            raise
+                        logger.exception("Flush of deferred state writes failed")
+
+    def _discard_unit(self, unit: _UnitOfWork) -> None:
+        with self._dirty_lock:
+            unit.players.clear()
+            unit.scholars.clear()
+            for player_id in unit.touched_players:
+                self._player_fingerprints.pop(player_id, None)
+            for scholar_id in unit.touched_scholars:
+                self._scholar_fact_counts.pop(scholar_id, None)
+            # Keep objects other threads still have to write.
+            pending_players = set(self._dirty_players)
+            pending_scholars = set(self._dirty_scholars)
+            for other in self._open_units:
+                pending_players |= other.players
+                pending_scholars |= other.scholars
+            for player_id in list(self._cached_players):
+                if player_id not in pending_players:
+                    self._cached_players.pop(player_id, None)
+            for scholar_id in list(self._cached_scholars):
+                if scholar_id not in pending_scholars:
+                    self._cached_scholars.pop(scholar_id, None)
+
+    def _current_unit(self) -> Optional[_UnitOfWork]:
+        return getattr(self._units, "unit", None)
+
+    def in_transaction(self) -> bool:
+        """Return ``True`` while this thread has a unit of work open."""
+
+        return bool(self._connections.transaction_depth())
+
+    def flush(self) -> None:
+        """Write dirty players and scholars in one batch.
+
+        Inside a unit of work only that unit's changes are written, on its
+        own connection; outside one, the shared write-behind set is flushed.
+        """
+
+        with self._flush_lock:
+            self._flush_dirty(self._current_unit())
+
+    def _flush_dirty(self, unit: Optional[_UnitOfWork]) -> None:
+        with self._dirty_lock:
+            if unit is None:
+                player_ids, self._dirty_players = self._dirty_players, set()
+                scholar_ids, self._dirty_scholars = self._dirty_scholars, set()
+            else:
+                player_ids, unit.players = unit.players, set()
+                scholar_ids, unit.scholars = unit.scholars, set()
+                unit.touched_players |= player_ids
+                unit.touched_scholars |= scholar_ids
+            players = [
+                self._cached_players[player_id]
+                for player_id in sorted(player_ids)
+                if player_id in self._cached_players
+            ]
+            scholars = [
+                self._cached_scholars[scholar_id]
+                for scholar_id in sorted(scholar_ids)
+                if scholar_id in self._cached_scholars
+            ]
+        self._last_flush = time.monotonic()
+        if not players and not scholars:
+            return
+        fingerprints = {
+            player.id: self._player_fingerprint(player) for player in players
+        }
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    "REPLACE INTO players "
+                    "(id, display_name, reputation, influence, cooldowns) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (
+                            player.id,
+                            player.display_name,
+                            player.reputation,
+                            json.dumps(player.influence),
+                            json.dumps(player.cooldowns),
+                        )
+                        for player in players
+                    ],
+                )
+                fact_counts = self._write_scholars(conn, scholars)
+                conn.commit()
+        except BaseException:
+            if unit is None:
+                with self._dirty_lock:
+                    self._dirty_players.update(player_ids)
+                    self._dirty_scholars.update(scholar_ids)
+                    for player in players:
+                        self._cached_players.setdefault(player.id, player)
+                    for scholar in scholars:
+                        self._cached_scholars.setdefault(scholar.id, scholar)
+            raise
+        with self._dirty_lock:
+            self._player_fingerprints.update(fingerprints)
+            self._scholar_fact_counts.update(fact_counts)
+
+    def _flush_periodically(self) -> None:
+        while not self._flusher_stop.wait(self._write_behind_seconds):
+            with self._units_changed:
+                if self._open_units or not (
+                    self._dirty_players or self._dirty_scholars
+                ):
+                    continue
+                self._background_flushing = True
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Background flush of deferred state writes failed")
+            finally:
+                with self._units_changed:
+                    self._background_flushing = False
+                    self._units_changed.notify_all()
+
+    def _mark_dirty(
+        self, *, player: Optional[Player] = None, scholar: Optional[Scholar] = None
+    ) -> None:
+        unit = self._current_unit()
+        with self._dirty_lock:
+            if player is not None:
+                self._cached_players[player.id] = player
+                if unit is None:
+                    self._dirty_players.add(player.id)
+                else:
+                    unit.players.add(player.id)
+            if scholar is not None:
+                self._cached_scholars[scholar.id] = scholar
+                if unit is None:
+                    self._dirty_scholars.add(scholar.id)
+                else:
+                    unit.scholars.add(scholar.id)
+            if unit is not None or self._open_units:
+                return
+        if (
+            self._write_behind_seconds
+            and time.monotonic() - self._last_flush < self._write_behind_seconds
+        ):
+            return
+        self.flush()
+
+    @staticmethod
+    def _player_fingerprint(player: Player) -> Tuple[object, ...]:
+        return (
+            player.display_name,
+            player.reputation,
+            tuple(sorted(player.influence.items())),
+            tuple(sorted(player.cooldowns.items())),
+        )
+
+    def close(self) -> None:
+        """Stop the background flusher, flush pending writes and close connections."""
+
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            _write_behind_states.discard(self)
+            self._flusher_stop.set()
+            flusher.join()
+        self.flush()
+        self._connections.close_all()
 
     def _ensure_schema(self) -> None:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.executescript(_DB_SCHEMA)
             columns = {
                 row[1]
@@ -377,10 +894,171 @@ class GameState:
                     ALTER TABLE symposium_debts_migrate RENAME TO symposium_debts;
                     """
                 )
+            offer_columns = {
+                row[1] for row in conn.execute("PRAGMA table_info('offers')").fetchall()
+            }
+            if "parent_offer_id" not in offer_columns:
+                conn.execute("ALTER TABLE offers ADD COLUMN parent_offer_id INTEGER")
+            # Runs on every start so a backfill interrupted after the column
+            # was committed is finished instead of truncating offer chains.
+            conn.execute(
+                "UPDATE offers SET parent_offer_id = "
+                "json_extract(payload, '$.parent_offer_id') "
+                "WHERE parent_offer_id IS NULL "
+                "AND json_extract(payload, '$.parent_offer_id') IS NOT NULL"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_offers_parent ON offers (parent_offer_id)"
+            )
+            self._migrate_scholar_columns(conn)
             conn.commit()
 
+    def _migrate_scholar_columns(self, conn: sqlite3.Connection) -> None:
+        """Promote hot scholar fields to columns and move facts to their own table."""
+
+        columns = {
+            row[1] for row in conn.execute("PRAGMA table_info('scholars')").fetchall()
+        }
+        missing = [
+            (name, kind) for name, kind in _SCHOLAR_COLUMNS if name not in columns
+        ]
+        for name, kind in missing:
+            conn.execute(f"ALTER TABLE scholars ADD COLUMN {name} {kind}")
+        conn.executescript(_SCHOLAR_INDEXES)
+        # Every scholar written in column form has a talent value, so rows
+        # without one still need the backfill. Selecting them on each start
+        # resumes a migration interrupted after the columns were committed.
+        rows = conn.execute("SELECT data FROM scholars WHERE talent IS NULL").fetchall()
+        scholars = [self._repo.from_dict(json.loads(row[0])) for row in rows]
+        if scholars:
+            self._write_scholars(conn, scholars)
+            logger.info("Migrated %d scholars to column-level storage", len(scholars))
+
+    def _write_scholars(
+        self, conn: sqlite3.Connection, scholars: List[Scholar]
+    ) -> Dict[str, int]:
+        """Write scholar rows and append new memory facts; return stored fact counts."""
+
+        conn.executemany(
+            "REPLACE INTO scholars (id, data, "
+            + ", ".join(name for name, _ in _SCHOLAR_COLUMNS)
+            + ") VALUES (?, ?"
+            + ", ?" * len(_SCHOLAR_COLUMNS)
+            + ")",
+            [self._scholar_row(scholar) for scholar in scholars],
+        )
+        fact_rows: List[Tuple[object, ...]] = []
+        fact_counts: Dict[str, int] = {}
+        with self._dirty_lock:
+            known_counts = {
+                scholar.id: self._scholar_fact_counts.get(scholar.id)
+                for scholar in scholars
+            }
+        for scholar in scholars:
+            stored = known_counts[scholar.id]
+            if stored is None:
+                stored = int(
+                    conn.execute(
+                        "SELECT COUNT(*) FROM scholar_memory_facts WHERE scholar_id = ?",
+                        (scholar.id,),
+                    ).fetchone()[0]
+                )
+            facts = scholar.memory.facts
+            if len(facts) < stored:
+                # The in-memory history was replaced wholesale; rewrite it.
+                conn.execute(
+                    "DELETE FROM scholar_memory_facts WHERE scholar_id = ?",
+                    (scholar.id,),
+                )
+                stored = 0
+            for seq in range(stored, len(facts)):
+                fact = facts[seq]
+                fact_rows.append(
+                    (
+                        scholar.id,
+                        seq,
+                        fact.timestamp.isoformat(),
+                        fact.type,
+                        fact.subject,
+                        json.dumps(fact.details),
+                    )
+                )
+            fact_counts[scholar.id] = len(facts)
+        if fact_rows:
+            conn.executemany(
+                "INSERT OR REPLACE INTO scholar_memory_facts "
+                "(scholar_id, seq, timestamp, type, subject, details) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                fact_rows,
+            )
+        return fact_counts
+
+    def _scholar_row(self, scholar: Scholar) -> Tuple[object, ...]:
+        data = self._repo.serialize(scholar, include_facts=False)
+        stats = scholar.stats
+        return (
+            scholar.id,
+            json.dumps(data),
+            scholar.contract.get("employer"),
+            scholar.contract.get("faction"),
+            scholar.career.get("track"),
+            scholar.career.get("tier"),
+            stats.talent,
+            stats.reliability,
+            stats.integrity,
+            stats.theatrics,
+            stats.loyalty,
+            stats.risk,
+        )
+
+    def _hydrate_scholars(
+        self, conn: sqlite3.Connection, rows: List[Tuple[str, str]]
+    ) -> List[Scholar]:
+        """Build scholars from ``(id, data)`` rows, preferring identity-map hits."""
+
+        missing = [row for row in rows if row[0] not in self._cached_scholars]
+        facts: Dict[str, List[MemoryFact]] = {}
+        if missing:
+            if len(missing) == len(rows) and len(rows) > 1:
+                fact_rows = conn.execute(
+                    "SELECT scholar_id, timestamp, type, subject, details "
+                    "FROM scholar_memory_facts ORDER BY scholar_id, seq"
+                ).fetchall()
+            else:
+                placeholders = ", ".join("?" for _ in missing)
+                fact_rows = conn.execute(
+                    "SELECT scholar_id, timestamp, type, subject, details "
+                    f"FROM scholar_memory_facts WHERE scholar_id IN ({placeholders}) "
+                    "ORDER BY scholar_id, seq",
+                    [row[0] for row in missing],
+                ).fetchall()
+            for scholar_id, timestamp, type_, subject, details in fact_rows:
+                facts.setdefault(scholar_id, []).append(
+                    MemoryFact(
+                        timestamp=datetime.fromisoformat(timestamp),
+                        type=type_,
+                        subject=subject,
+                        details=json.loads(details),
+                    )
+                )
+        scholars: List[Scholar] = []
+        for scholar_id, data_json in rows:
+            cached = self._cached_scholars.get(scholar_id)
+            if cached is not None:
+                scholars.append(cached)
+                continue
+            scholar = self._repo.from_dict(json.loads(data_json))
+            stored_facts = facts.get(scholar_id)
+            if stored_facts:
+                scholar.memory.facts = stored_facts
+            with self._dirty_lock:
+                self._scholar_fact_counts[scholar_id] = len(stored_facts or [])
+            self._cached_scholars[scholar.id] = scholar
+            scholars.append(scholar)
+        return scholars
+
     def _ensure_timeline(self) -> None:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT current_year, last_advanced FROM timeline WHERE singleton = 1"
             ).fetchone()
@@ -394,27 +1072,23 @@ class GameState:
 
     # Player management -------------------------------------------------
     def upsert_player(self, player: Player) -> None:
-        influence_json = json.dumps(player.influence)
-        cooldowns_json = json.dumps(player.cooldowns)
-        with closing(sqlite3.connect(self._db_path)) as conn:
-            conn.execute(
-                "REPLACE INTO players (id, display_name, reputation, influence, cooldowns) "
-                "VALUES (?, ?, ?, ?, ?)",
-                (
-                    player.id,
-                    player.display_name,
-                    player.reputation,
-                    influence_json,
-                    cooldowns_json,
-                ),
-            )
-            conn.commit()
+        """Record ``player`` in the identity map and persist it if it changed.
+
+        Inside a ``transaction()`` (or within the write-behind interval) the
+        write is deferred until the next flush.
+        """
+
         self._cached_players[player.id] = player
+        with self._dirty_lock:
+            stored = self._player_fingerprints.get(player.id)
+        if stored == self._player_fingerprint(player):
+            return
+        self._mark_dirty(player=player)
 
     def get_player(self, player_id: str) -> Optional[Player]:
         if player_id in self._cached_players:
             return self._cached_players[player_id]
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT id, display_name, reputation, influence, cooldowns FROM players WHERE id = ?",
                 (player_id,),
@@ -431,14 +1105,23 @@ class GameState:
                 cooldowns=cooldowns,
             )
             self._cached_players[player.id] = player
+            fingerprint = self._player_fingerprint(player)
+            with self._dirty_lock:
+                self._player_fingerprints[player.id] = fingerprint
             return player
 
     def all_players(self) -> Iterable[Player]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 "SELECT id, display_name, reputation, influence, cooldowns FROM players"
             ).fetchall()
+        # Unflushed changes (including brand new players) live only in the
+        # identity map, so those objects take precedence over stored rows.
+        pending = self._pending_players()
         for row in rows:
+            if row[0] in pending:
+                yield pending.pop(row[0])
+                continue
             try:
                 influence = json.loads(row[3])
                 cooldowns = json.loads(row[4])
@@ -453,26 +1136,45 @@ class GameState:
                 cooldowns=cooldowns,
             )
             self._cached_players[player.id] = player
+            fingerprint = self._player_fingerprint(player)
+            with self._dirty_lock:
+                self._player_fingerprints[player.id] = fingerprint
             yield player
+        yield from pending.values()
+
+    def _pending_players(self) -> Dict[str, Player]:
+        unit = self._current_unit()
+        with self._dirty_lock:
+            dirty = set(self._dirty_players)
+            if unit is not None:
+                dirty |= unit.players
+        return {
+            player_id: self._cached_players[player_id]
+            for player_id in sorted(dirty)
+            if player_id in self._cached_players
+        }
 
     # Scholar management ------------------------------------------------
     def seed_base_scholars(self) -> None:
-        for scholar in self._repo.base_scholars():
-            self.save_scholar(scholar)
+        with self.transaction():
+            for scholar in self._repo.base_scholars():
+                self.save_scholar(scholar)
 
     def save_scholar(self, scholar: Scholar) -> None:
-        data_json = json.dumps(self._repo.serialize(scholar))
-        with closing(sqlite3.connect(self._db_path)) as conn:
-            conn.execute(
-                "REPLACE INTO scholars (id, data) VALUES (?, ?)",
-                (scholar.id, data_json),
-            )
-            conn.commit()
+        """Record ``scholar`` in the identity map and mark it for flushing.
+
+        Repeated saves within one ``transaction()`` serialize the scholar once.
+        """
+
         self._cached_scholars[scholar.id] = scholar
+        self._mark_dirty(scholar=scholar)
 
     def remove_scholar(self, scholar_id: str) -> None:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute("DELETE FROM scholars WHERE id = ?", (scholar_id,))
+            conn.execute(
+                "DELETE FROM scholar_memory_facts WHERE scholar_id = ?", (scholar_id,)
+            )
             conn.execute(
                 "DELETE FROM relationships WHERE scholar_id = ? OR subject_id = ?",
                 (scholar_id, scholar_id),
@@ -483,36 +1185,87 @@ class GameState:
                 (scholar_id,),
             )
             conn.commit()
+        unit = self._current_unit()
+        with self._dirty_lock:
+            self._dirty_scholars.discard(scholar_id)
+            if unit is not None:
+                unit.scholars.discard(scholar_id)
+            self._scholar_fact_counts.pop(scholar_id, None)
         self._cached_scholars.pop(scholar_id, None)
 
     def get_scholar(self, scholar_id: str) -> Optional[Scholar]:
         if scholar_id in self._cached_scholars:
             return self._cached_scholars[scholar_id]
-        with closing(sqlite3.connect(self._db_path)) as conn:
-            row = conn.execute(
-                "SELECT data FROM scholars WHERE id = ?", (scholar_id,)
-            ).fetchone()
-        if not row:
-            return None
-        data = json.loads(row[0])
-        scholar = self._repo.from_dict(data)
-        self._cached_scholars[scholar.id] = scholar
-        return scholar
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, data FROM scholars WHERE id = ?", (scholar_id,)
+            ).fetchall()
+            if not rows:
+                return None
+            return self._hydrate_scholars(conn, rows)[0]
 
     def all_scholars(self) -> Iterable[Scholar]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
-            rows = conn.execute("SELECT data FROM scholars").fetchall()
-        for row in rows:
-            data = json.loads(row[0])
-            scholar = self._repo.from_dict(data)
-            self._cached_scholars[scholar.id] = scholar
+        with self._connect() as conn:
+            rows = conn.execute("SELECT id, data FROM scholars").fetchall()
+            scholars = self._hydrate_scholars(conn, rows)
+        # Scholars saved but not yet flushed only exist in the identity map.
+        pending = self._pending_scholars()
+        for scholar in scholars:
+            pending.pop(scholar.id, None)
             yield scholar
+        yield from pending.values()
+
+    def scholars_employed_by(
+        self, player_id: str, faction: Optional[str] = None
+    ) -> List[Scholar]:
+        """Return scholars contracted to ``player_id`` via the indexed columns."""
+
+        self.flush()
+        query = "SELECT id, data FROM scholars WHERE employer = ?"
+        params: List[object] = [player_id]
+        if faction:
+            query += " AND faction = ?"
+            params.append(faction)
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+            return self._hydrate_scholars(conn, rows)
+
+    def scholar_contract_counts(self) -> Dict[str, Dict[str, int]]:
+        """Return ``{employer: {faction: scholars}}`` for every active contract."""
+
+        self.flush()
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                    SELECT employer, faction, COUNT(*)
+                    FROM scholars
+                    WHERE employer IS NOT NULL AND employer != ''
+                      AND faction IS NOT NULL AND faction != ''
+                    GROUP BY employer, faction
+                """
+            ).fetchall()
+        counts: Dict[str, Dict[str, int]] = {}
+        for employer, faction, total in rows:
+            counts.setdefault(employer, {})[faction] = int(total)
+        return counts
+
+    def _pending_scholars(self) -> Dict[str, Scholar]:
+        unit = self._current_unit()
+        with self._dirty_lock:
+            dirty = set(self._dirty_scholars)
+            if unit is not None:
+                dirty |= unit.scholars
+        return {
+            scholar_id: self._cached_scholars[scholar_id]
+            for scholar_id in sorted(dirty)
+            if scholar_id in self._cached_scholars
+        }
 
     # Relationship management -------------------------------------------
     def update_relationship(
         self, scholar_id: str, subject_id: str, feeling: float
     ) -> None:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "REPLACE INTO relationships (scholar_id, subject_id, feeling) VALUES (?, ?, ?)",
                 (scholar_id, subject_id, feeling),
@@ -520,7 +1273,7 @@ class GameState:
             conn.commit()
 
     def get_relationship(self, scholar_id: str, subject_id: str) -> Optional[float]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT feeling FROM relationships WHERE scholar_id = ? AND subject_id = ?",
                 (scholar_id, subject_id),
@@ -531,7 +1284,7 @@ class GameState:
 
     # Event log ---------------------------------------------------------
     def append_event(self, event: Event) -> None:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "INSERT INTO events (timestamp, action, payload) VALUES (?, ?, ?)",
                 (event.timestamp.isoformat(), event.action, json.dumps(event.payload)),
@@ -540,7 +1293,7 @@ class GameState:
 
     # Follow-up queue ---------------------------------------------------
     def _collect_followup_rows(self) -> List[Tuple[str, str, str, str]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 "SELECT scholar_id, kind, payload, resolve_at FROM followups"
             ).fetchall()
@@ -567,7 +1320,7 @@ class GameState:
                 scheduled_at=scheduled_at,
             )
 
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute("DELETE FROM followups")
             conn.commit()
         return len(rows)
@@ -609,7 +1362,7 @@ class GameState:
         return summary
 
     def _followup_order_snapshot(self) -> Dict[str, object]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 """
                     SELECT
@@ -703,7 +1456,7 @@ class GameState:
         self, now: datetime
     ) -> List[Tuple[int, str, str, Dict[str, object]]]:
         self._migrate_followups_to_orders()
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 """
                     SELECT id, order_type, actor_id, payload
@@ -735,14 +1488,14 @@ class GameState:
         updated = self.update_order_status(followup_id, status, result=result)
         if updated:
             return
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute("DELETE FROM followups WHERE id = ?", (followup_id,))
             conn.commit()
 
     def list_followups(self) -> List[Tuple[int, str, str, datetime, Dict[str, object]]]:
         """List all followups (not just due ones)."""
         self._migrate_followups_to_orders()
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 """
                     SELECT id, order_type, actor_id, payload, scheduled_at
@@ -781,7 +1534,7 @@ class GameState:
     ) -> int:
         created_ts = (now or datetime.now(timezone.utc)).isoformat()
         expires_ts = expires_at.isoformat() if expires_at else None
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 """INSERT INTO moderation_overrides
                        (text_hash, surface, stage, category, notes, created_by, created_at, expires_at)
@@ -801,7 +1554,7 @@ class GameState:
             return int(cursor.lastrowid)
 
     def remove_moderation_override(self, override_id: int) -> bool:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "DELETE FROM moderation_overrides WHERE id = ?",
                 (override_id,),
@@ -815,7 +1568,7 @@ class GameState:
         include_expired: bool = False,
         now: Optional[datetime] = None,
     ) -> List[Dict[str, object]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 "SELECT id, text_hash, surface, stage, category, notes, created_by, created_at, expires_at FROM moderation_overrides ORDER BY created_at DESC"
             ).fetchall()
@@ -863,7 +1616,7 @@ class GameState:
                 "metadata": release.metadata,
             }
         )
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "INSERT INTO queued_press (release_at, payload) VALUES (?, ?)",
                 (release_at.isoformat(), payload),
@@ -873,7 +1626,7 @@ class GameState:
     def due_queued_press(
         self, now: datetime
     ) -> List[Tuple[int, datetime, Dict[str, object]]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 "SELECT id, release_at, payload FROM queued_press WHERE release_at <= ? ORDER BY release_at ASC",
                 (now.isoformat(),),
@@ -887,17 +1640,17 @@ class GameState:
         return releases
 
     def count_queued_press(self) -> int:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute("SELECT COUNT(*) FROM queued_press").fetchone()
         return int(row[0]) if row else 0
 
     def clear_queued_press(self, queue_id: int) -> None:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute("DELETE FROM queued_press WHERE id = ?", (queue_id,))
             conn.commit()
 
     def list_queued_press(self) -> List[Tuple[int, datetime, Dict[str, object]]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 "SELECT id, release_at, payload FROM queued_press ORDER BY release_at ASC"
             ).fetchall()
@@ -920,7 +1673,7 @@ class GameState:
     ) -> int:
         now = datetime.now(timezone.utc).isoformat()
         scheduled_iso = scheduled_at.isoformat() if scheduled_at else None
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 """INSERT INTO orders
                        (order_type, actor_id, subject_id, payload, status, scheduled_at, created_at, updated_at, source_table, source_id, result)
@@ -948,7 +1701,7 @@ class GameState:
         order_type: str,
         now: datetime,
     ) -> List[Dict[str, object]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 """SELECT id, actor_id, subject_id, payload, scheduled_at
                        FROM orders
@@ -982,7 +1735,7 @@ class GameState:
     ) -> bool:
         now = datetime.now(timezone.utc).isoformat()
         order_type: Optional[str] = None
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT order_type FROM orders WHERE id = ?",
                 (order_id,),
@@ -1026,7 +1779,7 @@ class GameState:
             query += " WHERE " + " AND ".join(conditions)
         query += " ORDER BY created_at"
 
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(query, params).fetchall()
 
         orders: List[Dict[str, object]] = []
@@ -1051,7 +1804,7 @@ class GameState:
         return orders
 
     def get_order(self, order_id: int) -> Optional[Dict[str, object]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 """SELECT id, order_type, actor_id, subject_id, payload, status,
                               scheduled_at, created_at, updated_at, source_table, source_id, result
@@ -1079,7 +1832,7 @@ class GameState:
     def _pending_order_stats(self, order_type: str) -> Tuple[int, Optional[float]]:
         """Return pending count and age in seconds for the given order type."""
 
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 """SELECT COUNT(*) as pending,
                               MIN(created_at) as oldest_created
@@ -1142,7 +1895,7 @@ class GameState:
 
     def export_events(self) -> List[Event]:
         events: List[Event] = []
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 "SELECT timestamp, action, payload FROM events ORDER BY id ASC"
             ).fetchall()
@@ -1158,7 +1911,7 @@ class GameState:
 
     # Timeline ----------------------------------------------------------
     def current_year(self) -> int:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT current_year FROM timeline WHERE singleton = 1"
             ).fetchone()
@@ -1167,7 +1920,7 @@ class GameState:
         return int(row[0])
 
     def advance_timeline(self, now: datetime, days_per_year: int) -> Tuple[int, int]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT current_year, last_advanced FROM timeline WHERE singleton = 1"
             ).fetchone()
@@ -1184,7 +1937,7 @@ class GameState:
         years_elapsed = delta_days // days_per_year
         new_year = current_year + years_elapsed
         new_anchor = last_advanced + timedelta(days=years_elapsed * days_per_year)
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "UPDATE timeline SET current_year = ?, last_advanced = ? WHERE singleton = 1",
                 (new_year, new_anchor.isoformat()),
@@ -1195,7 +1948,7 @@ class GameState:
     # Theory log --------------------------------------------------------
     def record_theory(self, record: TheoryRecord) -> int:
         """Record a theory and return its ID."""
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "INSERT INTO theories (timestamp, player_id, theory, confidence, supporters, deadline)"
                 " VALUES (?, ?, ?, ?, ?, ?)",
@@ -1216,7 +1969,7 @@ class GameState:
         self, record: ExpeditionRecord, result_payload: Dict[str, object] | None = None
     ) -> None:
         payload_json = json.dumps(result_payload or {})
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "REPLACE INTO expeditions (code, timestamp, player_id, expedition_type, objective, team, funding, prep_depth, confidence, outcome, reputation_delta, result_payload)"
                 " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
@@ -1256,7 +2009,7 @@ class GameState:
 
     # Press archive -----------------------------------------------------
     def record_press_release(self, record: PressRecord) -> None:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "INSERT INTO press_releases (timestamp, type, headline, body, metadata) VALUES (?, ?, ?, ?, ?)",
                 (
@@ -1270,7 +2023,7 @@ class GameState:
             conn.commit()
 
     def get_press_release(self, press_id: int) -> Optional[PressRecord]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT timestamp, type, headline, body, metadata FROM press_releases WHERE id = ?",
                 (press_id,),
@@ -1291,7 +2044,7 @@ class GameState:
         if limit is not None:
             query += " LIMIT ? OFFSET ?"
             params = (limit, offset)
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(query, params).fetchall()
         results: List[tuple[int, PressRecord]] = []
         for press_id, ts, type_, headline, body, metadata in rows:
@@ -1316,7 +2069,7 @@ class GameState:
             params = (limit, offset)
         else:
             params = ()
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(query, params).fetchall()
         for ts, type_, headline, body, metadata in rows:
             release = PressRelease(
@@ -1327,6 +2080,109 @@ class GameState:
             )
         return records
 
+    def iter_press_releases(
+        self,
+        *,
+        newest_first: bool = True,
+        after_id: Optional[int] = None,
+        types: Optional[Iterable[str]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        month: Optional[str] = None,
+        with_metadata: bool = True,
+        batch_size: int = 500,
+    ) -> Iterator[Tuple[int, PressRecord]]:
+        """Stream ``(id, record)`` pairs using keyset pagination on ``id``.
+
+        Rows are fetched ``batch_size`` at a time and no statement stays open
+        between batches, so memory is flat however large the archive grows.
+        ``after_id`` resumes past a previously seen id in the chosen order.
+        ``month`` restricts to one ``YYYY-MM`` calendar month of timestamps.
+        When ``with_metadata`` is false the metadata column is never read or
+        decoded and each release carries an empty dict.
+        """
+
+        columns = "id, timestamp, type, headline, body, "
+        columns += "metadata" if with_metadata else "NULL"
+        conditions: List[str] = []
+        params: List[object] = []
+        type_list = sorted(set(types)) if types is not None else None
+        if type_list is not None:
+            if not type_list:
+                return
+            conditions.append(f"type IN ({', '.join('?' for _ in type_list)})")
+            params.extend(type_list)
+        if since is not None:
+            conditions.append("timestamp >= ?")
+            params.append(since.isoformat())
+        if until is not None:
+            conditions.append("timestamp < ?")
+            params.append(until.isoformat())
+        if month is not None:
+            # A range on the raw column, like since/until, so the timestamp
+            # index can serve it.
+            year, month_number = (int(part) for part in month.split("-"))
+            next_year, next_month = divmod(year * 12 + month_number, 12)
+            conditions.append("timestamp >= ? AND timestamp < ?")
+            params.extend([month, f"{next_year:04d}-{next_month + 1:02d}"])
+        comparator, order = ("<", "DESC") if newest_first else (">", "ASC")
+        cursor_id = after_id
+        batch_size = max(1, batch_size)
+        while True:
+            clauses = list(conditions)
+            batch_params = list(params)
+            if cursor_id is not None:
+                clauses.append(f"id {comparator} ?")
+                batch_params.append(cursor_id)
+            query = f"SELECT {columns} FROM press_releases"
+            if clauses:
+                query += " WHERE " + " AND ".join(clauses)
+            query += f" ORDER BY id {order} LIMIT ?"
+            batch_params.append(batch_size)
+            with self._connect() as conn:
+                rows = conn.execute(query, batch_params).fetchall()
+            for press_id, ts, type_, headline, body, metadata in rows:
+                release = PressRelease(
+                    type=type_,
+                    headline=headline,
+                    body=body,
+                    metadata=json.loads(metadata) if metadata else {},
+                )
+                yield (
+                    press_id,
+                    PressRecord(timestamp=datetime.fromisoformat(ts), release=release),
+                )
+            if len(rows) < batch_size:
+                return
+            cursor_id = rows[-1][0]
+
+    def count_press_releases(self, types: Optional[Iterable[str]] = None) -> int:
+        query = "SELECT COUNT(*) FROM press_releases"
+        params: List[object] = []
+        if types is not None:
+            type_list = sorted(set(types))
+            if not type_list:
+                return 0
+            query += f" WHERE type IN ({', '.join('?' for _ in type_list)})"
+            params.extend(type_list)
+        with self._connect() as conn:
+            row = conn.execute(query, params).fetchone()
+        return int(row[0]) if row else 0
+
+    def press_release_counts(self, group_by: str) -> Dict[str, int]:
+        """Count press releases per ``"type"`` or per ``"month"`` (``YYYY-MM``)."""
+
+        expressions = {"type": "type", "month": "substr(timestamp, 1, 7)"}
+        if group_by not in expressions:
+            raise ValueError(f"Unsupported press grouping: {group_by}")
+        expression = expressions[group_by]
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {expression}, COUNT(*) FROM press_releases "
+                f"GROUP BY {expression} ORDER BY {expression}"
+            ).fetchall()
+        return {key: int(count) for key, count in rows}
+
     def add_scholar_nickname(
         self,
         *,
@@ -1335,7 +2191,7 @@ class GameState:
         nickname: str,
         created_at: datetime,
     ) -> None:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "INSERT INTO scholar_nicknames (scholar_id, player_id, nickname, created_at) VALUES (?, ?, ?, ?)",
                 (scholar_id, player_id, nickname, created_at.isoformat()),
@@ -1343,7 +2199,7 @@ class GameState:
             conn.commit()
 
     def list_scholar_nicknames(self, scholar_id: str) -> List[Dict[str, str]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 "SELECT player_id, nickname, created_at FROM scholar_nicknames WHERE scholar_id = ? ORDER BY created_at DESC",
                 (scholar_id,),
@@ -1365,7 +2221,7 @@ class GameState:
         headline: str,
         shared_at: datetime,
     ) -> None:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "INSERT INTO press_shares (player_id, press_id, headline, shared_at) VALUES (?, ?, ?, ?)",
                 (player_id, press_id, headline, shared_at.isoformat()),
@@ -1375,7 +2231,7 @@ class GameState:
     # Offer management (Defection negotiations) ------------------------
     def save_offer(self, offer: OfferRecord) -> int:
         """Save a defection offer to the database. First actual use of offers table!"""
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             # Convert influence_offered and terms to JSON
             payload = {
                 "rival_id": offer.rival_id,
@@ -1391,14 +2247,16 @@ class GameState:
             }
 
             cursor = conn.execute(
-                """INSERT INTO offers (scholar_id, faction, payload, status, created_at)
-                   VALUES (?, ?, ?, ?, ?)""",
+                """INSERT INTO offers
+                       (scholar_id, faction, payload, status, created_at, parent_offer_id)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
                 (
                     offer.scholar_id,
                     offer.faction,
                     json.dumps(payload),
                     offer.status,
                     offer.created_at.isoformat(),
+                    offer.parent_offer_id,
                 ),
             )
             conn.commit()
@@ -1406,49 +2264,52 @@ class GameState:
 
     def get_offer(self, offer_id: int) -> Optional[OfferRecord]:
         """Retrieve a specific offer by ID."""
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT id, scholar_id, faction, payload, status, created_at FROM offers WHERE id = ?",
                 (offer_id,),
             ).fetchone()
 
-            if not row:
-                return None
-
-            id_, scholar_id, faction, payload_json, status, created_at = row
-            payload = json.loads(payload_json)
-
-            return OfferRecord(
-                id=id_,
-                scholar_id=scholar_id,
-                faction=faction,
-                rival_id=payload.get("rival_id", ""),
-                patron_id=payload.get("patron_id", ""),
-                offer_type=payload.get("offer_type", "initial"),
-                influence_offered=payload.get("influence_offered", {}),
-                terms=payload.get("terms", {}),
-                relationship_snapshot=payload.get("relationship_snapshot", {}),
-                status=status,
-                parent_offer_id=payload.get("parent_offer_id"),
-                created_at=datetime.fromisoformat(created_at),
-                resolved_at=(
-                    datetime.fromisoformat(payload["resolved_at"])
-                    if payload.get("resolved_at")
-                    else None
-                ),
-            )
+        if not row:
+            return None
+        return self._offer_from_row(row, json.loads(row[3]))
+
+    @staticmethod
+    def _offer_from_row(
+        row: Tuple[int, str, str, str, str, str], payload: Dict[str, object]
+    ) -> OfferRecord:
+        id_, scholar_id, faction, _payload_json, status, created_at = row
+        return OfferRecord(
+            id=id_,
+            scholar_id=scholar_id,
+            faction=faction,
+            rival_id=payload.get("rival_id", ""),
+            patron_id=payload.get("patron_id", ""),
+            offer_type=payload.get("offer_type", "initial"),
+            influence_offered=payload.get("influence_offered", {}),
+            terms=payload.get("terms", {}),
+            relationship_snapshot=payload.get("relationship_snapshot", {}),
+            status=status,
+            parent_offer_id=payload.get("parent_offer_id"),
+            created_at=datetime.fromisoformat(created_at),
+            resolved_at=(
+                datetime.fromisoformat(payload["resolved_at"])
+                if payload.get("resolved_at")
+                else None
+            ),
+        )
 
     def list_active_offers(self, player_id: Optional[str] = None) -> List[OfferRecord]:
         """Get all pending offers, optionally filtered by player involvement."""
         query = "SELECT id, scholar_id, faction, payload, status, created_at FROM offers WHERE status IN ('pending', 'countered')"
         params = []
 
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(query, params).fetchall()
 
         offers = []
-        for id_, scholar_id, faction, payload_json, status, created_at in rows:
-            payload = json.loads(payload_json)
+        for row in rows:
+            payload = json.loads(row[3])
 
             # Filter by player if specified
             if player_id and player_id not in [
@@ -1457,27 +2318,7 @@ class GameState:
             ]:
                 continue
 
-            offers.append(
-                OfferRecord(
-                    id=id_,
-                    scholar_id=scholar_id,
-                    faction=faction,
-                    rival_id=payload.get("rival_id", ""),
-                    patron_id=payload.get("patron_id", ""),
-                    offer_type=payload.get("offer_type", "initial"),
-                    influence_offered=payload.get("influence_offered", {}),
-                    terms=payload.get("terms", {}),
-                    relationship_snapshot=payload.get("relationship_snapshot", {}),
-                    status=status,
-                    parent_offer_id=payload.get("parent_offer_id"),
-                    created_at=datetime.fromisoformat(created_at),
-                    resolved_at=(
-                        datetime.fromisoformat(payload["resolved_at"])
-                        if payload.get("resolved_at")
-                        else None
-                    ),
-                )
-            )
+            offers.append(self._offer_from_row(row, payload))
 
         return offers
 
@@ -1485,7 +2326,7 @@ class GameState:
         self, offer_id: int, new_status: str, resolved_at: Optional[datetime] = None
     ) -> None:
         """Update the status of an offer."""
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             # First get the current offer to update its payload
             row = conn.execute(
                 "SELECT payload FROM offers WHERE id = ?",
@@ -1504,38 +2345,39 @@ class GameState:
                 conn.commit()
 
     def get_offer_chain(self, offer_id: int) -> List[OfferRecord]:
-        """Get all offers in a negotiation chain."""
-        offers = []
-        current_offer = self.get_offer(offer_id)
-
-        if not current_offer:
-            return offers
+        """Get all offers in a negotiation chain.
 
-        # Find the root offer
-        while current_offer.parent_offer_id:
-            parent = self.get_offer(current_offer.parent_offer_id)
-            if parent:
-                current_offer = parent
-            else:
-                break
-
-        # Now collect all offers in the chain
-        def collect_children(offer: OfferRecord) -> None:
-            offers.append(offer)
-            # Find all offers that have this as parent
-            with closing(sqlite3.connect(self._db_path)) as conn:
-                rows = conn.execute(
-                    "SELECT id FROM offers WHERE payload LIKE ?",
-                    (f'%"parent_offer_id": {offer.id}%',),
-                ).fetchall()
-
-                for (child_id,) in rows:
-                    child = self.get_offer(child_id)
-                    if child:
-                        collect_children(child)
-
-        collect_children(current_offer)
-        return offers
+        A single recursive query walks up to the root offer via the indexed
+        ``parent_offer_id`` column and then back down through every counter,
+        returning offers depth-first with siblings in creation order.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                    WITH RECURSIVE
+                        ancestors(id, parent_offer_id, depth) AS (
+                            SELECT id, parent_offer_id, 0 FROM offers WHERE id = ?
+                            UNION ALL
+                            SELECT o.id, o.parent_offer_id, a.depth + 1
+                            FROM offers o JOIN ancestors a ON o.id = a.parent_offer_id
+                        ),
+                        root(id) AS (
+                            SELECT id FROM ancestors ORDER BY depth DESC LIMIT 1
+                        ),
+                        chain(id, path) AS (
+                            SELECT id, printf('%012d', id) FROM root
+                            UNION ALL
+                            SELECT o.id, chain.path || '/' || printf('%012d', o.id)
+                            FROM offers o JOIN chain ON o.parent_offer_id = chain.id
+                        )
+                    SELECT o.id, o.scholar_id, o.faction, o.payload, o.status,
+                           o.created_at
+                    FROM chain JOIN offers o ON o.id = chain.id
+                    ORDER BY chain.path
+                """,
+                (offer_id,),
+            ).fetchall()
+        return [self._offer_from_row(row, json.loads(row[3])) for row in rows]
 
     # Mentorship management ---------------------------------------------
     def add_mentorship(
@@ -1547,7 +2389,7 @@ class GameState:
     ) -> int:
         """Add a new mentorship relationship."""
         now = created_at or datetime.now(timezone.utc)
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 """INSERT INTO mentorships
                    (player_id, scholar_id, start_date, status, career_track, created_at, resolved_at)
@@ -1567,7 +2409,7 @@ class GameState:
         self, scholar_id: str
     ) -> Optional[Tuple[int, str, str, str]]:
         """Get active mentorship for a scholar if it exists."""
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 """SELECT id, player_id, career_track, start_date
                    FROM mentorships
@@ -1600,7 +2442,7 @@ class GameState:
         self,
         mentorship_id: int,
     ) -> Optional[Tuple[int, str, str, str | None, str]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 """SELECT id, player_id, scholar_id, career_track, status
                    FROM mentorships
@@ -1613,7 +2455,7 @@ class GameState:
 
     def activate_mentorship(self, mentorship_id: int) -> None:
         """Mark a mentorship as active."""
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "UPDATE mentorships SET status = 'active' WHERE id = ?",
                 (mentorship_id,),
@@ -1625,7 +2467,7 @@ class GameState:
     ) -> None:
         """Mark a mentorship as completed."""
         now = resolved_at or datetime.now(timezone.utc)
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "UPDATE mentorships SET status = 'completed', resolved_at = ? WHERE id = ?",
                 (now.isoformat(), mentorship_id),
@@ -1645,7 +2487,7 @@ class GameState:
     ) -> None:
         """Queue a conference for resolution."""
         now = timestamp or datetime.now(timezone.utc)
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """INSERT INTO conferences
                    (code, timestamp, player_id, theory_id, confidence, supporters, opposition)
@@ -1694,7 +2536,7 @@ class GameState:
         self,
         code: str,
     ) -> Optional[Tuple[str, str, int, str, List[str], List[str], datetime]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 """SELECT code, player_id, theory_id, confidence, supporters, opposition, timestamp
                    FROM conferences
@@ -1721,7 +2563,7 @@ class GameState:
         result_payload: Dict[str, object] | None = None,
     ) -> None:
         """Mark a conference as resolved with outcome."""
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """UPDATE conferences
                    SET outcome = ?, reputation_delta = ?, result_payload = ?
@@ -1737,7 +2579,7 @@ class GameState:
 
     def get_theory_by_id(self, theory_id: int) -> Optional[Tuple[int, TheoryRecord]]:
         """Retrieve a theory by ID, returning (id, record) tuple."""
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 """SELECT id, timestamp, player_id, theory, confidence, supporters, deadline
                    FROM theories WHERE id = ?""",
@@ -1757,7 +2599,7 @@ class GameState:
 
     def get_last_theory_id_by_player(self, player_id: str) -> Optional[int]:
         """Get the ID of the most recent theory submitted by a player."""
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 """SELECT id FROM theories
                    WHERE player_id = ?
@@ -1769,7 +2611,7 @@ class GameState:
 
     def pending_theories(self) -> List[Tuple[int, TheoryRecord]]:
         """Get all theories with deadlines that haven't passed yet."""
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             current_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
             rows = conn.execute(
                 """
@@ -1798,7 +2640,7 @@ class GameState:
 
     def list_theories(self, limit: int | None = None) -> List[Tuple[int, TheoryRecord]]:
         """List all theories with their IDs, optionally limited."""
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             query = "SELECT id, timestamp, player_id, theory, confidence, supporters, deadline FROM theories ORDER BY id DESC"
             if limit is not None:
                 query += f" LIMIT {limit}"
@@ -1828,7 +2670,7 @@ class GameState:
     ) -> int:
         """Create a new symposium topic for voting."""
         now = created_at or datetime.now(timezone.utc)
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 """INSERT INTO symposium_topics
                    (symposium_date, topic, description, status, created_at, proposal_id)
@@ -1851,7 +2693,7 @@ class GameState:
 
         Returns: (topic_id, topic, description, proposal_id, list of vote options) or None
         """
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 """SELECT id, topic, description, proposal_id
                    FROM symposium_topics
@@ -1873,7 +2715,7 @@ class GameState:
     ) -> None:
         """Record a player's vote on a symposium topic."""
         now = voted_at or datetime.now(timezone.utc)
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """INSERT OR REPLACE INTO symposium_votes
                    (topic_id, player_id, vote_option, voted_at)
@@ -1892,7 +2734,7 @@ class GameState:
 
         Returns: Dict mapping vote option to count
         """
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 """SELECT vote_option, COUNT(*) as count
                    FROM symposium_votes
@@ -1905,7 +2747,7 @@ class GameState:
     def list_symposium_voters(self, topic_id: int) -> List[str]:
         """Return the player ids that have voted for the symposium."""
 
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 "SELECT player_id FROM symposium_votes WHERE topic_id = ?",
                 (topic_id,),
@@ -1915,7 +2757,7 @@ class GameState:
     def get_symposium_topic(self, topic_id: int) -> Optional[Dict[str, object]]:
         """Return metadata for the requested symposium topic."""
 
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 """SELECT id, symposium_date, topic, description, status, winner, created_at, proposal_id
                    FROM symposium_topics
@@ -1938,7 +2780,7 @@ class GameState:
     def has_symposium_vote(self, topic_id: int, player_id: str) -> bool:
         """Return True if the player has already voted on the topic."""
 
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT 1 FROM symposium_votes WHERE topic_id = ? AND player_id = ?",
                 (topic_id, player_id),
@@ -1958,7 +2800,7 @@ class GameState:
     ) -> int:
         now = created_at or datetime.now(timezone.utc)
         expire_iso = expire_at.isoformat() if expire_at else None
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 """INSERT INTO symposium_proposals
                    (player_id, topic, description, status, created_at, updated_at, expire_at, priority)
@@ -1989,7 +2831,7 @@ class GameState:
         query = (
             "SELECT COUNT(*) FROM symposium_proposals WHERE " + where
         )  # nosec B608 - constants joined; values are bound
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(query, params).fetchone()
         return int(row[0]) if row else 0
 
@@ -2008,13 +2850,13 @@ class GameState:
         query = (
             "SELECT COUNT(*) FROM symposium_proposals WHERE " + where
         )  # nosec B608 - constants joined; values are bound
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(query, params).fetchone()
         return int(row[0]) if row else 0
 
     def expire_symposium_proposals(self, cutoff: datetime) -> List[int]:
         cutoff_iso = cutoff.isoformat()
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 """SELECT id FROM symposium_proposals
                        WHERE status = 'pending' AND expire_at IS NOT NULL AND expire_at <= ?""",
@@ -2056,7 +2898,7 @@ class GameState:
             if lim is not None and lim > 0:
                 sql += " LIMIT ?"
                 params.append(lim)
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(sql, params).fetchall()
         proposals: List[Dict[str, object]] = []
         for row in rows:
@@ -2083,7 +2925,7 @@ class GameState:
         return proposals[0] if proposals else None
 
     def get_symposium_proposal(self, proposal_id: int) -> Optional[Dict[str, object]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 """SELECT id, player_id, topic, description, status, created_at, updated_at, selected_topic_id, expire_at, priority
                    FROM symposium_proposals
@@ -2115,7 +2957,7 @@ class GameState:
     ) -> None:
         now = datetime.now(timezone.utc).isoformat()
         expire_iso = expire_at.isoformat() if expire_at else None
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """UPDATE symposium_proposals
                    SET status = ?,
@@ -2134,7 +2976,7 @@ class GameState:
         *,
         limit: int,
     ) -> List[Dict[str, object]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 """SELECT id, symposium_date, topic, description, proposal_id, status, winner, created_at
                        FROM symposium_topics
@@ -2170,7 +3012,7 @@ class GameState:
         created_at: Optional[datetime] = None,
     ) -> int:
         now = (created_at or datetime.now(timezone.utc)).isoformat()
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 """INSERT INTO symposium_pledges
                        (topic_id, player_id, pledge_amount, faction, status, created_at)
@@ -2191,7 +3033,7 @@ class GameState:
         faction: Optional[str] = None,
     ) -> None:
         now_iso = (resolved_at or datetime.now(timezone.utc)).isoformat()
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """UPDATE symposium_pledges
                        SET status = ?,
@@ -2217,7 +3059,7 @@ class GameState:
         if status is not None:
             sql += " AND status = ?"
             params.append(status)
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(sql, params).fetchall()
         pledges: List[Dict[str, object]] = []
         for row in rows:
@@ -2240,7 +3082,7 @@ class GameState:
         topic_id: int,
         player_id: str,
     ) -> Optional[Dict[str, object]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 """SELECT id, pledge_amount, faction, status, created_at, resolved_at
                        FROM symposium_pledges
@@ -2264,7 +3106,7 @@ class GameState:
         *,
         limit: int = 5,
     ) -> List[Dict[str, object]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 """SELECT p.topic_id, t.topic, t.symposium_date, p.pledge_amount, p.faction,
                               p.status, p.created_at, p.resolved_at
@@ -2299,7 +3141,7 @@ class GameState:
         *,
         source: str,
     ) -> List[Dict[str, object]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 """SELECT faction, amount, created_at, updated_at, reprisal_level, last_reprisal_at
                        FROM symposium_debts
@@ -2341,7 +3183,7 @@ class GameState:
         if amount <= 0:
             return
         timestamp = (now or datetime.now(timezone.utc)).isoformat()
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """INSERT INTO symposium_debts (player_id, faction, amount, created_at, updated_at, reprisal_level, last_reprisal_at, source)
                        VALUES (?, ?, ?, ?, ?, 0, NULL, ?)
@@ -2379,7 +3221,7 @@ class GameState:
     ) -> int:
         if amount <= 0:
             return 0
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT amount FROM symposium_debts WHERE player_id = ? AND faction = ? AND source = ?",
                 (player_id, faction, source),
@@ -2435,7 +3277,7 @@ class GameState:
         now: datetime,
         source: str,
     ) -> None:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """UPDATE symposium_debts
                        SET reprisal_level = ?, last_reprisal_at = ?, updated_at = ?
@@ -2474,7 +3316,7 @@ class GameState:
         faction: str,
         source: str,
     ) -> Optional[Dict[str, object]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 """SELECT amount, created_at, updated_at, reprisal_level, last_reprisal_at, source
                        FROM symposium_debts
@@ -2508,7 +3350,7 @@ class GameState:
         return record
 
     def total_influence_debt(self, player_id: str, *, source: str) -> int:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT SUM(amount) FROM symposium_debts WHERE player_id = ? AND source = ?",
                 (player_id, source),
@@ -2522,7 +3364,7 @@ class GameState:
         self,
         player_id: str,
     ) -> Optional[Dict[str, object]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 """SELECT player_id, miss_streak, grace_window_start, grace_miss_consumed, last_voted_at, updated_at
                        FROM symposium_participation
@@ -2553,7 +3395,7 @@ class GameState:
         now = (updated_at or datetime.now(timezone.utc)).isoformat()
         grace_start_iso = grace_window_start.isoformat() if grace_window_start else None
         last_vote_iso = last_voted_at.isoformat() if last_voted_at else None
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """INSERT INTO symposium_participation AS sp
                        (player_id, miss_streak, grace_window_start, grace_miss_consumed, last_voted_at, updated_at)
@@ -2577,7 +3419,7 @@ class GameState:
 
     def cancel_symposium_reminders(self, topic_id: int) -> None:
         now = datetime.now(timezone.utc).isoformat()
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """UPDATE orders
                    SET status = 'cancelled', updated_at = ?
@@ -2594,7 +3436,7 @@ class GameState:
         player_id: str,
     ) -> None:
         now = datetime.now(timezone.utc).isoformat()
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """UPDATE orders
                    SET status = 'completed', updated_at = ?
@@ -2612,7 +3454,7 @@ class GameState:
         winner: str,
     ) -> None:
         """Mark a symposium topic as resolved with a winner."""
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """UPDATE symposium_topics
                    SET status = 'resolved', winner = ?
@@ -2632,7 +3474,7 @@ class GameState:
         start_at: datetime,
         end_at: datetime,
     ) -> int:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 """INSERT INTO seasonal_commitments
                        (player_id, faction, tier, base_cost, start_at, end_at, status, last_processed_at, updated_at)
@@ -2653,7 +3495,7 @@ class GameState:
     def list_active_seasonal_commitments(
         self, now: datetime
     ) -> List[Dict[str, object]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 """SELECT id, player_id, faction, tier, base_cost, start_at, end_at, status, last_processed_at, updated_at
                        FROM seasonal_commitments
@@ -2681,7 +3523,7 @@ class GameState:
         return commitments
 
     def list_player_commitments(self, player_id: str) -> List[Dict[str, object]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 """SELECT id, faction, tier, base_cost, start_at, end_at, status, last_processed_at, updated_at
                        FROM seasonal_commitments
@@ -2710,7 +3552,7 @@ class GameState:
     def get_seasonal_commitment(
         self, commitment_id: int
     ) -> Optional[Dict[str, object]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 """SELECT id, player_id, faction, tier, base_cost, start_at, end_at, status, last_processed_at, updated_at
                        FROM seasonal_commitments
@@ -2737,7 +3579,7 @@ class GameState:
         commitment_id: int,
         processed_at: datetime,
     ) -> None:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "UPDATE seasonal_commitments SET last_processed_at = ?, updated_at = ? WHERE id = ?",
                 (processed_at.isoformat(), processed_at.isoformat(), commitment_id),
@@ -2750,7 +3592,7 @@ class GameState:
         status: str,
         processed_at: datetime,
     ) -> None:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "UPDATE seasonal_commitments SET status = ?, last_processed_at = ?, updated_at = ? WHERE id = ?",
                 (
@@ -2773,7 +3615,7 @@ class GameState:
         created_at: Optional[datetime] = None,
     ) -> int:
         now = (created_at or datetime.now(timezone.utc)).isoformat()
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 """INSERT INTO faction_projects
                        (name, faction, target_progress, progress, status, created_at, updated_at, metadata)
@@ -2791,7 +3633,7 @@ class GameState:
             return int(cursor.lastrowid)
 
     def list_active_faction_projects(self) -> List[Dict[str, object]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 """SELECT id, name, faction, target_progress, progress, status, created_at, updated_at, metadata
                        FROM faction_projects
@@ -2821,7 +3663,7 @@ class GameState:
         query = "SELECT id, name, faction, target_progress, progress, status, created_at, updated_at, metadata FROM faction_projects"
         if not include_completed:
             query += " WHERE status = 'active'"
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(query).fetchall()
         projects: List[Dict[str, object]] = []
         for row in rows:
@@ -2841,7 +3683,7 @@ class GameState:
         return projects
 
     def get_faction_project(self, project_id: int) -> Optional[Dict[str, object]]:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 """SELECT id, name, faction, target_progress, progress, status, created_at, updated_at, metadata
                        FROM faction_projects
@@ -2868,7 +3710,7 @@ class GameState:
         progress: float,
         updated_at: datetime,
     ) -> None:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "UPDATE faction_projects SET progress = ?, updated_at = ? WHERE id = ?",
                 (float(progress), updated_at.isoformat(), project_id),
@@ -2880,7 +3722,7 @@ class GameState:
         project_id: int,
         completed_at: datetime,
     ) -> None:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "UPDATE faction_projects SET status = 'completed', progress = target_progress, updated_at = ? WHERE id = ?",
                 (completed_at.isoformat(), project_id),
@@ -2893,7 +3735,7 @@ class GameState:
         status: str,
         updated_at: datetime,
     ) -> None:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "UPDATE faction_projects SET status = ?, updated_at = ? WHERE id = ?",
                 (status, updated_at.isoformat(), project_id),
@@ -2910,7 +3752,7 @@ class GameState:
         program: Optional[str],
         created_at: datetime,
     ) -> int:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 """INSERT INTO faction_investments
                        (player_id, faction, amount, program, created_at)
@@ -2939,7 +3781,7 @@ class GameState:
             query += " WHERE player_id = ?"
             params = (player_id,)
         query += " ORDER BY created_at DESC"
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(query, params).fetchall()
         investments: List[Dict[str, object]] = []
         for row in rows:
@@ -2966,7 +3808,7 @@ class GameState:
         if faction:
             query += " AND faction = ?"
             params = (player_id, faction)
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(query, params).fetchone()
         return int(row[0]) if row and row[0] is not None else 0
 
@@ -2980,7 +3822,7 @@ class GameState:
         program: Optional[str],
         created_at: datetime,
     ) -> int:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 """INSERT INTO archive_endowments
                        (player_id, faction, amount, program, created_at)
@@ -3009,7 +3851,7 @@ class GameState:
             query += " WHERE player_id = ?"
             params = (player_id,)
         query += " ORDER BY created_at DESC"
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             rows = conn.execute(query, params).fetchall()
         endowments: List[Dict[str, object]] = []
         for row in rows:
@@ -3027,7 +3869,7 @@ class GameState:
         return endowments
 
     def total_archive_endowment(self, player_id: str) -> int:
-        with closing(sqlite3.connect(self._db_path)) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT SUM(amount) FROM archive_endowments WHERE player_id = ?",
                 (player_id,),
@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
+import atexit
+import bisect
+import contextlib
+import heapq
 import json
 import logging
+import math
 import os
+import queue
 import sqlite3
+import threading
 import time
+import weakref
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .alerting import get_alert_router
+from .tracing import get_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +85,297 @@ class MetricType(Enum):
 
 DEFAULT_TELEMETRY_DB = Path("var") / "telemetry" / "telemetry.db"
 
+# Tags that report queries filter and group on, copied out of the JSON ``tags``
+# blob into columns so covering indexes can answer without parsing it.
+_TAG_COLUMNS = ("player_id", "channel_id", "success", "event_type", "event", "source")
+
+# Columns of the ``metrics`` view (before ``partition_name``), in order.
+METRIC_COLUMNS = (
+    "id",
+    "timestamp",
+    "metric_type",
+    "name",
+    "value",
+    "tags",
+    "metadata",
+    "created_at",
+    *_TAG_COLUMNS,
+)
+
+# Raw metrics live in one table per partition (a week by default), listed in
+# ``metric_partitions`` and read through a ``metrics`` view that unions them, so
+# retention drops whole tables instead of deleting rows. Rows whose timestamp
+# has no partition (inserted through the view by hand) go to an extra table.
+_UNPARTITIONED = "metrics_unpartitioned"
+# Partitions are aligned to Monday 1970-01-05 so weekly ones start on Mondays.
+_PARTITION_ALIGN = 4 * 86400
+# SQLite caps a compound SELECT at 500 terms; larger views nest subqueries.
+_VIEW_CHUNK = 400
+
+_METRICS_TABLE = """
+CREATE TABLE IF NOT EXISTS {table} (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    metric_type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value REAL NOT NULL,
+    tags TEXT,
+    metadata TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    """ + ", ".join(_TAG_COLUMNS) + """
+)
+"""
+
+_METRIC_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_{table}_timestamp ON {table} (timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_{table}_type_time_tags
+    ON {table} (metric_type, timestamp, name, player_id, channel_id, success);
+CREATE INDEX IF NOT EXISTS idx_{table}_type_name_time
+    ON {table} (metric_type, name, timestamp, player_id, success);
+"""
+
+_PARTITION_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metric_partitions (
+    name TEXT PRIMARY KEY,
+    range_start REAL NOT NULL,
+    range_end REAL NOT NULL
+)
+"""
+
+_INSERT_METRIC = (
+    "INSERT INTO {table} (timestamp, metric_type, name, value, tags, metadata, "
+    + ", ".join(_TAG_COLUMNS)
+    + ") VALUES (?, ?, ?, ?, ?, ?"
+    + ", ?" * len(_TAG_COLUMNS)
+    + ")"
+)
+
+
+def _create_metric_indexes(conn: sqlite3.Connection, table: str) -> None:
+    # Statement by statement: ``executescript`` would commit the open transaction.
+    for statement in _METRIC_INDEXES.format(table=table).split(";"):
+        if statement.strip():
+            conn.execute(statement)
+
+
+def _partition_bounds(timestamp: float, days: int) -> Tuple[float, float]:
+    """Return the aligned ``[start, end)`` partition range holding ``timestamp``."""
+
+    width = days * 86400
+    start = math.floor((timestamp - _PARTITION_ALIGN) / width) * width
+    return float(start + _PARTITION_ALIGN), float(start + _PARTITION_ALIGN + width)
+
+
+def _partition_name(start: float) -> str:
+    moment = datetime.fromtimestamp(start, tz=timezone.utc)
+    suffix = "" if start % 86400 == 0 else moment.strftime("_%H%M%S")
+    return f"metrics_p{moment:%Y%m%d}{suffix}"
+
+
+def _parse_event_cursor(cursor: str) -> Tuple[float, int, int]:
+    """Split a ``"<timestamp>:<source>:<id>"`` keyset cursor into its parts.
+
+    ``source`` ranks the table the row came from, since ids are only unique
+    within one table. Older ``"<timestamp>:<id>"`` cursors resume as source 0.
+    """
+
+    parts = cursor.split(":")
+    try:
+        if len(parts) == 2:
+            return float(parts[0]), 0, int(parts[1])
+        if len(parts) == 3:
+            return float(parts[0]), int(parts[1]), int(parts[2])
+    except ValueError:
+        pass
+    raise ValueError(f"Invalid cursor: {cursor!r}")
+
+
+def _metrics_union(tables: List[str]) -> str:
+    """Return a SELECT over ``tables`` shaped like the ``metrics`` view."""
+
+    columns = ", ".join(METRIC_COLUMNS)
+    selects = [
+        f"SELECT {columns}, '{table}' AS partition_name FROM {table}"
+        for table in tables
+    ]
+    while len(selects) > _VIEW_CHUNK:
+        selects = [
+            "SELECT * FROM (" + " UNION ALL ".join(selects[i : i + _VIEW_CHUNK]) + ")"
+            for i in range(0, len(selects), _VIEW_CHUNK)
+        ]
+    return "\nUNION ALL\n".join(selects)
+
+
+def _metrics_view_triggers(partitions: List[Tuple[str, float, float]]) -> List[str]:
+    """Build INSTEAD OF triggers that let the ``metrics`` view take writes.
+
+    Inserts are routed to the partition covering the row's timestamp, and
+    hot tag columns left unset are read from the ``tags`` blob so rows written
+    with only the JSON still reach column-backed reports. Updates stay in
+    place unless they move a row out of its partition's range, in which case
+    the row is deleted and re-inserted through the view.
+    """
+
+    def value(column: str) -> str:
+        if column == "created_at":
+            return "COALESCE(NEW.created_at, CURRENT_TIMESTAMP)"
+        if column in _TAG_COLUMNS:
+            return f"COALESCE(NEW.{column}, json_extract(NEW.tags, '$.{column}'))"
+        return f"NEW.{column}"
+
+    columns = [column for column in METRIC_COLUMNS if column != "id"]
+    target = ", ".join(columns)
+    values = ", ".join(value(column) for column in columns)
+    assignments = ", ".join(f"{column} = NEW.{column}" for column in columns)
+    unrouted = (
+        "NOT EXISTS (SELECT 1 FROM metric_partitions "
+        "WHERE NEW.timestamp >= range_start AND NEW.timestamp < range_end)"
+    )
+
+    insert = [
+        f"INSERT INTO {name} (id, {target}) SELECT NEW.id, {values} "
+        f"WHERE NEW.timestamp >= {start!r} AND NEW.timestamp < {end!r};"
+        for name, start, end in partitions
+    ]
+    insert.append(
+        f"INSERT INTO {_UNPARTITIONED} (id, {target}) "
+        f"SELECT NEW.id, {values} WHERE {unrouted};"
+    )
+    delete = [
+        f"DELETE FROM {name} WHERE OLD.partition_name = '{name}' AND id = OLD.id;"
+        for name in (_UNPARTITIONED, *(name for name, _, _ in partitions))
+    ]
+    update = [
+        f"UPDATE {_UNPARTITIONED} SET {assignments} "
+        f"WHERE OLD.partition_name = '{_UNPARTITIONED}' AND id = OLD.id;"
+    ]
+    for name, start, end in partitions:
+        inside = f"NEW.timestamp >= {start!r} AND NEW.timestamp < {end!r}"
+        update.append(
+            f"UPDATE {name} SET {assignments} "
+            f"WHERE OLD.partition_name = '{name}' AND id = OLD.id AND {inside};"
+        )
+        update.append(
+            f"DELETE FROM {name} "
+            f"WHERE OLD.partition_name = '{name}' AND id = OLD.id AND NOT ({inside});"
+        )
+    update.append(
+        f"INSERT INTO metrics ({target}) SELECT {values} "
+        f"WHERE OLD.partition_name <> '{_UNPARTITIONED}' AND NOT EXISTS ("
+        "SELECT 1 FROM metric_partitions WHERE name = OLD.partition_name "
+        "AND NEW.timestamp >= range_start AND NEW.timestamp < range_end);"
+    )
+    return [
+        f"CREATE TRIGGER metrics_{action} INSTEAD OF {action.upper()} ON metrics "
+        "BEGIN\n" + "\n".join(body) + "\nEND"
+        for action, body in (("insert", insert), ("delete", delete), ("update", update))
+    ]
+
+
+def _tag_column_value(value: Any) -> Any:
+    """Return a tag as ``json_extract`` would read it back from the tags blob."""
+
+    if isinstance(value, bool):
+        return int(value)
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return json.dumps(value)
+
+
+# Rollup bucket widths in seconds: per-minute and per-hour.
+ROLLUP_RESOLUTIONS = (60, 3600)
+# Percentiles reported by the latency summaries.
+LATENCY_QUANTILES = (0.5, 0.95, 0.99)
+
+_ROLLUP_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metric_rollups (
+    resolution INTEGER NOT NULL,
+    metric_type TEXT NOT NULL,
+    bucket_start REAL NOT NULL,
+    name TEXT NOT NULL,
+    success TEXT NOT NULL DEFAULT '',
+    count INTEGER NOT NULL,
+    total REAL NOT NULL,
+    min_value REAL NOT NULL,
+    max_value REAL NOT NULL,
+    sketch TEXT,
+    PRIMARY KEY (resolution, metric_type, bucket_start, name, success)
+) WITHOUT ROWID
+"""
+
+# Bumped when the meaning of stored rollups changes; older tables are rebuilt.
+# Version 1: sketches hold latency samples (``duration_ms`` for commands).
+_ROLLUP_VERSION = 1
+
+# The value each event contributes to its bucket's sketch: command usage is
+# always 1.0, so its latency lives in metadata; other types sketch ``value``.
+_SAMPLE_SQL = (
+    "CASE WHEN metric_type = 'command_usage' "
+    "THEN CAST(json_extract(metadata, '$.duration_ms') AS REAL) ELSE value END"
+)
+
+_REPLACE_ROLLUP = """
+REPLACE INTO metric_rollups
+(resolution, metric_type, bucket_start, name, success,
+ count, total, min_value, max_value, sketch)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Events are handed to the writer thread in batches of this size.
+TELEMETRY_BATCH_SIZE = 100
+# Writer threads exit after this long without work and restart on demand.
+_WRITER_IDLE_SECONDS = 30.0
+_WRITER_POLL_SECONDS = 0.5
+
+# One counter per metric type, bumped in the same transaction as each write so
+# cached report sections can tell which sources changed, even across processes.
+_WATERMARK_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metric_watermarks (
+    source TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID
+"""
+
+_BUMP_WATERMARK = """
+INSERT INTO metric_watermarks (source, version) VALUES (?, 1)
+ON CONFLICT(source) DO UPDATE SET version = version + 1
+"""
+
+# KPI targets live in their own table but are versioned alongside metric types.
+_KPI_TARGETS_SOURCE = "kpi_targets"
+
+_COMMANDS_AND_PROGRESSION = (
+    MetricType.COMMAND_USAGE.value,
+    MetricType.GAME_PROGRESSION.value,
+)
+
+# Cached report sections: the sources each one reads (``None`` for all of
+# them) and the longest, in seconds, a copy is served while those sources see
+# no writes. Windowed sections still expire as old rows age out of the window;
+# sections with no window (``None`` TTL) only change when new rows arrive.
+REPORT_SECTIONS: Dict[str, Tuple[Optional[Tuple[str, ...]], Optional[float]]] = {
+    "command_stats": ((MetricType.COMMAND_USAGE.value,), None),
+    "feature_engagement_7d": ((MetricType.FEATURE_ENGAGEMENT.value,), 600.0),
+    "errors_24h": ((MetricType.ERROR_RATE.value,), 60.0),
+    "performance_1h": ((MetricType.PERFORMANCE.value,), 30.0),
+    "command_latency_24h": ((MetricType.COMMAND_USAGE.value,), 60.0),
+    "llm_activity_24h": ((MetricType.LLM_ACTIVITY.value,), 60.0),
+    "channel_usage_24h": ((MetricType.COMMAND_USAGE.value,), 60.0),
+    "system_events_24h": ((MetricType.SYSTEM_EVENT.value,), 60.0),
+    "press_cadence_24h": ((MetricType.PRESS_CADENCE.value,), 60.0),
+    "digest_health_24h": ((MetricType.DIGEST.value,), 60.0),
+    "queue_depth_24h": ((MetricType.QUEUE_DEPTH.value,), 60.0),
+    "order_backlog_24h": ((MetricType.ORDER_STATE.value,), 60.0),
+    "symposium": (_COMMANDS_AND_PROGRESSION, 60.0),
+    "economy": ((MetricType.GAME_PROGRESSION.value,), 60.0),
+    "product_kpis": (_COMMANDS_AND_PROGRESSION, 300.0),
+    "product_kpi_history": (_COMMANDS_AND_PROGRESSION, 900.0),
+    "engagement_cohorts": ((MetricType.COMMAND_USAGE.value,), 600.0),
+    "kpi_targets": ((_KPI_TARGETS_SOURCE,), None),
+    "moderation_24h": ((MetricType.MODERATION.value,), 60.0),
+    "overall": (None, 60.0),
+}
+
 
 @dataclass
 class MetricEvent:
@@ -89,6 +389,258 @@ class MetricEvent:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+class QuantileSketch:
+    """Mergeable quantile sketch with bounded relative error (DDSketch).
+
+    Values are counted in logarithmically sized bins, so any quantile is
+    reported within ``relative_accuracy`` of the true value, and sketches for
+    different buckets merge exactly by adding their bin counts.
+    """
+
+    MAX_BINS = 2048
+    _MIN_VALUE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float, count: int = 1) -> None:
+        if value > self._MIN_VALUE:
+            store = self.positive
+            key = self._key(value)
+        elif value < -self._MIN_VALUE:
+            store = self.negative
+            key = self._key(-value)
+        else:
+            self.zero_count += count
+            self.count += count
+            return
+        store[key] = store.get(key, 0) + count
+        self.count += count
+        if len(store) > self.MAX_BINS:
+            self._collapse(store)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        for store, incoming in (
+            (self.positive, other.positive),
+            (self.negative, other.negative),
+        ):
+            for key, count in incoming.items():
+                store[key] = store.get(key, 0) + count
+            if len(store) > self.MAX_BINS:
+                self._collapse(store)
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the value at quantile ``q`` (0..1), or None when empty."""
+
+        if self.count == 0:
+            return None
+        rank = min(max(q, 0.0), 1.0) * (self.count - 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self.positive)) if self.positive else 0.0
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "a": self.relative_accuracy,
+                "z": self.zero_count,
+                "p": self.positive,
+                "n": self.negative,
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, payload: str) -> "QuantileSketch":
+        data = json.loads(payload)
+        sketch = cls(float(data.get("a", 0.01)))
+        sketch.zero_count = int(data.get("z", 0))
+        sketch.positive = {int(k): int(v) for k, v in data.get("p", {}).items()}
+        sketch.negative = {int(k): int(v) for k, v in data.get("n", {}).items()}
+        sketch.count = (
+            sketch.zero_count
+            + sum(sketch.positive.values())
+            + sum(sketch.negative.values())
+        )
+        return sketch
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def _collapse(self, store: Dict[int, int]) -> None:
+        # Fold the smallest magnitudes together; high quantiles stay accurate.
+        keys = sorted(store)
+        overflow = keys[: len(keys) - self.MAX_BINS + 1]
+        folded = sum(store.pop(key) for key in overflow)
+        target = keys[len(overflow)]
+        store[target] = store.get(target, 0) + folded
+
+
+@dataclass
+class _RollupBucket:
+    """Count/sum/min/max (and optionally a sketch) for one slice of metrics."""
+
+    count: int = 0
+    total: float = 0.0
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+    sketch: Optional[QuantileSketch] = None
+
+    def add(self, value: float, sample: Optional[float] = None) -> None:
+        """Count ``value``; ``sample`` (if any) feeds the latency sketch."""
+        self.count += 1
+        self.total += value
+        self.min_value = value if self.min_value is None else min(self.min_value, value)
+        self.max_value = value if self.max_value is None else max(self.max_value, value)
+        if self.sketch is not None and sample is not None:
+            self.sketch.add(sample)
+
+    def merge(self, other: "_RollupBucket") -> None:
+        if other.count == 0:
+            return
+        self.count += other.count
+        self.total += other.total
+        for attr, pick in (("min_value", min), ("max_value", max)):
+            mine, theirs = getattr(self, attr), getattr(other, attr)
+            setattr(self, attr, theirs if mine is None else pick(mine, theirs))
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+def _rollup_segments(
+    start: float, end: float
+) -> List[Tuple[Optional[int], float, Optional[float]]]:
+    """Split ``[start, end]`` into raw edges and whole rollup buckets.
+
+    Returns ``(resolution, lo, hi)`` triples; ``resolution`` is None for the
+    ranges that must be read from raw rows, and the trailing raw range is open
+    ended so events stamped after ``end`` are still counted.
+    """
+
+    minute, hour = ROLLUP_RESOLUTIONS
+    first_minute = math.ceil(start / minute) * minute
+    last_minute = math.floor(end / minute) * minute
+    if first_minute >= last_minute:
+        return [(None, start, None)]
+    segments: List[Tuple[Optional[int], float, Optional[float]]] = [
+        (None, start, first_minute)
+    ]
+    first_hour = math.ceil(start / hour) * hour
+    last_hour = math.floor(end / hour) * hour
+    if first_hour < last_hour:
+        segments += [
+            (minute, first_minute, first_hour),
+            (hour, first_hour, last_hour),
+            (minute, last_hour, last_minute),
+        ]
+    else:
+        segments.append((minute, first_minute, last_minute))
+    segments.append((None, last_minute, None))
+    return [seg for seg in segments if seg[2] is None or seg[1] < seg[2]]
+
+
+def _latency_sample(
+    metric_type: MetricType, value: float, metadata: Dict[str, Any]
+) -> Optional[float]:
+    """Mirror ``_SAMPLE_SQL`` for an in-memory event."""
+
+    if metric_type is MetricType.COMMAND_USAGE:
+        duration = metadata.get("duration_ms")
+        try:
+            return float(duration) if duration is not None else None
+        except (TypeError, ValueError):
+            return None
+    return float(value)
+
+
+def _rollup_row(key: Tuple[Any, ...], bucket: _RollupBucket) -> Tuple[Any, ...]:
+    return (
+        *key,
+        bucket.count,
+        bucket.total,
+        bucket.min_value,
+        bucket.max_value,
+        bucket.sketch.to_json() if bucket.sketch else None,
+    )
+
+
+def _fold_by_name(
+    buckets: Dict[Tuple[str, str], _RollupBucket],
+) -> Dict[str, _RollupBucket]:
+    """Merge ``(name, success)`` aggregates into one bucket per name."""
+
+    folded: Dict[str, _RollupBucket] = {}
+    for (name, _success), bucket in buckets.items():
+        if name not in folded:
+            sketch = QuantileSketch() if bucket.sketch is not None else None
+            folded[name] = _RollupBucket(sketch=sketch)
+        folded[name].merge(bucket)
+    return folded
+
+
+def _percentile_fields(
+    sketch: Optional[QuantileSketch],
+    quantiles: Iterable[float] = LATENCY_QUANTILES,
+    *,
+    suffix: str = "",
+) -> Dict[str, Optional[float]]:
+    """Format sketch quantiles as ``{"p50<suffix>": value, ...}``."""
+
+    return {
+        f"p{q * 100:g}{suffix}": sketch.quantile(q) if sketch is not None else None
+        for q in quantiles
+    }
+
+
+def _bucket_from_row(row: Tuple[Any, ...]) -> _RollupBucket:
+    count, total, min_value, max_value, sketch = row
+    return _RollupBucket(
+        count=int(count),
+        total=float(total),
+        min_value=float(min_value),
+        max_value=float(max_value),
+        sketch=QuantileSketch.from_json(sketch) if sketch else None,
+    )
+
+
+@dataclass
+class _CachedSection:
+    """One report section with the source versions it was computed from."""
+
+    value: Any
+    versions: Tuple[Any, ...]
+    computed_at: float
+
+
 class TelemetryCollector:
     """Collects and stores telemetry data for The Great Work."""
 
@@ -97,11 +649,33 @@ class TelemetryCollector:
         self.db_path = Path(db_path) if db_path is not None else DEFAULT_TELEMETRY_DB
         if self.db_path.parent != Path("."):
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._partition_days = max(
+            1, int(os.getenv("GREAT_WORK_TELEMETRY_PARTITION_DAYS", "7") or 7)
+        )
+        self._partitions: List[Tuple[float, float, str]] = []
+        self._partition_starts: List[float] = []
         self._init_database()
         self._start_time = time.time()
         self._metrics_buffer: List[MetricEvent] = []
         self._flush_interval = 60  # Flush to DB every 60 seconds
         self._last_flush = time.time()
+        # Full batches are written by a background thread so recording a
+        # metric never waits on disk. When the queue is full, new batches are
+        # dropped and counted rather than blocking the caller.
+        queue_size = int(os.getenv("GREAT_WORK_TELEMETRY_QUEUE_SIZE", "10000") or 10000)
+        self._write_queue: queue.Queue[List[MetricEvent]] = queue.Queue(
+            maxsize=max(1, queue_size // TELEMETRY_BATCH_SIZE)
+        )
+        self._buffer_lock = threading.Lock()
+        self._writer_lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
+        # Drops are counted from recording threads and the writer thread alike.
+        self._dropped_lock = threading.Lock()
+        self.dropped_events = 0
+        self.written_events = 0
+        self._report_lock = threading.Lock()
+        self._report_cache: Dict[str, _CachedSection] = {}
+        self._report_health: Optional[Dict[str, Any]] = None
         self._alert_history: Dict[str, float] = {}
         self._alert_cooldown_seconds = float(
             os.getenv("GREAT_WORK_ALERT_COOLDOWN_SECONDS", "300") or 300
@@ -110,32 +684,30 @@ class TelemetryCollector:
     def _init_database(self):
         """Initialize telemetry database schema."""
         with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS metrics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp REAL NOT NULL,
-                    metric_type TEXT NOT NULL,
-                    name TEXT NOT NULL,
-                    value REAL NOT NULL,
-                    tags TEXT,
-                    metadata TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-                """
-            )
-            conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_metrics_timestamp
-                ON metrics(timestamp DESC)
-                """
-            )
-            conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_metrics_type_name
-                ON metrics(metric_type, name)
-                """
-            )
+            conn.execute(_PARTITION_SCHEMA)
+            conn.execute(_METRICS_TABLE.format(table=_UNPARTITIONED))
+            _create_metric_indexes(conn, _UNPARTITIONED)
+            if self._metrics_kind(conn) != "view":
+                # Re-checked under the write lock in case another process is
+                # creating or migrating the same database.
+                conn.execute("BEGIN IMMEDIATE")
+                kind = self._metrics_kind(conn)
+                if kind is None:
+                    self._rebuild_metrics_view(conn)
+                elif kind == "table":
+                    self._partition_legacy_metrics(conn)
+                conn.commit()
+            (insert_sql,) = conn.execute(
+                "SELECT COALESCE(MAX(sql), '') FROM sqlite_master "
+                "WHERE type = 'trigger' AND name = 'metrics_insert'"
+            ).fetchone()
+            if "json_extract(NEW.tags" not in insert_sql:
+                # Triggers from before hot tags were derived from the blob.
+                conn.execute("BEGIN IMMEDIATE")
+                self._rebuild_metrics_view(conn)
+                conn.commit()
+            self._init_rollups(conn)
+            conn.execute(_WATERMARK_SCHEMA)
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS kpi_targets (
@@ -149,6 +721,239 @@ class TelemetryCollector:
             )
             conn.commit()
 
+    @staticmethod
+    def _metrics_kind(conn: sqlite3.Connection) -> Optional[str]:
+        row = conn.execute(
+            "SELECT type FROM sqlite_master WHERE name = 'metrics'"
+        ).fetchone()
+        return row[0] if row else None
+
+    def _partition_legacy_metrics(self, conn: sqlite3.Connection) -> None:
+        """Move rows from a pre-partitioning ``metrics`` table into partitions.
+
+        Tags that predate their indexed columns are read from the JSON blob as
+        they are copied. The old table is dropped once every row has moved.
+        """
+
+        conn.execute("ALTER TABLE metrics RENAME TO metrics_legacy")
+        legacy = {
+            row[1] for row in conn.execute("PRAGMA table_info('metrics_legacy')")
+        }
+        source = ", ".join(
+            (
+                column
+                if column in legacy
+                else f"json_extract(tags, '$.{column}')"
+                if column in _TAG_COLUMNS
+                else "NULL"
+            )
+            for column in METRIC_COLUMNS
+        )
+        moved = 0
+        (timestamp,) = conn.execute(
+            "SELECT MIN(timestamp) FROM metrics_legacy"
+        ).fetchone()
+        while timestamp is not None:
+            start, end = _partition_bounds(timestamp, self._partition_days)
+            name = _partition_name(start)
+            conn.execute(
+                "INSERT INTO metric_partitions (name, range_start, range_end) "
+                "VALUES (?, ?, ?)",
+                (name, start, end),
+            )
+            conn.execute(_METRICS_TABLE.format(table=name))
+            moved += conn.execute(
+                f"INSERT INTO {name} ({', '.join(METRIC_COLUMNS)}) "  # nosec B608
+                f"SELECT {source} FROM metrics_legacy "
+                "WHERE timestamp >= ? AND timestamp < ?",
+                (start, end),
+            ).rowcount
+            (timestamp,) = conn.execute(
+                "SELECT MIN(timestamp) FROM metrics_legacy WHERE timestamp >= ?",
+                (end,),
+            ).fetchone()
+        # Indexes are built once each partition is fully loaded.
+        for (name,) in conn.execute("SELECT name FROM metric_partitions").fetchall():
+            _create_metric_indexes(conn, name)
+        conn.execute("DROP TABLE metrics_legacy")
+        self._rebuild_metrics_view(conn)
+        if moved:
+            logger.info("Moved %d metric rows into dated partitions", moved)
+
+    def _rebuild_metrics_view(self, conn: sqlite3.Connection) -> None:
+        """Recreate the ``metrics`` view and its write triggers from the registry."""
+
+        partitions = conn.execute(
+            "SELECT name, range_start, range_end FROM metric_partitions "
+            "ORDER BY range_start"
+        ).fetchall()
+        tables = [_UNPARTITIONED, *(name for name, _, _ in partitions)]
+        conn.execute("DROP VIEW IF EXISTS metrics")
+        conn.execute(f"CREATE VIEW metrics AS {_metrics_union(tables)}")
+        for trigger in _metrics_view_triggers(partitions):
+            conn.execute(trigger)
+
+    def _partition_for(self, conn: sqlite3.Connection, timestamp: float) -> str:
+        """Return the partition table for ``timestamp``, creating it if needed.
+
+        Must run inside the caller's write transaction; a new partition's range
+        is clipped so it never overlaps one created with a different width.
+        """
+
+        index = bisect.bisect_right(self._partition_starts, timestamp) - 1
+        if index >= 0 and timestamp < self._partitions[index][1]:
+            return self._partitions[index][2]
+        start, end = _partition_bounds(timestamp, self._partition_days)
+        if index >= 0:
+            start = max(start, self._partitions[index][1])
+        if index + 1 < len(self._partitions):
+            end = min(end, self._partitions[index + 1][0])
+        name = _partition_name(start)
+        conn.execute(
+            "INSERT INTO metric_partitions (name, range_start, range_end) "
+            "VALUES (?, ?, ?)",
+            (name, start, end),
+        )
+        conn.execute(_METRICS_TABLE.format(table=name))
+        _create_metric_indexes(conn, name)
+        self._rebuild_metrics_view(conn)
+        self._load_partitions(conn)
+        return name
+
+    def _load_partitions(self, conn: sqlite3.Connection) -> None:
+        self._partitions = [
+            (start, end, name)
+            for name, start, end in conn.execute(
+                "SELECT name, range_start, range_end FROM metric_partitions "
+                "ORDER BY range_start"
+            )
+        ]
+        self._partition_starts = [start for start, _, _ in self._partitions]
+
+    def _connect(self, since: Optional[float] = None) -> sqlite3.Connection:
+        """Open the database with ``metrics`` limited to partitions after ``since``.
+
+        A temporary view shadows the full ``metrics`` view for this connection
+        only, so windowed queries skip older partitions without being rewritten.
+        """
+
+        conn = sqlite3.connect(self.db_path)
+        if since is None:
+            return conn
+        tables = [
+            name
+            for (name,) in conn.execute(
+                "SELECT name FROM metric_partitions WHERE range_end > ? "
+                "ORDER BY range_start",
+                (since,),
+            )
+        ]
+        recent_unpartitioned = conn.execute(
+            f"SELECT 1 FROM {_UNPARTITIONED} "  # nosec B608
+            "WHERE timestamp >= ? LIMIT 1",
+            (since,),
+        ).fetchone()
+        if recent_unpartitioned or not tables:
+            tables.insert(0, _UNPARTITIONED)
+        conn.execute(f"CREATE TEMP VIEW metrics AS {_metrics_union(tables)}")
+        return conn
+
+    def _init_rollups(self, conn: sqlite3.Connection) -> None:
+        """Create the rollup table, building it from raw rows the first time."""
+
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            ("metric_rollups",),
+        ).fetchone()
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if exists and version >= _ROLLUP_VERSION:
+            return
+        conn.execute("DROP TABLE IF EXISTS metric_rollups")
+        conn.execute(_ROLLUP_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {_ROLLUP_VERSION}")
+        try:
+            backfilled = self._backfill_rollups(conn)
+        except sqlite3.OperationalError:
+            # SQLite built without math functions: fold raw rows in Python.
+            conn.execute("DELETE FROM metric_rollups")
+            cursor = conn.execute(
+                "SELECT timestamp, metric_type, name, success, value, "
+                f"{_SAMPLE_SQL} FROM metrics ORDER BY timestamp"
+            )
+            backfilled = 0
+            while True:
+                rows = cursor.fetchmany(50000)
+                if not rows:
+                    break
+                self._update_rollups(conn, rows)
+                backfilled += len(rows)
+        if backfilled:
+            logger.info("Built telemetry rollups from %d metric rows", backfilled)
+
+    def _backfill_rollups(self, conn: sqlite3.Connection) -> int:
+        """Build rollups from raw rows, grouping sketch bins inside SQLite."""
+
+        log_gamma = QuantileSketch()._log_gamma
+        total = 0
+        for resolution in ROLLUP_RESOLUTIONS:
+            cursor = conn.execute(
+                f"""
+                SELECT metric_type,
+                       CAST(timestamp / :res AS INTEGER) * :res AS bucket_start,
+                       name,
+                       COALESCE(CAST(success AS TEXT), '') AS success_key,
+                       SIGN(sample) * (ABS(sample) > :tiny) AS sign,
+                       CAST(CEIL(LN(MAX(ABS(sample), :tiny)) / :log_gamma) AS INTEGER),
+                       COUNT(*), SUM(value), MIN(value), MAX(value)
+                FROM (SELECT *, {_SAMPLE_SQL} AS sample FROM metrics)
+                GROUP BY 1, 2, 3, 4, 5, 6
+                ORDER BY 1, 2, 3, 4
+                """,  # nosec B608 - constant SQL fragment
+                {
+                    "res": resolution,
+                    "tiny": QuantileSketch._MIN_VALUE,
+                    "log_gamma": log_gamma,
+                },
+            )
+            rollups: List[Tuple[Any, ...]] = []
+            current: Optional[Tuple[Any, ...]] = None
+            bucket = _RollupBucket()
+            for row in cursor:
+                metric_type, bucket_start, name, success, sign, key = row[:6]
+                count, value_sum, min_value, max_value = row[6:]
+                row_key = (resolution, metric_type, float(bucket_start), name, success)
+                if row_key != current:
+                    if current is not None:
+                        rollups.append(_rollup_row(current, bucket))
+                    if len(rollups) >= 10000:
+                        conn.executemany(_REPLACE_ROLLUP, rollups)
+                        rollups.clear()
+                    current = row_key
+                    bucket = _RollupBucket(sketch=QuantileSketch())
+                bucket.merge(
+                    _RollupBucket(
+                        count=count,
+                        total=value_sum,
+                        min_value=min_value,
+                        max_value=max_value,
+                    )
+                )
+                sketch = bucket.sketch
+                if sign is not None:  # rows without a latency sample skip it
+                    sketch.count += count
+                    if sign > 0:
+                        sketch.positive[key] = sketch.positive.get(key, 0) + count
+                    elif sign < 0:
+                        sketch.negative[key] = sketch.negative.get(key, 0) + count
+                    else:
+                        sketch.zero_count += count
+                if resolution == ROLLUP_RESOLUTIONS[0]:
+                    total += count
+            if current is not None:
+                rollups.append(_rollup_row(current, bucket))
+            conn.executemany(_REPLACE_ROLLUP, rollups)
+        return total
+
     def set_kpi_target(
         self,
         metric: str,
@@ -174,6 +979,7 @@ class TelemetryCollector:
                 """,
                 (metric_key, float(target), warning, notes),
             )
+            conn.execute(_BUMP_WATERMARK, (_KPI_TARGETS_SOURCE,))
             conn.commit()
 
     def get_kpi_targets(self) -> Dict[str, Dict[str, Any]]:
@@ -338,8 +1144,14 @@ class TelemetryCollector:
         duration_ms: float,
         persona: Optional[str] = None,
         error: Optional[str] = None,
+        cache: Optional[str] = None,
     ) -> None:
-        """Record latency/outcome information for an LLM narrative attempt."""
+        """Record latency/outcome information for an LLM narrative attempt.
+
+        ``cache`` is how the LLM client served the text: ``hit``/``miss``/
+        ``bypass`` for the response cache, or ``coalesced`` when it shared an
+        identical upstream call already in flight.
+        """
 
         tags = {
             "press_type": press_type,
@@ -347,6 +1159,8 @@ class TelemetryCollector:
         }
         if persona:
             tags["persona"] = persona
+        if cache:
+            tags["cache"] = cache
 
         metadata: Dict[str, Any] = {"duration_ms": duration_ms}
         if error:
@@ -615,46 +1429,286 @@ class TelemetryCollector:
             metadata=metadata or {},
         )
 
-        self._metrics_buffer.append(event)
-
-        # Auto-flush if buffer is getting large or enough time has passed
-        if (
-            len(self._metrics_buffer) >= 100
-            or time.time() - self._last_flush > self._flush_interval
-        ):
-            self.flush()
+        with self._buffer_lock:
+            self._metrics_buffer.append(event)
+            # Hand off if the buffer is getting large or enough time has passed
+            if (
+                len(self._metrics_buffer) < TELEMETRY_BATCH_SIZE
+                and time.time() - self._last_flush <= self._flush_interval
+            ):
+                return
+            batch = self._take_buffer()
+        self._enqueue(batch, block=False)
 
     def flush(self):
-        """Flush buffered metrics to database."""
-        if not self._metrics_buffer:
+        """Write buffered metrics and wait for the writer thread to catch up."""
+        with self._buffer_lock:
+            batch = self._take_buffer()
+        if batch:
+            self._enqueue(batch, block=True)
+        self._write_queue.join()
+
+    def close(self):
+        """Drain the writer thread, stop it, and write any remaining metrics."""
+        self._write_queue.join()
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.stop.set()
+            # An empty batch wakes the writer instead of waiting out its poll.
+            self._write_queue.put([])
+            writer.join()
+        with self._buffer_lock:
+            batch = self._take_buffer()
+        if batch:
+            # Written inline: close() also runs at interpreter exit, when no
+            # new writer thread can be started.
+            try:
+                with contextlib.closing(sqlite3.connect(self.db_path)) as conn:
+                    self._write_batch(conn, batch)
+            except Exception as e:
+                self._count_dropped(len(batch))
+                logger.error(f"Failed to flush metrics: {e}")
+
+    def iter_metric_batches(
+        self,
+        after: Optional[Dict[str, int]] = None,
+        *,
+        batch_size: int = 10000,
+    ) -> Iterator[Tuple[str, List[Tuple[Any, ...]]]]:
+        """Yield ``(partition, rows)`` for stored metrics not yet consumed.
+
+        ``after`` maps partition names to the last ``id`` already read; rows
+        come in ``id`` order within each partition as ``METRIC_COLUMNS``
+        tuples, fetched ``batch_size`` at a time by keyset pagination so
+        memory stays flat however large the table is.
+        """
+
+        after = after or {}
+        columns = ", ".join(METRIC_COLUMNS)
+        with contextlib.closing(sqlite3.connect(self.db_path)) as conn:
+            tables = [
+                _UNPARTITIONED,
+                *(
+                    name
+                    for (name,) in conn.execute(
+                        "SELECT name FROM metric_partitions ORDER BY range_start"
+                    )
+                ),
+            ]
+            for table in tables:
+                last_id = after.get(table, 0)
+                while True:
+                    rows = conn.execute(
+                        f"SELECT {columns} FROM {table} "  # nosec B608
+                        "WHERE id > ? ORDER BY id LIMIT ?",
+                        (last_id, batch_size),
+                    ).fetchall()
+                    if not rows:
+                        break
+                    yield table, rows
+                    last_id = rows[-1][0]
+
+    def writer_stats(self) -> Dict[str, Any]:
+        """Return counters describing the background writer."""
+        return {
+            "queued_batches": self._write_queue.qsize(),
+            "buffered_events": len(self._metrics_buffer),
+            "written_events": self.written_events,
+            "dropped_events": self.dropped_events,
+        }
+
+    def _take_buffer(self) -> List[MetricEvent]:
+        batch = self._metrics_buffer
+        self._metrics_buffer = []
+        self._last_flush = time.time()
+        return batch
+
+    def _count_dropped(self, count: int) -> None:
+        with self._dropped_lock:
+            self.dropped_events += count
+
+    def _enqueue(self, batch: List[MetricEvent], *, block: bool) -> None:
+        while True:
+            with self._writer_lock:
+                self._start_writer_locked()
+                try:
+                    self._write_queue.put_nowait(batch)
+                    return
+                except queue.Full:
+                    if not block:
+                        self._count_dropped(len(batch))
+                        logger.warning(
+                            "Telemetry write queue full; dropped %d events",
+                            len(batch),
+                        )
+                        return
+            # Explicit flushes wait for room instead of dropping; the lock is
+            # released so the writer can retire or be replaced meanwhile.
+            time.sleep(_WRITER_POLL_SECONDS / 10)
+
+    def _start_writer_locked(self) -> None:
+        if self._writer is not None:
             return
+        writer = _TelemetryWriter(self)
+        self._writer = writer
+        writer.start()
+        _open_collectors.add(self)
+
+    def _retire_writer(self, writer: "_TelemetryWriter") -> bool:
+        """Let an idle writer exit if nothing is queued behind it."""
+        with self._writer_lock:
+            if not self._write_queue.empty():
+                return False
+            if self._writer is writer:
+                self._writer = None
+            return True
 
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                for event in self._metrics_buffer:
-                    conn.execute(
-                        """
-                        INSERT INTO metrics
-                        (timestamp, metric_type, name, value, tags, metadata)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                        (
-                            event.timestamp,
-                            event.metric_type.value,
-                            event.name,
-                            event.value,
-                            json.dumps(event.tags),
-                            json.dumps(event.metadata),
-                        ),
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[MetricEvent]):
+        """Insert one batch with a single ``executemany`` in one transaction."""
+        rows = [
+            (
+                event.timestamp,
+                event.metric_type.value,
+                event.name,
+                event.value,
+                json.dumps(event.tags),
+                json.dumps(event.metadata),
+                *(_tag_column_value(event.tags.get(name)) for name in _TAG_COLUMNS),
+            )
+            for event in batch
+        ]
+        with conn:
+            # Take the write lock first so the partition registry cannot change
+            # (new partitions, retention drops) between routing and inserting.
+            conn.execute("BEGIN IMMEDIATE")
+            self._load_partitions(conn)
+            by_partition: Dict[str, List[Tuple[Any, ...]]] = defaultdict(list)
+            for event, row in zip(batch, rows):
+                by_partition[self._partition_for(conn, event.timestamp)].append(row)
+            for table, partition_rows in by_partition.items():
+                conn.executemany(_INSERT_METRIC.format(table=table), partition_rows)
+            self._update_rollups(
+                conn,
+                [
+                    (
+                        event.timestamp,
+                        event.metric_type.value,
+                        event.name,
+                        _tag_column_value(event.tags.get("success")),
+                        event.value,
+                        _latency_sample(event.metric_type, event.value, event.metadata),
                     )
-                conn.commit()
+                    for event in batch
+                ],
+            )
+            touched = {event.metric_type.value for event in batch}
+            conn.executemany(_BUMP_WATERMARK, [(source,) for source in touched])
+        self.written_events += len(rows)
+        logger.debug(f"Flushed {len(rows)} metrics to database")
 
-            logger.info(f"Flushed {len(self._metrics_buffer)} metrics to database")
-            self._metrics_buffer.clear()
-            self._last_flush = time.time()
+    def _update_rollups(
+        self, conn: sqlite3.Connection, rows: Iterable[Tuple[Any, ...]]
+    ) -> None:
+        """Fold ``(timestamp, metric_type, name, success, value, sample)`` rows.
 
-        except Exception as e:
-            logger.error(f"Failed to flush metrics: {e}")
+        Runs inside the caller's transaction, after the raw insert has taken
+        the write lock, so concurrent writers cannot interleave their merges.
+        """
+
+        pending: Dict[Tuple[int, str, float, str, str], _RollupBucket] = {}
+        for timestamp, metric_type, name, success, value, sample in rows:
+            success_key = "" if success is None else str(success)
+            for resolution in ROLLUP_RESOLUTIONS:
+                bucket_start = float(math.floor(timestamp / resolution) * resolution)
+                key = (resolution, metric_type, bucket_start, name, success_key)
+                bucket = pending.get(key)
+                if bucket is None:
+                    bucket = pending[key] = _RollupBucket(sketch=QuantileSketch())
+                bucket.add(float(value), sample)
+
+        # Read the buckets already stored for the touched range in one query
+        # per (resolution, metric type) rather than one lookup per key.
+        spans: Dict[Tuple[int, str], List[float]] = {}
+        for resolution, metric_type, bucket_start, _name, _success in pending:
+            span = spans.setdefault((resolution, metric_type), [bucket_start] * 2)
+            span[0] = min(span[0], bucket_start)
+            span[1] = max(span[1], bucket_start)
+        for (resolution, metric_type), (lo, hi) in spans.items():
+            stored = conn.execute(
+                """
+                SELECT bucket_start, name, success,
+                       count, total, min_value, max_value, sketch
+                FROM metric_rollups
+                WHERE resolution = ? AND metric_type = ?
+                  AND bucket_start BETWEEN ? AND ?
+                """,
+                (resolution, metric_type, lo, hi),
+            )
+            for row in stored:
+                bucket = pending.get((resolution, metric_type, *row[:3]))
+                if bucket is not None:
+                    bucket.merge(_bucket_from_row(row[3:]))
+
+        conn.executemany(
+            _REPLACE_ROLLUP,
+            [_rollup_row(key, bucket) for key, bucket in pending.items()],
+        )
+
+    def _aggregate_window(
+        self,
+        conn: sqlite3.Connection,
+        metric_type: MetricType,
+        start_time: float,
+        *,
+        name: Optional[str] = None,
+        with_sketch: bool = False,
+    ) -> Dict[Tuple[str, str], _RollupBucket]:
+        """Aggregate one metric type since ``start_time`` by (name, success).
+
+        Whole minutes and hours come from ``metric_rollups``; only the partial
+        minutes at either edge of the window are read from raw rows.
+        """
+
+        results: Dict[Tuple[str, str], _RollupBucket] = {}
+
+        def _bucket(key: Tuple[str, str]) -> _RollupBucket:
+            if key not in results:
+                sketch = QuantileSketch() if with_sketch else None
+                results[key] = _RollupBucket(sketch=sketch)
+            return results[key]
+
+        name_clause = " AND name = ?" if name is not None else ""
+        name_params: List[Any] = [name] if name is not None else []
+        for resolution, lo, hi in _rollup_segments(start_time, time.time()):
+            if resolution is None:
+                upper = " AND timestamp < ?" if hi is not None else ""
+                params = [metric_type.value, lo, *([hi] if hi is not None else [])]
+                raw_rows = conn.execute(
+                    f"""
+                    SELECT name, success, value, {_SAMPLE_SQL} FROM metrics
+                    WHERE metric_type = ? AND timestamp >= ?{upper}{name_clause}
+                    """,  # nosec B608 - constant fragments, bound parameters
+                    params + name_params,
+                )
+                for row_name, success, value, sample in raw_rows:
+                    success_key = "" if success is None else str(success)
+                    _bucket((row_name, success_key)).add(float(value), sample)
+                continue
+            sketch_column = "sketch" if with_sketch else "NULL"
+            rollup_rows = conn.execute(
+                f"""
+                SELECT name, success, count, total, min_value, max_value,
+                       {sketch_column}
+                FROM metric_rollups
+                WHERE resolution = ? AND metric_type = ?
+                  AND bucket_start >= ? AND bucket_start < ?{name_clause}
+                """,  # nosec B608 - constant fragments, bound parameters
+                [resolution, metric_type.value, lo, hi] + name_params,
+            )
+            for row in rollup_rows:
+                _bucket((row[0], row[1])).merge(_bucket_from_row(row[2:]))
+        return results
 
     def get_command_stats(
         self, start_time: Optional[float] = None, end_time: Optional[float] = None
@@ -664,9 +1718,9 @@ class TelemetryCollector:
             SELECT
                 name as command,
                 COUNT(*) as usage_count,
-                AVG(CASE WHEN json_extract(tags, '$.success') = 'True'
+                AVG(CASE WHEN success = 'True'
                     THEN 1 ELSE 0 END) as success_rate,
-                COUNT(DISTINCT json_extract(tags, '$.player_id')) as unique_players
+                COUNT(DISTINCT player_id) as unique_players
             FROM metrics
             WHERE metric_type = ?
         """
@@ -681,7 +1735,7 @@ class TelemetryCollector:
 
         query += " GROUP BY name"
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect(since=start_time) as conn:
             cursor = conn.execute(query, params)
             results = {}
             for row in cursor.fetchall():
@@ -700,7 +1754,7 @@ class TelemetryCollector:
             SELECT
                 name as feature,
                 COUNT(*) as total_uses,
-                COUNT(DISTINCT json_extract(tags, '$.player_id')) as unique_users,
+                COUNT(DISTINCT player_id) as unique_users,
                 MAX(timestamp) as last_used
             FROM metrics
             WHERE metric_type = ? AND timestamp >= ?
@@ -708,7 +1762,7 @@ class TelemetryCollector:
             ORDER BY total_uses DESC
         """
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect(since=start_time) as conn:
             cursor = conn.execute(
                 query, [MetricType.FEATURE_ENGAGEMENT.value, start_time]
             )
@@ -725,17 +1779,12 @@ class TelemetryCollector:
         """Get error counts for the last N hours."""
         start_time = time.time() - (hours * 3600)
 
-        query = """
-            SELECT name, COUNT(*) as error_count
-            FROM metrics
-            WHERE metric_type = ? AND timestamp >= ?
-            GROUP BY name
-            ORDER BY error_count DESC
-        """
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(query, [MetricType.ERROR_RATE.value, start_time])
-            return {row[0]: row[1] for row in cursor.fetchall()}
+        with self._connect(since=start_time) as conn:
+            buckets = self._aggregate_window(conn, MetricType.ERROR_RATE, start_time)
+        counts: Dict[str, int] = defaultdict(int)
+        for (name, _success), bucket in buckets.items():
+            counts[name] += bucket.count
+        return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
 
     def get_performance_summary(
         self, operation: Optional[str] = None, hours: int = 1
@@ -743,35 +1792,54 @@ class TelemetryCollector:
         """Get performance statistics for operations."""
         start_time = time.time() - (hours * 3600)
 
-        query = """
-            SELECT
-                name,
-                AVG(value) as avg_duration,
-                MIN(value) as min_duration,
-                MAX(value) as max_duration,
-                COUNT(*) as sample_count
-            FROM metrics
-            WHERE metric_type = ? AND timestamp >= ?
-        """
-        params = [MetricType.PERFORMANCE.value, start_time]
+        with self._connect(since=start_time) as conn:
+            buckets = self._aggregate_window(
+                conn,
+                MetricType.PERFORMANCE,
+                start_time,
+                name=operation,
+                with_sketch=True,
+            )
+        return {
+            name: {
+                "avg_duration_ms": bucket.average,
+                "min_duration_ms": bucket.min_value,
+                "max_duration_ms": bucket.max_value,
+                "sample_count": bucket.count,
+                **_percentile_fields(bucket.sketch, suffix="_duration_ms"),
+            }
+            for name, bucket in _fold_by_name(buckets).items()
+        }
 
-        if operation:
-            query += " AND name = ?"
-            params.append(operation)
+    def get_latency_percentiles(
+        self,
+        metric_type: MetricType,
+        hours: int = 24,
+        *,
+        name: Optional[str] = None,
+        quantiles: Iterable[float] = LATENCY_QUANTILES,
+    ) -> Dict[str, Dict[str, float]]:
+        """Return latency percentiles per metric name from the rollup sketches.
 
-        query += " GROUP BY name"
+        Command usage is measured by its recorded ``duration_ms``; performance
+        and LLM metrics by their value. No raw rows are read beyond the
+        partial minutes at the window edges.
+        """
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(query, params)
-            results = {}
-            for row in cursor.fetchall():
-                results[row[0]] = {
-                    "avg_duration_ms": row[1],
-                    "min_duration_ms": row[2],
-                    "max_duration_ms": row[3],
-                    "sample_count": row[4],
-                }
-            return results
+        start_time = time.time() - (hours * 3600)
+        with self._connect(since=start_time) as conn:
+            buckets = self._aggregate_window(
+                conn, metric_type, start_time, name=name, with_sketch=True
+            )
+        percentiles: Dict[str, Dict[str, float]] = {}
+        for metric_name, bucket in _fold_by_name(buckets).items():
+            if bucket.sketch is None or bucket.sketch.count == 0:
+                continue
+            percentiles[metric_name] = {
+                **_percentile_fields(bucket.sketch, quantiles),
+                "samples": bucket.sketch.count,
+            }
+        return percentiles
 
     def get_channel_usage(self, hours: int = 24) -> Dict[str, Dict[str, Any]]:
         """Summarise command usage by channel over the given window."""
@@ -780,16 +1848,16 @@ class TelemetryCollector:
 
         query = """
             SELECT
-                COALESCE(json_extract(tags, '$.channel_id'), 'unknown') as channel,
+                COALESCE(channel_id, 'unknown') as channel,
                 COUNT(*) as usage_count,
                 COUNT(DISTINCT name) as unique_commands,
-                COUNT(DISTINCT json_extract(tags, '$.player_id')) as unique_players
+                COUNT(DISTINCT player_id) as unique_players
             FROM metrics
             WHERE metric_type = ? AND timestamp >= ?
             GROUP BY channel
         """
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect(since=start_time) as conn:
             cursor = conn.execute(
                 query,
                 [
@@ -815,48 +1883,51 @@ class TelemetryCollector:
 
         start_time = time.time() - (hours * 3600)
 
-        query = """
-            SELECT
-                name,
-                SUM(CASE WHEN json_extract(tags, '$.success') = 'true' THEN 1 ELSE 0 END) as success_count,
-                SUM(CASE WHEN json_extract(tags, '$.success') = 'false' THEN 1 ELSE 0 END) as failure_count,
-                COUNT(*) as total_calls,
-                AVG(value) as avg_duration,
-                MAX(value) as max_duration
-            FROM metrics
-            WHERE metric_type = ? AND timestamp >= ?
-            GROUP BY name
-        """
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                query,
-                [
-                    MetricType.LLM_ACTIVITY.value,
-                    start_time,
-                ],
+        with self._connect(since=start_time) as conn:
+            buckets = self._aggregate_window(
+                conn, MetricType.LLM_ACTIVITY, start_time, with_sketch=True
             )
-            summary: Dict[str, Dict[str, Any]] = {}
-            for row in cursor.fetchall():
-                press_type = row[0]
-                successes = row[1] or 0
-                failures = row[2] or 0
-                total = row[3] or 0
-                avg_duration = row[4] or 0.0
-                max_duration = row[5] or 0.0
-
-                success_rate = successes / total if total else 0.0
-
-                summary[press_type] = {
-                    "total_calls": total,
-                    "successes": successes,
-                    "failures": failures,
-                    "success_rate": success_rate,
-                    "avg_duration_ms": avg_duration,
-                    "max_duration_ms": max_duration,
-                }
 
-            return summary
+            # Cache outcomes are a plain tag, so they come from the raw rows.
+            cache_rows = conn.execute(
+                """
+                SELECT name, json_extract(tags, '$.cache') AS cache, COUNT(*)
+                FROM metrics
+                WHERE metric_type = ? AND timestamp >= ? AND cache IS NOT NULL
+                GROUP BY name, cache
+                """,
+                (MetricType.LLM_ACTIVITY.value, start_time),
+            ).fetchall()
+
+        outcomes: Dict[str, Counter] = defaultdict(Counter)
+        for (press_type, success), bucket in buckets.items():
+            outcomes[press_type][success] += bucket.count
+        cache_outcomes: Dict[str, Counter] = defaultdict(Counter)
+        for press_type, cache, count in cache_rows:
+            cache_outcomes[press_type][cache] += count
+
+        summary: Dict[str, Dict[str, Any]] = {}
+        for press_type, bucket in _fold_by_name(buckets).items():
+            successes = outcomes[press_type]["true"]
+            failures = outcomes[press_type]["false"]
+            total = bucket.count
+            hits = cache_outcomes[press_type]["hit"]
+            lookups = hits + cache_outcomes[press_type]["miss"]
+            summary[press_type] = {
+                "total_calls": total,
+                "successes": successes,
+                "failures": failures,
+                "success_rate": successes / total if total else 0.0,
+                "avg_duration_ms": bucket.average,
+                "max_duration_ms": bucket.max_value or 0.0,
+                **_percentile_fields(bucket.sketch, suffix="_duration_ms"),
+                "cache_hits": hits,
+                "cache_misses": lookups - hits,
+                "cache_hit_rate": hits / lookups if lookups else 0.0,
+                "coalesced_calls": cache_outcomes[press_type]["coalesced"],
+            }
+
+        return summary
 
     def get_system_events(
         self, hours: int = 24, limit: int = 10
@@ -869,7 +1940,7 @@ class TelemetryCollector:
             SELECT
                 name,
                 timestamp,
-                json_extract(tags, '$.source') as source,
+                source,
                 json_extract(metadata, '$.reason') as reason
             FROM metrics
             WHERE metric_type = ? AND timestamp >= ?
@@ -877,7 +1948,7 @@ class TelemetryCollector:
             LIMIT ?
         """
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect(since=start_time) as conn:
             cursor = conn.execute(
                 query,
                 [
@@ -909,7 +1980,7 @@ class TelemetryCollector:
 
         query = """
             SELECT
-                json_extract(tags, '$.event_type') as event_type,
+                event_type,
                 json_extract(tags, '$.layer_type') as layer_type,
                 COUNT(*) as layer_count,
                 AVG(value) as avg_delay,
@@ -921,7 +1992,7 @@ class TelemetryCollector:
             LIMIT ?
         """
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect(since=start_time) as conn:
             cursor = conn.execute(
                 query,
                 [
@@ -967,7 +2038,7 @@ class TelemetryCollector:
             WHERE metric_type = ? AND timestamp >= ?
         """
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect(since=start_time) as conn:
             cursor = conn.execute(
                 query,
                 [
@@ -1020,7 +2091,7 @@ class TelemetryCollector:
             GROUP BY horizon
         """
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect(since=start_time) as conn:
             cursor = conn.execute(
                 query,
                 [
@@ -1047,7 +2118,7 @@ class TelemetryCollector:
         start_time = time.time() - (hours * 3600)
         summary: Dict[str, Dict[str, Any]] = {}
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect(since=start_time) as conn:
             cursor = conn.execute(
                 """
                     SELECT
@@ -1132,7 +2203,7 @@ class TelemetryCollector:
             where_clause = " AND name = ?"
             params.append(order_type)
         if event:
-            where_clause += " AND json_extract(tags, '$.event') = ?"
+            where_clause += " AND event = ?"
             params.append(event)
 
         # nosec B608 - where clause built from constant fragments and uses bound parameters
@@ -1141,7 +2212,7 @@ class TelemetryCollector:
                 name,
                 value,
                 json_extract(metadata, '$.oldest_pending_seconds') as oldest_seconds,
-                json_extract(tags, '$.event') as event,
+                event,
                 timestamp
             FROM metrics
             WHERE metric_type = ? AND timestamp >= ?{where_clause}
@@ -1151,7 +2222,7 @@ class TelemetryCollector:
         params.append(limit)
 
         records: List[Dict[str, Any]] = []
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect(since=start_time) as conn:
             cursor = conn.execute(query, params)
             for row in cursor.fetchall():
                 records.append(
@@ -1181,6 +2252,114 @@ class TelemetryCollector:
 
         return records
 
+    def iter_order_backlog_events(
+        self,
+        *,
+        order_type: Optional[str] = None,
+        hours: int = 24,
+        event: Optional[str] = None,
+        min_pending: Optional[float] = None,
+        min_age_seconds: Optional[float] = None,
+        after: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream dispatcher backlog events newest first, a keyset page at a time.
+
+        Filters run in SQL and only the current page is held in memory, so
+        months of events can be exported without materialising them. Every
+        record carries a ``cursor``; pass it back as ``after`` to resume after
+        that record. A malformed ``after`` raises ``ValueError`` immediately.
+        """
+
+        start_time = time.time() - (hours * 3600)
+        resume = _parse_event_cursor(after) if after else None
+        clauses = ["metric_type = ?", "timestamp >= ?"]
+        params: List[Any] = [MetricType.ORDER_STATE.value, start_time]
+        if order_type:
+            clauses.append("name = ?")
+            params.append(order_type)
+        if event:
+            clauses.append("event = ?")
+            params.append(event)
+        if min_pending is not None:
+            clauses.append("value >= ?")
+            params.append(min_pending)
+        if min_age_seconds is not None:
+            clauses.append("json_extract(metadata, '$.oldest_pending_seconds') >= ?")
+            params.append(min_age_seconds)
+
+        with contextlib.closing(sqlite3.connect(self.db_path)) as conn:
+            partitions = [
+                name
+                for (name,) in conn.execute(
+                    "SELECT name FROM metric_partitions "
+                    "WHERE range_end > ? AND range_start <= ? "
+                    "ORDER BY range_start DESC",
+                    (start_time, resume[0] if resume else math.inf),
+                )
+            ]
+
+        def pages(table: str, source: int) -> Iterator[Tuple[Any, ...]]:
+            # Keyset on (timestamp DESC, source, id) so each page is an index
+            # range scan; rows of an earlier source at the cursor's timestamp
+            # come after it, those of a later source before it.
+            key = resume
+            while True:
+                keyset = ""
+                bounds: List[Any] = []
+                if key is not None and key[1] == source:
+                    keyset = " AND (timestamp < ? OR (timestamp = ? AND id > ?))"
+                    bounds = [key[0], key[0], key[2]]
+                elif key is not None:
+                    keyset = (
+                        " AND timestamp <= ?" if source > key[1] else " AND timestamp < ?"
+                    )
+                    bounds = [key[0]]
+                query = (
+                    "SELECT id, name, value, "  # nosec B608
+                    "json_extract(metadata, '$.oldest_pending_seconds'), event, "
+                    f"timestamp FROM {table} WHERE {' AND '.join(clauses)}{keyset} "
+                    "ORDER BY timestamp DESC, id LIMIT ?"
+                )
+                try:
+                    with contextlib.closing(sqlite3.connect(self.db_path)) as conn:
+                        rows = conn.execute(
+                            query, [*params, *bounds, page_size]
+                        ).fetchall()
+                except sqlite3.OperationalError as exc:
+                    if "no such table" in str(exc):
+                        return  # partition dropped by retention mid-export
+                    raise
+                for row in rows:
+                    yield (*row, source)
+                if len(rows) < page_size:
+                    return
+                key = (rows[-1][5], source, rows[-1][0])
+
+        # Partition ranges are disjoint, so newest-first partitions are already
+        # in order; stray unpartitioned rows are merged in by timestamp. Ids
+        # repeat across tables, so ties are broken by source before id.
+        partitioned = (row for table in partitions for row in pages(table, 0))
+        merged = heapq.merge(
+            partitioned,
+            pages(_UNPARTITIONED, 1),
+            key=lambda row: (row[5], -row[6], -row[0]),
+            reverse=True,
+        )
+        return (
+            {
+                "order_type": row[1],
+                "pending": float(row[2] or 0.0),
+                "oldest_pending_seconds": (
+                    float(row[3]) if row[3] is not None else None
+                ),
+                "event": row[4] or "",
+                "timestamp": datetime.fromtimestamp(row[5]).isoformat(),
+                "cursor": f"{row[5]!r}:{row[6]}:{row[0]}",
+            }
+            for row in merged
+        )
+
     def track_moderation_event(
         self,
         *,
@@ -1213,7 +2392,7 @@ class TelemetryCollector:
 
     def get_moderation_summary(self, hours: int = 24) -> Dict[str, Any]:
         window_start = time.time() - (hours * 3600)
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect(since=window_start) as conn:
             rows = conn.execute(
                 """
                     SELECT
@@ -1289,12 +2468,15 @@ class TelemetryCollector:
             except (TypeError, ValueError, OSError):
                 return None
 
-        with sqlite3.connect(self.db_path) as conn:
+        window_start = min(
+            engagement_start, engagement_long_start, manifesto_start, archive_start
+        )
+        with self._connect(since=window_start) as conn:
             engagement_short_row = conn.execute(
                 """
                     SELECT
                         COUNT(*) AS command_count,
-                        COUNT(DISTINCT json_extract(tags, '$.player_id')) AS unique_players,
+                        COUNT(DISTINCT player_id) AS unique_players,
                         MAX(timestamp) AS last_timestamp
                     FROM metrics
                     WHERE metric_type = ? AND timestamp >= ?
@@ -1309,7 +2491,7 @@ class TelemetryCollector:
                 """
                     SELECT
                         COUNT(*) AS command_count,
-                        COUNT(DISTINCT json_extract(tags, '$.player_id')) AS unique_players,
+                        COUNT(DISTINCT player_id) AS unique_players,
                         MAX(timestamp) AS last_timestamp
                     FROM metrics
                     WHERE metric_type = ? AND timestamp >= ?
@@ -1325,7 +2507,7 @@ class TelemetryCollector:
                     SELECT
                         COALESCE(SUM(value), 0) AS total_value,
                         COUNT(*) AS event_count,
-                        COUNT(DISTINCT json_extract(tags, '$.player_id')) AS unique_players,
+                        COUNT(DISTINCT player_id) AS unique_players,
                         MAX(timestamp) AS last_timestamp
                     FROM metrics
                     WHERE metric_type = ? AND name = ? AND timestamp >= ?
@@ -1342,7 +2524,7 @@ class TelemetryCollector:
                     SELECT
                         COALESCE(SUM(value), 0) AS total_value,
                         COUNT(*) AS event_count,
-                        COUNT(DISTINCT json_extract(tags, '$.player_id')) AS unique_players,
+                        COUNT(DISTINCT player_id) AS unique_players,
                         MAX(timestamp) AS last_timestamp
                     FROM metrics
                     WHERE metric_type = ? AND name = ? AND timestamp >= ?
@@ -1358,7 +2540,7 @@ class TelemetryCollector:
                 """
                     SELECT
                         COUNT(*) AS event_count,
-                        COUNT(DISTINCT json_extract(tags, '$.player_id')) AS unique_players,
+                        COUNT(DISTINCT player_id) AS unique_players,
                         MAX(timestamp) AS last_timestamp
                     FROM metrics
                     WHERE metric_type = ? AND name = ? AND timestamp >= ?
@@ -1374,7 +2556,7 @@ class TelemetryCollector:
                 """
                     SELECT
                         COUNT(*) AS event_count,
-                        COUNT(DISTINCT json_extract(tags, '$.player_id')) AS unique_players,
+                        COUNT(DISTINCT player_id) AS unique_players,
                         MAX(timestamp) AS last_timestamp
                     FROM metrics
                     WHERE metric_type = ? AND name = ? AND timestamp >= ?
@@ -1503,7 +2685,7 @@ class TelemetryCollector:
             window_rows = conn.execute(
                 """
                 SELECT
-                    json_extract(tags, '$.player_id') AS player_id,
+                    player_id,
                     COUNT(*) AS command_count,
                     MAX(timestamp) AS last_command_ts
                 FROM metrics
@@ -1517,7 +2699,7 @@ class TelemetryCollector:
             first_rows = conn.execute(
                 """
                 SELECT
-                    json_extract(tags, '$.player_id') AS player_id,
+                    player_id,
                     MIN(timestamp) AS first_seen_ts
                 FROM metrics
                 WHERE metric_type = ?
@@ -1589,138 +2771,87 @@ class TelemetryCollector:
     def get_product_kpi_history(self, days: int = 30) -> Dict[str, Any]:
         """Return daily KPI history for the given window (UTC)."""
 
-        import sqlite3
-        import time
+        return {
+            "window_days": days,
+            "daily": list(self.iter_product_kpi_history(days)),
+        }
+
+    def iter_product_kpi_history(
+        self,
+        days: int = 30,
+        *,
+        after: Optional[str] = None,
+        page_days: int = 31,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield daily KPI rows (UTC) oldest first, aggregated in SQLite.
+
+        Days are fetched ``page_days`` at a time, each page grouped by the
+        database rather than bucketed in Python. ``after`` (``YYYY-MM-DD``)
+        resumes with the following day; a malformed date raises ``ValueError``
+        immediately.
+        """
 
         now = time.time()
         start_time = now - (days * 86400)
-
-        def _day(ts: float) -> Optional[str]:
-            from datetime import datetime, timezone
-
-            try:
-                return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d")
-            except (TypeError, ValueError, OSError):
-                return None
-
-        with sqlite3.connect(self.db_path) as conn:
-            engagement_rows = list(
-                conn.execute(
-                    """
-                        SELECT timestamp, json_extract(tags, '$.player_id')
-                        FROM metrics
-                        WHERE metric_type = ? AND timestamp >= ?
-                    """,
-                    (MetricType.COMMAND_USAGE.value, start_time),
-                )
-            )
-            manifesto_rows = list(
-                conn.execute(
-                    """
-                        SELECT timestamp, json_extract(tags, '$.player_id')
-                        FROM metrics
-                        WHERE metric_type = ? AND name = ? AND timestamp >= ?
-                    """,
-                    (
-                        MetricType.GAME_PROGRESSION.value,
-                        "manifesto_generated",
-                        start_time,
-                    ),
-                )
-            )
-            archive_rows = list(
-                conn.execute(
-                    """
-                        SELECT timestamp
-                        FROM metrics
-                        WHERE metric_type = ? AND name = ? AND timestamp >= ?
-                    """,
-                    (MetricType.GAME_PROGRESSION.value, "archive_lookup", start_time),
-                )
-            )
-            nickname_rows = list(
-                conn.execute(
-                    """
-                        SELECT timestamp, json_extract(tags, '$.player_id')
-                        FROM metrics
-                        WHERE metric_type = ? AND name = ? AND timestamp >= ?
-                    """,
-                    (MetricType.GAME_PROGRESSION.value, "nickname_adopted", start_time),
-                )
-            )
-            press_share_rows = list(
-                conn.execute(
-                    """
-                        SELECT timestamp, json_extract(tags, '$.player_id')
-                        FROM metrics
-                        WHERE metric_type = ? AND name = ? AND timestamp >= ?
-                    """,
-                    (MetricType.GAME_PROGRESSION.value, "press_shared", start_time),
-                )
+        if after:
+            resume_day = datetime.strptime(after, "%Y-%m-%d").replace(
+                tzinfo=timezone.utc
             )
+            start_time = max(start_time, resume_day.timestamp() + 86400)
+        return self._kpi_history_pages(start_time, now, max(1, page_days))
 
-        daily_players: Dict[str, set[str]] = defaultdict(set)
-        for ts, player in engagement_rows:
-            day = _day(ts)
-            if day and player:
-                daily_players[day].add(str(player))
-
-        daily_manifesto_players: Dict[str, set[str]] = defaultdict(set)
-        daily_manifesto_events: Dict[str, int] = defaultdict(int)
-        for ts, player in manifesto_rows:
-            day = _day(ts)
-            if day:
-                daily_manifesto_events[day] += 1
-                if player:
-                    daily_manifesto_players[day].add(str(player))
-
-        daily_archive_events: Dict[str, int] = defaultdict(int)
-        for (ts,) in archive_rows:
-            day = _day(ts)
-            if day:
-                daily_archive_events[day] += 1
-
-        daily_nickname_events: Dict[str, int] = defaultdict(int)
-        for ts, player in nickname_rows:
-            day = _day(ts)
-            if day:
-                daily_nickname_events[day] += 1
-
-        daily_press_share_events: Dict[str, int] = defaultdict(int)
-        for ts, player in press_share_rows:
-            day = _day(ts)
-            if day:
-                daily_press_share_events[day] += 1
-
-        all_days = sorted(
-            {
-                *daily_players.keys(),
-                *daily_manifesto_events.keys(),
-                *daily_archive_events.keys(),
-                *daily_nickname_events.keys(),
-                *daily_press_share_events.keys(),
+    def _kpi_history_pages(
+        self, start_time: float, now: float, page_days: int
+    ) -> Iterator[Dict[str, Any]]:
+        progression = MetricType.GAME_PROGRESSION.value
+        query = """
+            SELECT
+                CAST(timestamp / 86400 AS INTEGER) AS day,
+                COUNT(DISTINCT CASE WHEN metric_type = :usage AND player_id != ''
+                    THEN player_id END),
+                COUNT(DISTINCT CASE WHEN metric_type = :progression
+                    AND name = 'manifesto_generated' AND player_id != ''
+                    THEN player_id END),
+                SUM(metric_type = :progression AND name = 'manifesto_generated'),
+                SUM(metric_type = :progression AND name = 'archive_lookup'),
+                SUM(metric_type = :progression AND name = 'nickname_adopted'),
+                SUM(metric_type = :progression AND name = 'press_shared')
+            FROM metrics
+            WHERE timestamp >= :lower AND timestamp < :upper
+              AND (
+                metric_type = :usage
+                OR (metric_type = :progression AND name IN (
+                    'manifesto_generated', 'archive_lookup',
+                    'nickname_adopted', 'press_shared'
+                ))
+              )
+            GROUP BY day
+            ORDER BY day
+        """
+        lower = start_time
+        while lower <= now:
+            upper = (math.floor(lower / 86400) + page_days) * 86400
+            params = {
+                "usage": MetricType.COMMAND_USAGE.value,
+                "progression": progression,
+                "lower": lower,
+                "upper": upper if upper <= now else math.inf,
             }
-        )
-        history = []
-        for day in all_days:
-            history.append(
-                {
-                    "date": day,
-                    "active_players": float(len(daily_players.get(day, set()))),
-                    "manifesto_players": float(
-                        len(daily_manifesto_players.get(day, set()))
-                    ),
-                    "manifesto_events": float(daily_manifesto_events.get(day, 0)),
-                    "archive_events": float(daily_archive_events.get(day, 0)),
-                    "nickname_events": float(daily_nickname_events.get(day, 0)),
-                    "press_share_events": float(daily_press_share_events.get(day, 0)),
+            with contextlib.closing(self._connect(since=lower)) as conn:
+                rows = conn.execute(query, params).fetchall()
+            for day, players, manifesto_players, *events in rows:
+                yield {
+                    "date": datetime.fromtimestamp(
+                        day * 86400, tz=timezone.utc
+                    ).strftime("%Y-%m-%d"),
+                    "active_players": float(players),
+                    "manifesto_players": float(manifesto_players),
+                    "manifesto_events": float(events[0] or 0),
+                    "archive_events": float(events[1] or 0),
+                    "nickname_events": float(events[2] or 0),
+                    "press_share_events": float(events[3] or 0),
                 }
-            )
-
-        return {
-            "window_days": days,
-            "daily": history,
-        }
+            lower = upper
 
     def get_product_kpi_history_summary(self, days: int = 30) -> Dict[str, Any]:
         """Return summary statistics for KPI history (averages, percentiles)."""
@@ -1775,56 +2906,120 @@ class TelemetryCollector:
 
     def generate_report(self) -> Dict[str, Any]:
         """Generate comprehensive telemetry report."""
-        report = {
+        report: Dict[str, Any] = {
             "generated_at": datetime.now().isoformat(),
             "uptime_seconds": time.time() - self._start_time,
-            "command_stats": self.get_command_stats(),
-            "feature_engagement_7d": self.get_feature_engagement(7),
-            "errors_24h": self.get_error_summary(24),
-            "performance_1h": self.get_performance_summary(hours=1),
-            "llm_activity_24h": self.get_llm_activity_summary(24),
-            "channel_usage_24h": self.get_channel_usage(24),
-            "system_events_24h": self.get_system_events(24, limit=10),
-            "press_cadence_24h": self.get_press_cadence_summary(24, limit=10),
-            "digest_health_24h": self.get_digest_summary(24),
-            "queue_depth_24h": self.get_queue_depth_summary(24),
-            "order_backlog_24h": self.get_order_backlog_summary(24),
-            "symposium": self.get_symposium_metrics(24),
-            "economy": self.get_economy_metrics(24),
-            "product_kpis": self.get_product_kpis(),
-            "product_kpi_history": self.get_product_kpi_history_summary(),
-            "engagement_cohorts": self.get_engagement_cohorts(),
-            "kpi_targets": self.get_kpi_targets(),
-            "moderation_24h": self.get_moderation_summary(24),
         }
+        for key, build in self._report_builders().items():
+            report[key] = build()
+        report["writer"] = self.writer_stats()
+        report["traces"] = get_tracer().summary()
+        report["health"] = self.evaluate_health(report)
 
-        # Add overall statistics
+        return report
+
+    def cached_report(self) -> Dict[str, Any]:
+        """Return the telemetry report, recomputing only sections that changed.
+
+        A section is rebuilt when any source it reads (see ``REPORT_SECTIONS``)
+        has been written since it was computed, or once it outlives its TTL;
+        everything else is served from memory. Writes are detected through
+        ``metric_watermarks``, so rows recorded by other processes count too.
+        Sections are shared between calls and must not be mutated.
+        """
+
+        with self._report_lock:
+            versions = self._read_watermarks()
+            now = time.monotonic()
+            refreshed: List[str] = []
+            for key, build in self._report_builders().items():
+                sources, ttl = REPORT_SECTIONS[key]
+                seen = tuple(
+                    sorted(versions.items())
+                    if sources is None
+                    else (versions.get(source, 0) for source in sources)
+                )
+                cached = self._report_cache.get(key)
+                if (
+                    cached is not None
+                    and cached.versions == seen
+                    and (ttl is None or now - cached.computed_at < ttl)
+                ):
+                    continue
+                self._report_cache[key] = _CachedSection(build(), seen, now)
+                refreshed.append(key)
+
+            report: Dict[str, Any] = {
+                "generated_at": datetime.now().isoformat(),
+                "uptime_seconds": time.time() - self._start_time,
+            }
+            for key, cached in self._report_cache.items():
+                report[key] = cached.value
+            if refreshed or self._report_health is None:
+                self._report_health = self.evaluate_health(report)
+            report["writer"] = self.writer_stats()
+            report["traces"] = get_tracer().summary()
+            report["health"] = self._report_health
+            report["report_cache"] = {
+                "refreshed": refreshed,
+                "cached": len(self._report_cache) - len(refreshed),
+            }
+            return report
+
+    def _report_builders(self) -> Dict[str, Callable[[], Any]]:
+        return {
+            "command_stats": self.get_command_stats,
+            "feature_engagement_7d": lambda: self.get_feature_engagement(7),
+            "errors_24h": lambda: self.get_error_summary(24),
+            "performance_1h": lambda: self.get_performance_summary(hours=1),
+            "command_latency_24h": lambda: self.get_latency_percentiles(
+                MetricType.COMMAND_USAGE, 24
+            ),
+            "llm_activity_24h": lambda: self.get_llm_activity_summary(24),
+            "channel_usage_24h": lambda: self.get_channel_usage(24),
+            "system_events_24h": lambda: self.get_system_events(24, limit=10),
+            "press_cadence_24h": lambda: self.get_press_cadence_summary(24, limit=10),
+            "digest_health_24h": lambda: self.get_digest_summary(24),
+            "queue_depth_24h": lambda: self.get_queue_depth_summary(24),
+            "order_backlog_24h": lambda: self.get_order_backlog_summary(24),
+            "symposium": lambda: self.get_symposium_metrics(24),
+            "economy": lambda: self.get_economy_metrics(24),
+            "product_kpis": self.get_product_kpis,
+            "product_kpi_history": self.get_product_kpi_history_summary,
+            "engagement_cohorts": self.get_engagement_cohorts,
+            "kpi_targets": self.get_kpi_targets,
+            "moderation_24h": lambda: self.get_moderation_summary(24),
+            "overall": self.get_overall_stats,
+        }
+
+    def _read_watermarks(self) -> Dict[str, int]:
+        with contextlib.closing(sqlite3.connect(self.db_path)) as conn:
+            return dict(conn.execute("SELECT source, version FROM metric_watermarks"))
+
+    def get_overall_stats(self) -> Dict[str, Any]:
+        """Return event totals and the time span covered by stored metrics."""
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.execute(
                 """
                 SELECT
                     COUNT(*) as total_events,
-                    COUNT(DISTINCT json_extract(tags, '$.player_id')) as unique_players,
+                    COUNT(DISTINCT player_id) as unique_players,
                     MIN(timestamp) as first_event,
                     MAX(timestamp) as last_event
                 FROM metrics
             """
             )
             row = cursor.fetchone()
-            report["overall"] = {
-                "total_events": row[0],
-                "unique_players": row[1],
-                "first_event": (
-                    datetime.fromtimestamp(row[2]).isoformat() if row[2] else None
-                ),
-                "last_event": (
-                    datetime.fromtimestamp(row[3]).isoformat() if row[3] else None
-                ),
-            }
-
-        report["health"] = self.evaluate_health(report)
-
-        return report
+        return {
+            "total_events": row[0],
+            "unique_players": row[1],
+            "first_event": (
+                datetime.fromtimestamp(row[2]).isoformat() if row[2] else None
+            ),
+            "last_event": (
+                datetime.fromtimestamp(row[3]).isoformat() if row[3] else None
+            ),
+        }
 
     def evaluate_health(
         self, report_data: Optional[Dict[str, Any]] = None
@@ -2283,10 +3478,10 @@ class TelemetryCollector:
         commitment_players: Dict[str, Dict[str, Any]] = {}
         total_commitment_debt = 0.0
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect(since=start_time) as conn:
             cursor = conn.execute(
                 """SELECT value,
-                               json_extract(tags, '$.player_id') AS player_id,
+                               player_id,
                                json_extract(metadata, '$.faction') AS faction,
                                json_extract(metadata, '$.program') AS program,
                                json_extract(metadata, '$.total') AS total_contribution,
@@ -2343,7 +3538,7 @@ class TelemetryCollector:
 
             cursor = conn.execute(
                 """SELECT value,
-                               json_extract(tags, '$.player_id') AS player_id,
+                               player_id,
                                json_extract(metadata, '$.faction') AS faction,
                                json_extract(metadata, '$.program') AS program,
                                json_extract(metadata, '$.paid_debt') AS paid_debt,
@@ -2392,7 +3587,7 @@ class TelemetryCollector:
 
             cursor = conn.execute(
                 """SELECT value,
-                               json_extract(tags, '$.player_id') AS player_id,
+                               player_id,
                                json_extract(metadata, '$.faction') AS faction,
                                json_extract(metadata, '$.tier') AS tier,
                                json_extract(metadata, '$.remaining_debt') AS remaining,
@@ -2515,7 +3710,7 @@ class TelemetryCollector:
         reprisal_counts: Dict[str, Dict[str, Any]] = {}
         participation_raw: List[Tuple[str, str, float, float]] = []
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect(since=start_time) as conn:
             row = conn.execute(
                 """SELECT COUNT(*), AVG(value)
                        FROM metrics
@@ -2535,7 +3730,7 @@ class TelemetryCollector:
 
             cursor = conn.execute(
                 """SELECT value,
-                               json_extract(tags, '$.player_id') AS player_id,
+                               player_id,
                                json_extract(metadata, '$.proposal_id') AS proposal_id,
                                json_extract(metadata, '$.age_days') AS age_days,
                                timestamp
@@ -2562,7 +3757,7 @@ class TelemetryCollector:
 
             cursor = conn.execute(
                 """SELECT value,
-                               json_extract(tags, '$.player_id') AS player_id,
+                               player_id,
                                json_extract(metadata, '$.faction') AS faction,
                                timestamp
                         FROM metrics
@@ -2587,7 +3782,7 @@ class TelemetryCollector:
 
             cursor = conn.execute(
                 """SELECT value,
-                               json_extract(tags, '$.player_id') AS player_id,
+                               player_id,
                                json_extract(metadata, '$.faction') AS faction,
                                json_extract(metadata, '$.reprisal_level') AS level,
                                timestamp
@@ -2620,7 +3815,7 @@ class TelemetryCollector:
             participation_raw = conn.execute(
                 """
                 SELECT
-                    json_extract(tags, '$.player_id') AS player_id,
+                    player_id,
                     name,
                     COUNT(*) AS usage_count,
                     MAX(timestamp) AS last_ts
@@ -2682,17 +3877,55 @@ class TelemetryCollector:
         }
 
     def cleanup_old_data(self, days_to_keep: int = 30):
-        """Clean up old telemetry data."""
+        """Drop telemetry partitions that ended before the retention window.
+
+        Retention works in whole partitions: one straddling the cutoff is kept
+        until it has aged out entirely. Dropped tables free their pages for
+        reuse by new partitions, so the file never needs a VACUUM.
+        """
         cutoff_time = time.time() - (days_to_keep * 86400)
 
         with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "DELETE FROM metrics WHERE timestamp < ?", (cutoff_time,)
+            conn.execute("BEGIN IMMEDIATE")
+            expired = conn.execute(
+                "SELECT name FROM metric_partitions WHERE range_end <= ?",
+                (cutoff_time,),
+            ).fetchall()
+            deleted = 0
+            for (name,) in expired:
+                (rows,) = conn.execute(
+                    f"SELECT COUNT(*) FROM {name}"  # nosec B608
+                ).fetchone()
+                deleted += rows
+                conn.execute(f"DROP TABLE {name}")
+            conn.execute(
+                "DELETE FROM metric_partitions WHERE range_end <= ?", (cutoff_time,)
+            )
+            if expired:
+                self._rebuild_metrics_view(conn)
+            # Only rows inserted by hand outside any partition are deleted.
+            deleted += conn.execute(
+                f"DELETE FROM {_UNPARTITIONED} WHERE timestamp < ?",  # nosec B608
+                (cutoff_time,),
+            ).rowcount
+            # Rollups follow the raw rows actually kept, so reports and their
+            # sketches agree with the straddling partition until it is dropped.
+            (oldest_kept,) = conn.execute(
+                "SELECT MIN(range_start) FROM metric_partitions"
+            ).fetchone()
+            rollup_cutoff = (
+                cutoff_time if oldest_kept is None else min(oldest_kept, cutoff_time)
             )
-            deleted = cursor.rowcount
+            conn.execute(
+                "DELETE FROM metric_rollups WHERE bucket_start < ?", (rollup_cutoff,)
+            )
+            conn.execute("UPDATE metric_watermarks SET version = version + 1")
             conn.commit()
 
-        logger.info(f"Cleaned up {deleted} old metric events")
+        logger.info(
+            f"Cleaned up {deleted} old metric events "
+            f"({len(expired)} partitions dropped)"
+        )
         return deleted
 
     def _summarise_symposium_participation(
@@ -2757,6 +3990,65 @@ class TelemetryCollector:
         }
 
 
+_open_collectors: "weakref.WeakSet[TelemetryCollector]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_collectors() -> None:
+    for collector in list(_open_collectors):
+        if not collector.db_path.parent.exists():
+            # The database directory is gone (a removed temporary directory),
+            # so there is nowhere left to write the remaining metrics.
+            logger.debug(
+                "Skipping telemetry flush for removed database %s", collector.db_path
+            )
+            continue
+        collector.close()
+
+
+class _TelemetryWriter(threading.Thread):
+    """Drain a collector's write queue into SQLite in batched transactions."""
+
+    def __init__(self, collector: TelemetryCollector):
+        super().__init__(name="telemetry-writer", daemon=True)
+        self.collector = collector
+        self.stop = threading.Event()
+
+    def run(self) -> None:
+        collector = self.collector
+        conn: Optional[sqlite3.Connection] = None
+        idle_since = time.monotonic()
+        try:
+            while True:
+                try:
+                    batch = collector._write_queue.get(timeout=_WRITER_POLL_SECONDS)
+                except queue.Empty:
+                    idle = time.monotonic() - idle_since
+                    if (
+                        self.stop.is_set() or idle >= _WRITER_IDLE_SECONDS
+                    ) and collector._retire_writer(self):
+                        return
+                    continue
+                if not batch:
+                    collector._write_queue.task_done()
+                    if self.stop.is_set() and collector._retire_writer(self):
+                        return
+                    continue
+                try:
+                    if conn is None:
+                        conn = sqlite3.connect(collector.db_path)
+                    collector._write_batch(conn, batch)
+                except Exception as e:
+                    collector._count_dropped(len(batch))
+                    logger.error(f"Failed to flush metrics: {e}")
+                finally:
+                    collector._write_queue.task_done()
+                idle_since = time.monotonic()
+        finally:
+            if conn is not None:
+                conn.close()
+
+
 # Singleton instance
 _telemetry: Optional[TelemetryCollector] = None
 
@@ -0,0 +1,64 @@
+"""Inspect and restore content-addressed web archive snapshots."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import List
+
+from ..archive_snapshots import SnapshotStore
+
+
+def _list(args: argparse.Namespace) -> None:
+    store = SnapshotStore(args.store)
+    payload = {
+        "snapshots": store.names(),
+        "usage": asdict(store.usage()),
+    }
+    print(json.dumps(payload, indent=2))
+
+
+def _restore(args: argparse.Namespace) -> None:
+    store = SnapshotStore(args.store)
+    names = store.names()
+    name = args.name or (names[-1] if names else None)
+    if name is None:
+        raise SystemExit(f"No snapshots found in {args.store}")
+    count = store.restore(name, args.target)
+    print(f"Restored {count} files from {name} into {args.target}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--store",
+        type=Path,
+        default=Path("snapshots"),
+        help="Snapshot store directory (default: ./snapshots)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="List snapshots and disk usage")
+    list_parser.set_defaults(func=_list)
+
+    restore_parser = subparsers.add_parser(
+        "restore", help="Write a snapshot back out as plain files"
+    )
+    restore_parser.add_argument("target", type=Path, help="Directory to restore into")
+    restore_parser.add_argument(
+        "--name", help="Snapshot name (defaults to the most recent)"
+    )
+    restore_parser.set_defaults(func=_restore)
+    return parser
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark full versus incremental web archive export."""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List
+
+from ..models import PressRecord, PressRelease
+from ..state import GameState
+from ..web_archive import WebArchive
+
+_PRESS_TYPES = ("academic_bulletin", "discovery_report", "retraction_notice")
+
+
+def seed_press(state: GameState, count: int, *, offset: int = 0) -> None:
+    """Record ``count`` synthetic press releases in a single transaction."""
+
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with state.transaction():
+        for index in range(offset, offset + count):
+            state.record_press_release(
+                PressRecord(
+                    timestamp=base + timedelta(minutes=index),
+                    release=PressRelease(
+                        type=_PRESS_TYPES[index % len(_PRESS_TYPES)],
+                        headline=f"Bulletin {index}: findings under review",
+                        body=f"Synthetic release {index}.\n\nCounter-claims invited.",
+                        metadata={"index": index},
+                    ),
+                )
+            )
+
+
+def _timed(action) -> float:
+    started = time.perf_counter()
+    # The exporters report progress on stdout; keep the JSON output clean.
+    with contextlib.redirect_stdout(io.StringIO()):
+        action()
+    return time.perf_counter() - started
+
+
+def run_benchmark(
+    workdir: Path, *, releases: int, new_releases: int, workers: int = 1
+) -> Dict[str, object]:
+    """Export ``releases`` press pages in full, then incrementally after more.
+
+    With ``workers`` above one the full export is also repeated on a process
+    pool so serial and parallel rebuilds can be compared.
+    """
+
+    state = GameState(workdir / "bench.db", start_year=1923)
+    seed_press(state, releases)
+    archive = WebArchive(state, workdir / "archive", workers=1)
+
+    full_seconds = _timed(archive.export_full_archive)
+    parallel_seconds = None
+    if workers > 1:
+        parallel = WebArchive(state, workdir / "archive", workers=workers)
+        parallel_seconds = round(_timed(parallel.export_full_archive), 4)
+    noop_seconds = _timed(archive.export_incremental_archive)
+    seed_press(state, new_releases, offset=releases)
+    incremental_seconds = _timed(archive.export_incremental_archive)
+    state.close()
+
+    return {
+        "releases": releases,
+        "new_releases": new_releases,
+        "workers": workers,
+        "full_seconds": round(full_seconds, 4),
+        "full_parallel_seconds": parallel_seconds,
+        "incremental_noop_seconds": round(noop_seconds, 4),
+        "incremental_seconds": round(incremental_seconds, 4),
+        "speedup": round(full_seconds / max(incremental_seconds, 1e-9), 1),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare full and incremental web archive export times",
+    )
+    parser.add_argument(
+        "--releases", type=int, default=50000, help="Press releases to seed"
+    )
+    parser.add_argument(
+        "--new-releases",
+        type=int,
+        default=25,
+        help="Releases added before the incremental export",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Also time a full export on this many render processes",
+    )
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        default=None,
+        help="Directory for the database and archive (defaults to a temporary one)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.workdir is not None:
+        args.workdir.mkdir(parents=True, exist_ok=True)
+        result = run_benchmark(
+            args.workdir,
+            releases=args.releases,
+            new_releases=args.new_releases,
+            workers=args.workers,
+        )
+    else:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = run_benchmark(
+                Path(tmpdir),
+                releases=args.releases,
+                new_releases=args.new_releases,
+                workers=args.workers,
+            )
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI tool
+    raise SystemExit(main())
@@ -0,0 +1,81 @@
+"""Benchmark digest latency against a seeded state database."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from ..models import Player
+from ..service import GameService
+
+
+def seed_players(service: GameService, count: int) -> None:
+    """Insert ``count`` synthetic players through the public state API."""
+
+    for index in range(count):
+        player = Player(
+            id=f"bench-{index:05d}",
+            display_name=f"Bench Player {index}",
+            reputation=index % 40,
+            influence={faction: index % 7 for faction in service._FACTIONS},
+            cooldowns={"recruitment": 2, "expedition": 1} if index % 3 else {},
+        )
+        service.state.upsert_player(player)
+
+
+def run_benchmark(db_path: Path, *, players: int, ticks: int) -> Dict[str, object]:
+    """Seed ``players`` players and time ``ticks`` consecutive digests."""
+
+    service = GameService(db_path)
+    seed_started = time.perf_counter()
+    seed_players(service, players)
+    seed_seconds = time.perf_counter() - seed_started
+
+    durations: List[float] = []
+    for _ in range(ticks):
+        started = time.perf_counter()
+        service.advance_digest()
+        durations.append(time.perf_counter() - started)
+
+    return {
+        "players": players,
+        "ticks": ticks,
+        "seed_seconds": round(seed_seconds, 4),
+        "digest_mean_seconds": round(statistics.fmean(durations), 4),
+        "digest_min_seconds": round(min(durations), 4),
+        "digest_max_seconds": round(max(durations), 4),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure advance_digest latency on a seeded database",
+    )
+    parser.add_argument("--players", type=int, default=5000, help="Players to seed")
+    parser.add_argument("--ticks", type=int, default=3, help="Digest ticks to time")
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=None,
+        help="Database path (defaults to a throwaway temporary file)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.db is not None:
+        result = run_benchmark(args.db, players=args.players, ticks=args.ticks)
+    else:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = run_benchmark(
+                Path(tmpdir) / "bench.db", players=args.players, ticks=args.ticks
+            )
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI tool
+    raise SystemExit(main())
@@ -0,0 +1,219 @@
+"""Benchmark telemetry report queries before and after the tag-column migration."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from ..telemetry import MetricType, TelemetryCollector
+
+# Schema as it stood before hot tags were promoted to their own columns.
+_LEGACY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metrics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp REAL NOT NULL,
+    metric_type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value REAL NOT NULL,
+    tags TEXT,
+    metadata TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_metrics_timestamp ON metrics(timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_metrics_type_name ON metrics(metric_type, name);
+"""
+
+# Report queries as they were written against the JSON ``tags`` blob; the
+# column form is the same text with each ``json_extract`` swapped for its column.
+_LEGACY_QUERIES = {
+    "command_stats": (
+        """
+        SELECT name, COUNT(*),
+               AVG(CASE WHEN json_extract(tags, '$.success') = 'True'
+                   THEN 1 ELSE 0 END),
+               COUNT(DISTINCT json_extract(tags, '$.player_id'))
+        FROM metrics WHERE metric_type = ? GROUP BY name
+        """,
+        (MetricType.COMMAND_USAGE.value,),
+    ),
+    "channel_usage_24h": (
+        """
+        SELECT COALESCE(json_extract(tags, '$.channel_id'), 'unknown') AS channel,
+               COUNT(*), COUNT(DISTINCT name),
+               COUNT(DISTINCT json_extract(tags, '$.player_id'))
+        FROM metrics WHERE metric_type = ? AND timestamp >= ? GROUP BY channel
+        """,
+        (MetricType.COMMAND_USAGE.value, "window:1"),
+    ),
+    "active_players_7d": (
+        """
+        SELECT COUNT(*), COUNT(DISTINCT json_extract(tags, '$.player_id'))
+        FROM metrics WHERE metric_type = ? AND timestamp >= ?
+        """,
+        (MetricType.COMMAND_USAGE.value, "window:7"),
+    ),
+    "manifesto_players_7d": (
+        """
+        SELECT COUNT(*), COUNT(DISTINCT json_extract(tags, '$.player_id'))
+        FROM metrics WHERE metric_type = ? AND name = ? AND timestamp >= ?
+        """,
+        (MetricType.GAME_PROGRESSION.value, "manifesto_generated", "window:7"),
+    ),
+}
+
+_JSON_TAG = re.compile(r"json_extract\(tags, '\$\.(\w+)'\)")
+
+_PROGRESSION_NAMES = (
+    "manifesto_generated",
+    "archive_lookup",
+    "nickname_adopted",
+    "press_shared",
+)
+_COMMANDS = ("submit_theory", "launch_expedition", "recruit", "status", "archive")
+
+
+def seed_metrics(
+    db_path: Path, rows: int, *, days: int = 30, seed: int = 7, batch: int = 50000
+) -> None:
+    """Fill a legacy-schema metrics table with ``rows`` synthetic events."""
+
+    rng = random.Random(seed)
+    now = time.time()
+    span = days * 86400
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(_LEGACY_SCHEMA)
+        for start in range(0, rows, batch):
+            payload = []
+            for _ in range(min(batch, rows - start)):
+                player = f"player_{rng.randrange(500)}"
+                roll = rng.random()
+                if roll < 0.6:
+                    metric_type = MetricType.COMMAND_USAGE.value
+                    name = rng.choice(_COMMANDS)
+                    tags = {
+                        "player_id": player,
+                        "guild_id": "guild",
+                        "success": "True" if rng.random() < 0.95 else "False",
+                        "channel_id": f"channel_{rng.randrange(20)}",
+                    }
+                elif roll < 0.8:
+                    metric_type = MetricType.GAME_PROGRESSION.value
+                    name = rng.choice(_PROGRESSION_NAMES)
+                    tags = {"player_id": player}
+                else:
+                    metric_type = MetricType.PERFORMANCE.value
+                    name = rng.choice(_COMMANDS)
+                    tags = {}
+                payload.append(
+                    (
+                        now - rng.random() * span,
+                        metric_type,
+                        name,
+                        1.0,
+                        json.dumps(tags),
+                        "{}",
+                    )
+                )
+            conn.executemany(
+                "INSERT INTO metrics "
+                "(timestamp, metric_type, name, value, tags, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                payload,
+            )
+            conn.commit()
+
+
+def _timed(action: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    action()
+    return round(time.perf_counter() - started, 4)
+
+
+def _run_queries(db_path: Path, *, columns: bool) -> Dict[str, float]:
+    now = time.time()
+    timings: Dict[str, float] = {}
+    with sqlite3.connect(db_path) as conn:
+        for label, (query, params) in _LEGACY_QUERIES.items():
+            if columns:
+                query = _JSON_TAG.sub(r"\1", query)
+            bound = [
+                now - int(value.split(":")[1]) * 86400
+                if isinstance(value, str) and value.startswith("window:")
+                else value
+                for value in params
+            ]
+            timings[label] = _timed(lambda: conn.execute(query, bound).fetchall())
+    return timings
+
+
+def run_benchmark(workdir: Path, *, rows: int) -> Dict[str, object]:
+    """Time report queries on ``rows`` metrics before and after migrating."""
+
+    db_path = workdir / "telemetry_bench.db"
+    seed_seconds = _timed(lambda: seed_metrics(db_path, rows))
+    legacy = _run_queries(db_path, columns=False)
+
+    collector: Dict[str, TelemetryCollector] = {}
+    migrate_seconds = _timed(
+        lambda: collector.setdefault("c", TelemetryCollector(db_path))
+    )
+    telemetry = collector["c"]
+    migrated = _run_queries(db_path, columns=True)
+    reports = {
+        "command_stats": _timed(telemetry.get_command_stats),
+        "product_kpis": _timed(telemetry.get_product_kpis),
+        "engagement_cohorts": _timed(telemetry.get_engagement_cohorts),
+        "performance_summary_7d": _timed(
+            lambda: telemetry.get_performance_summary(hours=168)
+        ),
+        "error_summary_7d": _timed(lambda: telemetry.get_error_summary(168)),
+        "channel_usage_24h": _timed(lambda: telemetry.get_channel_usage(24)),
+    }
+    return {
+        "rows": rows,
+        "seed_seconds": seed_seconds,
+        "migrate_seconds": migrate_seconds,
+        "legacy_json_queries": legacy,
+        "column_queries": migrated,
+        "speedup": {
+            label: round(legacy[label] / max(migrated[label], 1e-9), 1)
+            for label in legacy
+        },
+        "collector_reports": reports,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare JSON-tag and column-backed telemetry report queries",
+    )
+    parser.add_argument(
+        "--rows", type=int, default=1_000_000, help="Metric rows to seed"
+    )
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        default=None,
+        help="Directory for the benchmark database (defaults to a temporary one)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.workdir is not None:
+        args.workdir.mkdir(parents=True, exist_ok=True)
+        result = run_benchmark(args.workdir, rows=args.rows)
+    else:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = run_benchmark(Path(tmpdir), rows=args.rows)
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI tool
+    raise SystemExit(main())
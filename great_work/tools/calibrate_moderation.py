@@ -9,7 +9,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict
 
+import numpy as np
+
 from ..telemetry import DEFAULT_TELEMETRY_DB, MetricType, TelemetryCollector
+from .export_telemetry_columnar import TAG_PREFIX, load_columns
 
 
 def _load_events(collector: TelemetryCollector, hours: int) -> list[dict]:
@@ -28,7 +31,7 @@ def _load_events(collector: TelemetryCollector, hours: int) -> list[dict]:
                     json_extract(tags, '$.severity') AS severity,
                     json_extract(tags, '$.actor') AS actor,
                     json_extract(tags, '$.text_hash') AS text_hash,
-                    json_extract(tags, '$.source') AS source,
+                    source,
                     timestamp
                 FROM metrics
                 WHERE metric_type = ? AND timestamp >= ?
@@ -67,6 +70,67 @@ def calibrate(collector: TelemetryCollector, *, hours: int) -> Dict[str, object]
         by_severity[event["severity"]] += 1
         per_surface[event["surface"]] += 1
 
+    return _summary(hours, events, by_category, by_stage, by_severity, per_surface)
+
+
+def calibrate_from_export(export_dir: Path, *, hours: int) -> Dict[str, object]:
+    """Build the same summary from a columnar export with vectorised counts."""
+
+    window_start = datetime.now(timezone.utc).timestamp() - (hours * 3600)
+    fields = {
+        "category": "name",
+        "stage": f"{TAG_PREFIX}stage",
+        "surface": f"{TAG_PREFIX}surface",
+        "severity": f"{TAG_PREFIX}severity",
+        "actor": f"{TAG_PREFIX}actor",
+        "text_hash": f"{TAG_PREFIX}text_hash",
+        "source": "source",
+    }
+    columns = load_columns(
+        export_dir,
+        MetricType.MODERATION.value,
+        (*fields.values(), "timestamp"),
+        since=window_start,
+    )
+    # Newest first, like the SQL path, so ties keep first-seen order below.
+    order = np.argsort(-columns["timestamp"], kind="stable")
+    columns = {name: values[order] for name, values in columns.items()}
+
+    def counts(values: np.ndarray) -> Dict[object, int]:
+        keys, first_seen, totals = np.unique(
+            values, return_index=True, return_counts=True
+        )
+        ranked = np.argsort(first_seen, kind="stable")
+        return {_optional(keys[i]): int(totals[i]) for i in ranked}
+
+    events = [
+        {
+            **{field: _optional(value) for field, value in zip(fields, row[:-1])},
+            "timestamp": datetime.fromtimestamp(row[-1], tz=timezone.utc).isoformat(),
+        }
+        for row in zip(
+            *(columns[column] for column in fields.values()),
+            columns["timestamp"].tolist(),
+        )
+    ]
+    return _summary(
+        hours,
+        events,
+        counts(columns["name"]),
+        counts(columns[fields["stage"]]),
+        counts(columns[fields["severity"]]),
+        counts(columns[fields["surface"]]),
+    )
+
+
+def _summary(
+    hours: int,
+    events: list[dict],
+    by_category: Dict[object, int],
+    by_stage: Dict[object, int],
+    by_severity: Dict[object, int],
+    per_surface: Dict[object, int],
+) -> Dict[str, object]:
     total = len(events)
     recommendation = {
         "hours": hours,
@@ -90,6 +154,13 @@ def calibrate(collector: TelemetryCollector, *, hours: int) -> Dict[str, object]
     return recommendation
 
 
+def _optional(value: object) -> object:
+    """Map the export's empty-string placeholder back to ``None``."""
+
+    text = str(value)
+    return text or None
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Summarise moderation telemetry for Guardian tuning."
@@ -106,11 +177,20 @@ def main() -> None:
         default=168,
         help="Hours of history to analyse (default: 168 hours / 7 days).",
     )
+    parser.add_argument(
+        "--export-dir",
+        type=Path,
+        help="Read a columnar export (export_telemetry_columnar) instead of the "
+        "database.",
+    )
     parser.add_argument("--json", action="store_true", help="Emit JSON output.")
     args = parser.parse_args()
 
-    collector = TelemetryCollector(args.telemetry_db)
-    summary = calibrate(collector, hours=max(1, args.hours))
+    if args.export_dir:
+        summary = calibrate_from_export(args.export_dir, hours=max(1, args.hours))
+    else:
+        collector = TelemetryCollector(args.telemetry_db)
+        summary = calibrate(collector, hours=max(1, args.hours))
     if args.json:
         print(json.dumps(summary, indent=2))
         return
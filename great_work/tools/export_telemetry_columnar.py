@@ -0,0 +1,326 @@
+"""Export telemetry metrics to day/metric-type partitioned columnar files."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..telemetry import DEFAULT_TELEMETRY_DB, METRIC_COLUMNS, TelemetryCollector
+
+logger = logging.getLogger(__name__)
+
+try:  # pragma: no cover - optional dependency
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - NumPy archives remain available
+    pa = pc = pq = None
+
+DEFAULT_EXPORT_DIR = Path("telemetry_exports") / "columnar"
+
+_STATE_FILE = "_export_state.json"
+_STATE_VERSION = 1
+_FORMAT_SUFFIXES = {"parquet": ".parquet", "npz": ".npz"}
+_FLOAT_COLUMNS = ("timestamp", "value")
+_STRING_COLUMNS = tuple(
+    column
+    for column in METRIC_COLUMNS
+    if column not in ("id", "created_at", "tags", *_FLOAT_COLUMNS)
+)
+# Tags without a dedicated column are flattened into ``tag_<key>`` columns.
+TAG_PREFIX = "tag_"
+
+_COLUMN_INDEX = {column: index for index, column in enumerate(METRIC_COLUMNS)}
+
+
+def export_columnar(
+    db_path: Path,
+    output_dir: Path,
+    *,
+    fmt: str = "parquet",
+    batch_size: int = 50000,
+    max_buffered_rows: int = 200000,
+) -> Dict[str, Any]:
+    """Append metrics recorded since the last export as columnar files.
+
+    Files are written under ``metric_type=<type>/day=<YYYY-MM-DD>/`` and never
+    rewritten. ``_export_state.json`` keeps the last exported ``id`` of every
+    telemetry partition, so each run only streams rows added since (including
+    late writes into older partitions). Parquet needs ``pyarrow``; without it
+    the same columns are stored as compressed NumPy archives.
+    """
+
+    if fmt not in _FORMAT_SUFFIXES:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    if fmt == "parquet" and pq is None:
+        logger.warning("pyarrow is not installed; exporting NumPy archives instead")
+        fmt = "npz"
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    state = load_state(output_dir)
+    _remove_unlisted_files(output_dir, state["files"])
+
+    collector = TelemetryCollector(db_path)
+    collector.flush()
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    high_water: Dict[str, int] = dict(state["high_water"])
+    buffers: Dict[Tuple[str, str], List[Tuple[Any, ...]]] = defaultdict(list)
+    buffered = exported = 0
+    written: List[str] = []
+
+    for partition, rows in collector.iter_metric_batches(
+        high_water, batch_size=batch_size
+    ):
+        for row in rows:
+            key = (
+                row[_COLUMN_INDEX["metric_type"]],
+                _day(row[_COLUMN_INDEX["timestamp"]]),
+            )
+            buffers[key].append(row)
+        buffered += len(rows)
+        exported += len(rows)
+        high_water[partition] = rows[-1][0]
+        if buffered >= max_buffered_rows:
+            written.extend(_flush(buffers, output_dir, run_id, fmt, len(written)))
+            buffered = 0
+    written.extend(_flush(buffers, output_dir, run_id, fmt, len(written)))
+
+    # Partitions dropped by retention can no longer produce rows.
+    with sqlite3.connect(db_path) as conn:
+        live = {row[0] for row in conn.execute("SELECT name FROM metric_partitions")}
+    high_water = {
+        name: last_id
+        for name, last_id in high_water.items()
+        if name in live or name == "metrics_unpartitioned"
+    }
+
+    state = {
+        "version": _STATE_VERSION,
+        "format": fmt,
+        "high_water": high_water,
+        "files": [*state["files"], *written],
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }
+    _write_atomic(output_dir / _STATE_FILE, json.dumps(state, indent=2).encode())
+    return {
+        "rows": exported,
+        "files": [output_dir / relpath for relpath in written],
+        "format": fmt,
+        "output_dir": output_dir,
+    }
+
+
+def load_state(output_dir: Path) -> Dict[str, Any]:
+    """Return the export's high-water marks and the files it has committed."""
+
+    path = output_dir / _STATE_FILE
+    if not path.exists():
+        return {"version": _STATE_VERSION, "high_water": {}, "files": []}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def load_columns(
+    export_dir: Path,
+    metric_type: str,
+    columns: Sequence[str],
+    *,
+    since: Optional[float] = None,
+    names: Optional[Iterable[str]] = None,
+) -> Dict[str, np.ndarray]:
+    """Concatenate ``columns`` of one metric type from an export into arrays.
+
+    Day directories before ``since`` are skipped without being opened. String
+    columns come back as ``str`` arrays with ``""`` for missing values, and
+    ``timestamp``/``value`` as ``float64``.
+    """
+
+    wanted = list(dict.fromkeys([*columns, "timestamp", "name"]))
+    prefix = f"metric_type={metric_type}/"
+    first_day = _day(since) if since is not None else None
+    chunks: Dict[str, List[np.ndarray]] = {column: [] for column in wanted}
+    for relpath in load_state(export_dir)["files"]:
+        if not relpath.startswith(prefix):
+            continue
+        day = relpath[len(prefix) :].split("/", 1)[0].removeprefix("day=")
+        if first_day is not None and day < first_day:
+            continue
+        data = _read_file(export_dir / relpath, wanted)
+        for column in wanted:
+            chunks[column].append(data[column])
+
+    result = {
+        column: (
+            np.concatenate(parts)
+            if parts
+            else np.array([], dtype=float if column in _FLOAT_COLUMNS else str)
+        )
+        for column, parts in chunks.items()
+    }
+    mask = np.ones(len(result["timestamp"]), dtype=bool)
+    if since is not None:
+        mask &= result["timestamp"] >= since
+    if names is not None:
+        mask &= np.isin(result["name"], list(names))
+    return {column: result[column][mask] for column in columns}
+
+
+def _flush(
+    buffers: Dict[Tuple[str, str], List[Tuple[Any, ...]]],
+    output_dir: Path,
+    run_id: str,
+    fmt: str,
+    sequence: int,
+) -> List[str]:
+    written = []
+    for (metric_type, day), rows in sorted(buffers.items()):
+        relpath = (
+            f"metric_type={metric_type}/day={day}/"
+            f"part-{run_id}-{sequence + len(written):05d}{_FORMAT_SUFFIXES[fmt]}"
+        )
+        path = output_dir / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_file(path, _columns(rows), fmt)
+        written.append(relpath)
+    buffers.clear()
+    return written
+
+
+def _columns(rows: List[Tuple[Any, ...]]) -> Dict[str, List[Any]]:
+    """Pivot metric rows into per-column lists, flattening the tags blob."""
+
+    columns: Dict[str, List[Any]] = {}
+    for column in (*_FLOAT_COLUMNS, *_STRING_COLUMNS):
+        index = _COLUMN_INDEX[column]
+        if column in _FLOAT_COLUMNS:
+            columns[column] = [row[index] for row in rows]
+        else:
+            columns[column] = [_text(row[index]) for row in rows]
+
+    tags = [json.loads(row[_COLUMN_INDEX["tags"]] or "{}") for row in rows]
+    extra = sorted({key for entry in tags for key in entry} - set(METRIC_COLUMNS))
+    for key in extra:
+        columns[f"{TAG_PREFIX}{key}"] = [_text(entry.get(key)) for entry in tags]
+    return columns
+
+
+def _write_file(path: Path, columns: Dict[str, List[Any]], fmt: str) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    if fmt == "parquet":
+        table = pa.table({name: pa.array(values) for name, values in columns.items()})
+        pq.write_table(table, tmp_path, compression="zstd")
+    else:
+        arrays = {
+            name: (
+                np.asarray(values, dtype=np.float64)
+                if name in _FLOAT_COLUMNS
+                else np.asarray(["" if v is None else v for v in values], dtype=str)
+            )
+            for name, values in columns.items()
+        }
+        with tmp_path.open("wb") as handle:
+            np.savez_compressed(handle, **arrays)
+    os.replace(tmp_path, path)
+
+
+def _read_file(path: Path, columns: Sequence[str]) -> Dict[str, np.ndarray]:
+    if path.suffix == ".parquet":
+        if pq is None:
+            raise RuntimeError("pyarrow is required to read .parquet telemetry exports")
+        available = set(pq.read_schema(path).names)
+        table = pq.read_table(path, columns=[c for c in columns if c in available])
+        rows = table.num_rows
+        data = {
+            name: (
+                table[name].to_numpy().astype(np.float64)
+                if name in _FLOAT_COLUMNS
+                else pc.fill_null(table[name], "").to_numpy().astype(str)
+            )
+            for name in table.column_names
+        }
+    else:
+        with np.load(path, allow_pickle=False) as archive:
+            data = {name: archive[name] for name in columns if name in archive.files}
+            rows = len(archive["timestamp"])
+    for name in columns:
+        if name not in data:
+            # Flattened tag columns only exist in files whose rows carried them.
+            data[name] = (
+                np.full(rows, np.nan) if name in _FLOAT_COLUMNS else np.full(rows, "")
+            )
+    return data
+
+
+def _remove_unlisted_files(output_dir: Path, files: List[str]) -> None:
+    """Delete files left behind by an export that died before saving its state."""
+
+    committed = set(files)
+    for path in output_dir.glob("metric_type=*/day=*/*"):
+        relpath = path.relative_to(output_dir).as_posix()
+        if relpath not in committed:
+            path.unlink(missing_ok=True)
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+def _day(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=DEFAULT_TELEMETRY_DB,
+        help=f"Path to telemetry SQLite database (default: {DEFAULT_TELEMETRY_DB}).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=DEFAULT_EXPORT_DIR,
+        help=f"Export directory (default: {DEFAULT_EXPORT_DIR}).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(_FORMAT_SUFFIXES),
+        default="parquet",
+        help="File format; parquet needs pyarrow (default: parquet).",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=50000, help="Rows fetched per query"
+    )
+    args = parser.parse_args(argv)
+
+    result = export_columnar(
+        args.db, args.output, fmt=args.format, batch_size=max(1, args.batch_size)
+    )
+    print(
+        f"Exported {result['rows']} metric rows into {len(result['files'])} "
+        f"{result['format']} files under {result['output_dir']}"
+    )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI tool
+    raise SystemExit(main())
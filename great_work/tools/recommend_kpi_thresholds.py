@@ -4,36 +4,213 @@ from __future__ import annotations
 
 import argparse
 import json
-import statistics
 import sys
-from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Optional, Sequence
+
+import numpy as np
 
 from ..telemetry import DEFAULT_TELEMETRY_DB, MetricType, TelemetryCollector
+from .export_telemetry_columnar import load_columns
 
+_SECONDS_PER_DAY = 86400
+DEFAULT_QUANTILES = (0.1, 0.5, 0.9)
 
-def _bucket_daily(records: Iterable[Tuple[float, str]]) -> Dict[str, set[str]]:
-    """Group player ids by UTC date (YYYY-MM-DD)."""
 
-    buckets: Dict[str, set[str]] = defaultdict(set)
-    for ts, player_id in records:
-        day = _timestamp_to_day(ts)
-        if day is None or not player_id:
-            continue
-        buckets[day].add(player_id)
-    return buckets
+@dataclass(frozen=True)
+class PlayerActivity:
+    """Distinct (UTC day, player) pairs as NumPy arrays, sorted by player then day.
+
+    ``days`` counts days since the epoch and ``players`` indexes ``player_ids``.
+    """
+
+    days: np.ndarray
+    players: np.ndarray
+    player_ids: np.ndarray
+
+    @classmethod
+    def from_events(
+        cls, timestamps: np.ndarray, player_ids: np.ndarray
+    ) -> "PlayerActivity":
+        """Build from raw event columns, ignoring events without a player."""
+
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        player_ids = np.asarray(player_ids, dtype=str)
+        known = (player_ids != "") & np.isfinite(timestamps)
+        days = np.floor(timestamps[known] / _SECONDS_PER_DAY).astype(np.int64)
+        return cls._from_days(days, player_ids[known])
+
+    @classmethod
+    def _from_days(cls, days: np.ndarray, player_ids: np.ndarray) -> "PlayerActivity":
+        ids, codes = np.unique(player_ids, return_inverse=True)
+        if not days.size:
+            empty = np.empty(0, dtype=np.int64)
+            return cls(days=empty, players=empty, player_ids=ids)
+        first = int(days.min())
+        span = int(days.max()) - first + 1
+        keys = np.unique(codes.astype(np.int64) * span + (days - first))
+        return cls(days=keys % span + first, players=keys // span, player_ids=ids)
+
+    @property
+    def first_day(self) -> int:
+        return int(self.days.min()) if self.days.size else 0
+
+    @property
+    def day_count(self) -> int:
+        return int(self.days.max()) - self.first_day + 1 if self.days.size else 0
 
+    def first_seen_days(self) -> np.ndarray:
+        """First active day of every player within the loaded history."""
 
-def _timestamp_to_day(timestamp: float) -> str | None:
-    from datetime import datetime, timezone
+        first = np.empty(len(self.player_ids), dtype=np.int64)
+        starts = np.r_[True, self.players[1:] != self.players[:-1]]
+        first[self.players[starts]] = self.days[starts]
+        return first
 
-    if timestamp is None:
-        return None
-    try:
-        return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
-    except (OverflowError, OSError, ValueError):
-        return None
+
+def load_player_activity(db_path: Path, since: float) -> PlayerActivity:
+    """Load command-usage activity since ``since``, de-duplicated by SQLite."""
+
+    with _connect(db_path) as conn:
+        rows = conn.execute(
+            """
+            SELECT DISTINCT CAST(timestamp / 86400 AS INTEGER), player_id
+            FROM metrics
+            WHERE metric_type = ? AND timestamp >= ?
+              AND player_id IS NOT NULL AND player_id != ''
+            """,
+            (MetricType.COMMAND_USAGE.value, since),
+        ).fetchall()
+    days = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+    player_ids = np.array([str(row[1]) for row in rows], dtype=str)
+    return PlayerActivity._from_days(days, player_ids)
+
+
+def load_export_activity(export_dir: Path, since: float) -> PlayerActivity:
+    """Load command-usage activity since ``since`` from a columnar export."""
+
+    engagement = load_columns(
+        export_dir,
+        MetricType.COMMAND_USAGE.value,
+        ("timestamp", "player_id"),
+        since=since,
+    )
+    return PlayerActivity.from_events(engagement["timestamp"], engagement["player_id"])
+
+
+def rolling_distinct_players(
+    activity: PlayerActivity,
+    windows: Sequence[int],
+    *,
+    cohorts: Optional[np.ndarray] = None,
+    cohort_count: int = 1,
+) -> np.ndarray:
+    """Count distinct players active in the trailing window ending on each day.
+
+    Returns an array shaped ``(len(windows), cohort_count, activity.day_count)``.
+    ``cohorts`` maps each player code to a cohort index. Every (player, day)
+    pair covers the days from itself up to the player's next active day or the
+    end of the window, whichever comes first, so all windows and cohorts come
+    out of two ``bincount`` calls and a cumulative sum.
+    """
+
+    windows_arr = np.asarray(windows, dtype=np.int64)
+    day_count = activity.day_count
+    day = activity.days - activity.first_day
+    next_day = np.full(day.shape, day_count, dtype=np.int64)
+    same_player = activity.players[1:] == activity.players[:-1]
+    next_day[:-1][same_player] = day[1:][same_player]
+    end = np.minimum(next_day, day + windows_arr[:, None])
+
+    cohort = (
+        np.zeros(len(day), dtype=np.int64)
+        if cohorts is None
+        else cohorts[activity.players]
+    )
+    stride = day_count + 1
+    series = np.arange(len(windows_arr))[:, None] * cohort_count + cohort
+    size = len(windows_arr) * cohort_count * stride
+    starts = np.bincount((series * stride + day).ravel(), minlength=size)
+    stops = np.bincount((series * stride + end).ravel(), minlength=size)
+    diff = (starts - stops).reshape(len(windows_arr), cohort_count, stride)
+    return np.cumsum(diff, axis=2)[..., :day_count]
+
+
+def window_report(
+    activity: PlayerActivity,
+    windows: Sequence[int] = (1, 7, 28),
+    *,
+    cohort_days: Optional[int] = None,
+    quantiles: Sequence[float] = DEFAULT_QUANTILES,
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Summarise distinct active players for every window and cohort at once.
+
+    Keys are ``"<window>d"`` then ``"all"`` plus, with ``cohort_days``, one
+    cohort per first-seen period labelled by its start date. Only days with a
+    complete trailing window and at least one active player are summarised,
+    matching how daily activity has always been averaged; ``floor`` applies
+    the active-player rule used for ``GREAT_WORK_ALERT_MIN_ACTIVE_PLAYERS``.
+    """
+
+    labels = ["all"]
+    cohorts = None
+    if cohort_days:
+        first_seen = activity.first_seen_days()
+        period_start, cohorts = np.unique(
+            first_seen - (first_seen - activity.first_day) % cohort_days,
+            return_inverse=True,
+        )
+        labels += [_format_day(day) for day in period_start]
+    counts = rolling_distinct_players(
+        activity, windows, cohorts=cohorts, cohort_count=max(len(labels) - 1, 1)
+    )
+    if cohorts is not None:
+        counts = np.concatenate([counts.sum(axis=1, keepdims=True), counts], axis=1)
+
+    stats = _series_stats(counts, windows, quantiles)
+    report: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for w_index, window in enumerate(windows):
+        report[f"{window}d"] = {
+            label: {
+                key: round(float(values[w_index, c_index]), 2)
+                for key, values in stats.items()
+            }
+            for c_index, label in enumerate(labels)
+        }
+    return report
+
+
+def _series_stats(
+    counts: np.ndarray, windows: Sequence[int], quantiles: Sequence[float]
+) -> Dict[str, np.ndarray]:
+    """Mean, minimum, quantiles and recommended floor of every series."""
+
+    complete = np.arange(counts.shape[2]) >= np.asarray(windows)[:, None] - 1
+    keep = complete[:, None, :] & (counts > 0)
+    days = keep.sum(axis=2)
+    has_days = days > 0
+    # Series without a qualifying day are summarised as zeros.
+    values = np.where(keep | ~has_days[..., None], counts, np.nan).astype(float)
+    mean = np.nanmean(values, axis=2) if values.size else np.zeros(days.shape)
+    minimum = np.nanmin(values, axis=2) if values.size else np.zeros(days.shape)
+    stats = {"days": days, "mean": mean, "min": minimum}
+    for quantile in quantiles:
+        stats[f"p{round(quantile * 100)}"] = (
+            np.nanquantile(values, quantile, axis=2)
+            if values.size
+            else np.zeros(days.shape)
+        )
+    stats["floor"] = np.where(
+        has_days, np.minimum(np.maximum(1.0, mean * 0.7), minimum), 1.0
+    )
+    return stats
+
+
+def _format_day(day: int) -> str:
+    moment = datetime.fromtimestamp(int(day) * _SECONDS_PER_DAY, tz=timezone.utc)
+    return moment.strftime("%Y-%m-%d")
 
 
 def _percent_floor(value: float, ratio: float, minimum: float = 0.0) -> float:
@@ -58,22 +235,12 @@ def recommend_thresholds(
     start_manifesto = _window_start_seconds(manifesto_days)
     start_archive = _window_start_seconds(archive_days)
 
+    activity = load_player_activity(db_path, start_engagement)
     with _connect(db_path) as conn:
-        engagement_rows = list(
-            conn.execute(
-                """
-                SELECT timestamp, json_extract(tags, '$.player_id')
-                FROM metrics
-                WHERE metric_type = ? AND timestamp >= ?
-                """,
-                (MetricType.COMMAND_USAGE.value, start_engagement),
-            )
-        )
-
         manifesto_rows = list(
             conn.execute(
                 """
-                SELECT json_extract(tags, '$.player_id')
+                SELECT player_id
                 FROM metrics
                 WHERE metric_type = ? AND name = ? AND timestamp >= ?
                 """,
@@ -98,7 +265,7 @@ def recommend_thresholds(
         nickname_rows = list(
             conn.execute(
                 """
-                SELECT json_extract(tags, '$.player_id')
+                SELECT player_id
                 FROM metrics
                 WHERE metric_type = ? AND name = ? AND timestamp >= ?
                 """,
@@ -120,33 +287,85 @@ def recommend_thresholds(
             )
         )
 
-    daily_players = _bucket_daily(engagement_rows)
-    player_counts = [len(players) for players in daily_players.values()]
+    return _recommendations(
+        activity=activity,
+        manifesto_player_total=len(
+            {row[0] for row in manifesto_rows if row and row[0]}
+        ),
+        nickname_player_total=len({row for row in nickname_rows if row and row[0]}),
+        archive_events=len(archive_rows),
+        press_share_events=len(press_share_rows),
+        archive_days=archive_days,
+    )
 
-    if not player_counts:
-        active_recommendation = 1.0
-    else:
-        average_players = statistics.mean(player_counts)
-        floor_players = min(player_counts)
-        active_recommendation = max(1.0, _percent_floor(average_players, 0.7))
-        active_recommendation = min(active_recommendation, float(floor_players))
 
-    active_player_total = len(
-        {player for players in daily_players.values() for player in players}
+def recommend_thresholds_from_export(
+    export_dir: Path,
+    *,
+    engagement_days: int,
+    manifesto_days: int,
+    archive_days: int,
+) -> Dict[str, float]:
+    """Compute the same recommendations from a columnar telemetry export.
+
+    The export (see ``export_telemetry_columnar``) is read column-wise and the
+    distinct-player counts are taken with NumPy.
+    """
+
+    start_engagement = _window_start_seconds(engagement_days)
+    start_manifesto = _window_start_seconds(manifesto_days)
+    start_archive = _window_start_seconds(archive_days)
+    progression = MetricType.GAME_PROGRESSION.value
+
+    activity = load_export_activity(export_dir, start_engagement)
+    def distinct_players(name: str, since: float) -> int:
+        column = load_columns(
+            export_dir, progression, ("player_id",), since=since, names=(name,)
+        )["player_id"]
+        return int(np.unique(column[column != ""]).size)
+
+    def event_count(name: str) -> int:
+        return int(
+            load_columns(
+                export_dir,
+                progression,
+                ("timestamp",),
+                since=start_archive,
+                names=(name,),
+            )["timestamp"].size
+        )
+
+    return _recommendations(
+        activity=activity,
+        manifesto_player_total=distinct_players("manifesto_generated", start_manifesto),
+        nickname_player_total=distinct_players("nickname_adopted", start_manifesto),
+        archive_events=event_count("archive_lookup"),
+        press_share_events=event_count("press_shared"),
+        archive_days=archive_days,
     )
-    manifesto_players = {row[0] for row in manifesto_rows if row and row[0]}
+
+
+def _recommendations(
+    *,
+    activity: PlayerActivity,
+    manifesto_player_total: int,
+    nickname_player_total: int,
+    archive_events: int,
+    press_share_events: int,
+    archive_days: int,
+) -> Dict[str, float]:
+    daily = _series_stats(rolling_distinct_players(activity, (1,)), (1,), ())
+    active_recommendation = float(daily["floor"][0, 0])
+    active_player_total = len(activity.player_ids)
 
     manifesto_recommendation = 0.0
     nickname_recommendation = 0.0
     if active_player_total:
-        adoption_ratio = len(manifesto_players) / active_player_total
+        adoption_ratio = manifesto_player_total / active_player_total
         manifesto_recommendation = round(_percent_floor(adoption_ratio, 0.8), 2)
-        nickname_ratio = (
-            len({row for row in nickname_rows if row and row[0]}) / active_player_total
-        )
+        nickname_ratio = nickname_player_total / active_player_total
         nickname_recommendation = round(_percent_floor(nickname_ratio, 0.8), 2)
 
-    archive_events = len(archive_rows)
     if archive_events:
         archive_recommendation = max(
             1.0, _percent_floor(archive_events / archive_days, 0.5)
@@ -154,7 +373,6 @@ def recommend_thresholds(
     else:
         archive_recommendation = 0.0
 
-    press_share_events = len(press_share_rows)
     if press_share_events:
         press_share_recommendation = max(
             1.0, round(_percent_floor(press_share_events / archive_days, 0.6), 2)
@@ -233,6 +451,24 @@ def main() -> None:
         default=14,
         help="Window (days) to analyse archive lookups.",
     )
+    parser.add_argument(
+        "--export-dir",
+        type=Path,
+        help="Read history from a columnar export (export_telemetry_columnar) "
+        "instead of the live database.",
+    )
+    parser.add_argument(
+        "--windows",
+        type=lambda text: [int(part) for part in text.split(",") if part],
+        help="Also report distinct active players over these trailing windows "
+        "(comma-separated days, e.g. 1,7,28) across the engagement history.",
+    )
+    parser.add_argument(
+        "--cohort-days",
+        type=int,
+        help="With --windows, split players into cohorts by the period (days) "
+        "in which they were first seen.",
+    )
     parser.add_argument(
         "--apply",
         action="store_true",
@@ -245,12 +481,26 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    recommendations = recommend_thresholds(
-        args.db,
-        engagement_days=args.engagement_days,
-        manifesto_days=args.manifesto_days,
-        archive_days=args.archive_days,
-    )
+    windows = {
+        "engagement_days": args.engagement_days,
+        "manifesto_days": args.manifesto_days,
+        "archive_days": args.archive_days,
+    }
+    if args.export_dir:
+        recommendations = recommend_thresholds_from_export(args.export_dir, **windows)
+    else:
+        recommendations = recommend_thresholds(args.db, **windows)
+
+    windows_summary: Dict[str, Dict[str, Dict[str, float]]] = {}
+    if args.windows:
+        since = _window_start_seconds(args.engagement_days)
+        if args.export_dir:
+            activity = load_export_activity(args.export_dir, since)
+        else:
+            activity = load_player_activity(args.db, since)
+        windows_summary = window_report(
+            activity, args.windows, cohort_days=args.cohort_days
+        )
 
     applied: Dict[str, Dict[str, float]] = {}
     if args.apply:
@@ -261,6 +511,7 @@ def main() -> None:
         payload = {
             "recommendations": recommendations,
             "applied_targets": applied,
+            "windows": windows_summary,
             "database": str(args.db),
         }
         args.output.write_text(json.dumps(payload, indent=2))
@@ -270,6 +521,13 @@ def main() -> None:
     for key, value in recommendations.items():
         print(f"{key}={value}")
 
+    if windows_summary:
+        print("\n# Distinct active players by trailing window")
+        for window, cohorts in windows_summary.items():
+            for cohort, summary in cohorts.items():
+                fields = " ".join(f"{key}={value}" for key, value in summary.items())
+                print(f"# {window} {cohort}: {fields}")
+
     if args.apply:
         print("\n# Applied targets")
         for name, payload in applied.items():
@@ -27,7 +27,7 @@ def recommend_settings(db_path: Path, days: int = 30) -> Dict[str, float]:
                 """
                     SELECT timestamp,
                            value,
-                           json_extract(tags, '$.player_id') as player_id,
+                           player_id,
                            json_extract(metadata, '$.remaining_debt') as remaining_debt,
                            json_extract(metadata, '$.threshold') as threshold,
                            json_extract(metadata, '$.days_remaining') as days_remaining
@@ -0,0 +1,352 @@
+"""Sampled, context-local span tracing for service hot paths."""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Spans kept per trace; a digest can issue thousands of state queries and the
+# overflow is counted rather than stored.
+MAX_SPANS_PER_TRACE = 512
+
+# Marks a trace that lost the sampling roll so nested spans stay untraced
+# instead of each starting a trace of their own.
+_UNSAMPLED = object()
+
+_current: ContextVar[Any] = ContextVar("great_work_span", default=None)
+
+
+@dataclass(eq=False, slots=True)
+class Span:
+    """A timed operation and the child operations it ran."""
+
+    name: str
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.time)
+    duration_ms: float = 0.0
+    error: Optional[str] = None
+    children: List["Span"] = field(default_factory=list)
+    # Bookkeeping carried by the root span for the whole trace.
+    span_count: int = 1
+    dropped_spans: int = 0
+
+    @property
+    def self_ms(self) -> float:
+        """Time spent in this span outside any recorded child."""
+
+        return max(0.0, self.duration_ms - sum(c.duration_ms for c in self.children))
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "attributes": dict(self.attributes),
+            "started_at": datetime.fromtimestamp(
+                self.started_at, tz=timezone.utc
+            ).isoformat(),
+            "duration_ms": round(self.duration_ms, 3),
+            "self_ms": round(self.self_ms, 3),
+            "error": self.error,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class _NoopScope:
+    """Shared scope returned when nothing is recorded."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+_NOOP = _NoopScope()
+
+
+class _UnsampledScope:
+    __slots__ = ("_token",)
+
+    def __enter__(self) -> None:
+        self._token = _current.set(_UNSAMPLED)
+        return None
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        _current.reset(self._token)
+
+
+class _SpanScope:
+    __slots__ = ("_tracer", "_span", "_parent", "_root", "_start", "_token", "_leaf")
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        span: Span,
+        parent: Optional[Span],
+        root: Optional[Span],
+        *,
+        leaf: bool,
+    ) -> None:
+        self._tracer = tracer
+        self._span = span
+        self._parent = parent
+        self._root = root
+        self._leaf = leaf
+        self._token = None
+
+    def __enter__(self) -> Span:
+        if not self._leaf:
+            self._token = _current.set(self)
+        self._start = time.perf_counter()
+        return self._span
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        span = self._span
+        span.duration_ms = (time.perf_counter() - self._start) * 1000
+        if exc_type is not None:
+            span.error = exc_type.__name__
+        if self._token is not None:
+            _current.reset(self._token)
+        if self._parent is None:
+            self._tracer._finish(span)
+            return
+        root = self._root
+        if root.span_count >= self._tracer.max_spans:
+            root.dropped_spans += 1
+            return
+        root.span_count += 1
+        self._parent.children.append(span)
+
+
+class Tracer:
+    """Record nested spans for a sample of traces into a ring buffer.
+
+    A trace starts at the outermost ``span()`` in the current context (thread
+    or asyncio task); spans opened beneath it become its children. Finished
+    traces are kept in a fixed-size buffer, so memory stays bounded no matter
+    how long the process runs. With a sample rate of zero every call returns
+    a shared no-op scope.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: float = 1.0,
+        capacity: int = 50,
+        max_spans: int = MAX_SPANS_PER_TRACE,
+    ) -> None:
+        self.sample_rate = min(1.0, max(0.0, sample_rate))
+        self.max_spans = max(1, max_spans)
+        self._traces: Deque[Span] = deque(maxlen=max(1, capacity))
+        self._lock = threading.Lock()
+        self._finished = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0
+
+    def span(self, name: str, **attributes: Any):
+        """Return a context manager timing ``name`` as a child of the open span."""
+
+        if self.sample_rate <= 0:
+            return _NOOP
+        current = _current.get()
+        if current is _UNSAMPLED:
+            return _NOOP
+        if current is None:
+            if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+                return _UnsampledScope()
+            return _SpanScope(self, Span(name, attributes), None, None, leaf=False)
+        return self._child(current, name, attributes, leaf=False)
+
+    def child(self, name: str, **attributes: Any):
+        """Like ``span`` but only records inside an open trace.
+
+        Helpers called from many entry points use this so that calls made
+        outside a digest or command do not each fill the buffer with a trace.
+        """
+
+        current = _current.get()
+        if current is None or current is _UNSAMPLED:
+            return _NOOP
+        return self._child(current, name, attributes, leaf=False)
+
+    def leaf(self, name: str, **attributes: Any):
+        """Time ``name`` inside an open trace without making it the parent.
+
+        Leaves never start a trace and never change the current span, which
+        keeps them safe around generators that suspend mid-block.
+        """
+
+        current = _current.get()
+        if current is None or current is _UNSAMPLED:
+            return _NOOP
+        return self._child(current, name, attributes, leaf=True)
+
+    def active(self) -> bool:
+        """Return ``True`` when the current context is inside a recorded trace."""
+
+        current = _current.get()
+        return current is not None and current is not _UNSAMPLED
+
+    def traces(self) -> List[Span]:
+        """Return the buffered traces, oldest first."""
+
+        with self._lock:
+            return list(self._traces)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+            self._finished = 0
+
+    def summary(self, *, slowest: int = 3, operations: int = 10) -> Dict[str, Any]:
+        """Aggregate buffered traces for the telemetry report.
+
+        ``slowest`` lists the longest traces with the span names that took
+        the most self time in each; ``operations`` ranks span names by self
+        time across the whole buffer.
+        """
+
+        traces = self.traces()
+        totals = _breakdown(span for trace in traces for span in trace.walk())
+        ranked = sorted(traces, key=lambda trace: trace.duration_ms, reverse=True)
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "buffered": len(traces),
+            "capacity": self._traces.maxlen,
+            "finished": self._finished,
+            "operations": totals[:operations],
+            "slowest": [
+                {
+                    "name": trace.name,
+                    "attributes": dict(trace.attributes),
+                    "started_at": datetime.fromtimestamp(
+                        trace.started_at, tz=timezone.utc
+                    ).isoformat(),
+                    "duration_ms": round(trace.duration_ms, 3),
+                    "error": trace.error,
+                    "spans": trace.span_count,
+                    "dropped_spans": trace.dropped_spans,
+                    "breakdown": _breakdown(trace.walk())[:5],
+                }
+                for trace in ranked[:slowest]
+            ],
+        }
+
+    def _child(
+        self, parent: _SpanScope, name: str, attributes: Dict[str, Any], *, leaf: bool
+    ) -> _SpanScope:
+        return _SpanScope(
+            self,
+            Span(name, attributes),
+            parent._span,
+            parent._root or parent._span,
+            leaf=leaf,
+        )
+
+    def _finish(self, root: Span) -> None:
+        with self._lock:
+            self._traces.append(root)
+            self._finished += 1
+
+
+def _breakdown(spans) -> List[Dict[str, Any]]:
+    """Group spans by name, ranked by the self time they account for."""
+
+    stats: Dict[str, Dict[str, float]] = defaultdict(
+        lambda: {"count": 0, "total_ms": 0.0, "self_ms": 0.0, "max_ms": 0.0}
+    )
+    for span in spans:
+        entry = stats[span.name]
+        entry["count"] += 1
+        entry["total_ms"] += span.duration_ms
+        entry["self_ms"] += span.self_ms
+        entry["max_ms"] = max(entry["max_ms"], span.duration_ms)
+    return [
+        {
+            "name": name,
+            "count": int(entry["count"]),
+            "total_ms": round(entry["total_ms"], 3),
+            "self_ms": round(entry["self_ms"], 3),
+            "max_ms": round(entry["max_ms"], 3),
+        }
+        for name, entry in sorted(
+            stats.items(), key=lambda item: item[1]["self_ms"], reverse=True
+        )
+    ]
+
+
+# Singleton instance
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """Get or create the process tracer configured from the environment.
+
+    Tracing is off unless ``GREAT_WORK_TRACE_SAMPLE_RATE`` opts in.
+    """
+
+    global _tracer
+    if _tracer is None:
+        try:
+            sample_rate = float(os.getenv("GREAT_WORK_TRACE_SAMPLE_RATE", "0") or 0)
+        except ValueError:
+            logger.warning("Invalid GREAT_WORK_TRACE_SAMPLE_RATE; tracing disabled")
+            sample_rate = 0.0
+        _tracer = Tracer(
+            sample_rate=sample_rate,
+            capacity=int(os.getenv("GREAT_WORK_TRACE_BUFFER", "50") or 50),
+        )
+    return _tracer
+
+
+def trace_span(name: str, **attributes: Any):
+    """Open a span on the process tracer."""
+
+    return get_tracer().span(name, **attributes)
+
+
+def child_span(name: str, **attributes: Any):
+    """Open a span on the process tracer only if a trace is already open."""
+
+    return get_tracer().child(name, **attributes)
+
+
+def traced(name: str, *, start_trace: bool = True) -> Callable[[_F], _F]:
+    """Decorate a function so each call runs inside a span called ``name``.
+
+    With ``start_trace=False`` calls are only recorded beneath an open trace.
+    """
+
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = get_tracer()
+            scope = tracer.span(name) if start_trace else tracer.child(name)
+            with scope:
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
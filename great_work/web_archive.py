@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import multiprocessing
 import os
-from dataclasses import dataclass
-from datetime import datetime
+import re
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
 from html import escape
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
 
 from .models import Event, PressRecord, Scholar
 from .state import GameState
@@ -28,11 +35,26 @@ class ArchivePage:
 class WebArchive:
     """Generate static HTML archive of game history."""
 
+    INDEX_PER_PAGE = 20
+    TIMELINE_PRESS_LIMIT = 50
+    MANIFEST_NAME = "manifest.json"
+    MANIFEST_VERSION = 3
+    RENDER_CHUNK_SIZE = 250
+    SEARCH_PREFIX_LENGTH = 2
+
     def __init__(
-        self, state: GameState, output_dir: Path, *, base_url: str | None = None
+        self,
+        state: GameState,
+        output_dir: Path,
+        *,
+        base_url: str | None = None,
+        workers: int | None = None,
     ):
         self.state = state
         self.output_dir = output_dir
+        if workers is None:
+            workers = int(os.getenv("GREAT_WORK_ARCHIVE_WORKERS", "1") or 1)
+        self.workers = max(1, workers)
         configured_base = (
             base_url
             if base_url is not None
@@ -46,9 +68,17 @@ class WebArchive:
         self.press_dir = output_dir / "press"
         self.scholars_dir = output_dir / "scholars"
         self.assets_dir = output_dir / "assets"
+        self.search_dir = output_dir / "search"
 
         # Ensure directories exist
-        for dir_path in [self.press_dir, self.scholars_dir, self.assets_dir]:
+        for dir_path in [
+            self.press_dir,
+            self.scholars_dir,
+            self.assets_dir,
+            self.search_dir,
+            output_dir / "types",
+            output_dir / "months",
+        ]:
             dir_path.mkdir(parents=True, exist_ok=True)
 
     def generate_permalink(self, press: PressRecord) -> str:
@@ -431,19 +461,38 @@ class WebArchive:
         return "\n".join(formatted)
 
     def generate_index(
-        self, press_records: List[PressRecord], page: int = 1, per_page: int = 20
+        self,
+        press_records: List[PressRecord],
+        page: int = 1,
+        per_page: int = 20,
+        *,
+        total_count: Optional[int] = None,
+        listing: str = "index",
+        heading: str = "Press Archive",
+        summary: Optional[str] = None,
     ) -> str:
-        """Create index page with navigation and search."""
-        total_pages = (len(press_records) + per_page - 1) // per_page
+        """Create index page with navigation and search.
+
+        When ``total_count`` is given, ``press_records`` holds only the records
+        for ``page`` (as produced by a streaming reader) rather than the
+        complete archive. ``listing`` names the page family (``index``,
+        ``types/<slug>``, ``months/<YYYY-MM>``) that pagination links point at,
+        and ``summary`` replaces the introduction shown on its first page.
+        """
         start_idx = (page - 1) * per_page
-        end_idx = start_idx + per_page
-        page_records = press_records[start_idx:end_idx]
+        if total_count is None:
+            total_count = len(press_records)
+            page_records = press_records[start_idx : start_idx + per_page]
+        else:
+            page_records = press_records[:per_page]
+        total_pages = (total_count + per_page - 1) // per_page
 
         # Search box
         search_html = """
         <div class="search-box">
             <input type="text" id="searchInput" placeholder="Search press releases..."
                    onkeyup="filterPress()">
+            <div id="searchResults"></div>
         </div>
 
         <div class="filter-buttons">
@@ -483,13 +532,23 @@ class WebArchive:
             cards_html.append(card)
 
         # Pagination
-        pagination_html = self._generate_pagination(page, total_pages)
+        pagination_html = self._generate_pagination(page, total_pages, listing)
+
+        # Later pages omit totals so appending releases leaves them untouched.
+        if page > 1:
+            summary = f"Continued listing, page {page}."
+        elif summary is None:
+            summary = (
+                f"Browse the complete archive of {total_count} press releases "
+                "from The Great Work. All entries are permanently archived for "
+                "citation and reference."
+            )
 
         content = f"""
-        <h1>Press Archive</h1>
+        <h1>{escape(heading)}</h1>
         <p style="margin-bottom: 30px; color: #7f8c8d;">
-            Browse the complete archive of {len(press_records)} press releases from The Great Work.
-            All entries are permanently archived for citation and reference.
+            {summary}
+            <a href="{self.base_url}/browse.html">Browse by type or month →</a>
         </p>
 
         {search_html}
@@ -501,8 +560,73 @@ class WebArchive:
         {pagination_html}
         """
 
-        search_script = """
+        search_script = f"""
         <script>
+        const SEARCH_INDEX = '{self.base_url}/search';
+        const SEARCH_PREFIX_LENGTH = {self.SEARCH_PREFIX_LENGTH};
+        const SEARCH_DOCS_PER_CHUNK = {_SearchIndex.DOCS_PER_CHUNK};
+        const searchFiles = {{}};
+        let searchGeneration = 0;
+
+        function loadSearchFile(name) {{
+            if (!searchFiles[name]) {{
+                searchFiles[name] = fetch(`${{SEARCH_INDEX}}/${{name}}.json`)
+                    .then(response => response.ok ? response.json() : {{}})
+                    .catch(() => ({{}}));
+            }}
+            return searchFiles[name];
+        }}
+
+        // Look every query word up in its prefix shard and intersect the hits.
+        async function searchArchive(query) {{
+            const terms = (query.match(/[a-z0-9]+/g) || [])
+                .filter(term => term.length >= SEARCH_PREFIX_LENGTH);
+            if (!terms.length) {{
+                return null;
+            }}
+            let matches = null;
+            for (const term of terms) {{
+                const shard = await loadSearchFile(term.slice(0, SEARCH_PREFIX_LENGTH));
+                const found = new Set();
+                for (const [word, ids] of Object.entries(shard)) {{
+                    if (word.startsWith(term)) {{
+                        ids.forEach(id => found.add(id));
+                    }}
+                }}
+                matches = matches === null
+                    ? found
+                    : new Set([...matches].filter(id => found.has(id)));
+            }}
+            const ids = [...matches].sort((a, b) => b - a).slice(0, 50);
+            const chunks = await Promise.all(ids.map(
+                id => loadSearchFile(`docs-${{Math.floor(id / SEARCH_DOCS_PER_CHUNK)}}`)
+            ));
+            return ids.map((id, i) => chunks[i][id]).filter(Boolean);
+        }}
+
+        function showArchiveMatches(found) {{
+            const results = document.getElementById('searchResults');
+            results.replaceChildren();
+            if (found === null) {{
+                return;
+            }}
+            const heading = document.createElement('p');
+            heading.textContent = found.length
+                ? `Across the archive (${{found.length}} shown):`
+                : 'No matches across the archive.';
+            results.appendChild(heading);
+            const list = document.createElement('ul');
+            found.forEach(([headline, filename, date]) => {{
+                const item = document.createElement('li');
+                const link = document.createElement('a');
+                link.href = `{self.base_url}/press/${{filename}}`;
+                link.textContent = headline;
+                item.append(link, ` (${{date}})`);
+                list.appendChild(item);
+            }});
+            results.appendChild(list);
+        }}
+
         function filterPress() {{
             const input = document.getElementById('searchInput');
             const filter = input.value.toLowerCase();
@@ -516,6 +640,13 @@ class WebArchive:
                     card.style.display = 'none';
                 }}
             }});
+
+            const generation = ++searchGeneration;
+            searchArchive(filter).then(found => {{
+                if (generation === searchGeneration) {{
+                    showArchiveMatches(found);
+                }}
+            }});
         }}
 
         function filterByType(type) {{
@@ -543,7 +674,7 @@ class WebArchive:
         """
 
         return self.get_base_template().format(
-            title="Press Archive",
+            title=escape(heading),
             description="Complete archive of press releases from The Great Work academic game",
             base_url=self.base_url,
             content=content,
@@ -552,18 +683,25 @@ class WebArchive:
             extra_scripts=search_script,
         )
 
-    def _generate_pagination(self, current_page: int, total_pages: int) -> str:
+    def listing_page_path(self, listing: str, page: int) -> str:
+        """Return the archive-relative file name of a listing page."""
+        return f"{listing}.html" if page <= 1 else f"{listing}-{page}.html"
+
+    def _generate_pagination(
+        self, current_page: int, total_pages: int, listing: str = "index"
+    ) -> str:
         """Generate pagination HTML."""
         if total_pages <= 1:
             return ""
 
+        def href(page: int) -> str:
+            return f"{self.base_url}/{self.listing_page_path(listing, page)}"
+
         links = []
 
         # Previous link
         if current_page > 1:
-            links.append(
-                f'<a href="{self.base_url}/index.html?page={current_page-1}">← Previous</a>'
-            )
+            links.append(f'<a href="{href(current_page - 1)}">← Previous</a>')
 
         # Page numbers (show max 5 pages)
         start_page = max(1, current_page - 2)
@@ -573,15 +711,11 @@ class WebArchive:
             if page == current_page:
                 links.append(f'<span class="current">{page}</span>')
             else:
-                links.append(
-                    f'<a href="{self.base_url}/index.html?page={page}">{page}</a>'
-                )
+                links.append(f'<a href="{href(page)}">{page}</a>')
 
         # Next link
         if current_page < total_pages:
-            links.append(
-                f'<a href="{self.base_url}/index.html?page={current_page+1}">Next →</a>'
-            )
+            links.append(f'<a href="{href(current_page + 1)}">Next →</a>')
 
         return f'<div class="pagination">{"".join(links)}</div>'
 
@@ -592,8 +726,8 @@ class WebArchive:
         # Combine events and press into timeline items
         timeline_items = []
 
-        # Add press releases to timeline
-        for record in press_records[:50]:  # Limit to recent 50 for performance
+        # Add press releases to timeline (limited for performance)
+        for record in press_records[: self.TIMELINE_PRESS_LIMIT]:
             permalink = self.generate_permalink(record)
             filename = permalink.split("/")[-1]
 
@@ -783,71 +917,715 @@ class WebArchive:
             extra_scripts="",
         )
 
+    def generate_placeholder_page(self, page_name: str) -> str:
+        """Create a "coming soon" page for sections without content yet."""
+        content = f"""
+                <h1>{page_name.title()}</h1>
+                <p style="color: #7f8c8d;">This section is coming soon.</p>
+                """
+        return self.get_base_template().format(
+            title=page_name.title(),
+            description=f"{page_name.title()} in The Great Work",
+            base_url=self.base_url,
+            content=content,
+            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M UTC"),
+            extra_head="",
+            extra_scripts="",
+        )
+
+    def generate_browse_page(
+        self, type_counts: Dict[str, int], month_counts: Dict[str, int]
+    ) -> str:
+        """Create the page linking every per-type and per-month listing."""
+
+        def entries(kind: str, counts: Dict[str, int]) -> str:
+            items = []
+            for value, count in counts.items():
+                key = self.listing_key(kind, value)
+                heading, _ = self._listing_labels(kind, value, count)
+                items.append(
+                    f'<li><a href="{self.base_url}/{key}.html">{escape(heading)}</a> '
+                    f"<small>({count})</small></li>"
+                )
+            return "\n".join(items)
+
+        content = f"""
+        <h1>Browse the Archive</h1>
+        <p style="margin-bottom: 30px; color: #7f8c8d;">
+            Every press release is listed by type and by month of publication.
+        </p>
+
+        <article class="press-card">
+            <h2>By Type</h2>
+            <ul>
+                {entries("type", type_counts)}
+            </ul>
+        </article>
+
+        <article class="press-card">
+            <h2>By Month</h2>
+            <ul>
+                {entries("month", dict(sorted(month_counts.items(), reverse=True)))}
+            </ul>
+        </article>
+        """
+
+        return self.get_base_template().format(
+            title="Browse",
+            description="Press releases of The Great Work by type and month",
+            base_url=self.base_url,
+            content=content,
+            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M UTC"),
+            extra_head="",
+            extra_scripts="",
+        )
+
+    def listing_key(self, kind: str, value: str = "") -> str:
+        """Return the page family for the ``all``, ``type`` or ``month`` listing."""
+        if kind == "all":
+            return "index"
+        slug = _SLUG_UNSAFE.sub("-", value.lower()).strip("-") or "unknown"
+        return f"{'types' if kind == 'type' else 'months'}/{slug}"
+
     def export_full_archive(self) -> Path:
         """Export complete archive with all pages."""
         print(f"Exporting web archive to {self.output_dir}")
 
         # Get all data
-        press_records = list(reversed(self.state.list_press_releases()))  # Oldest first
         scholars = list(self.state.all_scholars())
         events = self.state.export_events()
+        type_counts = self.state.press_release_counts("type")
+        month_counts = self.state.press_release_counts("month")
+        totals = {self.listing_key("all"): sum(type_counts.values())}
+        totals.update({self.listing_key("type", k): n for k, n in type_counts.items()})
+        totals.update(
+            {self.listing_key("month", k): n for k, n in month_counts.items()}
+        )
+        search_index = _SearchIndex(self.SEARCH_PREFIX_LENGTH)
+
+        with _RenderQueue(self) as queue:
+            # Stream press releases oldest first, queueing each page as it
+            # arrives. Listing pages are cut as soon as they fill up, so only
+            # one partial page per listing is ever held in memory.
+            pager = _ListingPager(self, queue, totals)
+            last_press_id, press_count, leading_records = self._queue_press_pages(
+                queue, pager=pager, search_index=search_index
+            )
+            listings = pager.finish()
 
-        # Generate index pages
-        index_path = self.output_dir / "index.html"
-        with open(index_path, "w", encoding="utf-8") as f:
-            f.write(self.generate_index(press_records))
+            queue.add("browse.html", "generate_browse_page", type_counts, month_counts)
 
-        # Generate individual press releases
-        for i, record in enumerate(press_records, start=1):
-            permalink = self.generate_permalink(record)
-            filename = permalink.split("/")[-1]
-            press_path = self.press_dir / filename
+            # Generate timeline
+            queue.add("timeline.html", "generate_timeline", events, leading_records)
 
-            with open(press_path, "w", encoding="utf-8") as f:
-                f.write(self.generate_press_html(record, i))
+            # Generate scholars index
+            queue.add("scholars.html", "generate_scholars_index", scholars)
 
-        # Generate timeline
-        timeline_path = self.output_dir / "timeline.html"
-        with open(timeline_path, "w", encoding="utf-8") as f:
-            f.write(self.generate_timeline(events, press_records))
+            # Generate individual scholar pages
+            for scholar in scholars:
+                queue.add(
+                    f"scholars/{scholar.id}.html", "generate_scholar_page", scholar
+                )
 
-        # Generate scholars index
-        scholars_index_path = self.output_dir / "scholars.html"
-        with open(scholars_index_path, "w", encoding="utf-8") as f:
-            f.write(self.generate_scholars_index(scholars))
+            # Create placeholder pages for theories and expeditions
+            self._queue_placeholders(queue, overwrite=True)
 
-        # Generate individual scholar pages
-        for scholar in scholars:
-            scholar_path = self.scholars_dir / f"{scholar.id}.html"
-            with open(scholar_path, "w", encoding="utf-8") as f:
-                f.write(self.generate_scholar_page(scholar))
+        # Shards are merged in place by incremental exports; start them afresh.
+        for stale in self.search_dir.glob("*.json"):
+            stale.unlink()
+        search_index.write(self.search_dir, merge=False)
 
-        # Create placeholder pages for theories and expeditions
-        for page_name in ["theories", "expeditions"]:
-            page_path = self.output_dir / f"{page_name}.html"
-            with open(page_path, "w", encoding="utf-8") as f:
-                content = f"""
-                <h1>{page_name.title()}</h1>
-                <p style="color: #7f8c8d;">This section is coming soon.</p>
-                """
-                f.write(
-                    self.get_base_template().format(
-                        title=page_name.title(),
-                        description=f"{page_name.title()} in The Great Work",
-                        base_url=self.base_url,
-                        content=content,
-                        timestamp=datetime.now().strftime("%Y-%m-%d %H:%M UTC"),
-                        extra_head="",
-                        extra_scripts="",
-                    )
-                )
+        self._save_manifest(
+            last_press_id=last_press_id,
+            press_count=press_count,
+            scholars={scholar.id: self._scholar_hash(scholar) for scholar in scholars},
+            listings=listings,
+        )
 
         print(f"Archive exported successfully to {self.output_dir}")
-        print(f"  - {len(press_records)} press releases")
+        print(f"  - {press_count} press releases")
+        print(f"  - {len(listings)} listings, {search_index.shard_count} search shards")
         print(f"  - {len(scholars)} scholar profiles")
         print(f"  - Timeline with {len(events)} events")
 
         return self.output_dir
 
+    def export_incremental_archive(self) -> Path:
+        """Render only pages that changed since the last recorded export.
+
+        The manifest written alongside the archive records the highest press id
+        already exported, the size of every listing and a content hash per
+        scholar. New press releases are rendered past that high-water mark;
+        listings they join re-render their first page and the tail pages whose
+        pagination moved; search shards they touch are merged in place; and
+        scholar pages only when their hash moves. Falls back to
+        :meth:`export_full_archive` when no usable manifest exists.
+        """
+        manifest = self._load_manifest()
+        if manifest is None:
+            return self.export_full_archive()
+        previous_count = int(manifest["press_count"])
+        if self.state.count_press_releases() < previous_count:
+            # The database shrank underneath the archive; start over.
+            return self.export_full_archive()
+
+        print(f"Updating web archive in {self.output_dir}")
+
+        listings: Dict[str, Dict[str, Any]] = {
+            key: dict(entry) for key, entry in manifest["listings"].items()
+        }
+        previous_hashes: Dict[str, str] = dict(manifest["scholars"])
+        scholars = list(self.state.all_scholars())
+        scholar_hashes: Dict[str, str] = {}
+        changed = 0
+        search_index = _SearchIndex(self.SEARCH_PREFIX_LENGTH)
+        with _RenderQueue(self) as queue:
+            tracker = _ListingTracker(self)
+            last_press_id, press_count, _ = self._queue_press_pages(
+                queue,
+                after_id=int(manifest["last_press_id"]),
+                start_position=previous_count,
+                pager=tracker,
+                search_index=search_index,
+            )
+            new_press = press_count - previous_count
+
+            for key, (kind, value, added) in tracker.added.items():
+                entry = listings.get(key, {})
+                before = int(entry.get("count", 0))
+                after = before + added
+                page_ends = self._queue_listing_tail(
+                    queue, key, kind, value, before, after, entry.get("page_ends", [])
+                )
+                listings[key] = {
+                    "kind": kind,
+                    "value": value,
+                    "count": after,
+                    "page_ends": page_ends,
+                }
+            index_key = self.listing_key("all")
+            if index_key not in tracker.added:
+                if not (self.output_dir / "index.html").exists():
+                    entry = listings.setdefault(
+                        index_key, {"kind": "all", "value": "", "count": 0}
+                    )
+                    entry["page_ends"] = self._queue_listing_tail(
+                        queue, index_key, "all", "", 0, int(entry["count"]), []
+                    )
+
+            if new_press or not (self.output_dir / "browse.html").exists():
+                queue.add(
+                    "browse.html",
+                    "generate_browse_page",
+                    self.state.press_release_counts("type"),
+                    self.state.press_release_counts("month"),
+                )
+
+            timeline_stale = new_press and previous_count < self.TIMELINE_PRESS_LIMIT
+            if timeline_stale or not (self.output_dir / "timeline.html").exists():
+                leading = self._leading_records(self.TIMELINE_PRESS_LIMIT)
+                # Events are not rendered on the timeline, so skip loading them.
+                queue.add("timeline.html", "generate_timeline", [], leading)
+
+            for scholar in scholars:
+                digest = self._scholar_hash(scholar)
+                scholar_hashes[scholar.id] = digest
+                if previous_hashes.get(scholar.id) != digest:
+                    queue.add(
+                        f"scholars/{scholar.id}.html", "generate_scholar_page", scholar
+                    )
+                    changed += 1
+            removed = set(previous_hashes) - set(scholar_hashes)
+            for scholar_id in removed:
+                (self.scholars_dir / f"{scholar_id}.html").unlink(missing_ok=True)
+
+            scholars_index_missing = not (self.output_dir / "scholars.html").exists()
+            if changed or removed or scholars_index_missing:
+                queue.add("scholars.html", "generate_scholars_index", scholars)
+
+            self._queue_placeholders(queue, overwrite=False)
+
+        search_index.write(self.search_dir, merge=True)
+        self._save_manifest(
+            last_press_id=last_press_id,
+            press_count=press_count,
+            scholars=scholar_hashes,
+            listings=listings,
+        )
+
+        print(f"Archive updated in {self.output_dir}")
+        print(f"  - {new_press} new press releases ({press_count} total)")
+        print(
+            f"  - {len(tracker.added)} listings and "
+            f"{search_index.shard_count} search shards touched"
+        )
+        print(f"  - {changed} scholar profiles refreshed, {len(removed)} removed")
+
+        return self.output_dir
+
+    def _listings_for(self, record: PressRecord) -> List[Tuple[str, str, str]]:
+        """Return ``(key, kind, value)`` for every listing ``record`` appears in."""
+        press_type = record.release.type
+        # Stored timestamps are ISO strings, so this matches the SQL grouping.
+        month = record.timestamp.isoformat()[:7]
+        return [
+            (self.listing_key("all"), "all", ""),
+            (self.listing_key("type", press_type), "type", press_type),
+            (self.listing_key("month", month), "month", month),
+        ]
+
+    def _listing_labels(self, kind: str, value: str, count: int) -> Tuple[str, str]:
+        """Return the heading and first-page summary for a listing."""
+        if kind == "type":
+            label = value.replace("_", " ").title()
+            return (
+                f"Press Archive: {label}",
+                f"{count} {escape(label)} releases from The Great Work.",
+            )
+        if kind == "month":
+            try:
+                label = datetime.strptime(value, "%Y-%m").strftime("%B %Y")
+            except ValueError:
+                label = value
+            return (
+                f"Press Archive: {label}",
+                f"{count} press releases published in {escape(label)}.",
+            )
+        return (
+            "Press Archive",
+            f"Browse the complete archive of {count} press releases from The Great "
+            "Work. All entries are permanently archived for citation and reference.",
+        )
+
+    def _queue_listing_page(
+        self,
+        queue: _RenderQueue,
+        key: str,
+        kind: str,
+        value: str,
+        page: int,
+        records: List[PressRecord],
+        total: int,
+    ) -> None:
+        heading, summary = self._listing_labels(kind, value, total)
+        queue.add(
+            self.listing_page_path(key, page),
+            "generate_index",
+            records,
+            page,
+            self.INDEX_PER_PAGE,
+            total_count=total,
+            listing=key,
+            heading=heading,
+            summary=summary,
+        )
+
+    def _queue_listing_tail(
+        self,
+        queue: _RenderQueue,
+        key: str,
+        kind: str,
+        value: str,
+        before: int,
+        after: int,
+        page_ends: List[int],
+    ) -> List[int]:
+        """Re-render the pages of a listing that grew from ``before`` to ``after``.
+
+        Page one carries the total, and pagination shows two pages either side,
+        so only the first page and those within reach of the old last page move.
+        ``page_ends`` holds the id closing each full page; the tail is streamed
+        from the one before it, and the list is returned extended to ``after``.
+        """
+        per_page = self.INDEX_PER_PAGE
+        old_pages = max(1, -(-before // per_page))
+        new_pages = max(1, -(-after // per_page))
+        first_tail = min(max(1, old_pages - 2), len(page_ends) + 1)
+        page_ends = list(page_ends[: first_tail - 1])
+
+        def stream(after_id: Optional[int]) -> Iterator[Tuple[int, PressRecord]]:
+            return self.state.iter_press_releases(
+                newest_first=False,
+                after_id=after_id,
+                types=[value] if kind == "type" else None,
+                month=value if kind == "month" else None,
+                with_metadata=False,
+                batch_size=per_page,
+            )
+
+        if first_tail > 1:
+            records = [record for _, record in islice(stream(None), per_page)]
+            self._queue_listing_page(queue, key, kind, value, 1, records, after)
+        tail = stream(page_ends[-1] if page_ends else None)
+        for page in range(first_tail, new_pages + 1):
+            rows = list(islice(tail, per_page))
+            if len(rows) == per_page:
+                page_ends.append(rows[-1][0])
+            records = [record for _, record in rows]
+            self._queue_listing_page(queue, key, kind, value, page, records, after)
+        return page_ends
+
+    def _queue_press_pages(
+        self,
+        queue: _RenderQueue,
+        *,
+        after_id: Optional[int] = None,
+        start_position: int = 0,
+        pager: Optional[_ListingPager | _ListingTracker] = None,
+        search_index: Optional[_SearchIndex] = None,
+    ) -> tuple[Optional[int], int, List[PressRecord]]:
+        """Queue press pages past ``after_id`` in id order.
+
+        Each record is also handed to ``pager`` and ``search_index`` when given.
+        Returns the last id queued (or ``after_id`` if nothing was new), the
+        running press count and the first records streamed, capped at the
+        timeline limit.
+        """
+        last_press_id = after_id
+        position = start_position
+        leading_records: List[PressRecord] = []
+        for press_id, record in self.state.iter_press_releases(
+            newest_first=False, after_id=after_id
+        ):
+            position += 1
+            last_press_id = press_id
+            if len(leading_records) < self.TIMELINE_PRESS_LIMIT:
+                leading_records.append(record)
+            filename = self.generate_permalink(record).split("/")[-1]
+            queue.add(f"press/{filename}", "generate_press_html", record, position)
+            if pager is not None:
+                pager.add(press_id, record)
+            if search_index is not None:
+                search_index.add(position, record, filename)
+        return last_press_id, position, leading_records
+
+    def _leading_records(self, limit: int) -> List[PressRecord]:
+        stream = self.state.iter_press_releases(
+            newest_first=False, with_metadata=False, batch_size=limit
+        )
+        return [record for _, record in islice(stream, limit)]
+
+    def _queue_placeholders(self, queue: _RenderQueue, *, overwrite: bool) -> None:
+        for page_name in ["theories", "expeditions"]:
+            relpath = f"{page_name}.html"
+            if (self.output_dir / relpath).exists() and not overwrite:
+                continue
+            queue.add(relpath, "generate_placeholder_page", page_name)
+
+    @staticmethod
+    def _scholar_hash(scholar: Scholar) -> str:
+        payload = json.dumps(asdict(scholar), sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.output_dir / self.MANIFEST_NAME
+
+    def _load_manifest(self) -> Optional[Dict[str, object]]:
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict):
+            return None
+        if manifest.get("version") != self.MANIFEST_VERSION:
+            return None
+        if manifest.get("base_url") != self.base_url:
+            # Every page embeds the base URL, so a change invalidates them all.
+            return None
+        if not isinstance(manifest.get("scholars"), dict):
+            return None
+        if not isinstance(manifest.get("listings"), dict):
+            return None
+        if not isinstance(manifest.get("press_count"), int):
+            return None
+        if manifest.get("last_press_id") is None:
+            manifest["last_press_id"] = 0
+        return manifest
+
+    def _save_manifest(
+        self,
+        *,
+        last_press_id: Optional[int],
+        press_count: int,
+        scholars: Dict[str, str],
+        listings: Dict[str, Dict[str, Any]],
+    ) -> None:
+        manifest = {
+            "version": self.MANIFEST_VERSION,
+            "base_url": self.base_url,
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "last_press_id": last_press_id,
+            "press_count": press_count,
+            "scholars": scholars,
+            "listings": listings,
+        }
+        _write_atomic(
+            self.manifest_path, json.dumps(manifest, indent=2, sort_keys=True)
+        )
+
+    @classmethod
+    def _renderer(cls, output_dir: Path, base_url: str) -> WebArchive:
+        """Build a state-less instance that can only render and write pages."""
+
+        archive = cls.__new__(cls)
+        archive.output_dir = output_dir
+        archive.base_url = base_url
+        return archive
+
+
+_SEARCH_TERM = re.compile(r"[a-z0-9]+")
+_SLUG_UNSAFE = re.compile(r"[^a-z0-9_-]+")
+
+
+class _ListingPager:
+    """Cut a complete, id-ordered press stream into listing pages as they fill."""
+
+    def __init__(
+        self, archive: WebArchive, queue: _RenderQueue, totals: Dict[str, int]
+    ) -> None:
+        self._archive = archive
+        self._queue = queue
+        self._totals = totals
+        self._buffers: Dict[str, List[PressRecord]] = {}
+        self._pages: Dict[str, int] = {}
+        self._listings: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, press_id: int, record: PressRecord) -> None:
+        for key, kind, value in self._archive._listings_for(record):
+            entry = self._listings.setdefault(
+                key, {"kind": kind, "value": value, "count": 0, "page_ends": []}
+            )
+            entry["count"] += 1
+            buffer = self._buffers.setdefault(key, [])
+            buffer.append(record)
+            if len(buffer) >= self._archive.INDEX_PER_PAGE:
+                entry["page_ends"].append(press_id)
+                self._emit(key, buffer)
+                self._buffers[key] = []
+
+    def finish(self) -> Dict[str, Dict[str, Any]]:
+        """Emit partial last pages and return each listing's manifest entry."""
+        index_key = self._archive.listing_key("all")
+        self._listings.setdefault(
+            index_key, {"kind": "all", "value": "", "count": 0, "page_ends": []}
+        )
+        for key in self._listings:
+            buffer = self._buffers.get(key, [])
+            if buffer or key not in self._pages:
+                self._emit(key, buffer)
+        self._buffers.clear()
+        return self._listings
+
+    def _emit(self, key: str, records: List[PressRecord]) -> None:
+        entry = self._listings[key]
+        page = self._pages.get(key, 0) + 1
+        self._pages[key] = page
+        total = max(self._totals.get(key, 0), entry["count"])
+        self._archive._queue_listing_page(
+            self._queue, key, entry["kind"], entry["value"], page, records, total
+        )
+
+
+class _ListingTracker:
+    """Count how many newly streamed records join each listing."""
+
+    def __init__(self, archive: WebArchive) -> None:
+        self._archive = archive
+        self.added: Dict[str, Tuple[str, str, int]] = {}
+
+    def add(self, press_id: int, record: PressRecord) -> None:
+        for key, kind, value in self._archive._listings_for(record):
+            _, _, count = self.added.get(key, (kind, value, 0))
+            self.added[key] = (kind, value, count + 1)
+
+
+class _SearchIndex:
+    """Headline term index written as small JSON files for the search box.
+
+    Terms live in ``<prefix>.json`` shards (term -> press positions) and the
+    entries they point at in ``docs-<n>.json`` chunks of consecutive positions
+    (position -> ``[headline, filename, date, type]``). A browser fetches only
+    the shards for its query words and the chunks holding the hits it shows;
+    appending releases touches only the shards of their words and the last
+    chunk.
+    """
+
+    DOCS_PER_CHUNK = 500
+
+    def __init__(self, prefix_length: int) -> None:
+        self._prefix_length = prefix_length
+        self._shards: Dict[str, Dict[str, List[int]]] = {}
+        self._chunks: Dict[int, Dict[str, List[str]]] = {}
+
+    @property
+    def shard_count(self) -> int:
+        return len(self._shards)
+
+    def add(self, position: int, record: PressRecord, filename: str) -> None:
+        terms = {
+            term
+            for term in _SEARCH_TERM.findall(record.release.headline.lower())
+            if len(term) >= self._prefix_length
+        }
+        for term in terms:
+            shard = self._shards.setdefault(term[: self._prefix_length], {})
+            shard.setdefault(term, []).append(position)
+        chunk = self._chunks.setdefault(position // self.DOCS_PER_CHUNK, {})
+        chunk[str(position)] = [
+            record.release.headline,
+            filename,
+            record.timestamp.strftime("%Y-%m-%d"),
+            record.release.type,
+        ]
+
+    def write(self, directory: Path, *, merge: bool) -> None:
+        """Write shards and doc chunks, folding into existing files when ``merge``."""
+        for prefix, terms in self._shards.items():
+            path = directory / f"{prefix}.json"
+            existing = self._load(path) if merge else {}
+            for term, positions in terms.items():
+                known = existing.setdefault(term, [])
+                seen = set(known)
+                known.extend(p for p in positions if p not in seen)
+            self._dump(path, existing)
+        for chunk, docs in self._chunks.items():
+            path = directory / f"docs-{chunk}.json"
+            existing = self._load(path) if merge else {}
+            existing.update(docs)
+            self._dump(path, existing)
+
+    @staticmethod
+    def _load(path: Path) -> Dict[str, Any]:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _dump(path: Path, data: Dict[str, Any]) -> None:
+        _write_atomic(path, json.dumps(data, separators=(",", ":"), sort_keys=True))
+
+
+_RenderItem = Tuple[str, str, Tuple[Any, ...], Dict[str, Any]]
+
+
+def _write_atomic(path: Path, data: str | bytes, *, replace: bool = True) -> None:
+    """Write beside ``path`` and rename into place so readers never see halves.
+
+    With ``replace=False`` an existing ``path`` is left untouched and
+    :class:`FileExistsError` is raised instead.
+    """
+
+    # Unique per thread as well as per process, so concurrent exports of the
+    # same page never share (or rename away) each other's temporary file.
+    tmp_path = path.with_name(
+        f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        if isinstance(data, bytes):
+            tmp_path.write_bytes(data)
+        else:
+            tmp_path.write_text(data, encoding="utf-8")
+        if replace:
+            os.replace(tmp_path, path)
+        else:
+            os.link(tmp_path, path)
+            tmp_path.unlink()
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _render_items(archive: WebArchive, items: List[_RenderItem]) -> int:
+    for relpath, renderer, args, kwargs in items:
+        html = getattr(archive, renderer)(*args, **kwargs)
+        _write_atomic(archive.output_dir / relpath, html)
+    return len(items)
+
+
+_WORKER_ARCHIVE: Optional[WebArchive] = None
+
+
+def _init_render_worker(output_dir: str, base_url: str) -> None:
+    global _WORKER_ARCHIVE
+    _WORKER_ARCHIVE = WebArchive._renderer(Path(output_dir), base_url)
+
+
+def _render_chunk(items: List[_RenderItem]) -> int:
+    if _WORKER_ARCHIVE is None:  # pragma: no cover - initializer always runs
+        raise RuntimeError("Render worker was not initialised")
+    return _render_items(_WORKER_ARCHIVE, items)
+
+
+class _RenderQueue:
+    """Render queued pages inline or, with several workers, on a process pool.
+
+    Pages are named by a path relative to the archive root and the name of the
+    ``WebArchive`` method that renders them, so work items stay picklable. The
+    pool is only started once a full chunk is queued; smaller batches (typical
+    of incremental exports) render inline. At most two chunks per worker are
+    in flight, keeping memory flat while press releases stream in.
+    """
+
+    def __init__(self, archive: WebArchive) -> None:
+        self._archive = archive
+        self._workers = archive.workers
+        self._chunk_size = max(1, archive.RENDER_CHUNK_SIZE)
+        self._chunk: List[_RenderItem] = []
+        self._pending: Deque[Future[int]] = deque()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.rendered = 0
+
+    def __enter__(self) -> _RenderQueue:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        elif self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def add(self, relpath: str, renderer: str, *args: Any, **kwargs: Any) -> None:
+        item = (relpath, renderer, args, kwargs)
+        if self._workers <= 1:
+            self.rendered += _render_items(self._archive, [item])
+            return
+        self._chunk.append(item)
+        if len(self._chunk) >= self._chunk_size:
+            self._submit()
+
+    def close(self) -> None:
+        try:
+            if self._executor is None:
+                self.rendered += _render_items(self._archive, self._chunk)
+                self._chunk = []
+                return
+            self._submit()
+            while self._pending:
+                self.rendered += self._pending.popleft().result()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
+
+    def _submit(self) -> None:
+        if not self._chunk:
+            return
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                # Spawn rather than fork: the parent holds SQLite connections.
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_render_worker,
+                initargs=(str(self._archive.output_dir), self._archive.base_url),
+            )
+        self._pending.append(self._executor.submit(_render_chunk, self._chunk))
+        self._chunk = []
+        while len(self._pending) > self._workers * 2:
+            self.rendered += self._pending.popleft().result()
+
 
 __all__ = ["WebArchive", "ArchivePage"]
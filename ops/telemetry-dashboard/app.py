@@ -1,12 +1,16 @@
 """Containerised telemetry dashboard for The Great Work."""
 from __future__ import annotations
 
+import csv
+import io
 import json
 import os
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
 
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from pydantic import BaseModel, Field
@@ -28,6 +32,8 @@ jinja_env = Environment(
 )
 
 app = FastAPI(title="The Great Work Telemetry Dashboard")
+# Compresses streamed exports chunk by chunk for clients sending Accept-Encoding.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 
 class SemanticPressResult(BaseModel):
@@ -42,13 +48,42 @@ class SemanticPressResult(BaseModel):
 MAX_QUERY_HOURS = int(os.environ.get("TELEMETRY_MAX_QUERY_HOURS", "168") or 168)
 MAX_ORDER_RECORDS = int(os.environ.get("TELEMETRY_MAX_ORDER_RECORDS", "1000") or 1000)
 MAX_HISTORY_DAYS = int(os.environ.get("TELEMETRY_MAX_HISTORY_DAYS", "120") or 120)
+# Streamed exports hold one page at a time, so they may reach much further back.
+MAX_EXPORT_HOURS = int(
+    os.environ.get("TELEMETRY_MAX_EXPORT_HOURS", str(MAX_HISTORY_DAYS * 24))
+    or MAX_HISTORY_DAYS * 24
+)
+MAX_EXPORT_RECORDS = int(
+    os.environ.get("TELEMETRY_MAX_EXPORT_RECORDS", "1000000") or 1000000
+)
+
+ORDER_CSV_COLUMNS = (
+    "order_type",
+    "pending",
+    "oldest_pending_seconds",
+    "event",
+    "timestamp",
+)
+KPI_HISTORY_COLUMNS = (
+    "date",
+    "active_players",
+    "manifesto_players",
+    "manifesto_events",
+    "archive_events",
+    "nickname_events",
+    "press_share_events",
+)
 
 
 def build_report() -> dict:
-    """Fetch the latest aggregated telemetry report."""
+    """Fetch the latest aggregated telemetry report.
+
+    Served from the collector's section cache; only sections whose metrics
+    changed (or whose TTL lapsed) are recomputed.
+    """
 
     collector.flush()
-    return collector.generate_report()
+    return collector.cached_report()
 
 
 def _load_latest_calibration_snapshot() -> Optional[dict]:
@@ -173,6 +208,74 @@ def _normalise_days(value: int) -> int:
         raise HTTPException(status_code=400, detail="days must be positive")
     return min(value, MAX_HISTORY_DAYS)
 
+
+def _stream_order_records(
+    *,
+    order_type: Optional[str],
+    hours: int,
+    limit: int,
+    event: Optional[str],
+    min_pending: Optional[float],
+    min_age_hours: Optional[float],
+    after: Optional[str],
+) -> Iterator[Dict[str, Any]]:
+    """Validate export filters and open a keyset stream of backlog events."""
+
+    if hours <= 0:
+        raise HTTPException(status_code=400, detail="hours must be positive")
+    if limit <= 0:
+        raise HTTPException(status_code=400, detail="limit must be positive")
+    min_age_seconds = None
+    if min_age_hours is not None:
+        if min_age_hours < 0:
+            raise HTTPException(status_code=400, detail="min_age_hours must be non-negative")
+        min_age_seconds = float(min_age_hours) * 3600.0
+
+    collector.flush()
+    try:
+        records = collector.iter_order_backlog_events(
+            order_type=order_type or None,
+            hours=min(hours, MAX_EXPORT_HOURS),
+            event=event or None,
+            min_pending=min_pending,
+            min_age_seconds=min_age_seconds,
+            after=after or None,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return islice(records, min(limit, MAX_EXPORT_RECORDS))
+
+
+def _ndjson_lines(records: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    for record in records:
+        yield json.dumps(record) + "\n"
+
+
+def _csv_lines(
+    columns: Sequence[str], rows: Iterable[Sequence[Any]]
+) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _order_csv_row(record: Dict[str, Any]) -> list:
+    oldest = record["oldest_pending_seconds"]
+    return [
+        record["order_type"],
+        f"{record['pending']:.0f}",
+        f"{oldest:.0f}" if oldest is not None else "",
+        record.get("event", ""),
+        record["timestamp"],
+    ]
+
 @app.get("/", response_class=HTMLResponse)
 async def index() -> HTMLResponse:
     """Render the dashboard landing page."""
@@ -265,50 +368,88 @@ async def api_order_records_csv(
     event: Optional[str] = None,
     min_pending: Optional[float] = None,
     min_age_hours: Optional[float] = None,
+    after: Optional[str] = None,
 ) -> StreamingResponse:
-    """Export dispatcher backlog events as CSV."""
+    """Stream dispatcher backlog events as CSV, newest first.
 
-    normalised_hours = _normalise_hours(hours)
-    normalised_limit = _normalise_limit(limit)
-    min_age_seconds = None
-    if min_age_hours is not None:
-        if min_age_hours < 0:
-            raise HTTPException(status_code=400, detail="min_age_hours must be non-negative")
-        min_age_seconds = float(min_age_hours) * 3600.0
+    Rows are read a keyset page at a time; ``after`` takes the ``cursor`` of
+    an NDJSON record to continue an export from that point.
+    """
 
-    records = collector.get_order_backlog_events(
-        order_type=order_type or None,
-        hours=normalised_hours,
-        limit=normalised_limit,
-        event=event or None,
+    records = _stream_order_records(
+        order_type=order_type,
+        hours=hours,
+        limit=limit,
+        event=event,
         min_pending=min_pending,
-        min_age_seconds=min_age_seconds,
+        min_age_hours=min_age_hours,
+        after=after,
     )
-
-    def _row_iter() -> Iterable[str]:
-        yield "order_type,pending,oldest_pending_seconds,event,timestamp\n"
-        for record in records:
-            oldest = record["oldest_pending_seconds"]
-            oldest_val = f"{oldest:.0f}" if oldest is not None else ""
-            row = ",".join(
-                [
-                    record["order_type"],
-                    f"{record['pending']:.0f}",
-                    oldest_val,
-                    record.get("event", ""),
-                    record["timestamp"],
-                ]
-            )
-            yield row + "\n"
-
     filename = "order_backlog.csv"
     headers = {"Content-Disposition": f"attachment; filename={filename}"}
-    return StreamingResponse(_row_iter(), media_type="text/csv", headers=headers)
+    rows = (_order_csv_row(record) for record in records)
+    return StreamingResponse(
+        _csv_lines(ORDER_CSV_COLUMNS, rows), media_type="text/csv", headers=headers
+    )
 
 
-@app.get("/api/kpi_history", response_class=JSONResponse)
-async def api_kpi_history(days: int = 30) -> JSONResponse:
-    """Return KPI history in JSON for charts."""
+@app.get("/api/orders.ndjson")
+async def api_order_records_ndjson(
+    order_type: Optional[str] = None,
+    hours: int = 24,
+    limit: int = 250,
+    event: Optional[str] = None,
+    min_pending: Optional[float] = None,
+    min_age_hours: Optional[float] = None,
+    after: Optional[str] = None,
+) -> StreamingResponse:
+    """Stream dispatcher backlog events as newline-delimited JSON.
+
+    Each record includes a ``cursor``; pass the last one received as
+    ``after`` to resume an interrupted export.
+    """
+
+    records = _stream_order_records(
+        order_type=order_type,
+        hours=hours,
+        limit=limit,
+        event=event,
+        min_pending=min_pending,
+        min_age_hours=min_age_hours,
+        after=after,
+    )
+    return StreamingResponse(_ndjson_lines(records), media_type="application/x-ndjson")
+
+
+@app.get("/api/kpi_history", response_model=None)
+async def api_kpi_history(
+    days: int = 30,
+    format: str = Query("json", pattern="^(json|ndjson|csv)$"),
+    after: Optional[str] = None,
+) -> JSONResponse | StreamingResponse:
+    """Return KPI history in JSON for charts, or stream daily rows.
+
+    ``format=ndjson`` or ``format=csv`` streams one row per day (oldest first)
+    straight from the collector; ``after`` resumes after a ``YYYY-MM-DD`` date.
+    """
+
+    if format != "json":
+        if days <= 0:
+            raise HTTPException(status_code=400, detail="days must be positive")
+        try:
+            daily = collector.iter_product_kpi_history(
+                days=min(days, MAX_EXPORT_HOURS // 24), after=after or None
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        if format == "csv":
+            rows = ([row[column] for column in KPI_HISTORY_COLUMNS] for row in daily)
+            return StreamingResponse(
+                _csv_lines(KPI_HISTORY_COLUMNS, rows),
+                media_type="text/csv",
+                headers={"Content-Disposition": "attachment; filename=kpi_history.csv"},
+            )
+        return StreamingResponse(_ndjson_lines(daily), media_type="application/x-ndjson")
 
     normalised_days = _normalise_days(days)
     history = collector.get_product_kpi_history_summary(days=normalised_days)
@@ -5,6 +5,23 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def _close_telemetry_collectors():
+    """Close telemetry collectors a test started so exit has nothing to flush."""
+    from great_work import telemetry
+
+    before = set(telemetry._open_collectors)
+    yield
+    for collector in list(telemetry._open_collectors):
+        if collector in before:
+            continue
+        if collector.db_path.parent.exists():
+            collector.close()
+        telemetry._open_collectors.discard(collector)
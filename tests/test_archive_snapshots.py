@@ -0,0 +1,133 @@
+"""Tests for the content-addressed archive snapshot store."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from great_work.archive_snapshots import SnapshotStore
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_snapshots_store_each_page_once(tmp_path):
+    """Unchanged pages should be shared between snapshots."""
+
+    archive = tmp_path / "web_archive"
+    _write(archive / "index.html", "<h1>Index</h1>" * 50)
+    _write(archive / "press" / "a.html", "first release " * 50)
+    _write(archive / "press" / "b.html", "first release " * 50)
+    _write(archive / ".index.html.123.tmp", "partial")
+    store = SnapshotStore(tmp_path / "snapshots")
+
+    first = store.snapshot(archive, "web_archive_20240101_000000")
+    assert first.files == 3
+    assert first.new_objects == 2  # identical press pages share a blob
+
+    _write(archive / "index.html", "<h1>Index v2</h1>" * 50)
+    second = store.snapshot(archive, "web_archive_20240102_000000")
+    assert second.files == 3
+    assert second.new_objects == 1
+
+    usage = store.usage()
+    assert usage.snapshots == 2
+    assert usage.objects == 3
+    assert usage.logical_bytes == first.logical_bytes + second.logical_bytes
+    assert usage.stored_bytes < usage.logical_bytes
+
+    restored = tmp_path / "restored"
+    assert store.restore("web_archive_20240101_000000", restored) == 3
+    assert (restored / "index.html").read_text() == "<h1>Index</h1>" * 50
+    assert (restored / "press" / "b.html").read_text() == "first release " * 50
+
+
+def test_prune_collects_unreferenced_objects(tmp_path):
+    """Pruning should drop old manifests and the blobs only they referenced."""
+
+    archive = tmp_path / "web_archive"
+    store = SnapshotStore(tmp_path / "snapshots")
+    for day in range(1, 4):
+        _write(archive / "index.html", f"edition {day}")
+        _write(archive / "about.html", "static")
+        store.snapshot(archive, f"web_archive_2024010{day}_000000")
+    assert store.usage().objects == 4
+
+    assert store.prune(2) == ["web_archive_20240101_000000"]
+    assert store.names() == [
+        "web_archive_20240102_000000",
+        "web_archive_20240103_000000",
+    ]
+    assert store.usage().objects == 3
+    restored = tmp_path / "restored"
+    store.restore("web_archive_20240102_000000", restored)
+    assert (restored / "index.html").read_text() == "edition 2"
+
+
+def test_unchanged_files_are_not_reread(tmp_path, monkeypatch):
+    """Files matching the previous manifest's size and mtime reuse its digest."""
+
+    archive = tmp_path / "web_archive"
+    _write(archive / "index.html", "stable")
+    store = SnapshotStore(tmp_path / "snapshots")
+    store.snapshot(archive, "web_archive_20240101_000000")
+
+    reads: list[str] = []
+    original = type(archive).read_bytes
+
+    def tracking_read(path):
+        reads.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(type(archive), "read_bytes", tracking_read)
+    stat = (archive / "index.html").stat()
+    os.utime(archive / "index.html", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    result = store.snapshot(archive, "web_archive_20240102_000000")
+    assert result.new_objects == 0
+    assert "index.html" not in reads
+
+
+def test_unknown_codec_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        SnapshotStore(tmp_path, codec="lz4")
+
+
+def test_collect_garbage_spares_fresh_temporary_files(tmp_path):
+    """In-flight temporary blobs survive GC until they pass the grace period."""
+
+    archive = tmp_path / "web_archive"
+    _write(archive / "index.html", "edition 1")
+    store = SnapshotStore(tmp_path / "snapshots")
+    store.snapshot(archive, "web_archive_20240101_000000")
+
+    shard = store.objects_dir / "ab"
+    fresh = shard / ".ab12.gz.1.2.tmp"
+    stale = shard / ".ab34.gz.1.2.tmp"
+    orphan = shard / "ab56.gz"
+    for path in (fresh, stale, orphan):
+        _write(path, "blob")
+    old = stale.stat().st_mtime - 2 * 3600
+    os.utime(stale, (old, old))
+
+    assert store.collect_garbage() == 2
+    assert fresh.exists()
+    assert not stale.exists()
+    assert not orphan.exists()
+    assert store.usage().objects == 2
+
+
+def test_snapshot_refuses_to_overwrite_manifest(tmp_path):
+    archive = tmp_path / "web_archive"
+    _write(archive / "index.html", "edition 1")
+    store = SnapshotStore(tmp_path / "snapshots")
+    store.snapshot(archive, "web_archive_20240101_000000")
+
+    _write(archive / "index.html", "edition 2")
+    with pytest.raises(FileExistsError):
+        store.snapshot(archive, "web_archive_20240101_000000")
+    restored = tmp_path / "restored"
+    store.restore("web_archive_20240101_000000", restored)
+    assert (restored / "index.html").read_text() == "edition 1"
@@ -157,6 +157,69 @@ def test_llm_output_moderation_fallback(tmp_path, monkeypatch):
     assert moderation_meta.get("blocked") is True
 
 
+def test_multi_press_layers_enhance_concurrently_in_order(monkeypatch, tmp_path):
+    import asyncio
+
+    import great_work.llm_client as llm_client
+    from great_work.llm_client import LLMClient, LLMConfig, LLMGenerationError
+    from great_work.multi_press import PressLayer
+
+    service = build_service(tmp_path)
+    client = LLMClient(LLMConfig(mock_mode=True, max_concurrent=2))
+    in_flight = {"now": 0, "peak": 0}
+
+    async def slow_generate(prompt, context, persona_name=None, persona_traits=None):
+        index = int(context["headline"].split()[-1])
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        # Later layers finish first, so ordering must not follow completion.
+        await asyncio.sleep(0.01 * (5 - index))
+        in_flight["now"] -= 1
+        if index == 2:
+            raise LLMGenerationError("layer offline")
+        return f"Enhanced {index}"
+
+    client.generate_narrative = slow_generate
+    monkeypatch.setattr(llm_client, "_llm_client", client)
+
+    def make_release(context):
+        return PressRelease(
+            type="academic_gossip",
+            headline=f"Layer {context['index']}",
+            body=f"Base {context['index']}",
+        )
+
+    layers = [
+        PressLayer(
+            delay_minutes=0,
+            type="academic_gossip",
+            generator=make_release,
+            context={"index": index},
+        )
+        for index in range(5)
+    ]
+    now = datetime.now(timezone.utc)
+    releases = service._apply_multi_press_layers(
+        layers, skip_types=set(), timestamp=now, event_type="index"
+    )
+
+    assert [release.headline for release in releases] == [
+        f"Layer {index}" for index in range(5)
+    ]
+    assert [release.body for release in releases] == [
+        "Enhanced 0",
+        "Enhanced 1",
+        "Base 2",
+        "Enhanced 3",
+        "Enhanced 4",
+    ]
+    assert in_flight["peak"] == 2
+    archived = [
+        record.release.headline for record in service.state.list_press_releases()
+    ]
+    assert archived[:5] == [f"Layer {index}" for index in reversed(range(5))]
+
+
 def test_llm_activity_records_telemetry(monkeypatch, tmp_path):
     os.environ.setdefault("LLM_MODE", "mock")
 
@@ -166,7 +229,7 @@ def test_llm_activity_records_telemetry(monkeypatch, tmp_path):
             self.system_events = []
 
         def track_llm_activity(
-            self, press_type, success, duration_ms, persona=None, error=None
+            self, press_type, success, duration_ms, persona=None, error=None, cache=None
         ):
             self.llm_calls.append(
                 {
@@ -2,15 +2,18 @@
 
 import asyncio
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from great_work.llm_client import (
+    CircuitBreaker,
     ContentModerator,
     LLMClient,
+    LLMCircuitOpenError,
     LLMConfig,
     LLMGenerationError,
+    LLMResponseCache,
     SafetyLevel,
     enhance_press_release,
     get_llm_client,
@@ -204,6 +207,389 @@ async def test_generate_batch():
     assert "Generated for 3" in results[2]
 
 
+def test_generate_batch_sync_caps_concurrency_and_keeps_failures_in_place():
+    client = LLMClient(LLMConfig(mock_mode=True, max_concurrent=2))
+    in_flight = {"now": 0, "peak": 0}
+
+    async def mock_generate(prompt, context, persona_name=None, persona_traits=None):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        if context["id"] == 1:
+            raise LLMGenerationError("offline")
+        return f"Generated for {context['id']}"
+
+    client.generate_narrative = mock_generate
+
+    results = client.generate_batch_sync(
+        [{"prompt": f"Test {i}", "context": {"id": i}} for i in range(4)],
+        return_exceptions=True,
+    )
+
+    assert results[0] == "Generated for 0"
+    assert isinstance(results[1], LLMGenerationError)
+    assert results[2:] == ["Generated for 2", "Generated for 3"]
+    assert in_flight["peak"] == 2
+
+
+def test_generate_batch_times_each_prompt_on_its_own():
+    client = LLMClient(LLMConfig(max_concurrent=4))
+    client.enabled = True
+
+    async def create(**kwargs):
+        prompt = kwargs["messages"][1]["content"]
+        if prompt == "Slow":
+            await asyncio.sleep(0.2)
+        elif prompt == "Broken":
+            raise RuntimeError("upstream down")
+        response = Mock()
+        response.choices = [Mock(message=Mock(content=prompt))]
+        return response
+
+    client.client = AsyncMock()
+    client.client.chat.completions.create.side_effect = create
+    client.config.use_fallback_templates = False
+    client.config.retry_attempts = 1
+
+    results = client.generate_batch_sync(
+        [{"prompt": prompt, "context": {}} for prompt in ("Fast", "Slow", "Broken")],
+        return_exceptions=True,
+        timed=True,
+    )
+
+    (fast, fast_ms), (slow, slow_ms), (broken, _) = results
+    assert (fast, slow) == ("Fast", "Slow")
+    assert isinstance(broken, LLMGenerationError)
+    assert slow_ms >= 200
+    assert fast_ms < 150
+    client.close()
+
+
+def test_response_cache_expires_and_evicts_least_recently_used(tmp_path, monkeypatch):
+    import great_work.llm_client as llm_client
+
+    now = {"t": 1000.0}
+    monkeypatch.setattr(llm_client.time, "time", lambda: now["t"])
+    cache = LLMResponseCache(tmp_path / "cache.db", ttl_seconds=60, max_entries=2)
+    messages = [{"role": "user", "content": "Write  about\nthe comet"}]
+    key = LLMResponseCache.fingerprint("m", 0.8, 500, messages)
+    # Whitespace is normalised; model and temperature are part of the key.
+    assert key == LLMResponseCache.fingerprint(
+        "m", 0.8, 500, [{"role": "user", "content": "Write about the comet"}]
+    )
+    assert key != LLMResponseCache.fingerprint("m", 0.2, 500, messages)
+
+    cache.put("a", "m", "A")
+    now["t"] += 1
+    cache.put("b", "m", "B")
+    now["t"] += 1
+    assert cache.get("a") == "A"  # "b" becomes the least recently used
+    cache.put("c", "m", "C")
+    assert cache.get("b") is None
+    assert cache.get("c") == "C"
+
+    now["t"] += 61
+    assert cache.get("a") is None
+    assert cache.stats() == {
+        "entries": 1,
+        "hits": 2,
+        "misses": 2,
+        "evictions": 1,
+        "hit_rate": 0.5,
+    }
+    cache.close()
+
+
+def test_generate_narrative_serves_repeat_prompts_from_cache(tmp_path):
+    def build(**overrides):
+        config = LLMConfig(cache_path=str(tmp_path / "cache.db"), **overrides)
+        client = LLMClient(config)
+        client.enabled = True
+        response = Mock()
+        response.choices = [Mock(message=Mock(content=" A comet appears. "))]
+        client.client = AsyncMock()
+        client.client.chat.completions.create.return_value = response
+        return client
+
+    client = build()
+    first = client.generate_narrative_sync("Describe the comet", {"player": "Ada"})
+    second = client.generate_narrative_sync("Describe   the comet", {"player": "Ada"})
+    assert first == second == "A comet appears."
+    assert (first.cache_status, second.cache_status) == ("miss", "hit")
+    assert client.client.chat.completions.create.call_count == 1
+    client.close()
+
+    # A fresh client reads the same database.
+    restarted = build()
+    assert restarted.generate_narrative_sync("Describe the comet", {}).cache_status == (
+        "hit"
+    )
+    restarted.close()
+
+    bypassed = build(cache_max_temperature=0.5)
+    for _ in range(2):
+        result = bypassed.generate_narrative_sync("Describe the comet", {})
+        assert result.cache_status == "bypass"
+    assert bypassed.client.chat.completions.create.call_count == 2
+    bypassed.close()
+
+
+def test_cache_lookups_run_off_the_callers_loop(tmp_path):
+    import threading
+
+    client = LLMClient(LLMConfig(cache_path=str(tmp_path / "cache.db")))
+    client.enabled = True
+    response = Mock()
+    response.choices = [Mock(message=Mock(content="A comet appears."))]
+    client.client = AsyncMock()
+    client.client.chat.completions.create.return_value = response
+    cache_threads = []
+    real_get, real_put = client.cache.get, client.cache.put
+
+    def get(key):
+        cache_threads.append(threading.current_thread())
+        return real_get(key)
+
+    def put(*args):
+        cache_threads.append(threading.current_thread())
+        return real_put(*args)
+
+    client.cache.get, client.cache.put = get, put
+
+    async def from_caller_loop():
+        first = await client.generate_narrative("Describe the comet", {})
+        second = await client.generate_narrative("Describe the comet", {})
+        return first.cache_status, second.cache_status
+
+    assert asyncio.run(from_caller_loop()) == ("miss", "hit")
+    assert len(cache_threads) == 3
+    assert threading.main_thread() not in cache_threads
+    client.close()
+
+
+def test_requests_share_one_client_loop_beyond_four_in_flight(tmp_path):
+    import threading
+
+    client = LLMClient(LLMConfig(max_concurrent=8))
+    client.enabled = True
+    seen = {"threads": set(), "now": 0, "peak": 0}
+
+    async def create(**kwargs):
+        seen["threads"].add(threading.current_thread().name)
+        seen["now"] += 1
+        seen["peak"] = max(seen["peak"], seen["now"])
+        await asyncio.sleep(0.02)
+        seen["now"] -= 1
+        response = Mock()
+        prompt = kwargs["messages"][1]["content"]
+        response.choices = [Mock(message=Mock(content=prompt))]
+        return response
+
+    client.client = AsyncMock()
+    client.client.chat.completions.create.side_effect = create
+
+    results = client.generate_batch_sync(
+        [{"prompt": f"Prompt {i}", "context": {}} for i in range(8)]
+    )
+    assert results == [f"Prompt {i}" for i in range(8)]
+    assert seen["peak"] == 8
+
+    async def from_running_loop():
+        # Both the blocking facade and a direct await work inside another loop.
+        blocking = client.generate_narrative_sync("Blocking", {})
+        awaited = await client.generate_narrative("Awaited", {})
+        return blocking, awaited
+
+    assert asyncio.run(from_running_loop()) == ("Blocking", "Awaited")
+    assert seen["threads"] == {"llm-client-loop"}
+
+    loop_thread = client._loop_thread
+    client.close()
+    assert not loop_thread.is_alive()
+
+
+def test_identical_concurrent_requests_share_one_upstream_call():
+    client = LLMClient(LLMConfig(max_concurrent=8))
+    client.enabled = True
+
+    async def create(**kwargs):
+        await asyncio.sleep(0.02)
+        response = Mock()
+        prompt = kwargs["messages"][1]["content"]
+        response.choices = [Mock(message=Mock(content=f"Reply to {prompt}"))]
+        return response
+
+    client.client = AsyncMock()
+    client.client.chat.completions.create.side_effect = create
+
+    prompts = ["Gossip", "Gossip", "Gossip ", "Bulletin"]
+    results = client.generate_batch_sync(
+        [{"prompt": prompt, "context": {}} for prompt in prompts]
+    )
+
+    assert results == ["Reply to Gossip"] * 3 + ["Reply to Bulletin"]
+    assert [result.cache_status for result in results].count("coalesced") == 2
+    assert client.client.chat.completions.create.call_count == 2
+    assert client.coalesced_calls == 2
+    assert client._inflight == {}
+
+    # Above the caching temperature every request goes upstream on its own.
+    client.config.cache_max_temperature = 0.5
+    client.generate_batch_sync([{"prompt": "Gossip", "context": {}}] * 2)
+    assert client.client.chat.completions.create.call_count == 4
+    client.close()
+
+
+def test_circuit_breaker_opens_probes_once_and_backs_off():
+    now = [0.0]
+    breaker = CircuitBreaker(
+        window_seconds=60,
+        min_requests=4,
+        failure_rate=0.5,
+        slow_call_ms=1000,
+        open_seconds=10,
+        clock=lambda: now[0],
+    )
+    for success, latency in [(True, 50), (False, 50), (True, 50)]:
+        breaker.record(success, latency)
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record(True, 5000)  # Slow enough to count against the window
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.rejecting() and not breaker.allow()
+
+    now[0] += 13  # Past the jittered cool-down
+    assert breaker.snapshot()["state"] == CircuitBreaker.HALF_OPEN
+    probe = breaker.allow()
+    assert probe
+    assert breaker.rejecting() and not breaker.allow()
+    breaker.record(False, 50, probe)
+    assert breaker.state == CircuitBreaker.OPEN and breaker.trips == 2
+
+    now[0] += 13  # The failed probe doubled the cool-down
+    assert breaker.rejecting()
+    now[0] += 13
+    probe = breaker.allow()
+    breaker.record(True, 40, probe)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.snapshot()["calls"] == 1
+    assert breaker.latency_quantile(0.95) == 40
+    assert breaker.latency_quantile(0.95, min_samples=2) is None
+
+
+def test_half_open_breaker_ignores_calls_admitted_before_the_trip():
+    now = [0.0]
+    breaker = CircuitBreaker(
+        min_requests=2, failure_rate=0.5, open_seconds=10, clock=lambda: now[0]
+    )
+    slow = breaker.allow()  # Admitted while closed, still in flight
+    for _ in range(2):
+        breaker.record(False, 50, breaker.allow())
+    assert breaker.state == CircuitBreaker.OPEN
+
+    now[0] += 13
+    probe = breaker.allow()
+    assert probe and probe != slow
+    # The slow pre-trip call finishing neither closes nor reopens the breaker.
+    breaker.record(True, 40, slow)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.record(False, 40, slow)
+    breaker.release(slow)
+    assert breaker.state == CircuitBreaker.HALF_OPEN and breaker.trips == 1
+    assert not breaker.allow()  # The real probe is still in flight
+
+    breaker.record(True, 40, probe)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_open_circuit_short_circuits_without_calling_upstream():
+    client = LLMClient(
+        LLMConfig(retry_attempts=1, breaker_min_requests=2, breaker_open_seconds=60)
+    )
+    client.enabled = True
+    client.client = AsyncMock()
+    client.client.chat.completions.create.side_effect = ConnectionError("down")
+    context = {"player": "Bob", "action": "filed a report"}
+
+    first = client.generate_narrative_sync("First", context)
+    assert getattr(first, "cache_status", None) is None
+    tripped = client.generate_narrative_sync("Second", context)
+    assert tripped.cache_status == "short_circuit"
+    assert client.breaker.snapshot()["state"] == CircuitBreaker.OPEN
+
+    skipped = client.generate_narrative_sync("Third", context)
+    assert skipped.cache_status == "short_circuit"
+    assert "Bob" in skipped
+    assert client.client.chat.completions.create.call_count == 2
+
+    client.config.use_fallback_templates = False
+    with pytest.raises(LLMCircuitOpenError, match="2 of 2 calls failed"):
+        client.generate_narrative_sync("Fourth", context)
+    client.close()
+
+
+def test_deadline_bounds_retries_and_hedge_beats_a_stalled_request():
+    import time
+
+    client = LLMClient(
+        LLMConfig(
+            retry_attempts=3, retry_schedule=[0.05], deadline_seconds=0.3, timeout=30
+        )
+    )
+    client.enabled = True
+    calls = []
+
+    async def create(**kwargs):
+        calls.append(kwargs["messages"][1]["content"])
+        # The first request of each prompt stalls; a repeat answers at once.
+        if calls.count(calls[-1]) == 1:
+            await asyncio.sleep(5)
+        response = Mock()
+        response.choices = [Mock(message=Mock(content="Hedged reply"))]
+        return response
+
+    client.client = AsyncMock()
+    client.client.chat.completions.create.side_effect = create
+
+    started = time.monotonic()
+    result = client.generate_narrative_sync("Stalled", {"player": "Bob"})
+    assert time.monotonic() - started < 1.5
+    assert result != "Hedged reply"
+    assert client.breaker.snapshot()["failure_rate"] == 1.0
+
+    client.config.hedge_requests = True
+    client.config.deadline_seconds = 5
+    for _ in range(20):
+        client.breaker.record(True, 20)
+    started = time.monotonic()
+    assert client.generate_narrative_sync("Hedged", {}) == "Hedged reply"
+    assert time.monotonic() - started < 1
+    assert calls.count("Hedged") == 2
+    assert client.hedged_calls == 1
+    client.close()
+
+
+def test_hedging_returns_a_reply_that_beats_the_hedge_delay():
+    client = LLMClient(LLMConfig(hedge_requests=True, retry_attempts=1))
+    client.enabled = True
+    for _ in range(25):
+        client.breaker.record(True, 500)
+
+    async def create(**kwargs):
+        await asyncio.sleep(0.001)
+        response = Mock()
+        response.choices = [Mock(message=Mock(content="Quick reply"))]
+        return response
+
+    client.client = AsyncMock()
+    client.client.chat.completions.create.side_effect = create
+
+    assert client.generate_narrative_sync("Quick", {}) == "Quick reply"
+    assert client.client.chat.completions.create.call_count == 1
+    assert client.hedged_calls == 0
+    client.close()
+
+
 def test_generate_narrative_sync_mock():
     """Synchronous helper should work when mock mode is enabled."""
     config = LLMConfig(mock_mode=True)
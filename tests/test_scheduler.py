@@ -90,6 +90,65 @@ def test_prune_snapshots_enforces_limit(tmp_path, monkeypatch):
     assert remaining[-1].name.endswith("2.zip")
 
 
+def test_package_archive_deduplicates_snapshots(tmp_path, monkeypatch):
+    """Packaging should store snapshots by content and keep one upload ZIP."""
+
+    monkeypatch.setenv("GREAT_WORK_ARCHIVE_MAX_SNAPSHOTS", "2")
+    scheduler = GazetteScheduler(service=DummyService())
+
+    export_dir = tmp_path / "export"
+    export_dir.mkdir()
+    (export_dir / "index.html").write_text("edition 0", encoding="utf-8")
+    (export_dir / "data.bin").write_bytes(os.urandom(4096))
+
+    stamps = iter(["20240101_000000", "20240102_000000", "20240103_000000"])
+
+    class FixedClock:
+        @staticmethod
+        def now(tz=None):
+            return datetime.strptime(next(stamps), "%Y%m%d_%H%M%S")
+
+    monkeypatch.setattr("great_work.scheduler.datetime", FixedClock)
+    for edition in range(3):
+        (export_dir / "index.html").write_text(f"edition {edition}", encoding="utf-8")
+        zip_path = scheduler._package_archive(export_dir)
+
+    snapshots_dir = tmp_path / "snapshots"
+    assert zip_path.name == "web_archive_20240103_000000.zip"
+    assert list((snapshots_dir / "outbox").glob("*.zip")) == [zip_path]
+    manifests = sorted(p.stem for p in (snapshots_dir / "manifests").glob("*.json"))
+    assert manifests == ["web_archive_20240102_000000", "web_archive_20240103_000000"]
+    # One blob for data.bin plus one per retained index edition.
+    blobs = [p for p in (snapshots_dir / "objects").rglob("*") if p.is_file()]
+    assert len(blobs) == 3
+
+
+def test_package_archive_same_second_keeps_both_snapshots(tmp_path, monkeypatch):
+    """Two packages stamped in the same second must not share a manifest."""
+
+    monkeypatch.setenv("GREAT_WORK_ARCHIVE_PUBLISH_DIR", str(tmp_path / "publish"))
+    monkeypatch.setenv("GREAT_WORK_ARCHIVE_MAX_SNAPSHOTS", "0")
+    scheduler = GazetteScheduler(service=DummyService())
+
+    export_dir = tmp_path / "export"
+    export_dir.mkdir()
+
+    class FixedClock:
+        @staticmethod
+        def now(tz=None):
+            return datetime.strptime("20240101_000000", "%Y%m%d_%H%M%S")
+
+    monkeypatch.setattr("great_work.scheduler.datetime", FixedClock)
+    for edition in range(2):
+        (export_dir / "index.html").write_text(f"edition {edition}", encoding="utf-8")
+        scheduler._package_archive(export_dir)
+
+    manifests = sorted(
+        p.stem for p in (tmp_path / "snapshots" / "manifests").glob("*.json")
+    )
+    assert manifests == ["web_archive_20240101_000000", "web_archive_20240101_000000_2"]
+
+
 def test_queue_depth_tracked_in_upcoming_highlights(monkeypatch):
     """Upcoming highlights should record queue depth telemetry."""
 
@@ -7,7 +7,7 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
-from great_work.llm_client import LLMGenerationError
+from great_work.llm_client import GeneratedText, LLMGenerationError
 from great_work.models import (
     ConfidenceLevel,
     ExpeditionOutcome,
@@ -525,6 +525,17 @@ def test_resolve_pending_expeditions_empty(tmp_path):
     assert releases == []
 
 
+def test_state_write_behind_interval_is_configurable(tmp_path, monkeypatch):
+    """GameService should pass the write-behind interval through to GameState."""
+    monkeypatch.setenv("GREAT_WORK_STATE_WRITE_BEHIND_SECONDS", "2.5")
+    service = GameService(db_path=tmp_path / "state.sqlite", auto_seed=False)
+
+    assert service.state._write_behind_seconds == 2.5
+    assert service.state._flusher is not None
+    service.state.close()
+    assert service.state._flusher is None
+
+
 def test_generated_scholar_counter_increments(tmp_path):
     """Generated scholar counter should increment when creating new scholars."""
     db_path = tmp_path / "state.sqlite"
@@ -586,6 +597,11 @@ def test_llm_failure_triggers_pause(tmp_path, monkeypatch):
     monkeypatch.setattr(
         "great_work.service.enhance_press_release_sync", failing_enhance
     )
+    monkeypatch.setattr(
+        "great_work.service.enhance_press_releases_sync",
+        lambda requests, **kwargs: [(LLMGenerationError("LLM offline"), 1.0)]
+        * len(requests),
+    )
 
     service.ensure_player("sarah", "Sarah")
     prep = ExpeditionPreparation()
@@ -626,6 +642,10 @@ def test_llm_failure_triggers_pause(tmp_path, monkeypatch):
     monkeypatch.setattr(
         "great_work.service.enhance_press_release_sync", recovering_enhance
     )
+    monkeypatch.setattr(
+        "great_work.service.enhance_press_releases_sync",
+        lambda requests, **kwargs: [("Recovered narrative", 1.0)] * len(requests),
+    )
 
     resume_press = service.resume_game("Admin")
     assert service.is_paused() is False
@@ -643,3 +663,131 @@ def test_llm_failure_triggers_pause(tmp_path, monkeypatch):
         confidence=ConfidenceLevel.SUSPECT,
     )
     assert "Recovered narrative" in release_after.body
+
+
+def test_batched_press_layers_report_their_own_llm_latency(tmp_path, monkeypatch):
+    """Each layer of a batch should report its own duration, not the batch's."""
+    os.environ["LLM_MODE"] = "mock"
+    service = GameService(db_path=tmp_path / "state.sqlite", auto_seed=False)
+    monkeypatch.setattr(
+        "great_work.service.enhance_press_releases_sync",
+        lambda requests, **kwargs: [
+            (f"{request['base_content']} (enhanced)", 100.0 * (index + 1))
+            for index, request in enumerate(requests)
+        ],
+    )
+    durations: list[float] = []
+    monkeypatch.setattr(
+        service._telemetry,
+        "track_llm_activity",
+        lambda press_type, success, duration_ms, **kwargs: durations.append(
+            duration_ms
+        ),
+    )
+
+    releases = service._enhance_press_releases(
+        [
+            {
+                "release": PressRelease(
+                    type="academic_gossip", headline=f"Layer {index}", body="Body"
+                ),
+                "base_body": "Body",
+            }
+            for index in range(3)
+        ]
+    )
+
+    assert [release.body for release in releases] == ["Body (enhanced)"] * 3
+    assert durations == [100.0, 200.0, 300.0]
+
+
+def test_open_llm_circuit_keeps_base_body_and_pauses(tmp_path, monkeypatch):
+    """Templates served by an open circuit breaker count as an outage."""
+    os.environ["LLM_MODE"] = "mock"
+    service = GameService(db_path=tmp_path / "state.sqlite")
+    service._llm_pause_timeout = 0
+    template = GeneratedText("A generic template.", "short_circuit")
+
+    monkeypatch.setattr(
+        "great_work.service.enhance_press_release_sync", lambda *a, **k: template
+    )
+    monkeypatch.setattr(
+        "great_work.service.enhance_press_releases_sync",
+        lambda requests, **kwargs: [(template, 1.0)] * len(requests),
+    )
+    monkeypatch.setattr(
+        "great_work.service.llm_circuit_state",
+        lambda: {"state": "open", "reason": "5 of 5 calls failed or were slow"},
+    )
+
+    service.ensure_player("sarah", "Sarah")
+    release = service.queue_expedition(
+        code="AR-OPEN",
+        player_id="sarah",
+        expedition_type="field",
+        objective="Test open circuit",
+        team=[],
+        funding=[],
+        preparation=ExpeditionPreparation(),
+        prep_depth="standard",
+        confidence=ConfidenceLevel.SUSPECT,
+    )
+
+    assert "A generic template." not in release.body
+    assert "llm" not in release.metadata
+    assert service.is_paused() is True
+    assert "LLM circuit open: 5 of 5 calls failed" in service._pause_reason
+
+
+def test_llm_enhancement_runs_outside_state_transactions(tmp_path, monkeypatch):
+    """Press is enhanced before a unit of work opens, never while it is held."""
+    os.environ["LLM_MODE"] = "mock"
+    service = GameService(db_path=tmp_path / "state.sqlite")
+    in_transaction: list[bool] = []
+
+    def enhance(press_type, base_content, *args, **kwargs):
+        in_transaction.append(service.state.in_transaction())
+        return f"{base_content} (enhanced)"
+
+    def enhance_many(requests, **kwargs):
+        in_transaction.append(service.state.in_transaction())
+        return [
+            (f"{request['base_content']} (enhanced)", 1.0) for request in requests
+        ]
+
+    monkeypatch.setattr("great_work.service.enhance_press_release_sync", enhance)
+    monkeypatch.setattr(
+        "great_work.service.enhance_press_releases_sync", enhance_many
+    )
+
+    service.ensure_player("sarah", "Sarah")
+    scholar = next(iter(service.state.all_scholars()))
+    service.queue_mentorship("sarah", scholar.id, "Academia")
+    service.queue_expedition(
+        code="AR-LOCK",
+        player_id="sarah",
+        expedition_type="field",
+        objective="Hold no locks",
+        team=[scholar.id],
+        funding=[],
+        preparation=ExpeditionPreparation(),
+        prep_depth="standard",
+        confidence=ConfidenceLevel.SUSPECT,
+    )
+    releases = service.resolve_pending_expeditions()
+    service.start_symposium(topic="Locks", description="Who holds them?")
+    for _ in range(4):
+        releases.extend(service.advance_digest())
+    releases.append(service.resolve_symposium())
+
+    actions = {event.action for event in service.state.export_events()}
+    assert {
+        "expedition_resolved",
+        "mentorship_activated",
+        "career_progression",
+        "symposium_resolved",
+    } <= actions
+    assert len(in_transaction) > 4
+    assert not any(in_transaction)
+    assert any(release.body.endswith("(enhanced)") for release in releases)
+
@@ -4,12 +4,22 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
-from great_work.models import Event, ExpeditionRecord, Player, Scholar, TheoryRecord
+from great_work.models import (
+    Event,
+    ExpeditionRecord,
+    MemoryFact,
+    OfferRecord,
+    Player,
+    Scholar,
+    TheoryRecord,
+)
 from great_work.rng import DeterministicRNG
 from great_work.scholars import ScholarRepository
 from great_work.state import GameState
@@ -427,3 +437,531 @@ def test_followup_scheduling_and_retrieval(tmp_path):
     assert due[0][1] == "scholar1"  # scholar_id is second element
     assert due[0][2] == "grudge"  # followup_type is third element
     assert due[0][3]["reason"] == "betrayal"  # payload is fourth element
+
+
+def test_state_reuses_one_connection_per_thread(tmp_path):
+    """State calls on one thread should share a single long-lived connection."""
+    state = GameState(db_path=tmp_path / "test.db", start_year=1923)
+
+    with state._connect() as first:
+        pass
+    with state._connect() as second:
+        pass
+    assert first is second
+    assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    seen = []
+
+    def worker():
+        with state._connect() as conn:
+            seen.append(conn)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert seen and seen[0] is not first
+
+    state.close()
+    with state._connect() as reopened:
+        assert reopened is not first
+        assert reopened.execute("SELECT COUNT(*) FROM players").fetchone()[0] == 0
+
+
+def test_synchronous_level_is_validated(tmp_path):
+    """Only SQLite's synchronous levels reach the PRAGMA."""
+    state = GameState(db_path=tmp_path / "test.db", start_year=1923, synchronous="full")
+    with state._connect() as conn:
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2
+    state.close()
+
+    with pytest.raises(ValueError):
+        GameState(
+            db_path=tmp_path / "other.db",
+            start_year=1923,
+            synchronous="NORMAL; DROP TABLE players",
+        )
+
+
+def test_uncommitted_writes_are_discarded_on_exit(tmp_path):
+    """Writes left uncommitted by a state call must not leak into the next call."""
+    state = GameState(db_path=tmp_path / "test.db", start_year=1923)
+
+    with state._connect() as conn:
+        conn.execute(
+            "INSERT INTO events (timestamp, action, payload) VALUES ('t', 'a', '{}')"
+        )
+    assert state.export_events() == []
+
+
+def test_transaction_commits_once_and_rolls_back_together(tmp_path):
+    """Writes inside a transaction should land together or not at all."""
+    state = GameState(db_path=tmp_path / "test.db", start_year=1923)
+    player = Player(
+        id="p1", display_name="P1", reputation=1, influence={}, cooldowns={}
+    )
+
+    with pytest.raises(RuntimeError):
+        with state.transaction():
+            state.upsert_player(player)
+            state.append_event(
+                Event(timestamp=datetime.now(timezone.utc), action="x", payload={})
+            )
+            raise RuntimeError("boom")
+
+    assert state.get_player("p1") is None
+    assert state.export_events() == []
+
+    with state.transaction():
+        state.upsert_player(player)
+        # Other connections must not observe the write before the outer commit.
+        with sqlite3.connect(state._db_path) as other:
+            assert other.execute("SELECT COUNT(*) FROM players").fetchone()[0] == 0
+    with sqlite3.connect(state._db_path) as other:
+        assert other.execute("SELECT COUNT(*) FROM players").fetchone()[0] == 1
+
+
+def test_nested_transaction_rolls_back_to_savepoint(tmp_path):
+    """A failing inner block should only unwind its own writes."""
+    state = GameState(db_path=tmp_path / "test.db", start_year=1923)
+    now = datetime.now(timezone.utc)
+
+    with state.transaction():
+        state.append_event(Event(timestamp=now, action="outer", payload={}))
+        with pytest.raises(ValueError):
+            with state.transaction():
+                state.append_event(Event(timestamp=now, action="inner", payload={}))
+                raise ValueError("inner failure")
+        state.append_event(Event(timestamp=now, action="after", payload={}))
+
+    assert [event.action for event in state.export_events()] == ["outer", "after"]
+
+
+def test_dirty_players_flush_once_per_unit_of_work(tmp_path, monkeypatch):
+    """Repeated upserts inside a transaction should serialize each player once."""
+    state = GameState(db_path=tmp_path / "test.db", start_year=1923)
+    player = Player(
+        id="p1", display_name="P1", reputation=1, influence={}, cooldowns={}
+    )
+
+    dumped = []
+    real_dumps = json.dumps
+
+    def counting_dumps(value, *args, **kwargs):
+        dumped.append(value)
+        return real_dumps(value, *args, **kwargs)
+
+    monkeypatch.setattr("great_work.state.json.dumps", counting_dumps)
+    with state.transaction():
+        for reputation in range(5):
+            player.reputation = reputation
+            state.upsert_player(player)
+    # influence + cooldowns for a single flush
+    assert len(dumped) == 2
+
+    dumped.clear()
+    state.upsert_player(player)
+    assert dumped == []  # unchanged players are never re-serialized
+
+    with sqlite3.connect(state._db_path) as conn:
+        row = conn.execute("SELECT reputation FROM players WHERE id = 'p1'").fetchone()
+    assert row[0] == 4
+
+
+def test_write_behind_interval_defers_flush(tmp_path):
+    """With a write-behind interval, writes outside a transaction wait for a flush."""
+    state = GameState(
+        db_path=tmp_path / "test.db", start_year=1923, write_behind_seconds=3600
+    )
+    player = Player(
+        id="p1", display_name="P1", reputation=3, influence={}, cooldowns={}
+    )
+    state.upsert_player(player)
+
+    def persisted() -> int:
+        with sqlite3.connect(state._db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+
+    assert persisted() == 0
+    assert [p.reputation for p in state.all_players()] == [3]
+    assert state.get_player("p1") is player
+
+    state.flush()
+    assert persisted() == 1
+    player.reputation = 9
+    state.upsert_player(player)
+    state.close()
+    with sqlite3.connect(state._db_path) as conn:
+        row = conn.execute("SELECT reputation FROM players WHERE id = 'p1'").fetchone()
+    assert row[0] == 9
+
+
+def test_write_behind_flushes_on_a_quiet_server(tmp_path):
+    """Deferred writes reach disk even when no later mutation triggers a flush."""
+    state = GameState(
+        db_path=tmp_path / "test.db", start_year=1923, write_behind_seconds=0.05
+    )
+    state.flush()  # restart the interval so the next write is deferred
+    state.upsert_player(
+        Player(id="p1", display_name="P1", reputation=3, influence={}, cooldowns={})
+    )
+
+    def persisted() -> int:
+        with sqlite3.connect(state._db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+
+    assert persisted() == 0
+    with state.transaction():
+        state.upsert_player(
+            Player(id="p2", display_name="P2", reputation=1, influence={}, cooldowns={})
+        )
+        time.sleep(0.2)
+        # The background flush stands aside while a unit of work is open.
+        assert persisted() == 0
+
+    state.upsert_player(
+        Player(id="p3", display_name="P3", reputation=5, influence={}, cooldowns={})
+    )
+    deadline = time.monotonic() + 5
+    while persisted() < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert persisted() == 3
+    state.close()
+    assert state._flusher is None
+
+
+def test_units_of_work_do_not_flush_or_discard_other_threads_writes(tmp_path):
+    """Dirty ids belong to the unit (or thread) that marked them."""
+    state = GameState(db_path=tmp_path / "test.db", start_year=1923)
+
+    def player(player_id: str) -> Player:
+        return Player(
+            id=player_id, display_name=player_id, reputation=1, influence={}, cooldowns={}
+        )
+
+    def persisted() -> set:
+        with sqlite3.connect(state._db_path) as conn:
+            return {row[0] for row in conn.execute("SELECT id FROM players")}
+
+    opened = threading.Event()
+    release = threading.Event()
+
+    def failing_unit():
+        with pytest.raises(RuntimeError):
+            with state.transaction():
+                state.upsert_player(player("in-unit"))
+                opened.set()
+                release.wait(5)
+                raise RuntimeError("boom")
+
+    # A write outside a unit neither writes nor waits on another thread's unit.
+    worker = threading.Thread(target=failing_unit)
+    worker.start()
+    assert opened.wait(5)
+    state.upsert_player(player("outside"))
+    assert persisted() == set()
+    release.set()
+    worker.join()
+    assert persisted() == {"outside"}
+    assert state.get_player("in-unit") is None
+
+    # A rollback on one thread keeps other threads' deferred writes.
+    state = GameState(
+        db_path=tmp_path / "behind.db", start_year=1923, write_behind_seconds=3600
+    )
+    state.flush()
+    deferred = player("deferred")
+    state.upsert_player(deferred)
+    opened.clear()
+    release.clear()
+    other_opened = threading.Event()
+    other_release = threading.Event()
+
+    def committing_unit():
+        with state.transaction():
+            state.upsert_player(player("committed"))
+            other_opened.set()
+            other_release.wait(5)
+
+    committer = threading.Thread(target=committing_unit)
+    committer.start()
+    assert other_opened.wait(5)
+    worker = threading.Thread(target=failing_unit)
+    worker.start()
+    assert opened.wait(5)
+    release.set()
+    worker.join()
+    other_release.set()
+    committer.join()
+
+    assert persisted() == {"committed"}
+    assert state.get_player("deferred") is deferred
+    state.flush()
+    assert persisted() == {"committed", "deferred"}
+    state.close()
+
+
+def test_scholar_facts_are_stored_in_append_only_table(tmp_path):
+    """Memory facts should live outside the scholar JSON blob and only be appended."""
+    db_path = tmp_path / "test.db"
+    state = GameState(db_path=db_path, start_year=1923)
+    scholar = ScholarRepository().generate(DeterministicRNG(7), "s1")
+    now = datetime.now(timezone.utc)
+    scholar.memory.record_fact(MemoryFact(now, "met", "p1", {"where": "salon"}))
+    state.save_scholar(scholar)
+    scholar.memory.record_fact(MemoryFact(now, "argued", "p2"))
+    state.save_scholar(scholar)
+
+    with sqlite3.connect(db_path) as conn:
+        data = json.loads(
+            conn.execute("SELECT data FROM scholars WHERE id = 's1'").fetchone()[0]
+        )
+        facts = conn.execute(
+            "SELECT seq, type, subject FROM scholar_memory_facts ORDER BY seq"
+        ).fetchall()
+    assert data["memory"]["facts"] == []
+    assert facts == [(0, "met", "p1"), (1, "argued", "p2")]
+
+    reloaded = GameState(db_path=db_path, start_year=1923).get_scholar("s1")
+    assert [fact.type for fact in reloaded.memory.facts] == ["met", "argued"]
+    assert reloaded.memory.facts[0].details == {"where": "salon"}
+
+
+def test_scholars_employed_by_uses_contract_columns(tmp_path):
+    """Employer and faction lookups should be answered from indexed columns."""
+    state = GameState(db_path=tmp_path / "test.db", start_year=1923)
+    repo = ScholarRepository()
+    rng = DeterministicRNG(11)
+    for scholar_id, employer, faction in (
+        ("s1", "p1", "academia"),
+        ("s2", "p1", "industry"),
+        ("s3", "p2", "academia"),
+        ("s4", None, None),
+    ):
+        scholar = repo.generate(rng, scholar_id)
+        if employer:
+            scholar.contract["employer"] = employer
+            scholar.contract["faction"] = faction
+        state.save_scholar(scholar)
+
+    assert {s.id for s in state.scholars_employed_by("p1")} == {"s1", "s2"}
+    assert [s.id for s in state.scholars_employed_by("p1", faction="industry")] == [
+        "s2"
+    ]
+    assert state.scholar_contract_counts() == {
+        "p1": {"academia": 1, "industry": 1},
+        "p2": {"academia": 1},
+    }
+
+
+def test_legacy_scholar_rows_are_migrated(tmp_path):
+    """Databases with JSON-only scholar rows should be backfilled on startup."""
+    db_path = tmp_path / "legacy.db"
+    repo = ScholarRepository()
+    scholar = repo.generate(DeterministicRNG(3), "legacy")
+    scholar.contract["employer"] = "p9"
+    scholar.contract["faction"] = "government"
+    scholar.memory.record_fact(
+        MemoryFact(datetime.now(timezone.utc), "recruited", "p9")
+    )
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE scholars (id TEXT PRIMARY KEY, data TEXT NOT NULL)")
+        conn.execute(
+            "INSERT INTO scholars (id, data) VALUES (?, ?)",
+            ("legacy", json.dumps(repo.serialize(scholar))),
+        )
+
+    state = GameState(db_path=db_path, start_year=1923)
+
+    with sqlite3.connect(db_path) as conn:
+        row = conn.execute(
+            "SELECT employer, faction, loyalty FROM scholars WHERE id = 'legacy'"
+        ).fetchone()
+        fact_count = conn.execute(
+            "SELECT COUNT(*) FROM scholar_memory_facts"
+        ).fetchone()[0]
+    assert row == ("p9", "government", scholar.stats.loyalty)
+    assert fact_count == 1
+    migrated = state.scholars_employed_by("p9", faction="government")
+    assert [fact.type for fact in migrated[0].memory.facts] == ["recruited"]
+
+
+def test_interrupted_scholar_backfill_resumes_on_next_start(tmp_path):
+    """Rows left behind once the columns exist should still be backfilled."""
+    db_path = tmp_path / "legacy.db"
+    repo = ScholarRepository()
+    scholar = repo.generate(DeterministicRNG(5), "stranded")
+    scholar.contract["employer"] = "p3"
+    scholar.memory.record_fact(
+        MemoryFact(datetime.now(timezone.utc), "recruited", "p3")
+    )
+    GameState(db_path=db_path, start_year=1923)
+    # The columns were added and committed, then the process died before
+    # the JSON-only row was rewritten.
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "INSERT INTO scholars (id, data) VALUES (?, ?)",
+            ("stranded", json.dumps(repo.serialize(scholar))),
+        )
+
+    state = GameState(db_path=db_path, start_year=1923)
+
+    with sqlite3.connect(db_path) as conn:
+        row = conn.execute(
+            "SELECT employer, talent FROM scholars WHERE id = 'stranded'"
+        ).fetchone()
+    assert row == ("p3", scholar.stats.talent)
+    restored = state.scholars_employed_by("p3")
+    assert [fact.type for fact in restored[0].memory.facts] == ["recruited"]
+
+
+def test_offer_chain_walks_indexed_parent_links(tmp_path):
+    """Offer chains should come back depth-first from the root offer."""
+    state = GameState(db_path=tmp_path / "test.db", start_year=1923)
+
+    def save(parent=None):
+        return state.save_offer(
+            OfferRecord(scholar_id="s1", faction="industry", parent_offer_id=parent)
+        )
+
+    root = save()
+    counter = save(root)
+    sibling = save(root)
+    final = save(counter)
+    unrelated = [save() for _ in range(6)]
+    # Offer 11 points at offer 10; a substring match on parent 1 would catch it.
+    save(unrelated[-1])
+
+    chain = [offer.id for offer in state.get_offer_chain(final)]
+    assert chain == [root, counter, final, sibling]
+    assert [offer.id for offer in state.get_offer_chain(root)] == chain
+    assert state.get_offer_chain(9999) == []
+
+
+def test_offer_parent_column_is_backfilled(tmp_path):
+    """Legacy offers tables should gain an indexed parent column from payloads."""
+    db_path = tmp_path / "legacy.db"
+    now = datetime.now(timezone.utc).isoformat()
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE offers (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "scholar_id TEXT NOT NULL, faction TEXT NOT NULL, payload TEXT NOT NULL, "
+            "status TEXT NOT NULL, created_at TEXT NOT NULL)"
+        )
+        for parent in (None, 1):
+            conn.execute(
+                "INSERT INTO offers (scholar_id, faction, payload, status, created_at) "
+                "VALUES ('s1', 'academia', ?, 'pending', ?)",
+                (json.dumps({"parent_offer_id": parent}), now),
+            )
+
+    state = GameState(db_path=db_path, start_year=1923)
+
+    with sqlite3.connect(db_path) as conn:
+        parents = conn.execute(
+            "SELECT parent_offer_id FROM offers ORDER BY id"
+        ).fetchall()
+    assert parents == [(None,), (1,)]
+    assert [offer.id for offer in state.get_offer_chain(2)] == [1, 2]
+
+    # A backfill interrupted after the column was committed resumes on start.
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE offers SET parent_offer_id = NULL")
+    state = GameState(db_path=db_path, start_year=1923)
+    assert [offer.id for offer in state.get_offer_chain(2)] == [1, 2]
+
+
+def test_iter_press_releases_pages_with_keyset_cursor(tmp_path):
+    """Streaming press reads should page by id and honour filters."""
+    from great_work.models import PressRecord, PressRelease
+
+    state = GameState(db_path=tmp_path / "test.db", start_year=1923)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for i in range(7):
+        state.record_press_release(
+            PressRecord(
+                timestamp=base + timedelta(days=i),
+                release=PressRelease(
+                    type="even" if i % 2 == 0 else "odd",
+                    headline=f"Headline {i}",
+                    body=f"Body {i}",
+                    metadata={"index": i},
+                ),
+            )
+        )
+    existing = state.count_press_releases()
+    assert existing >= 7
+
+    newest = [record for _, record in state.iter_press_releases(batch_size=2)]
+    assert newest == state.list_press_releases()
+
+    ids = [press_id for press_id, _ in state.iter_press_releases(newest_first=False)]
+    assert ids == sorted(ids) and len(ids) == existing
+    resumed = [
+        press_id
+        for press_id, _ in state.iter_press_releases(
+            newest_first=False, after_id=ids[2], batch_size=3
+        )
+    ]
+    assert resumed == ids[3:]
+
+    evens = list(state.iter_press_releases(types=["even"], batch_size=2))
+    assert [record.release.metadata["index"] for _, record in evens] == [6, 4, 2, 0]
+    assert state.count_press_releases(types=["even"]) == 4
+    assert state.count_press_releases(types=[]) == 0
+    assert list(state.iter_press_releases(types=[])) == []
+
+    window = state.iter_press_releases(
+        since=base + timedelta(days=2),
+        until=base + timedelta(days=4),
+        with_metadata=False,
+    )
+    records = [record for _, record in window]
+    assert [record.release.headline for record in records] == [
+        "Headline 3",
+        "Headline 2",
+    ]
+    assert all(record.release.metadata == {} for record in records)
+
+
+def test_press_release_offsets_months_and_counts(tmp_path):
+    """Listing reads should resume by id and group by type or month."""
+    from great_work.models import PressRecord, PressRelease
+
+    state = GameState(db_path=tmp_path / "test.db", start_year=1923)
+    baseline_types = state.press_release_counts("type")
+    for i in range(6):
+        state.record_press_release(
+            PressRecord(
+                timestamp=datetime(2030, 1 + i % 2, 10 + i, tzinfo=timezone.utc),
+                release=PressRelease(
+                    type="listing_test", headline=f"Listing {i}", body="Body"
+                ),
+            )
+        )
+
+    months = state.press_release_counts("month")
+    assert months["2030-01"] == 3
+    assert months["2030-02"] == 3
+    types = state.press_release_counts("type")
+    assert types["listing_test"] == 6
+    assert {k: v for k, v in types.items() if k != "listing_test"} == baseline_types
+
+    february = list(
+        state.iter_press_releases(newest_first=False, month="2030-02", batch_size=1)
+    )
+    assert [record.release.headline for _, record in february] == [
+        "Listing 1",
+        "Listing 3",
+        "Listing 5",
+    ]
+    resumed = state.iter_press_releases(
+        newest_first=False, month="2030-02", after_id=february[0][0]
+    )
+    assert [record.release.headline for _, record in resumed] == [
+        "Listing 3",
+        "Listing 5",
+    ]
+    december = state.iter_press_releases(month="2029-12")
+    assert list(december) == []
+    with pytest.raises(ValueError):
+        state.press_release_counts("headline")
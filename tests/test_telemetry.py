@@ -1,7 +1,9 @@
 """Tests for telemetry and metrics tracking."""
 
 import json
+import sqlite3
 import tempfile
+import threading
 import time
 from pathlib import Path
 
@@ -12,6 +14,7 @@ from great_work.telemetry import (
     MetricEvent,
     MetricType,
     TelemetryCollector,
+    _partition_bounds,
     get_telemetry,
     track_duration,
 )
@@ -172,6 +175,19 @@ def test_track_press_layer_and_summary():
         assert top["avg_delay_minutes"] > 0
 
 
+def test_llm_activity_summary_counts_cache_outcomes(tmp_path):
+    collector = TelemetryCollector(tmp_path / "llm_cache.db")
+    for cache in ("hit", "hit", "miss", "bypass", "coalesced", None):
+        collector.track_llm_activity("bulletin", True, 5.0, cache=cache)
+    collector.flush()
+
+    summary = collector.get_llm_activity_summary(1)["bulletin"]
+    assert summary["total_calls"] == 6
+    assert (summary["cache_hits"], summary["cache_misses"]) == (2, 1)
+    assert summary["cache_hit_rate"] == pytest.approx(2 / 3)
+    assert summary["coalesced_calls"] == 1
+
+
 def test_track_queue_depth_and_summary():
     """Queue depth metrics should aggregate by horizon."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -600,6 +616,7 @@ def test_product_kpis_and_health(monkeypatch):
         assert metrics.get("archive_usage") == "alert"
         assert metrics.get("nickname_rate") == "alert"
         assert metrics.get("press_shares") == "alert"
+        collector.close()
 
 
 def test_product_kpi_history():
@@ -830,6 +847,118 @@ def test_auto_flush():
 
         # Should have auto-flushed
         assert len(collector._metrics_buffer) < 100
+        collector.close()
+
+        with sqlite3.connect(collector.db_path) as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM metrics").fetchone()
+        assert count == 101
+
+
+def test_record_hands_batches_to_writer_thread(tmp_path):
+    """Full batches are written off-thread; flush waits for them."""
+    collector = TelemetryCollector(tmp_path / "writer.db")
+    main_thread = threading.get_ident()
+    writer_threads = set()
+    original_write = collector._write_batch
+
+    def tracking_write(conn, batch):
+        writer_threads.add(threading.get_ident())
+        original_write(conn, batch)
+
+    collector._write_batch = tracking_write
+    for i in range(250):
+        collector.record(MetricType.COMMAND_USAGE, f"cmd_{i}", 1.0)
+    collector.flush()
+
+    assert writer_threads and main_thread not in writer_threads
+    stats = collector.writer_stats()
+    assert stats["written_events"] == 250
+    assert stats["dropped_events"] == 0
+    assert stats["buffered_events"] == 0
+    collector.close()
+    assert collector._writer is None
+
+
+def test_exit_hook_skips_collectors_whose_database_was_removed(tmp_path, caplog):
+    """Collectors left in a deleted temporary directory are not flushed at exit."""
+    import shutil
+
+    import great_work.telemetry
+
+    workdir = tmp_path / "gone"
+    collector = TelemetryCollector(workdir / "gone.db")
+    collector.record(MetricType.COMMAND_USAGE, "kept", 1.0)
+    collector.flush()
+    collector.record(MetricType.COMMAND_USAGE, "pending", 1.0)
+    shutil.rmtree(workdir)
+
+    with caplog.at_level("ERROR", logger="great_work.telemetry"):
+        great_work.telemetry._close_open_collectors()
+    assert "Failed to flush metrics" not in caplog.text
+    assert collector._writer is not None  # Left alone, not closed
+
+
+def test_record_drops_batches_when_writer_queue_full(tmp_path, monkeypatch):
+    """A saturated queue drops new batches and counts them instead of blocking."""
+    monkeypatch.setenv("GREAT_WORK_TELEMETRY_QUEUE_SIZE", "100")
+    collector = TelemetryCollector(tmp_path / "backpressure.db")
+    writing = threading.Event()
+    release = threading.Event()
+    original_write = collector._write_batch
+
+    def slow_write(conn, batch):
+        writing.set()
+        release.wait(timeout=10)
+        original_write(conn, batch)
+
+    collector._write_batch = slow_write
+    for i in range(400):
+        collector.record(MetricType.COMMAND_USAGE, f"cmd_{i}", 1.0)
+        if i == 99:
+            assert writing.wait(timeout=10)
+
+    # One batch is being written, one waits in the queue, the rest are dropped.
+    assert collector.dropped_events == 200
+    release.set()
+    collector.close()
+
+    report = collector.generate_report()
+    assert report["writer"]["dropped_events"] == 200
+    assert report["overall"]["total_events"] == 200
+
+
+def test_dropped_events_count_is_exact_across_threads(tmp_path, monkeypatch):
+    """Drops counted from many recording threads are never lost."""
+    monkeypatch.setenv("GREAT_WORK_TELEMETRY_QUEUE_SIZE", "100")
+    collector = TelemetryCollector(tmp_path / "drops.db")
+    writing = threading.Event()
+    release = threading.Event()
+    original_write = collector._write_batch
+
+    def slow_write(conn, batch):
+        writing.set()
+        release.wait(timeout=10)
+        original_write(conn, batch)
+
+    collector._write_batch = slow_write
+    for i in range(200):
+        collector.record(MetricType.COMMAND_USAGE, f"cmd_{i}", 1.0)
+        if i == 99:
+            assert writing.wait(timeout=10)
+
+    def produce():
+        for i in range(1000):
+            collector.record(MetricType.COMMAND_USAGE, f"burst_{i}", 1.0)
+
+    threads = [threading.Thread(target=produce) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert collector.dropped_events == 8000
+    release.set()
+    collector.close()
 
 
 def test_get_command_stats():
@@ -976,6 +1105,7 @@ def test_generate_report():
         assert report["overall"]["total_events"] == 4
         assert "health" in report
         assert isinstance(report["health"].get("checks"), list)
+        collector.close()
 
 
 def test_economy_metrics_summary():
@@ -1161,6 +1291,7 @@ def test_health_evaluation_thresholds(monkeypatch):
         )
         assert investment_alert is not None
         assert investment_alert["status"] == "alert"
+        collector.close()
 
 
 def test_cleanup_old_data():
@@ -1200,3 +1331,467 @@ def test_singleton_pattern():
     collector2 = get_telemetry()
 
     assert collector1 is collector2
+
+
+def test_legacy_metrics_table_gains_indexed_tag_columns(tmp_path):
+    """Existing databases are migrated so reports read hot tags from indexes."""
+    from great_work.tools.benchmark_telemetry import seed_metrics
+
+    db_path = tmp_path / "legacy.db"
+    seed_metrics(db_path, 500, days=1)
+    with sqlite3.connect(db_path) as conn:
+        (legacy_players,) = conn.execute(
+            "SELECT COUNT(DISTINCT json_extract(tags, '$.player_id')) FROM metrics"
+            " WHERE metric_type = ?",
+            (MetricType.COMMAND_USAGE.value,),
+        ).fetchone()
+
+    collector = TelemetryCollector(db_path)
+    collector.track_command("theory", "late_player", "g1", True, channel_id="c9")
+    collector.flush()
+
+    with sqlite3.connect(db_path) as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_xinfo('metrics')")}
+        assert {"player_id", "channel_id", "success", "event_type"} <= columns
+        (partition,) = conn.execute(
+            "SELECT partition_name FROM metrics WHERE player_id = 'late_player'"
+        ).fetchone()
+        plan = " ".join(
+            str(row[3])
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT name, COUNT(DISTINCT player_id),"
+                f" AVG(success = 'True') FROM {partition} WHERE metric_type = ?"
+                " GROUP BY name",
+                (MetricType.COMMAND_USAGE.value,),
+            )
+        )
+    assert "COVERING INDEX" in plan
+
+    stats = collector.get_command_stats()
+    assert stats["theory"]["unique_players"] == 1
+    assert collector.get_channel_usage(24)["c9"]["usage_count"] == 1
+    total_players = sum(
+        row["unique_players"] for row in collector.get_channel_usage(48).values()
+    )
+    assert total_players >= legacy_players
+
+
+def test_quantile_sketch_is_accurate_and_mergeable():
+    """Sketch quantiles stay within the relative error and merge exactly."""
+    from great_work.telemetry import QuantileSketch
+
+    first, second, combined = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for value in range(1, 5001):
+        first.add(float(value))
+        combined.add(float(value))
+    for value in range(5001, 10001):
+        second.add(float(value))
+        combined.add(float(value))
+    first.merge(QuantileSketch.from_json(second.to_json()))
+
+    assert first.count == combined.count == 10000
+    for q, expected in ((0.5, 5000), (0.95, 9500), (0.99, 9900)):
+        assert first.quantile(q) == combined.quantile(q)
+        assert first.quantile(q) == pytest.approx(expected, rel=0.011)
+    assert QuantileSketch().quantile(0.5) is None
+
+
+def test_summaries_read_whole_buckets_from_rollups(tmp_path):
+    """Aligned buckets come from rollups; raw rows are read only at the edges."""
+    from great_work.telemetry import MetricEvent
+
+    collector = TelemetryCollector(tmp_path / "rollups.db")
+    now = time.time()
+    for offset_minutes in range(0, 180, 3):
+        collector._metrics_buffer.append(
+            MetricEvent(
+                timestamp=now - offset_minutes * 60,
+                metric_type=MetricType.PERFORMANCE,
+                name="digest",
+                value=float(offset_minutes),
+            )
+        )
+        collector._metrics_buffer.append(
+            MetricEvent(
+                timestamp=now - offset_minutes * 60,
+                metric_type=MetricType.LLM_ACTIVITY,
+                name="bulletin",
+                value=10.0,
+                tags={"success": "true" if offset_minutes % 2 else "false"},
+            )
+        )
+    collector.flush()
+
+    summary = collector.get_performance_summary(hours=4)["digest"]
+    assert summary["sample_count"] == 60
+    assert summary["min_duration_ms"] == 0.0
+    assert summary["max_duration_ms"] == 177.0
+    assert summary["avg_duration_ms"] == pytest.approx(88.5)
+    llm = collector.get_llm_activity_summary(4)["bulletin"]
+    assert (llm["successes"], llm["failures"], llm["total_calls"]) == (30, 30, 60)
+
+    with sqlite3.connect(collector.db_path) as conn:
+        resolutions = {
+            row[0] for row in conn.execute("SELECT resolution FROM metric_rollups")
+        }
+        # Drop raw rows older than five minutes; only the edges are read raw.
+        conn.execute("DELETE FROM metrics WHERE timestamp < ?", (now - 300,))
+    assert resolutions == {60, 3600}
+    assert collector.get_performance_summary(hours=4)["digest"]["sample_count"] == 60
+
+
+def test_rollups_are_built_for_existing_metrics(tmp_path):
+    """Databases created before rollups existed are backfilled on first open."""
+    from great_work.tools.benchmark_telemetry import seed_metrics
+
+    db_path = tmp_path / "legacy.db"
+    seed_metrics(db_path, 2000, days=2)
+    with sqlite3.connect(db_path) as conn:
+        raw = dict(
+            conn.execute(
+                "SELECT name, COUNT(*) FROM metrics WHERE metric_type = ?"
+                " AND timestamp >= ? GROUP BY name",
+                (MetricType.PERFORMANCE.value, time.time() - 86400),
+            ).fetchall()
+        )
+
+    collector = TelemetryCollector(db_path)
+    summary = collector.get_performance_summary(hours=24)
+    assert {name: stats["sample_count"] for name, stats in summary.items()} == raw
+
+
+def test_latency_percentiles_come_from_rollup_sketches(tmp_path, monkeypatch):
+    """p50/p95/p99 are answered from persisted sketches, not raw rows."""
+    collector = TelemetryCollector(tmp_path / "latency.db")
+    recorded_at = time.time() - 600
+    # Record ten minutes ago so every event lands in a closed minute bucket.
+    with monkeypatch.context() as patch:
+        patch.setattr(time, "time", lambda: recorded_at)
+        for duration in range(1, 201):
+            collector.track_performance("digest", float(duration))
+            collector.track_command(
+                "theory", "p1", "g1", duration_ms=float(duration * 2)
+            )
+            collector.track_llm_activity(
+                "bulletin", duration % 10 != 0, float(duration)
+            )
+        collector.track_command("status", "p1", "g1")
+        collector.flush()
+
+    with sqlite3.connect(collector.db_path) as conn:
+        conn.execute("DELETE FROM metrics")
+
+    perf = collector.get_performance_summary(hours=1)["digest"]
+    assert perf["p50_duration_ms"] == pytest.approx(100, rel=0.02)
+    assert perf["p99_duration_ms"] == pytest.approx(198, rel=0.02)
+
+    commands = collector.get_latency_percentiles(MetricType.COMMAND_USAGE, 1)
+    assert commands["theory"]["samples"] == 200
+    assert commands["theory"]["p95"] == pytest.approx(380, rel=0.02)
+    # Commands recorded without a duration contribute no latency samples.
+    assert "status" not in commands
+
+    llm = collector.get_llm_activity_summary(1)["bulletin"]
+    assert llm["failures"] == 20
+    assert llm["p95_duration_ms"] == pytest.approx(190, rel=0.02)
+
+
+def test_cached_report_refreshes_only_sections_with_new_rows(tmp_path, monkeypatch):
+    """Repeated reports come from memory; writes invalidate their sections."""
+    collector = TelemetryCollector(tmp_path / "cached.db")
+    collector.track_command("theory", "p1", "g1")
+    collector.flush()
+    first = collector.cached_report()
+    assert first["command_stats"]["theory"]["usage_count"] == 1
+
+    calls = {"commands": 0, "errors": 0}
+    get_command_stats = collector.get_command_stats
+    get_error_summary = collector.get_error_summary
+
+    def counting_command_stats(*args, **kwargs):
+        calls["commands"] += 1
+        return get_command_stats(*args, **kwargs)
+
+    def counting_error_summary(*args, **kwargs):
+        calls["errors"] += 1
+        return get_error_summary(*args, **kwargs)
+
+    monkeypatch.setattr(collector, "get_command_stats", counting_command_stats)
+    monkeypatch.setattr(collector, "get_error_summary", counting_error_summary)
+
+    second = collector.cached_report()
+    assert calls == {"commands": 0, "errors": 0}
+    assert second["command_stats"] is first["command_stats"]
+    assert second["report_cache"]["refreshed"] == []
+
+    collector.track_error("TestError")
+    collector.flush()
+    third = collector.cached_report()
+    assert calls == {"commands": 0, "errors": 1}
+    assert third["errors_24h"] == {"TestError": 1}
+    assert "overall" in third["report_cache"]["refreshed"]
+
+    # Rows written by another collector on the same database are noticed too.
+    other = TelemetryCollector(collector.db_path)
+    other.track_command("theory", "p2", "g1")
+    other.close()
+    fourth = collector.cached_report()
+    assert calls["commands"] == 1
+    assert fourth["command_stats"]["theory"]["usage_count"] == 2
+
+    # Windowed sections expire after their TTL even without new rows.
+    collector._report_cache["errors_24h"].computed_at -= 3600
+    collector.cached_report()
+    assert calls == {"commands": 1, "errors": 2}
+
+    collector.set_kpi_target("active_players", 5)
+    assert collector.cached_report()["kpi_targets"]["active_players"]["target"] == 5
+
+
+def test_metrics_are_partitioned_by_week_and_retention_drops_partitions(tmp_path):
+    """Each week gets its own table; retention drops whole partitions."""
+    collector = TelemetryCollector(tmp_path / "partitioned.db")
+    now = time.time()
+    collector._metrics_buffer = [
+        MetricEvent(now - 40 * 86400, MetricType.COMMAND_USAGE, "ancient", 1.0),
+        MetricEvent(now - 10 * 86400, MetricType.COMMAND_USAGE, "recent", 1.0),
+        MetricEvent(now, MetricType.COMMAND_USAGE, "today", 1.0),
+    ]
+    collector.flush()
+
+    with sqlite3.connect(collector.db_path) as conn:
+        partitions = [
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM metric_partitions ORDER BY range_start"
+            )
+        ]
+        placement = dict(conn.execute("SELECT name, partition_name FROM metrics"))
+    assert len(partitions) == 3
+    assert placement == dict(zip(["ancient", "recent", "today"], partitions))
+
+    # Windowed reads only see partitions overlapping the window.
+    with collector._connect(since=now - 3600) as conn:
+        routed = {row[0] for row in conn.execute("SELECT partition_name FROM metrics")}
+    assert routed == {partitions[2]}
+    with collector._connect(since=now - 3600) as conn:
+        view_sql = conn.execute(
+            "SELECT sql FROM sqlite_temp_master WHERE name = 'metrics'"
+        ).fetchone()[0]
+    assert partitions[0] not in view_sql and partitions[1] not in view_sql
+
+    assert collector.cleanup_old_data(days_to_keep=30) == 1
+    with sqlite3.connect(collector.db_path) as conn:
+        tables = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+    assert partitions[0] not in tables
+    assert set(collector.get_command_stats()) == {"recent", "today"}
+
+
+def test_retention_keeps_rollups_for_the_straddling_partition(tmp_path):
+    """Rollups are trimmed to the oldest kept partition, not the exact cutoff."""
+    collector = TelemetryCollector(tmp_path / "straddle.db")
+    cutoff = time.time() - 30 * 86400
+    start, _ = _partition_bounds(cutoff, collector._partition_days)
+    kept = (start + cutoff) / 2  # Older than the cutoff, same partition
+    collector._metrics_buffer = [
+        MetricEvent(start - 86400, MetricType.COMMAND_USAGE, "expired", 1.0),
+        MetricEvent(kept, MetricType.COMMAND_USAGE, "straddling", 1.0),
+    ]
+    collector.flush()
+
+    assert collector.cleanup_old_data(days_to_keep=30) == 1
+    with sqlite3.connect(collector.db_path) as conn:
+        raw = conn.execute("SELECT name FROM metrics").fetchall()
+        rollups = {
+            row[0]
+            for row in conn.execute("SELECT DISTINCT name FROM metric_rollups")
+        }
+    assert raw == [("straddling",)]
+    assert rollups == {"straddling"}
+
+
+def test_metrics_view_routes_raw_writes_to_partitions(tmp_path):
+    """Hand-written SQL against ``metrics`` still inserts, moves, and deletes."""
+    collector = TelemetryCollector(tmp_path / "raw.db")
+    collector.track_command("theory", "p1", "g1")
+    collector.flush()
+    now = time.time()
+
+    with sqlite3.connect(collector.db_path) as conn:
+        (today,) = conn.execute("SELECT partition_name FROM metrics").fetchone()
+        conn.execute(
+            "INSERT INTO metrics (timestamp, metric_type, name, value, player_id)"
+            " VALUES (?, 'command_usage', 'status', 1.0, 'p2')",
+            (now,),
+        )
+        conn.execute(
+            "INSERT INTO metrics (timestamp, metric_type, name, value)"
+            " VALUES (?, 'command_usage', 'archive', 1.0)",
+            (now - 90 * 86400,),
+        )
+        placement = dict(conn.execute("SELECT name, partition_name FROM metrics"))
+        assert placement == {
+            "theory": today,
+            "status": today,
+            "archive": "metrics_unpartitioned",
+        }
+
+        # Ageing a row past its partition's range moves it out of the partition.
+        conn.execute(
+            "UPDATE metrics SET timestamp = timestamp - ? WHERE name = 'status'",
+            (90 * 86400,),
+        )
+        conn.execute("DELETE FROM metrics WHERE name = 'theory'")
+        rows = conn.execute(
+            "SELECT name, partition_name, player_id FROM metrics ORDER BY name"
+        ).fetchall()
+    assert rows == [
+        ("archive", "metrics_unpartitioned", None),
+        ("status", "metrics_unpartitioned", "p2"),
+    ]
+
+
+def test_legacy_metrics_table_is_split_into_partitions(tmp_path):
+    """A pre-partitioning ``metrics`` table is moved into dated partitions."""
+    from great_work.tools.benchmark_telemetry import seed_metrics
+
+    db_path = tmp_path / "legacy.db"
+    seed_metrics(db_path, 1000, days=10)
+    with sqlite3.connect(db_path) as conn:
+        (legacy_rows,) = conn.execute("SELECT COUNT(*) FROM metrics").fetchone()
+
+    TelemetryCollector(db_path)
+    with sqlite3.connect(db_path) as conn:
+        (kind,) = conn.execute(
+            "SELECT type FROM sqlite_master WHERE name = 'metrics'"
+        ).fetchone()
+        (partitions,) = conn.execute(
+            "SELECT COUNT(*) FROM metric_partitions"
+        ).fetchone()
+        counts = dict(
+            conn.execute("SELECT partition_name, COUNT(*) FROM metrics GROUP BY 1")
+        )
+    assert kind == "view"
+    assert partitions in (2, 3)
+    assert sum(counts.values()) == legacy_rows
+    assert counts.get("metrics_unpartitioned", 0) == 0
+
+
+def test_order_backlog_events_stream_across_partitions_by_keyset(tmp_path):
+    """Streaming walks every partition newest first and resumes from a cursor."""
+    collector = TelemetryCollector(tmp_path / "orders.db")
+    now = time.time()
+    collector._metrics_buffer = [
+        MetricEvent(
+            now - offset * 3 * 86400,
+            MetricType.ORDER_STATE,
+            "mentorship_activation" if offset % 2 else "conference_resolution",
+            float(offset),
+            tags={"event": "poll"},
+            metadata={"oldest_pending_seconds": 600.0 * offset},
+        )
+        for offset in range(12)
+    ]
+    collector.flush()
+    with sqlite3.connect(collector.db_path) as conn:
+        (partitions,) = conn.execute(
+            "SELECT COUNT(*) FROM metric_partitions"
+        ).fetchone()
+    assert partitions >= 5
+
+    streamed = list(collector.iter_order_backlog_events(hours=40 * 24, page_size=2))
+    assert [record["pending"] for record in streamed] == [float(i) for i in range(12)]
+
+    resumed = collector.iter_order_backlog_events(
+        hours=40 * 24, after=streamed[4]["cursor"], page_size=2
+    )
+    assert [record["pending"] for record in resumed] == [float(i) for i in range(5, 12)]
+
+    filtered = collector.iter_order_backlog_events(
+        hours=40 * 24,
+        order_type="mentorship_activation",
+        min_pending=4,
+        min_age_seconds=4000,
+    )
+    assert [record["pending"] for record in filtered] == [7.0, 9.0, 11.0]
+
+    with pytest.raises(ValueError):
+        collector.iter_order_backlog_events(after="not-a-cursor")
+
+
+def test_order_backlog_cursor_tells_apart_rows_sharing_an_id(tmp_path):
+    """Partition and unpartitioned rows with equal timestamp and id both stream."""
+    collector = TelemetryCollector(tmp_path / "ties.db")
+    now = time.time()
+    collector._metrics_buffer = [
+        MetricEvent(now - offset, MetricType.ORDER_STATE, "poll", float(offset))
+        for offset in range(3)
+    ]
+    collector.flush()
+    with sqlite3.connect(collector.db_path) as conn:
+        partitioned = conn.execute(
+            "SELECT id, timestamp FROM metrics WHERE partition_name <> ?",
+            ("metrics_unpartitioned",),
+        ).fetchall()
+        conn.executemany(
+            "INSERT INTO metrics_unpartitioned "
+            "(id, timestamp, metric_type, name, value, tags, metadata) "
+            "VALUES (?, ?, ?, 'stray', ?, '{}', '{}')",
+            [
+                (row_id, timestamp, MetricType.ORDER_STATE.value, 10.0 + row_id)
+                for row_id, timestamp in partitioned
+            ],
+        )
+
+    streamed = list(collector.iter_order_backlog_events(page_size=1))
+    assert len(streamed) == 6
+    assert len({record["cursor"] for record in streamed}) == 6
+    for index, record in enumerate(streamed):
+        resumed = collector.iter_order_backlog_events(
+            after=record["cursor"], page_size=1
+        )
+        assert [r["cursor"] for r in resumed] == [
+            r["cursor"] for r in streamed[index + 1 :]
+        ]
+    # Cursors issued before the source rank was added still resume.
+    assert len(list(collector.iter_order_backlog_events(after=f"{now!r}:1"))) == 5
+
+
+def test_product_kpi_history_streams_days_in_pages(tmp_path):
+    """Daily KPI rows are aggregated in SQLite and can resume after a date."""
+    collector = TelemetryCollector(tmp_path / "history.db")
+    now = time.time()
+    events = []
+    for offset in range(5):
+        ts = now - offset * 86400
+        events += [
+            MetricEvent(ts, MetricType.COMMAND_USAGE, "status", 1.0, {"player_id": p})
+            for p in ("alice", "bob", "carol")[: offset % 3 + 1]
+        ]
+        events.append(
+            MetricEvent(
+                ts,
+                MetricType.GAME_PROGRESSION,
+                "manifesto_generated",
+                1.0,
+                {"player_id": "alice"},
+            )
+        )
+    collector._metrics_buffer = events
+    collector.flush()
+
+    daily = list(collector.iter_product_kpi_history(days=7, page_days=2))
+    assert daily == collector.get_product_kpi_history(days=7)["daily"]
+    assert len(daily) == 5
+    assert [row["active_players"] for row in daily] == [2.0, 1.0, 3.0, 2.0, 1.0]
+    assert all(row["manifesto_players"] == 1.0 for row in daily)
+
+    resumed = list(collector.iter_product_kpi_history(days=7, after=daily[2]["date"]))
+    assert resumed == daily[3:]
+    with pytest.raises(ValueError):
+        collector.iter_product_kpi_history(after="yesterday")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import importlib.util
+import json
 import sys
 import tempfile
 from pathlib import Path
@@ -73,6 +74,36 @@ def test_orders_api_returns_filtered_records(dashboard_module):
     assert body[0] == "order_type,pending,oldest_pending_seconds,event,timestamp"
 
 
+def test_order_exports_stream_ndjson_with_resumable_cursor(dashboard_module):
+    collector = dashboard_module.collector
+    for pending in (3, 2, 1):
+        collector.track_order_snapshot(
+            order_type="mentorship_activation",
+            event="poll",
+            pending_count=pending,
+            oldest_pending_seconds=600.0 * pending,
+        )
+    collector.flush()
+
+    client = TestClient(dashboard_module.app)
+    response = client.get("/api/orders.ndjson", params={"hours": 24, "limit": 2})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [record["pending"] for record in records] == [1.0, 2.0]
+
+    resumed = client.get(
+        "/api/orders.csv", params={"hours": 24, "after": records[-1]["cursor"]}
+    )
+    assert resumed.text.splitlines()[1].startswith("mentorship_activation,3,")
+    bogus = client.get("/api/orders.ndjson", params={"after": "bogus"})
+    assert bogus.status_code == 400
+
+    history = client.get("/api/kpi_history", params={"format": "csv"})
+    assert history.status_code == 200
+    assert history.text.splitlines()[0].startswith("date,active_players,")
+
+
 def test_semantic_search_disabled_returns_503(dashboard_module):
     client = TestClient(dashboard_module.app)
     response = client.get("/api/semantic-press", params={"query": "bronze age"})
@@ -3,15 +3,24 @@
 from __future__ import annotations
 
 import json
+import random
 import tempfile
 from pathlib import Path
 
+import numpy as np
+
 from great_work.telemetry import TelemetryCollector
 from great_work.tools import export_product_metrics as export_product_metrics_module
 from great_work.tools import generate_sample_telemetry as generate_sample_module
+from great_work.tools.calibrate_moderation import calibrate, calibrate_from_export
+from great_work.tools.export_telemetry_columnar import export_columnar, load_state
 from great_work.tools.recommend_kpi_thresholds import (
+    PlayerActivity,
     apply_thresholds,
     recommend_thresholds,
+    recommend_thresholds_from_export,
+    rolling_distinct_players,
+    window_report,
 )
 
 
@@ -72,3 +81,117 @@ def test_export_product_metrics_outputs(tmp_path: Path) -> None:
     csv_lines = csv_path.read_text().strip().splitlines()
     # Header + at least one history row
     assert len(csv_lines) >= 2
+
+
+def test_columnar_export_is_incremental_and_feeds_the_tools(tmp_path: Path) -> None:
+    """Exports append only new rows and give the same answers as the database."""
+
+    db_path = tmp_path / "telemetry.db"
+    _build_sample_telemetry(db_path)
+    collector = TelemetryCollector(db_path)
+    for index, (severity, stage) in enumerate(
+        [("high", "input"), ("low", "output"), ("high", "input"), ("low", "input")]
+    ):
+        collector.track_moderation_event(
+            surface=f"surface_{index % 2}",
+            stage=stage,
+            category="hate" if index % 3 else "spam",
+            severity=severity,
+            actor=f"player_{index}",
+            text_hash=f"hash_{index}",
+        )
+    collector.flush()
+
+    export_dir = tmp_path / "columnar"
+    first = export_columnar(db_path, export_dir)
+    assert first["rows"] > 0
+    assert all(path.exists() for path in first["files"])
+    assert any("metric_type=moderation/day=" in str(path) for path in first["files"])
+    assert load_state(export_dir)["high_water"]
+
+    windows = {"engagement_days": 7, "manifesto_days": 7, "archive_days": 7}
+    assert recommend_thresholds_from_export(
+        export_dir, **windows
+    ) == recommend_thresholds(db_path, **windows)
+    from_export = calibrate_from_export(export_dir, hours=24)
+    from_db = calibrate(collector, hours=24)
+    assert from_export["total_events"] == from_db["total_events"] == 4
+    for key in ("by_category", "by_stage", "by_severity", "top_surfaces"):
+        assert list(from_export[key].items()) == list(from_db[key].items())
+    assert from_export["events"] == from_db["events"]
+
+    assert export_columnar(db_path, export_dir)["rows"] == 0
+
+    collector.track_moderation_event(
+        surface="surface_0",
+        stage="input",
+        category="spam",
+        severity="high",
+        actor=None,
+        text_hash=None,
+    )
+    collector.flush()
+    # A file left by an export that crashed before saving its state is discarded.
+    orphan = export_dir / "metric_type=moderation" / "day=2000-01-01" / "part-x.npz"
+    orphan.parent.mkdir(parents=True)
+    orphan.write_bytes(b"partial")
+
+    second = export_columnar(db_path, export_dir)
+    assert second["rows"] == 1
+    assert not orphan.exists()
+    assert calibrate_from_export(export_dir, hours=24)["total_events"] == 5
+
+
+def test_rolling_distinct_players_match_set_counts() -> None:
+    """Vectorised window and cohort counts agree with counting sets per day."""
+
+    rng = random.Random(3)
+    events = []
+    for _ in range(500):
+        day = rng.randrange(40)
+        # New players keep arriving, so later cohorts are populated too.
+        player = f"p{rng.randrange(day + 1)}"
+        events.append((day * 86400 + rng.random() * 86400, player))
+    events.append((5 * 86400, ""))
+    activity = PlayerActivity.from_events(
+        np.array([ts for ts, _ in events]), np.array([player for _, player in events])
+    )
+    by_day: dict[int, set[str]] = {}
+    for ts, player in events:
+        if player:
+            by_day.setdefault(int(ts // 86400), set()).add(player)
+    first_seen = {
+        player: min(day for day, players in by_day.items() if player in players)
+        for players in by_day.values()
+        for player in players
+    }
+
+    windows = (1, 7, 30)
+    cohorts = np.array([first_seen[str(pid)] // 10 for pid in activity.player_ids])
+    counts = rolling_distinct_players(
+        activity, windows, cohorts=cohorts, cohort_count=int(cohorts.max()) + 1
+    )
+    assert counts.shape == (3, int(cohorts.max()) + 1, activity.day_count)
+    for w_index, window in enumerate(windows):
+        for offset in range(activity.day_count):
+            day = activity.first_day + offset
+            active = set().union(
+                *(by_day.get(d, set()) for d in range(day - window + 1, day + 1))
+            )
+            for cohort in range(counts.shape[1]):
+                expected = sum(1 for p in active if first_seen[p] // 10 == cohort)
+                assert counts[w_index, cohort, offset] == expected
+
+    report = window_report(activity, windows, cohort_days=10)
+    assert set(report) == {"1d", "7d", "30d"}
+    assert list(report["7d"]) == [
+        "all",
+        "1970-01-01",
+        "1970-01-11",
+        "1970-01-21",
+        "1970-01-31",
+    ]
+    daily = [len(players) for players in by_day.values()]
+    assert report["1d"]["all"]["mean"] == round(sum(daily) / len(daily), 2)
+    assert report["1d"]["all"]["min"] == min(daily)
+    assert report["30d"]["all"]["days"] == activity.day_count - 29
@@ -0,0 +1,122 @@
+"""Tests for sampled span tracing."""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+import great_work.tracing as tracing
+from great_work.models import ConfidenceLevel, ExpeditionPreparation
+from great_work.service import GameService
+from great_work.tracing import Tracer
+
+
+def test_spans_nest_per_context_and_leaves_never_become_parents():
+    tracer = Tracer(capacity=2)
+
+    with tracer.span("digest", source="test") as root:
+        with tracer.span("step"):
+            with tracer.leaf("state.query"):
+                # A leaf must not adopt spans opened while it is running.
+                with tracer.span("nested"):
+                    pass
+        with pytest.raises(RuntimeError):
+            with tracer.span("failing"):
+                raise RuntimeError("boom")
+    with tracer.leaf("orphan"):
+        pass
+
+    (trace,) = tracer.traces()
+    assert trace is root
+    assert trace.attributes == {"source": "test"}
+    step, failing = trace.children
+    assert [child.name for child in step.children] == ["nested", "state.query"]
+    assert failing.error == "RuntimeError"
+    assert trace.span_count == 5
+    assert trace.self_ms <= trace.duration_ms
+    assert not tracer.active()
+
+    for index in range(3):
+        with tracer.span(f"trace-{index}"):
+            pass
+    assert [trace.name for trace in tracer.traces()] == ["trace-1", "trace-2"]
+
+
+def test_disabled_and_unsampled_traces_record_nothing(monkeypatch):
+    disabled = Tracer(sample_rate=0.0)
+    assert disabled.span("a") is disabled.span("b")
+    with disabled.span("digest"):
+        assert not disabled.active()
+        assert disabled.leaf("state.query") is disabled.span("c")
+    assert disabled.traces() == []
+
+    sampled = Tracer(sample_rate=0.5)
+    monkeypatch.setattr(tracing.random, "random", lambda: 0.9)
+    with sampled.span("digest"):
+        with sampled.span("step"):
+            assert not sampled.active()
+    assert sampled.traces() == []
+
+    capped = Tracer(max_spans=3)
+    with capped.span("digest"):
+        for _ in range(5):
+            with capped.leaf("state.query"):
+                pass
+    (trace,) = capped.traces()
+    assert (trace.span_count, trace.dropped_spans) == (3, 3)
+    assert capped.summary()["slowest"][0]["spans"] == 3
+
+
+def test_digest_trace_breaks_down_service_hot_paths(monkeypatch, tmp_path):
+    os.environ.setdefault("LLM_MODE", "mock")
+    tracer = Tracer()
+    monkeypatch.setattr(tracing, "_tracer", tracer)
+
+    service = GameService(db_path=tmp_path / "state.sqlite")
+    service.queue_expedition(
+        code="TR-01",
+        player_id="sarah",
+        expedition_type="field",
+        objective="Time the digest",
+        team=["s.ironquill"],
+        funding=["academia"],
+        preparation=ExpeditionPreparation(),
+        prep_depth="standard",
+        confidence=ConfidenceLevel.CERTAIN,
+    )
+    assert tracer.traces() == []
+
+    with tracer.span("digest"):
+        service.advance_digest()
+        service.resolve_pending_expeditions()
+        service.create_digest_highlights(now=datetime.now(timezone.utc))
+
+    (trace,) = tracer.traces()
+    names = {span.name for span in trace.walk()}
+    assert {
+        "service.advance_digest",
+        "digest.progress_careers",
+        "service.resolve_pending_expeditions",
+        "service.enhance_press_release",
+        "llm.enhance_press_release",
+        "moderation.llm_output",
+    } <= names
+    assert any(name.startswith("state.") for name in names)
+
+    summary = tracer.summary()
+    slowest = summary["slowest"][0]
+    assert slowest["name"] == "digest"
+    assert slowest["breakdown"][0]["self_ms"] >= slowest["breakdown"][-1]["self_ms"]
+    assert sum(entry["count"] for entry in summary["operations"]) <= trace.span_count
+
+
+def test_process_tracer_is_off_unless_sample_rate_opts_in(monkeypatch):
+    monkeypatch.delenv("GREAT_WORK_TRACE_SAMPLE_RATE", raising=False)
+    monkeypatch.setattr(tracing, "_tracer", None)
+    assert tracing.get_tracer().sample_rate == 0.0
+
+    monkeypatch.setenv("GREAT_WORK_TRACE_SAMPLE_RATE", "0.05")
+    monkeypatch.setattr(tracing, "_tracer", None)
+    assert tracing.get_tracer().sample_rate == 0.05
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import re
 import tempfile
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
@@ -425,6 +427,237 @@ class TestWebArchive:
                 for press in sample_press:
                     assert press.release.headline in index_html
 
+    def test_incremental_export_renders_only_changes(
+        self, state, sample_press, sample_scholar
+    ):
+        """Incremental export should render past the manifest high-water mark."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            archive = WebArchive(state, output_dir)
+            for press in sample_press[:2]:
+                state.record_press_release(press)
+            state.save_scholar(sample_scholar)
+            archive.export_full_archive()
+
+            manifest = json.loads((output_dir / "manifest.json").read_text())
+            assert manifest["press_count"] == 2
+            assert set(manifest["scholars"]) == {sample_scholar.id}
+
+            rendered_press: list[int] = []
+            rendered_scholars: list[str] = []
+            original_press = archive.generate_press_html
+            original_scholar = archive.generate_scholar_page
+
+            def track_press(record, press_id):
+                rendered_press.append(press_id)
+                return original_press(record, press_id)
+
+            def track_scholar(scholar):
+                rendered_scholars.append(scholar.id)
+                return original_scholar(scholar)
+
+            archive.generate_press_html = track_press
+            archive.generate_scholar_page = track_scholar
+
+            archive.export_incremental_archive()
+            assert rendered_press == []
+            assert rendered_scholars == []
+
+            state.record_press_release(sample_press[2])
+            sample_scholar.catchphrase = "Nature and nature's laws"
+            state.save_scholar(sample_scholar)
+            archive.export_incremental_archive()
+
+            assert rendered_press == [3]
+            assert rendered_scholars == [sample_scholar.id]
+            assert len(list((output_dir / "press").glob("*.html"))) == 3
+            index_html = (output_dir / "index.html").read_text()
+            assert sample_press[2].release.headline in index_html
+            assert "archive of 3 press releases" in index_html
+            assert "Nature and nature" in (output_dir / "scholars.html").read_text()
+            manifest = json.loads((output_dir / "manifest.json").read_text())
+            assert manifest["press_count"] == 3
+
+    def test_incremental_export_falls_back_to_full(self, state, sample_press):
+        """A missing or stale manifest should trigger a full rebuild."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            for press in sample_press:
+                state.record_press_release(press)
+
+            WebArchive(state, output_dir).export_incremental_archive()
+            assert len(list((output_dir / "press").glob("*.html"))) == 3
+            assert (output_dir / "timeline.html").exists()
+
+            rebased = WebArchive(state, output_dir, base_url="/gazette")
+            rendered: list[int] = []
+            original = rebased.generate_press_html
+
+            def track_press(record, press_id):
+                rendered.append(press_id)
+                return original(record, press_id)
+
+            rebased.generate_press_html = track_press
+            rebased.export_incremental_archive()
+            assert rendered == [1, 2, 3]
+            manifest = json.loads((output_dir / "manifest.json").read_text())
+            assert manifest["base_url"] == "/gazette"
+
+    def test_parallel_export_matches_serial(
+        self, state, sample_press, sample_scholar
+    ):
+        """A process-pool export should write the same pages as a serial one."""
+        for press in sample_press:
+            state.record_press_release(press)
+        state.save_scholar(sample_scholar)
+
+        with (
+            tempfile.TemporaryDirectory() as serial_dir,
+            tempfile.TemporaryDirectory() as parallel_dir,
+        ):
+            WebArchive(state, Path(serial_dir), workers=1).export_full_archive()
+            archive = WebArchive(state, Path(parallel_dir), workers=2)
+            archive.RENDER_CHUNK_SIZE = 2
+            archive.export_full_archive()
+
+            def listing(root):
+                return sorted(
+                    str(path.relative_to(root))
+                    for path in Path(root).rglob("*")
+                    if path.is_file()
+                )
+
+            assert listing(parallel_dir) == listing(serial_dir)
+            assert not list(Path(parallel_dir).rglob("*.tmp"))
+            press_pages = (Path(parallel_dir) / "press").glob("*.html")
+            assert any(
+                "Press ID:</strong> #3" in page.read_text() for page in press_pages
+            )
+
+    def test_concurrent_writes_of_one_page_do_not_collide(self, tmp_path):
+        """Threads writing the same page should each use their own temp file."""
+        import threading
+
+        from great_work.web_archive import _write_atomic
+
+        page = tmp_path / "index.html"
+        errors = []
+
+        def writer(label):
+            try:
+                for _ in range(50):
+                    _write_atomic(page, label * 1000)
+            except OSError as exc:  # pragma: no cover - the failure under test
+                errors.append(exc)
+
+        threads = [
+            threading.Thread(target=writer, args=(label,)) for label in "abcd"
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert page.read_text() in {label * 1000 for label in "abcd"}
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_workers_default_from_environment(self, state, monkeypatch):
+        """Worker count should fall back to GREAT_WORK_ARCHIVE_WORKERS."""
+        monkeypatch.setenv("GREAT_WORK_ARCHIVE_WORKERS", "3")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            assert WebArchive(state, Path(tmpdir)).workers == 3
+            assert WebArchive(state, Path(tmpdir), workers=0).workers == 1
+
+    def test_export_writes_listing_pages_and_search_shards(self, state):
+        """Full export should paginate every listing and shard the search index."""
+        for i in range(45):
+            state.record_press_release(
+                PressRecord(
+                    timestamp=datetime(
+                        2024, 1 + i // 30, 1 + i % 28, tzinfo=timezone.utc
+                    ),
+                    release=PressRelease(
+                        type="discovery_report" if i % 3 else "academic_bulletin",
+                        headline=f"Expedition {i} returns from Alexandria",
+                        body=f"Report {i}",
+                    ),
+                )
+            )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            WebArchive(state, output_dir).export_full_archive()
+
+            assert (output_dir / "index-3.html").exists()
+            assert not (output_dir / "index-4.html").exists()
+            page_two = (output_dir / "index-2.html").read_text()
+            assert "Expedition 20 returns" in page_two
+            assert "/archive/index-3.html" in page_two
+            assert "Continued listing, page 2." in page_two
+
+            reports = (output_dir / "types" / "discovery_report.html").read_text()
+            assert "30 Discovery Report releases" in reports
+            assert (output_dir / "types" / "discovery_report-2.html").exists()
+            assert (output_dir / "types" / "academic_bulletin.html").exists()
+            february = (output_dir / "months" / "2024-02.html").read_text()
+            assert "15 press releases published in February 2024" in february
+
+            browse = (output_dir / "browse.html").read_text()
+            assert "/archive/types/academic_bulletin.html" in browse
+            assert "/archive/months/2024-01.html" in browse
+
+            shard = json.loads((output_dir / "search" / "al.json").read_text())
+            assert shard["alexandria"] == list(range(1, 46))
+            docs = json.loads((output_dir / "search" / "docs-0.json").read_text())
+            assert docs["1"][0] == "Expedition 0 returns from Alexandria"
+            assert docs["1"][1].endswith(".html")
+
+    def test_incremental_listings_match_full_export(self, state):
+        """Tail re-rendering should leave listings identical to a full rebuild."""
+
+        def record(i):
+            return PressRecord(
+                timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc)
+                + timedelta(days=3 * i),
+                release=PressRelease(
+                    type=("academic_bulletin", "discovery_report")[i % 2],
+                    headline=f"Bulletin {i} on comet {i % 5}",
+                    body="Details withheld.",
+                ),
+            )
+
+        def snapshot(root):
+            return {
+                str(path.relative_to(root)): re.sub(
+                    r"\d{4}-\d\d-\d\d \d\d:\d\d UTC", "", path.read_text()
+                )
+                for path in root.rglob("*")
+                if path.is_file() and path.name != "manifest.json"
+            }
+
+        def listings(root):
+            return json.loads((root / "manifest.json").read_text())["listings"]
+
+        # Enough releases that the tail starts past page one and has to resume
+        # from a recorded page boundary.
+        for i in range(97):
+            state.record_press_release(record(i))
+        with (
+            tempfile.TemporaryDirectory() as incremental_dir,
+            tempfile.TemporaryDirectory() as full_dir,
+        ):
+            incremental = WebArchive(state, Path(incremental_dir))
+            incremental.export_full_archive()
+            for i in range(97, 141):
+                state.record_press_release(record(i))
+            incremental.export_incremental_archive()
+            WebArchive(state, Path(full_dir)).export_full_archive()
+
+            assert snapshot(Path(incremental_dir)) == snapshot(Path(full_dir))
+            assert listings(Path(incremental_dir)) == listings(Path(full_dir))
+            assert len(listings(Path(full_dir))["index"]["page_ends"]) == 7
+
     def test_format_body_paragraphs(self, state):
         """Test body text formatting."""
         with tempfile.TemporaryDirectory() as tmpdir: